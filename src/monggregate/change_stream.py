@@ -0,0 +1,370 @@
+"""
+Module defining change stream pipelines and an incremental consumer of change events.
+
+Online MongoDB documentation:
+--------------------------------------------------------------------------------------------------------------------
+
+Last Updated (in this package) : 19/10/2026
+Source : https://www.mongodb.com/docs/manual/changeStreams/
+
+Change streams allow applications to access real-time data changes without the complexity and risk of tailing the oplog.
+Applications can use change streams to subscribe to all data changes on a single collection, a database, or an entire deployment,
+and immediately react to them.
+
+Modify Change Stream Output
+----------------------------
+You control change stream output by providing an array of one or more of the following pipeline stages when configuring the change stream:
+
+    * $addFields
+
+    * $match
+
+    * $project
+
+    * $redact
+
+    * $replaceRoot
+
+    * $replaceWith (Available starting in MongoDB 4.2)
+
+    * $set (Available starting in MongoDB 4.2)
+
+    * $unset (Available starting in MongoDB 4.2)
+
+    * $changeStreamSplitLargeEvent (Available starting in MongoDB 7.0. Must be the last stage of the pipeline)
+
+Resume a Change Stream
+----------------------------
+Change streams are resumable by specifying a resume token to either resumeAfter or startAfter when opening the cursor.
+The _id value of a change stream event document acts as the resume token.
+
+NOTE : If you modify or remove the _id field of the events in the pipeline, the change stream cannot be resumed
+and the server raises an error.
+
+Usage:
+----------------------------
+Refreshing a materialized view incrementally, by merging the changed orders only:
+
+    >>> pipeline = ChangeStreamPipeline().match(operationType={"$in": ["insert", "update", "replace"]})
+    >>> def refresh(events: list[dict]) -> None:
+            changed = [event["documentKey"]["_id"] for event in events]
+            db.orders.aggregate(
+                Pipeline()
+                .match(_id={"$in": changed})
+                .group(by="customer", query={"total": {"$sum": "$amount"}})
+                .merge("totals", when_matched="merge")
+                .export()
+            )
+    >>> consumer = ChangeStreamConsumer(db.orders, refresh, pipeline, token_store=FileTokenStore("orders.token"))
+    >>> consumer.run()
+
+"""
+
+# Standard Library imports
+# ----------------------------
+import json
+from pathlib import Path
+from typing import Any, Callable, Iterable, Protocol
+
+# Package imports
+# ----------------------------
+from monggregate.base import pyd, Expression, express
+from monggregate.pipeline import Pipeline
+from monggregate.stages import AnyStage
+
+# Stages allowed in a change stream pipeline
+CHANGE_STREAM_STAGES = {
+    "$addFields",
+    "$changeStreamSplitLargeEvent",
+    "$match",
+    "$project",
+    "$redact",
+    "$replaceRoot",
+    "$replaceWith",
+    "$set",
+    "$unset",
+}
+
+
+class ChangeStreamPipeline(Pipeline):
+    """
+    Pipeline restricted to the stages accepted by change streams (i.e by `watch()`).
+
+    Only $match, $project, $redact, $set (and $addFields), $unset, $replaceRoot (and $replaceWith)
+    and $changeStreamSplitLargeEvent are allowed.
+    The stages are checked when the pipeline is built and when it is exported, so that stages added
+    through the methods of `Pipeline` that are not allowed in change streams raise at export time at the latest.
+
+    The stages must not modify or remove the _id field of the events, which is their resume token.
+    """
+
+    # Redeclared for the validator below to apply
+    stages: list[AnyStage | Expression] = []
+
+    @pyd.validator("stages")
+    @classmethod
+    def validate_stages(cls, stages: list[AnyStage | Expression]) -> list[AnyStage | Expression]:
+        """Validates that the stages are allowed in change streams"""
+
+        for stage in stages:
+            check_change_stream_stage(stage)
+
+        return stages
+
+    @property
+    def expression(self) -> list[dict]:
+        """Returns the pipeline statement"""
+
+        statements = super().expression
+        for statement in statements:
+            check_change_stream_stage(statement)
+
+        return statements
+
+    def append(self, stage: AnyStage) -> None:
+        """Appends a stage to the pipeline"""
+
+        check_change_stream_stage(stage)
+        super().append(stage)
+
+    def insert(self, index: int, stage: AnyStage) -> None:
+        """Inserts a stage in the pipeline"""
+
+        check_change_stream_stage(stage)
+        super().insert(index, stage)
+
+    def extend(self, stages: list[AnyStage]) -> None:
+        """Extends the pipeline with a list of stages"""
+
+        for stage in stages:
+            check_change_stream_stage(stage)
+        super().extend(stages)
+
+
+def check_change_stream_stage(stage: Any) -> None:
+    """Raises a ValueError if stage cannot be used in a change stream pipeline"""
+
+    statement = express(stage)
+    if not isinstance(statement, dict) or len(statement) != 1:
+        raise ValueError(f"Invalid stage in change stream pipeline: {statement}")
+
+    ((name, specification),) = statement.items()
+    if name not in CHANGE_STREAM_STAGES:
+        raise ValueError(
+            f"{name} is not allowed in change stream pipelines. "
+            f"Allowed stages are: {', '.join(sorted(CHANGE_STREAM_STAGES))}"
+        )
+
+    if _modifies_id(name, specification):
+        raise ValueError(f"{name} cannot modify or remove _id, which is the resume token of the events")
+
+
+def _modifies_id(name: str, specification: Any) -> bool:
+    """Returns true if a stage modifies or removes the _id field"""
+
+    if name == "$project":
+        value = specification.get("_id", True)
+        modified = not (value is True or (isinstance(value, (int, float)) and value))
+    elif name in {"$set", "$addFields"}:
+        modified = any(field.split(".")[0] == "_id" for field in specification)
+    elif name == "$unset":
+        fields = [specification] if isinstance(specification, str) else specification
+        modified = any(field.split(".")[0] == "_id" for field in fields)
+    else:
+        # $replaceRoot can only be checked by the server
+        modified = False
+
+    return modified
+
+
+# Consumer
+# ----------------------------
+class ChangeStream(Protocol):
+    """Protocol of the change streams supported by `ChangeStreamConsumer` (ex: pymongo.change_stream.ChangeStream)"""
+
+    def __enter__(self) -> "ChangeStream":
+        """Returns the change stream"""
+
+    def __exit__(self, *args: Any) -> Any:
+        """Closes the change stream"""
+
+    @property
+    def alive(self) -> bool:
+        """Whether the change stream can return more events"""
+
+    @property
+    def resume_token(self) -> dict | None:
+        """The token to resume the change stream from its current position"""
+
+    def try_next(self) -> dict | None:
+        """Returns the next event if one is available, None otherwise"""
+
+
+class WatchableCollection(Protocol):
+    """Protocol of the objects supported by `ChangeStreamConsumer` (ex: a pymongo collection, database or client)"""
+
+    def watch(self, pipeline: list[dict] | None = None, **kwargs: Any) -> ChangeStream:
+        """Opens a change stream"""
+
+
+class TokenStore(Protocol):
+    """Protocol of the resume token stores"""
+
+    def load(self) -> dict | None:
+        """Returns the saved resume token, None if there is none"""
+
+    def save(self, token: dict) -> None:
+        """Saves the resume token"""
+
+
+class MemoryTokenStore:
+    """Keeps the resume token in memory"""
+
+    def __init__(self, token: dict | None = None) -> None:
+        self.token = token
+
+    def load(self) -> dict | None:
+        return self.token
+
+    def save(self, token: dict) -> None:
+        self.token = token
+
+
+class FileTokenStore:
+    """
+    Keeps the resume token in a JSON file, so that consumers can resume after a restart.
+
+    NOTE : Resume tokens are documents like {"_data": "<hexadecimal string>"}, which are JSON serializable.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+
+    def load(self) -> dict | None:
+        if not self.path.exists():
+            return None
+
+        return json.loads(self.path.read_text())
+
+    def save(self, token: dict) -> None:
+        temporary = self.path.with_suffix(self.path.suffix + ".tmp")
+        temporary.write_text(json.dumps(token))
+        temporary.replace(self.path)
+
+
+class ChangeStreamConsumer:
+    """
+    Consumes a change stream by batches of events and hands them to a callback.
+
+    The resume token of the last event of a batch is saved once the callback returned, so that a consumer
+    restarted after a failure resumes right after the last processed batch (at-least-once delivery).
+    When the stream is idle, the resume token of the stream is saved as well, so that resuming does not
+    have to scan the changes that did not match the pipeline again.
+
+    Attributes:
+    ----------------------------
+        - source, WatchableCollection : the collection, database or client to watch
+        - callback, Callable[[list[dict]], Any] : function called with each batch of events
+        - pipeline, ChangeStreamPipeline | list[dict] | None : pipeline applied to the events by the server
+        - batch_size, int : maximum number of events per batch. Defaults to 100.
+        - max_await_time_ms, int | None : maximum time the server waits for new events before a partial batch
+                                          is handed to the callback. Defaults to 1000.
+        - token_store, TokenStore | None : where the resume token is kept. Defaults to a MemoryTokenStore.
+        - watch_options, dict : additional options passed to watch (ex: full_document="updateLookup")
+    """
+
+    def __init__(
+        self,
+        source: WatchableCollection,
+        callback: Callable[[list[dict]], Any],
+        pipeline: ChangeStreamPipeline | Iterable[dict] | None = None,
+        *,
+        batch_size: int = 100,
+        max_await_time_ms: int | None = 1000,
+        token_store: TokenStore | None = None,
+        **watch_options: Any,
+    ) -> None:
+        if batch_size < 1:
+            raise ValueError("batch_size must be a positive integer")
+
+        if pipeline is not None and not isinstance(pipeline, ChangeStreamPipeline):
+            pipeline = ChangeStreamPipeline(stages=list(pipeline))
+
+        self.source = source
+        self.callback = callback
+        self.pipeline = pipeline or ChangeStreamPipeline()
+        self.batch_size = batch_size
+        self.max_await_time_ms = max_await_time_ms
+        self.token_store: TokenStore = token_store or MemoryTokenStore()
+        self.watch_options = watch_options
+        self._running = False
+
+    @property
+    def resume_token(self) -> dict | None:
+        """The token from which the consumer resumes"""
+
+        return self.token_store.load()
+
+    def run(self, *, max_batches: int | None = None, until_idle: bool = False) -> int:
+        """
+        Consumes the change stream until stop is called, the stream is closed or invalidated,
+        max_batches batches were processed or, if until_idle is true, no more events are available.
+        The events of a partial batch are handed to the callback before returning.
+
+        Returns the number of events handed to the callback.
+        """
+
+        self._running = True
+        handled = batches = 0
+        batch: list[dict] = []
+        with self.source.watch(self.pipeline.export(), **self._options()) as stream:
+            while self._running and stream.alive:
+                event = stream.try_next()
+                if event is not None:
+                    batch.append(event)
+                    if len(batch) < self.batch_size:
+                        continue
+                elif not batch:
+                    # Idle stream : its token skips the events filtered out by the pipeline
+                    if stream.resume_token is not None:
+                        self.token_store.save(stream.resume_token)
+                    if until_idle:
+                        break
+                    continue
+
+                self._deliver(batch)
+                handled, batches, batch = handled + len(batch), batches + 1, []
+                if (max_batches is not None and batches >= max_batches) or (event is None and until_idle):
+                    break
+
+            # The stream was closed or invalidated, or stop was called, before the batch was full
+            if batch:
+                self._deliver(batch)
+                handled += len(batch)
+
+        self._running = False
+        return handled
+
+    def stop(self) -> None:
+        """Stops the consumer after the current event (ex: from the callback or from another thread)"""
+
+        self._running = False
+
+    def _options(self) -> dict[str, Any]:
+        """Returns the options of watch"""
+
+        options = dict(self.watch_options)
+        if self.max_await_time_ms is not None:
+            options["max_await_time_ms"] = self.max_await_time_ms
+        token = self.token_store.load()
+        if token is not None:
+            # Unlike resume_after, start_after can resume after an invalidate event
+            options["start_after"] = token
+
+        return options
+
+    def _deliver(self, batch: list[dict]) -> None:
+        """Hands a batch to the callback and saves its resume token once processed"""
+
+        self.callback(batch)
+        self.token_store.save(batch[-1]["_id"])
@@ -23,8 +23,10 @@ from monggregate.operators import (
     conditional,
     date,
     objects,
+    set_,
     strings,
     type_,
+    window,
 )
 
 from monggregate.utils import StrEnum
@@ -52,6 +54,8 @@ class AggregationVariableEnum(StrEnum):
         - KEEP = "$$KEEP" : One of the allowed results of a $redact expression.NOW = "$$NOW" : Returns the current datetime value,
                             which is same across all members of the deployment and remains constant throughout the aggregation pipeline.
                             (Available in 4.2+)
+        - SEARCH_META = "$$SEARCH_META" : Stores the metadata results (count and facets) of the preceding $search stage.
+                                          (Atlas Search only)
 
 
 
@@ -65,6 +69,7 @@ class AggregationVariableEnum(StrEnum):
     DESCEND = "$$DESCEND"
     PRUNE = "$$PRUNE"
     KEEP = "$$KEEP"
+    SEARCH_META = "$$SEARCH_META"
 
 
 # Constants
@@ -77,8 +82,9 @@ REMOVE = AggregationVariableEnum.REMOVE.value
 DESCEND = AggregationVariableEnum.DESCEND.value
 PRUNE = AggregationVariableEnum.PRUNE.value
 KEEP = AggregationVariableEnum.KEEP.value
+SEARCH_META = AggregationVariableEnum.SEARCH_META.value
 
-CONSTANTS = [CLUSTER_TIME, NOW, ROOT, CURRENT, REMOVE, DESCEND, PRUNE, KEEP]
+CONSTANTS = [CLUSTER_TIME, NOW, ROOT, CURRENT, REMOVE, DESCEND, PRUNE, KEEP, SEARCH_META]
 
 # Classes
 # -------------------------------------------
@@ -139,6 +145,18 @@ class Dollar(Singleton):
 
         return accumulators.avg(operand)
 
+    @classmethod
+    def bottom(cls, sort_by: dict, output: Any) -> accumulators.Bottom:
+        """Returns the $bottom operator"""
+
+        return accumulators.bottom(sort_by, output)
+
+    @classmethod
+    def bottom_n(cls, n: Any, sort_by: dict, output: Any) -> accumulators.BottomN:
+        """Returns the $bottomN operator"""
+
+        return accumulators.bottom_n(n, sort_by, output)
+
     @classmethod
     def count(cls) -> accumulators.Count:
         """Returns the $count operator"""
@@ -151,12 +169,24 @@ class Dollar(Singleton):
 
         return accumulators.first(operand)
 
+    @classmethod
+    def first_n(cls, operand: Any, n: Any) -> accumulators.FirstN:
+        """Returns the $firstN operator"""
+
+        return accumulators.first_n(operand, n)
+
     @classmethod
     def last(cls, operand: Any) -> accumulators.Last:
         """Returns the $last operator"""
 
         return accumulators.last(operand)
 
+    @classmethod
+    def last_n(cls, operand: Any, n: Any) -> accumulators.LastN:
+        """Returns the $lastN operator"""
+
+        return accumulators.last_n(operand, n)
+
     @classmethod
     def max(cls, operand: Any) -> accumulators.Max:
         """Returns the $max operator"""
@@ -181,6 +211,18 @@ class Dollar(Singleton):
 
         return accumulators.sum(operand)
 
+    @classmethod
+    def top(cls, sort_by: dict, output: Any) -> accumulators.Top:
+        """Returns the $top operator"""
+
+        return accumulators.top(sort_by, output)
+
+    @classmethod
+    def top_n(cls, n: Any, sort_by: dict, output: Any) -> accumulators.TopN:
+        """Returns the $topN operator"""
+
+        return accumulators.top_n(n, sort_by, output)
+
     # --------------------------------
     # Arithmetic
     # -------------------------------
@@ -451,6 +493,51 @@ class Dollar(Singleton):
 
         return boolean.not_(operand)
 
+    # --------------------------------
+    # Set
+    # -------------------------------
+    @classmethod
+    def all_elements_true(cls, operand: Any) -> set_.AllElementsTrue:
+        """Returns the $allElementsTrue operator"""
+
+        return set_.all_elements_true(operand)
+
+    @classmethod
+    def any_element_true(cls, operand: Any) -> set_.AnyElementTrue:
+        """Returns the $anyElementTrue operator"""
+
+        return set_.any_element_true(operand)
+
+    @classmethod
+    def set_difference(cls, left: Any, right: Any) -> set_.SetDifference:
+        """Returns the $setDifference operator"""
+
+        return set_.set_difference(left, right)
+
+    @classmethod
+    def set_equals(cls, *args: Any) -> set_.SetEquals:
+        """Returns the $setEquals operator"""
+
+        return set_.set_equals(*args)
+
+    @classmethod
+    def set_intersection(cls, *args: Any) -> set_.SetIntersection:
+        """Returns the $setIntersection operator"""
+
+        return set_.set_intersection(*args)
+
+    @classmethod
+    def set_is_subset(cls, left: Any, right: Any) -> set_.SetIsSubset:
+        """Returns the $setIsSubset operator"""
+
+        return set_.set_is_subset(left, right)
+
+    @classmethod
+    def set_union(cls, *args: Any) -> set_.SetUnion:
+        """Returns the $setUnion operator"""
+
+        return set_.set_union(*args)
+
     # --------------------------------
     # Type
     # -------------------------------
@@ -460,6 +547,47 @@ class Dollar(Singleton):
 
         return type_.type_(operand)
 
+    # --------------------------------
+    # Window
+    # -------------------------------
+    @classmethod
+    def dense_rank(cls) -> window.DenseRank:
+        """Returns the $denseRank operator"""
+
+        return window.dense_rank()
+
+    @classmethod
+    def derivative(cls, operand: Any, unit: window.TimeUnitEnum | None = None) -> window.Derivative:
+        """Returns the $derivative operator"""
+
+        return window.derivative(operand, unit)
+
+    @classmethod
+    def exp_moving_avg(
+        cls, operand: Any, n: int | None = None, alpha: float | None = None
+    ) -> window.ExpMovingAvg:
+        """Returns the $expMovingAvg operator"""
+
+        return window.exp_moving_avg(operand, n, alpha)
+
+    @classmethod
+    def integral(cls, operand: Any, unit: window.TimeUnitEnum | None = None) -> window.Integral:
+        """Returns the $integral operator"""
+
+        return window.integral(operand, unit)
+
+    @classmethod
+    def rank(cls) -> window.Rank:
+        """Returns the $rank operator"""
+
+        return window.rank()
+
+    @classmethod
+    def shift(cls, output: Any, by: int, default: Any = None) -> window.Shift:
+        """Returns the $shift operator"""
+
+        return window.shift(output, by, default)
+
 
 class DollarDollar(Singleton):
     """
@@ -486,6 +614,7 @@ class DollarDollar(Singleton):
     DESCEND = AggregationVariableEnum.DESCEND.value
     PRUNE = AggregationVariableEnum.PRUNE.value
     KEEP = AggregationVariableEnum.KEEP.value
+    SEARCH_META = AggregationVariableEnum.SEARCH_META.value
 
     def __getattr__(self, name) -> str | Any:
         """Overloads the __getattr__ method.
@@ -0,0 +1,24 @@
+"""Local engine sub-package
+
+Contains executors running parts of aggregation pipelines on the client side.
+"""
+
+from monggregate.engine.evaluator import evaluate
+from monggregate.engine.indexes import IndexedCollection
+from monggregate.engine.join import CollectionJoin, hash_join, join
+from monggregate.engine.search_index import SearchIndex
+from monggregate.engine.sources import BSONSource, NDJSONSource, open_source
+from monggregate.engine.vector_index import VectorIndex
+
+__all__ = [
+    "BSONSource",
+    "CollectionJoin",
+    "IndexedCollection",
+    "NDJSONSource",
+    "SearchIndex",
+    "VectorIndex",
+    "evaluate",
+    "hash_join",
+    "join",
+    "open_source",
+]
@@ -0,0 +1,463 @@
+"""
+Module defining the local implementation of the $group accumulators.
+
+Each accumulator is implemented as a `Reducer`, that is a stateless object operating on
+plain python states:
+
+    * `initial` returns the state of an empty group
+    * `step` folds the value of a document into a state
+    * `merge` combines two partial states computed on consecutive partitions of the input
+    * `result` converts a state into the value of the output field
+
+Keeping the states separate from the reducers allows to compute partial states in
+worker processes and to merge them in the parent process.
+
+"""
+
+# Standard Library imports
+# ----------------------------
+import heapq
+import math
+from abc import ABC, abstractmethod
+from functools import cmp_to_key
+from typing import Any, Callable
+
+# Package imports
+# ----------------------------
+from monggregate.engine.documents import MISSING, compare_values, freeze, get_path, sort_value
+from monggregate.engine.expressions import Variables, evaluate
+
+
+class Reducer(ABC):
+    """Base class of the local accumulators"""
+
+    def __init__(self, argument: Any) -> None:
+        self.argument = argument
+
+    def value(self, variables: Variables) -> Any:
+        """Evaluates the accumulator argument on the current document"""
+
+        return evaluate(self.argument, variables)
+
+    @abstractmethod
+    def initial(self) -> Any:
+        """Returns the state of an empty group"""
+
+    @abstractmethod
+    def step(self, state: Any, value: Any, position: Any) -> Any:
+        """Folds the value of a document into state. Positions order the documents of the input."""
+
+    @abstractmethod
+    def merge(self, left: Any, right: Any) -> Any:
+        """Combines two partial states, left having been computed on the earlier documents"""
+
+    def result(self, state: Any) -> Any:
+        """Converts a state into the output value"""
+
+        return state
+
+
+class SumReducer(Reducer):
+    """$sum, non numeric values are ignored"""
+
+    def initial(self) -> Any:
+        return 0
+
+    def step(self, state: Any, value: Any, position: Any) -> Any:
+        if _is_number(value):
+            state += value
+        return state
+
+    def merge(self, left: Any, right: Any) -> Any:
+        return left + right
+
+
+class CountReducer(Reducer):
+    """$count"""
+
+    def value(self, variables: Variables) -> Any:
+        return 1
+
+    def initial(self) -> Any:
+        return 0
+
+    def step(self, state: Any, value: Any, position: Any) -> Any:
+        return state + 1
+
+    def merge(self, left: Any, right: Any) -> Any:
+        return left + right
+
+
+class AvgReducer(Reducer):
+    """$avg, the state is a (sum, count) pair"""
+
+    def initial(self) -> Any:
+        return (0, 0)
+
+    def step(self, state: Any, value: Any, position: Any) -> Any:
+        if _is_number(value):
+            state = (state[0] + value, state[1] + 1)
+        return state
+
+    def merge(self, left: Any, right: Any) -> Any:
+        return (left[0] + right[0], left[1] + right[1])
+
+    def result(self, state: Any) -> Any:
+        total, count = state
+        return total / count if count else None
+
+
+class MinReducer(Reducer):
+    """$min, null and missing values are ignored"""
+
+    sign = 1
+
+    def initial(self) -> Any:
+        return MISSING
+
+    def step(self, state: Any, value: Any, position: Any) -> Any:
+        if value is None or value is MISSING:
+            return state
+        return self.merge(state, value)
+
+    def merge(self, left: Any, right: Any) -> Any:
+        if left is MISSING:
+            return right
+        if right is MISSING:
+            return left
+        return right if compare_values(right, left) * self.sign < 0 else left
+
+    def result(self, state: Any) -> Any:
+        return None if state is MISSING else state
+
+
+class MaxReducer(MinReducer):
+    """$max, null and missing values are ignored"""
+
+    sign = -1
+
+
+class FirstReducer(Reducer):
+    """$first, the state is a (position, value) pair or None for an empty group"""
+
+    def initial(self) -> Any:
+        return None
+
+    def step(self, state: Any, value: Any, position: Any) -> Any:
+        if state is None:
+            state = (position, None if value is MISSING else value)
+        return state
+
+    def merge(self, left: Any, right: Any) -> Any:
+        if left is None or (right is not None and right[0] < left[0]):
+            return right
+        return left
+
+    def result(self, state: Any) -> Any:
+        return None if state is None else state[1]
+
+
+class LastReducer(FirstReducer):
+    """$last, the state is a (position, value) pair or None for an empty group"""
+
+    def step(self, state: Any, value: Any, position: Any) -> Any:
+        return (position, None if value is MISSING else value)
+
+    def merge(self, left: Any, right: Any) -> Any:
+        if left is None or (right is not None and right[0] > left[0]):
+            return right
+        return left
+
+
+class PushReducer(Reducer):
+    """$push"""
+
+    def initial(self) -> Any:
+        return []
+
+    def step(self, state: Any, value: Any, position: Any) -> Any:
+        if value is not MISSING:
+            state.append(value)
+        return state
+
+    def merge(self, left: Any, right: Any) -> Any:
+        return left + right
+
+
+class AddToSetReducer(Reducer):
+    """$addToSet, the state maps the hashed values to the values"""
+
+    def initial(self) -> Any:
+        return {}
+
+    def step(self, state: Any, value: Any, position: Any) -> Any:
+        if value is not MISSING:
+            state.setdefault(freeze(value), value)
+        return state
+
+    def merge(self, left: Any, right: Any) -> Any:
+        for key, value in right.items():
+            left.setdefault(key, value)
+        return left
+
+    def result(self, state: Any) -> Any:
+        return list(state.values())
+
+
+class MergeObjectsReducer(Reducer):
+    """$mergeObjects"""
+
+    def initial(self) -> Any:
+        return {}
+
+    def step(self, state: Any, value: Any, position: Any) -> Any:
+        if isinstance(value, dict):
+            state.update(value)
+        return state
+
+    def merge(self, left: Any, right: Any) -> Any:
+        return left | right
+
+
+class StdDevPopReducer(Reducer):
+    """$stdDevPop, the state is a (count, mean, M2) triple merged with Chan's algorithm"""
+
+    ddof = 0
+
+    def initial(self) -> Any:
+        return (0, 0.0, 0.0)
+
+    def step(self, state: Any, value: Any, position: Any) -> Any:
+        if not _is_number(value):
+            return state
+        count, mean, m2 = state
+        count += 1
+        delta = value - mean
+        mean += delta / count
+        m2 += delta * (value - mean)
+        return (count, mean, m2)
+
+    def merge(self, left: Any, right: Any) -> Any:
+        left_count, left_mean, left_m2 = left
+        right_count, right_mean, right_m2 = right
+        count = left_count + right_count
+        if not count:
+            return left
+        delta = right_mean - left_mean
+        mean = left_mean + delta * right_count / count
+        m2 = left_m2 + right_m2 + delta**2 * left_count * right_count / count
+        return (count, mean, m2)
+
+    def result(self, state: Any) -> Any:
+        count, _, m2 = state
+        if count - self.ddof <= 0:
+            return None
+        return math.sqrt(m2 / (count - self.ddof))
+
+
+class StdDevSampReducer(StdDevPopReducer):
+    """$stdDevSamp"""
+
+    ddof = 1
+
+
+class _Worst:
+    """Heap entry inverting the order of the entries, so that the root of a heap is the worst kept entry"""
+
+    __slots__ = ("entry", "compare")
+
+    def __init__(self, entry: tuple, compare: Callable[[tuple, tuple], int]) -> None:
+        self.entry = entry
+        self.compare = compare
+
+    def __lt__(self, other: "_Worst") -> bool:
+        return self.compare(self.entry, other.entry) > 0
+
+
+class BoundedReducer(Reducer):
+    """
+    Base class of the N accumulators ($topN, $bottomN, $firstN, $lastN, $maxN, $minN).
+
+    The state is a (n, heap) pair where the heap keeps the n best (key, position, output) entries seen so far,
+    its root being the worst of them. Each document costs O(log n) and a group never holds more than n entries,
+    however large it is.
+
+    Subclasses define how entries are built and ordered. The best entries are the smallest ones for `compare`.
+    """
+
+    # Whether the result is ordered from the worst to the best kept entry
+    reverse_result = False
+
+    def value(self, variables: Variables) -> Any:
+        n = evaluate(self.argument.get("n", 1), variables)
+        if isinstance(n, bool) or not isinstance(n, (int, float)) or n < 1 or n != int(n):
+            raise ValueError(f"n must be a positive integer, got {n!r}")
+        return int(n), self.entry(variables)
+
+    def entry(self, variables: Variables) -> tuple | None:
+        """Returns the (key, output) pair of the current document, None to skip it"""
+
+        output = evaluate(self.argument["input"], variables)
+        return (output, None if output is MISSING else output)
+
+    def compare(self, left: tuple, right: tuple) -> int:
+        """Compares two (key, position, output) entries"""
+
+        return _compare_positions(left[1], right[1])
+
+    def initial(self) -> Any:
+        return (None, [])
+
+    def step(self, state: Any, value: Any, position: Any) -> Any:
+        n, entry = value
+        heap = state[1]
+        if entry is not None:
+            self._push(heap, n, (entry[0], position, entry[1]))
+        return (n, heap)
+
+    def merge(self, left: Any, right: Any) -> Any:
+        n = left[0] or right[0]
+        heap = left[1]
+        for item in right[1]:
+            self._push(heap, n, item.entry)
+        return (n, heap)
+
+    def result(self, state: Any) -> Any:
+        entries = sorted((item.entry for item in state[1]), key=cmp_to_key(self.compare), reverse=self.reverse_result)
+        return [output for _, _, output in entries]
+
+    def _push(self, heap: list, n: int, entry: tuple) -> None:
+        """Adds an entry to the heap if it is among the n best ones"""
+
+        item = _Worst(entry, self.compare)
+        if len(heap) < n:
+            heapq.heappush(heap, item)
+        elif item.compare(entry, heap[0].entry) < 0:
+            heapq.heapreplace(heap, item)
+
+
+class FirstNReducer(BoundedReducer):
+    """$firstN, keeps the n earliest values"""
+
+
+class LastNReducer(BoundedReducer):
+    """$lastN, keeps the n latest values"""
+
+    reverse_result = True
+
+    def compare(self, left: tuple, right: tuple) -> int:
+        return -_compare_positions(left[1], right[1])
+
+
+class MinNReducer(BoundedReducer):
+    """$minN, keeps the n smallest values, null and missing values are ignored"""
+
+    sign = 1
+
+    def entry(self, variables: Variables) -> tuple | None:
+        output = evaluate(self.argument["input"], variables)
+        if output is None or output is MISSING:
+            return None
+        return (output, output)
+
+    def compare(self, left: tuple, right: tuple) -> int:
+        return compare_values(left[0], right[0]) * self.sign or _compare_positions(left[1], right[1])
+
+
+class MaxNReducer(MinNReducer):
+    """$maxN, keeps the n largest values in descending order, null and missing values are ignored"""
+
+    sign = -1
+
+
+class TopNReducer(BoundedReducer):
+    """$topN, keeps the n first documents according to sortBy"""
+
+    def entry(self, variables: Variables) -> tuple | None:
+        document = variables["CURRENT"]
+        key = tuple(
+            sort_value(get_path(document, path), direction) for path, direction in self.argument["sortBy"].items()
+        )
+        output = evaluate(self.argument["output"], variables)
+        return (key, None if output is MISSING else output)
+
+    def compare(self, left: tuple, right: tuple) -> int:
+        for left_value, right_value, direction in zip(left[0], right[0], self.argument["sortBy"].values()):
+            output = compare_values(left_value, right_value) * direction
+            if output:
+                return output
+        return _compare_positions(left[1], right[1])
+
+
+class BottomNReducer(TopNReducer):
+    """$bottomN, keeps the n last documents according to sortBy, in sortBy order"""
+
+    reverse_result = True
+
+    def compare(self, left: tuple, right: tuple) -> int:
+        return -super().compare(left, right)
+
+
+class TopReducer(TopNReducer):
+    """$top"""
+
+    def result(self, state: Any) -> Any:
+        outputs = super().result(state)
+        return outputs[0] if outputs else None
+
+
+class BottomReducer(BottomNReducer):
+    """$bottom"""
+
+    def result(self, state: Any) -> Any:
+        outputs = super().result(state)
+        return outputs[-1] if outputs else None
+
+
+def _compare_positions(left: Any, right: Any) -> int:
+    """Compares the positions of two documents in the input"""
+
+    return (left > right) - (left < right)
+
+
+def _is_number(value: Any) -> bool:
+    """Returns true if value is a number (booleans excluded)"""
+
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+REDUCERS: dict[str, type[Reducer]] = {
+    "$addToSet": AddToSetReducer,
+    "$avg": AvgReducer,
+    "$bottom": BottomReducer,
+    "$bottomN": BottomNReducer,
+    "$count": CountReducer,
+    "$first": FirstReducer,
+    "$firstN": FirstNReducer,
+    "$last": LastReducer,
+    "$lastN": LastNReducer,
+    "$max": MaxReducer,
+    "$maxN": MaxNReducer,
+    "$mergeObjects": MergeObjectsReducer,
+    "$min": MinReducer,
+    "$minN": MinNReducer,
+    "$push": PushReducer,
+    "$stdDevPop": StdDevPopReducer,
+    "$stdDevSamp": StdDevSampReducer,
+    "$sum": SumReducer,
+    "$top": TopReducer,
+    "$topN": TopNReducer,
+}
+
+
+def build_reducer(specification: dict) -> Reducer:
+    """Builds the reducer of an accumulator expression such as {"$sum": "$price"}"""
+
+    if not isinstance(specification, dict) or len(specification) != 1:
+        raise ValueError(f"Invalid accumulator expression: {specification}")
+
+    ((name, argument),) = specification.items()
+    if name not in REDUCERS:
+        raise NotImplementedError(f"Accumulator {name} is not supported by the local engine")
+
+    return REDUCERS[name](argument)
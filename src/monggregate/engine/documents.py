@@ -0,0 +1,301 @@
+"""
+Module defining helpers to read and write values in plain python documents.
+
+Those helpers are shared by the local engine executors and follow MongoDB semantics:
+
+    * `get_path` follows the aggregation expressions semantics (`"$a.b"`), where
+      traversing an array maps the remaining path over its elements.
+
+    * `iter_values` follows the query semantics (`{"a.b": ...}`), where a value at the end
+      of the path matches both as a whole and element by element, and where numeric path
+      components index into arrays.
+
+"""
+
+# Standard Library imports
+# ----------------------------
+import re
+from datetime import datetime
+from functools import cmp_to_key
+from typing import Any, Callable, Iterator
+
+
+# Constants
+# ----------------------------
+class _Missing:
+    """Sentinel type for a field that does not exist in a document"""
+
+    def __repr__(self) -> str:
+        return "MISSING"
+
+    def __bool__(self) -> bool:
+        return False
+
+
+MISSING: Any = _Missing()
+
+
+class AnnotatedDocument(dict):
+    """
+    Document carrying metadata (ex: the vectorSearchScore of a $vectorSearch result).
+
+    The metadata is read by the $meta expressions of the stage following the one that produced the document.
+    As the stages copy the documents they modify, it is not propagated further.
+    """
+
+    def __init__(self, document: dict, metadata: dict[str, Any]) -> None:
+        super().__init__(document)
+        self.metadata = metadata
+
+
+# Functions
+# ----------------------------
+def split_path(path: str) -> list[str]:
+    """Splits a field path, with or without its $ prefix, into its components"""
+
+    return path.removeprefix("$").split(".")
+
+
+def get_path(document: Any, path: str) -> Any:
+    """
+    Returns the value found at path in document.
+
+    Follows the aggregation expressions semantics.
+    Returns MISSING when the path does not resolve.
+
+    Ex:
+        >>> get_path({"a":[{"b":1}, {"b":2}, {}]}, "$a.b")
+        [1, 2]
+
+    """
+
+    return _get(document, split_path(path))
+
+
+def _get(value: Any, parts: list[str]) -> Any:
+    """Recursively resolves parts in value"""
+
+    if not parts:
+        return value
+
+    head, tail = parts[0], parts[1:]
+    if isinstance(value, dict):
+        output = _get(value[head], tail) if head in value else MISSING
+    elif isinstance(value, list):
+        output = [
+            resolved
+            for resolved in (_get(element, parts) for element in value)
+            if resolved is not MISSING
+        ]
+    else:
+        output = MISSING
+
+    return output
+
+
+def iter_values(document: Any, path: str) -> Iterator[Any]:
+    """
+    Yields the candidate values found at path in document.
+
+    Follows the query semantics, that is arrays found at the end of the path are yielded
+    both as a whole and element by element. Nothing is yielded when the path does not resolve.
+
+    Ex:
+        >>> list(iter_values({"a":{"b":[1, 2]}}, "a.b"))
+        [[1, 2], 1, 2]
+
+    """
+
+    yield from _iter(document, split_path(path))
+
+
+def _iter(value: Any, parts: list[str]) -> Iterator[Any]:
+    """Recursively yields the values matching parts in value"""
+
+    if not parts:
+        yield value
+        if isinstance(value, list):
+            yield from value
+        return
+
+    head, tail = parts[0], parts[1:]
+    if isinstance(value, dict):
+        if head in value:
+            yield from _iter(value[head], tail)
+    elif isinstance(value, list):
+        if head.isdigit() and int(head) < len(value):
+            yield from _iter(value[int(head)], tail)
+        for element in value:
+            if isinstance(element, dict):
+                yield from _iter(element, parts)
+
+
+def set_path(document: dict, path: str, value: Any) -> dict:
+    """
+    Returns a copy of document where path is set to value.
+
+    The documents along the path are copied and never mutated, so that the input documents
+    can safely be shared between several outputs.
+    """
+
+    head, _, rest = path.removeprefix("$").partition(".")
+    output = dict(document)
+    if rest:
+        child = output.get(head)
+        output[head] = set_path(child if isinstance(child, dict) else {}, rest, value)
+    else:
+        output[head] = value
+
+    return output
+
+
+def unset_path(document: dict, path: str) -> dict:
+    """Returns a copy of document where path is removed"""
+
+    head, _, rest = path.removeprefix("$").partition(".")
+    if head not in document:
+        return document
+
+    output = dict(document)
+    if not rest:
+        del output[head]
+    elif isinstance(output[head], dict):
+        output[head] = unset_path(output[head], rest)
+    elif isinstance(output[head], list):
+        output[head] = [
+            unset_path(element, rest) if isinstance(element, dict) else element
+            for element in output[head]
+        ]
+
+    return output
+
+
+def freeze(value: Any) -> Any:
+    """
+    Converts value into a hashable equivalent.
+
+    Used to build hash tables keyed on document values.
+    Booleans are tagged so that True and 1 do not collide as they do in python,
+    while they are distinct values in MongoDB.
+    """
+
+    if isinstance(value, dict):
+        output: Any = ("__document__", tuple((k, freeze(v)) for k, v in value.items()))
+    elif isinstance(value, list):
+        output = ("__array__", tuple(freeze(element) for element in value))
+    elif isinstance(value, bool):
+        output = ("__bool__", value)
+    elif value is MISSING:
+        output = None
+    else:
+        output = value
+
+    return output
+
+
+# Comparison
+# ----------------------------
+def type_rank(value: Any) -> int:
+    """
+    Returns the rank of the type of value in the BSON comparison order.
+
+    MinKey < Null < Numbers < Symbol, String < Object < Array < BinData < ObjectId < Boolean < Date < Timestamp < Regular Expression < MaxKey
+
+    bson types (ObjectId, Timestamp) are recognized by name so that pymongo remains optional.
+    Other unknown types are ranked last.
+    """
+
+    if value is None or value is MISSING:
+        rank = 1
+    elif isinstance(value, bool):
+        rank = 8
+    elif isinstance(value, (int, float)):
+        rank = 2
+    elif isinstance(value, str):
+        rank = 3
+    elif isinstance(value, dict):
+        rank = 4
+    elif isinstance(value, (list, tuple)):
+        rank = 5
+    elif isinstance(value, (bytes, bytearray, memoryview)):
+        rank = 6
+    elif type(value).__name__ == "ObjectId":
+        rank = 7
+    elif isinstance(value, datetime):
+        rank = 9
+    elif type(value).__name__ == "Timestamp":
+        rank = 10
+    elif isinstance(value, re.Pattern):
+        rank = 11
+    else:
+        rank = 12
+
+    return rank
+
+
+def compare_values(left: Any, right: Any) -> int:
+    """Compares two values following the BSON comparison order. Returns -1, 0 or 1."""
+
+    left_rank, right_rank = type_rank(left), type_rank(right)
+    if left_rank != right_rank:
+        return -1 if left_rank < right_rank else 1
+
+    if left_rank == 1:
+        output = 0
+    elif left_rank == 4:
+        output = _compare_sequences(
+            [item for pair in left.items() for item in pair],
+            [item for pair in right.items() for item in pair],
+        )
+    elif left_rank == 5:
+        output = _compare_sequences(list(left), list(right))
+    else:
+        try:
+            output = (left > right) - (left < right)
+        except TypeError:
+            output = (str(left) > str(right)) - (str(left) < str(right))
+
+    return output
+
+
+def _compare_sequences(left: list, right: list) -> int:
+    """Compares two sequences element by element"""
+
+    for left_item, right_item in zip(left, right):
+        output = compare_values(left_item, right_item)
+        if output:
+            return output
+
+    return (len(left) > len(right)) - (len(left) < len(right))
+
+
+def sort_key(specification: dict[str, int]) -> Callable[[dict], Any]:
+    """
+    Returns a key function sorting documents according to a $sort specification.
+
+    As in MongoDB, an array is sorted by its smallest element in ascending order
+    and by its largest element in descending order.
+    """
+
+    def compare_documents(left: dict, right: dict) -> int:
+        for path, direction in specification.items():
+            left_value = sort_value(get_path(left, path), direction)
+            right_value = sort_value(get_path(right, path), direction)
+            output = compare_values(left_value, right_value) * direction
+            if output:
+                return output
+        return 0
+
+    return cmp_to_key(compare_documents)
+
+
+def sort_value(value: Any, direction: int) -> Any:
+    """Returns the value used to sort a document"""
+
+    if isinstance(value, list):
+        if not value:
+            return MISSING
+        comparator = cmp_to_key(compare_values)
+        value = min(value, key=comparator) if direction > 0 else max(value, key=comparator)
+
+    return value
@@ -0,0 +1,657 @@
+"""
+Module defining the local evaluator of aggregation pipelines.
+
+The evaluator runs a pipeline against an iterable of python documents, which is useful for tests,
+fixtures and batch processing of exported data. Pipelines are evaluated in their exported form,
+so `Pipeline` instances, lists of stages and raw MongoDB pipelines are all supported.
+
+Usage:
+----------------------------
+    >>> pipeline = Pipeline().match(status="A").group(by="customer", query={"total":{"$sum":"$amount"}})
+    >>> evaluate(pipeline, orders)
+    [{"_id": "alice", "total": 42}, ...]
+
+    >>> evaluate(pipeline, orders, workers=4)  # same results, computed in 4 processes
+
+Parallel evaluation
+----------------------------
+When workers is provided, the input is split into contiguous partitions that are processed in a
+`ProcessPoolExecutor`. Only the streamable prefix of the pipeline (the stages in `STREAMABLE_STAGES`,
+that process documents one at a time) runs in the workers. If that prefix is followed by a $group stage,
+the workers also compute partial accumulator states per group that are merged in the parent process
+(ex: (sum, count) pairs for $avg, positions for $first/$last). The rest of the pipeline runs in the parent process.
+
+NOTE : The documents, the stages and the variables are pickled to be sent to the workers.
+
+"""
+
+# Standard Library imports
+# ----------------------------
+import random
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from itertools import islice
+from typing import Any, Callable, Iterable, Iterator
+
+# Package imports
+# ----------------------------
+from monggregate.base import express
+from monggregate.engine.accumulators import build_reducer
+from monggregate.engine.documents import (
+    MISSING,
+    freeze,
+    get_path,
+    iter_values,
+    set_path,
+    sort_key,
+    unset_path,
+)
+from monggregate.engine.expressions import Variables
+from monggregate.engine.expressions import evaluate as evaluate_value
+from monggregate.engine.indexes import IndexedCollection
+from monggregate.engine.join import hash_join
+from monggregate.engine.query import matches
+from monggregate.stages.lookup import Lookup
+
+StageFunction = Callable[[Iterable[dict], Any, "Context"], Iterable[dict]]
+
+STAGES: dict[str, StageFunction] = {}
+
+# Variables that $redact expressions resolve to
+REDACT_OUTCOMES = ("DESCEND", "PRUNE", "KEEP")
+
+STREAMABLE_STAGES = {
+    "$addFields",
+    "$match",
+    "$project",
+    "$redact",
+    "$replaceRoot",
+    "$replaceWith",
+    "$set",
+    "$unset",
+    "$unwind",
+}
+
+
+def stage(*names: str) -> Callable[[StageFunction], StageFunction]:
+    """Registers a stage implementation under the provided names"""
+
+    def decorator(function: StageFunction) -> StageFunction:
+        for name in names:
+            STAGES[name] = function
+        return function
+
+    return decorator
+
+
+class Context:
+    """
+    Evaluation context shared by the stages of a pipeline.
+
+    Attributes:
+    ----------------------------
+        - collections, dict[str, Iterable[dict]] : documents of the collections referenced by
+                                                   $lookup, $graphLookup and $unionWith stages
+        - variables, dict[str, Any] : variables available to the expressions
+    """
+
+    def __init__(
+        self,
+        collections: dict[str, Iterable[dict]] | None = None,
+        variables: Variables | None = None,
+    ) -> None:
+        self.collections = dict(collections or {})
+        self.variables = dict(variables or {})
+        self.variables.setdefault("NOW", datetime.now(timezone.utc))
+
+    def collection(self, name: str) -> list[dict]:
+        """Returns the documents of a collection"""
+
+        if name not in self.collections:
+            raise ValueError(f"Collection {name} was not provided to the local engine")
+
+        documents = self.collections[name]
+        if isinstance(documents, IndexedCollection):
+            return documents.documents
+        if not isinstance(documents, list):
+            documents = self.collections[name] = list(documents)
+
+        return documents
+
+    def scope(self, document: dict) -> Variables:
+        """Returns the variables to evaluate expressions on document"""
+
+        return self.variables | {"ROOT": document, "CURRENT": document}
+
+    def with_variables(self, variables: Variables) -> "Context":
+        """Returns a child context with additional variables"""
+
+        child = Context(variables=self.variables | variables)
+        child.collections = self.collections
+        return child
+
+
+# Entrypoint
+# ----------------------------
+def evaluate(
+    pipeline: Any,
+    documents: Iterable[dict],
+    *,
+    collections: dict[str, Iterable[dict]] | None = None,
+    variables: Variables | None = None,
+    workers: int | None = None,
+) -> list[dict]:
+    """
+    Evaluates an aggregation pipeline against documents.
+
+    Arguments:
+    ----------------------------
+        - pipeline, Pipeline | list[Stage|dict] : the pipeline to evaluate
+        - documents, Iterable[dict] : the input documents. The indexes of an `IndexedCollection`
+                                      are used for the leading $match and $sort stages
+        - collections, dict[str, Iterable[dict]] | None : documents of the other collections
+                                                          referenced by the pipeline
+        - variables, dict | None : user variables available to the expressions
+        - workers, int | None : number of processes to use. Defaults to None, i.e sequential evaluation
+
+    Returns the output documents.
+    """
+
+    stages = to_stages(pipeline)
+    context = Context(collections=collections, variables=variables)
+    if isinstance(documents, IndexedCollection):
+        stages, documents = documents.plan(stages, context.variables)
+
+    if workers is not None and workers > 1:
+        output = _run_parallel(stages, documents, context, workers)
+    else:
+        output = run(stages, documents, context)
+
+    return list(output)
+
+
+def to_stages(pipeline: Any) -> list[dict]:
+    """Returns the stages of a pipeline in their exported form"""
+
+    stages = express(pipeline)
+    if isinstance(stages, dict):
+        stages = [stages]
+
+    return stages
+
+
+def run(stages: list[dict], documents: Iterable[dict], context: Context) -> Iterable[dict]:
+    """Chains the stages over documents"""
+
+    for statement in stages:
+        ((name, specification),) = statement.items()
+        if name not in STAGES:
+            raise NotImplementedError(f"Stage {name} is not supported by the local engine")
+        documents = STAGES[name](documents, specification, context)
+
+    return documents
+
+
+# Parallel evaluation
+# ----------------------------
+def _run_parallel(
+    stages: list[dict], documents: Iterable[dict], context: Context, workers: int
+) -> Iterable[dict]:
+    """Runs the streamable prefix of the pipeline in a process pool"""
+
+    prefix_length = 0
+    while prefix_length < len(stages) and next(iter(stages[prefix_length])) in STREAMABLE_STAGES:
+        prefix_length += 1
+
+    if not prefix_length:
+        return run(stages, documents, context)
+
+    prefix, rest = stages[:prefix_length], stages[prefix_length:]
+    group: dict | None = None
+    if rest and "$group" in rest[0]:
+        group, rest = rest[0]["$group"], rest[1:]
+
+    documents = list(documents)
+    size = -(-len(documents) // workers) or 1
+    partitions = [documents[start : start + size] for start in range(0, len(documents), size)]
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(_run_partition, prefix, partition, index, group, context.variables)
+            for index, partition in enumerate(partitions)
+        ]
+        results = [future.result() for future in futures]
+
+    if group is None:
+        output: Iterable[dict] = [document for result in results for document in result]
+    else:
+        output = _group_output(group, _merge_group_states(group, results))
+
+    return run(rest, output, context)
+
+
+def _run_partition(
+    prefix: list[dict],
+    documents: list[dict],
+    partition: int,
+    group: dict | None,
+    variables: Variables,
+) -> Any:
+    """Worker function. Runs the prefix and computes partial group states if needed"""
+
+    context = Context(variables=variables)
+    output = run(prefix, documents, context)
+    if group is None:
+        return list(output)
+
+    return _group_states(output, group, context, partition)
+
+
+def _merge_group_states(group: dict, results: list[dict]) -> dict:
+    """Merges the partial group states of consecutive partitions"""
+
+    reducers = _reducers(group)
+    merged: dict = {}
+    for states in results:
+        for key, (group_id, partial) in states.items():
+            if key not in merged:
+                merged[key] = (group_id, partial)
+                continue
+            current = merged[key][1]
+            for field, reducer in reducers.items():
+                current[field] = reducer.merge(current[field], partial[field])
+
+    return merged
+
+
+# Stages
+# ----------------------------
+@stage("$match")
+def _match(documents: Iterable[dict], query: dict, context: Context) -> Iterator[dict]:
+    for document in documents:
+        if matches(document, query, context.variables):
+            yield document
+
+
+@stage("$limit")
+def _limit(documents: Iterable[dict], value: int, context: Context) -> Iterable[dict]:
+    return islice(documents, value)
+
+
+@stage("$skip")
+def _skip(documents: Iterable[dict], value: int, context: Context) -> Iterable[dict]:
+    return islice(documents, value, None)
+
+
+@stage("$sort")
+def _sort(documents: Iterable[dict], specification: dict, context: Context) -> list[dict]:
+    return sorted(documents, key=sort_key(specification))
+
+
+@stage("$sample")
+def _sample(documents: Iterable[dict], specification: dict, context: Context) -> list[dict]:
+    documents = list(documents)
+    return random.sample(documents, min(specification["size"], len(documents)))
+
+
+@stage("$count")
+def _count(documents: Iterable[dict], name: str, context: Context) -> list[dict]:
+    count = sum(1 for _ in documents)
+    return [{name: count}] if count else []
+
+
+@stage("$set", "$addFields")
+def _set(documents: Iterable[dict], specification: dict, context: Context) -> Iterator[dict]:
+    fields = _flatten(specification)
+    for document in documents:
+        output = document
+        scope = context.scope(document)
+        for path, expression in fields.items():
+            value = evaluate_value(expression, scope)
+            output = unset_path(output, path) if value is MISSING else set_path(output, path, value)
+        yield output
+
+
+@stage("$unset")
+def _unset(documents: Iterable[dict], fields: str | list[str], context: Context) -> Iterator[dict]:
+    paths = [fields] if isinstance(fields, str) else fields
+    for document in documents:
+        for path in paths:
+            document = unset_path(document, path)
+        yield document
+
+
+@stage("$project")
+def _project(documents: Iterable[dict], specification: dict, context: Context) -> Iterator[dict]:
+    fields = _flatten(specification)
+    flags = {path: value for path, value in fields.items() if _is_flag(value)}
+    exclusion = bool(fields) and all(
+        path in flags and not flags[path] for path in fields if path != "_id"
+    )
+    if exclusion:
+        excluded = [path for path in fields if not fields[path]]
+        yield from _unset(documents, excluded, context)
+        return
+
+    tree = _tree(fields)
+    include_id = fields.get("_id", True)
+    for document in documents:
+        output = _include(document, tree, context.scope(document))
+        if include_id is True or include_id == 1:
+            if "_id" in document and "_id" not in tree:
+                output = {"_id": document["_id"]} | output
+        yield output
+
+
+@stage("$replaceRoot", "$replaceWith")
+def _replace_root(documents: Iterable[dict], specification: Any, context: Context) -> Iterator[dict]:
+    if isinstance(specification, dict) and "newRoot" in specification:
+        specification = specification["newRoot"]
+    for document in documents:
+        output = evaluate_value(specification, context.scope(document))
+        if not isinstance(output, dict):
+            raise TypeError(f"'newRoot' expression must evaluate to an object, got {output!r}")
+        yield output
+
+
+@stage("$redact")
+def _redact(documents: Iterable[dict], expression: Any, context: Context) -> Iterator[dict]:
+    variables = context.variables | {name: f"$${name}" for name in REDACT_OUTCOMES}
+    for document in documents:
+        output = _redact_level(document, expression, variables | {"ROOT": document})
+        if output is not MISSING:
+            yield output
+
+
+@stage("$unwind")
+def _unwind(documents: Iterable[dict], specification: Any, context: Context) -> Iterator[dict]:
+    if isinstance(specification, str):
+        specification = {"path": specification}
+    path = specification["path"]
+    index_field = specification.get("includeArrayIndex")
+    preserve = specification.get("preserveNullAndEmptyArrays", False)
+
+    for document in documents:
+        value = get_path(document, path)
+        if isinstance(value, list) and value:
+            for index, element in enumerate(value):
+                output = set_path(document, path, element)
+                yield set_path(output, index_field, index) if index_field else output
+        elif value is MISSING or value is None or value == []:
+            if preserve:
+                yield set_path(document, index_field, None) if index_field else document
+        else:
+            yield set_path(document, index_field, None) if index_field else document
+
+
+@stage("$group")
+def _group(documents: Iterable[dict], specification: dict, context: Context) -> list[dict]:
+    states = _group_states(documents, specification, context)
+    return _group_output(specification, states)
+
+
+@stage("$sortByCount")
+def _sort_by_count(documents: Iterable[dict], expression: Any, context: Context) -> list[dict]:
+    groups = _group(documents, {"_id": expression, "count": {"$sum": 1}}, context)
+    return list(_sort(groups, {"count": -1}, context))
+
+
+@stage("$documents")
+def _documents(documents: Iterable[dict], specification: Any, context: Context) -> list[dict]:
+    if isinstance(specification, list):
+        return specification
+    return evaluate_value(specification, context.variables)
+
+
+@stage("$facet")
+def _facet(documents: Iterable[dict], pipelines: dict, context: Context) -> list[dict]:
+    documents = list(documents)
+    return [{name: list(run(pipeline, documents, context)) for name, pipeline in pipelines.items()}]
+
+
+@stage("$lookup")
+def _lookup(documents: Iterable[dict], specification: dict, context: Context) -> Iterator[dict]:
+    foreign = context.collection(specification["from"]) if "from" in specification else []
+    local_field = specification.get("localField")
+    foreign_field = specification.get("foreignField")
+    name = specification["as"]
+    let = specification.get("let") or {}
+    pipeline = specification.get("pipeline")
+
+    if local_field and foreign_field:
+        lookup = Lookup(right=specification.get("from", "$documents"), left_on=local_field, right_on=foreign_field, name=name)
+        if "from" not in specification and let:
+            # The foreign documents are produced by the pipeline in the scope of each local document
+            for document in documents:
+                produced = run(pipeline or [], [], _let(let, document, context))
+                yield from hash_join(lookup, [document], produced)
+            return
+        if "from" not in specification:
+            # The foreign documents are produced by the pipeline itself (ex: a $documents stage)
+            foreign, pipeline = list(run(pipeline or [], [], context)), None
+
+        joined: Iterable[dict] = hash_join(lookup, documents, foreign)
+        if pipeline is None:
+            yield from joined
+            return
+        for document in joined:
+            scope = _let(let, document, context)
+            matched = run(pipeline, get_path(document, name), scope)
+            yield set_path(document, name, list(matched))
+        return
+
+    for document in documents:
+        scope = _let(let, document, context)
+        yield set_path(document, name, list(run(pipeline or [], foreign, scope)))
+
+
+@stage("$graphLookup")
+def _graph_lookup(documents: Iterable[dict], specification: dict, context: Context) -> Iterator[dict]:
+    connect_from_field = specification["connectFromField"]
+    max_depth = specification.get("maxDepth")
+    depth_field = specification.get("depthField")
+    restriction = specification.get("restrictSearchWithMatch") or {}
+
+    # The documents are indexed on connectToField once for all the input documents
+    foreign = [document for document in context.collection(specification["from"]) if matches(document, restriction)]
+    index: dict[Any, list[int]] = {}
+    for position, document in enumerate(foreign):
+        for value in set(map(freeze, iter_values(document, specification["connectToField"]))):
+            index.setdefault(value, []).append(position)
+
+    for document in documents:
+        start = evaluate_value(specification["startWith"], context.scope(document))
+        frontier = start if isinstance(start, list) else [start]
+        searched: set[Any] = set()
+        visited: set[int] = set()
+        traversed: list[dict] = []
+        depth = 0
+        while frontier and (max_depth is None or depth <= max_depth):
+            following: list[Any] = []
+            for value in frontier:
+                key = freeze(value)
+                if value is MISSING or key in searched:
+                    continue
+                searched.add(key)
+                for position in index.get(key, []):
+                    if position in visited:
+                        continue
+                    visited.add(position)
+                    match = foreign[position]
+                    traversed.append(match | {depth_field: depth} if depth_field else match)
+                    connected = get_path(match, connect_from_field)
+                    following.extend(connected if isinstance(connected, list) else [connected])
+            frontier = following
+            depth += 1
+
+        yield set_path(document, specification["as"], traversed)
+
+
+@stage("$unionWith")
+def _union_with(documents: Iterable[dict], specification: Any, context: Context) -> Iterator[dict]:
+    if isinstance(specification, str):
+        specification = {"coll": specification}
+    yield from documents
+    pipeline = specification.get("pipeline") or []
+    source = context.collections.get(specification.get("coll"))  # type: ignore[arg-type]
+    # The sub-pipeline has its own SEARCH_META
+    child = context.with_variables({})
+    if isinstance(source, IndexedCollection):
+        pipeline, foreign = source.plan(pipeline, child.variables)
+    else:
+        foreign = context.collection(specification["coll"]) if "coll" in specification else []
+    yield from run(pipeline, foreign, child)
+
+
+@stage("$vectorSearch", "$search", "$searchMeta")
+def _index_search(documents: Iterable[dict], specification: dict, context: Context) -> Iterable[dict]:
+    raise ValueError(
+        "$vectorSearch, $search and $searchMeta must be the first stage of a pipeline evaluated "
+        "on an IndexedCollection with a vector or search index"
+    )
+
+
+# Helpers
+# ----------------------------
+def _reducers(group: dict) -> dict:
+    """Builds the reducers of the accumulated fields of a $group stage"""
+
+    return {field: build_reducer(spec) for field, spec in group.items() if field != "_id"}
+
+
+def _group_states(
+    documents: Iterable[dict], group: dict, context: Context, partition: int | None = None
+) -> dict:
+    """
+    Computes the accumulator states of each group.
+
+    Returns a mapping between the hashed group keys and (group key, states) pairs, in order of appearance.
+    When partition is provided, positions are (partition, index) pairs so that states of several partitions can be merged.
+    """
+
+    reducers = _reducers(group)
+    states: dict = {}
+    for index, document in enumerate(documents):
+        scope = context.scope(document)
+        group_id = evaluate_value(group.get("_id"), scope)
+        if group_id is MISSING:
+            group_id = None
+        key = freeze(group_id)
+        if key not in states:
+            states[key] = (group_id, {field: reducer.initial() for field, reducer in reducers.items()})
+        current = states[key][1]
+        position = index if partition is None else (partition, index)
+        for field, reducer in reducers.items():
+            current[field] = reducer.step(current[field], reducer.value(scope), position)
+
+    return states
+
+
+def _group_output(group: dict, states: dict) -> list[dict]:
+    """Builds the output documents of a $group stage from the groups states"""
+
+    reducers = _reducers(group)
+    return [
+        {"_id": group_id} | {field: reducers[field].result(state) for field, state in current.items()}
+        for group_id, current in states.values()
+    ]
+
+
+def _let(let: dict, document: dict, context: Context) -> Context:
+    """Returns the context of a $lookup sub-pipeline"""
+
+    scope = context.scope(document)
+    return context.with_variables({name: evaluate_value(expression, scope) for name, expression in let.items()})
+
+
+def _is_flag(value: Any) -> bool:
+    """Returns true if a projection value is an inclusion or exclusion flag"""
+
+    return isinstance(value, (bool, int, float))
+
+
+def _flatten(specification: dict, prefix: str = "") -> dict[str, Any]:
+    """Flattens nested documents of a $project or $set specification into dotted paths"""
+
+    output: dict[str, Any] = {}
+    for key, value in specification.items():
+        path = f"{prefix}{key}"
+        is_nested = (
+            isinstance(value, dict) and value and not any(name.startswith("$") for name in value)
+        )
+        if is_nested:
+            output.update(_flatten(value, prefix=f"{path}."))
+        else:
+            output[path] = value
+
+    return output
+
+
+def _tree(fields: dict[str, Any]) -> dict:
+    """Converts dotted paths back into a tree of projections, leaving out _id exclusion"""
+
+    tree: dict = {}
+    for path, value in fields.items():
+        if path == "_id" and _is_flag(value):
+            continue
+        *parents, leaf = path.split(".")
+        node = tree
+        for parent in parents:
+            node = node.setdefault(parent, _Subtree())
+        node[leaf] = value
+
+    return tree
+
+
+class _Subtree(dict):
+    """Marks nested projections in projection trees"""
+
+
+def _redact_level(document: dict, expression: Any, variables: Variables) -> Any:
+    """Applies a $redact expression to a document and, when it descends, to its embedded documents"""
+
+    outcome = evaluate_value(expression, variables | {"CURRENT": document})
+    if outcome == "$$KEEP":
+        return document
+    if outcome == "$$PRUNE":
+        return MISSING
+    if outcome != "$$DESCEND":
+        raise ValueError(f"$redact's expression should not return anything aside from the variables $$KEEP, $$DESCEND, and $$PRUNE, but returned {outcome!r}")
+
+    output = {}
+    for key, value in document.items():
+        if isinstance(value, dict):
+            value = _redact_level(value, expression, variables)
+        elif isinstance(value, list):
+            value = [
+                _redact_level(element, expression, variables) if isinstance(element, dict) else element
+                for element in value
+            ]
+            value = [element for element in value if element is not MISSING]
+        if value is not MISSING:
+            output[key] = value
+    return output
+
+
+def _include(document: Any, tree: dict, scope: Variables) -> dict:
+    """Applies an inclusion projection tree to a document"""
+
+    output: dict = {}
+    for key, projection in tree.items():
+        value = document.get(key, MISSING) if isinstance(document, dict) else MISSING
+        if isinstance(projection, _Subtree):
+            if isinstance(value, list):
+                output[key] = [_include(element, projection, scope) for element in value if isinstance(element, dict)]
+            else:
+                nested = _include(value if isinstance(value, dict) else {}, projection, scope)
+                if nested or isinstance(value, dict):
+                    output[key] = nested
+        elif _is_flag(projection):
+            if projection and value is not MISSING:
+                output[key] = value
+        else:
+            computed = evaluate_value(projection, scope)
+            if computed is not MISSING:
+                output[key] = computed
+
+    return output
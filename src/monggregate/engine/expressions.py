@@ -0,0 +1,686 @@
+"""
+Module defining the local evaluation of aggregation expressions.
+
+Expressions are evaluated in their exported form (i.e what `express` returns), so that both
+monggregate operators and raw MongoDB expressions are supported.
+
+Supported expressions:
+    * literals, documents and arrays
+    * field paths ("$field.subfield")
+    * variables ("$$ROOT", "$$CURRENT", "$$NOW", "$$REMOVE" and user variables)
+    * the operators registered in `OPERATORS`
+    * $meta, for the metadata of `AnnotatedDocument` inputs (ex: "vectorSearchScore")
+
+"""
+
+# Standard Library imports
+# ----------------------------
+import math
+from datetime import datetime, timezone
+from functools import cmp_to_key
+from typing import Any, Callable
+
+# Package imports
+# ----------------------------
+from monggregate.engine.documents import (
+    MISSING,
+    compare_values,
+    freeze,
+    get_path,
+    sort_key,
+)
+
+Variables = dict[str, Any]
+OperatorFunction = Callable[[Any, Variables], Any]
+
+OPERATORS: dict[str, OperatorFunction] = {}
+
+
+def operator(*names: str) -> Callable[[OperatorFunction], OperatorFunction]:
+    """Registers an operator implementation under the provided names"""
+
+    def decorator(function: OperatorFunction) -> OperatorFunction:
+        for name in names:
+            OPERATORS[name] = function
+        return function
+
+    return decorator
+
+
+# Entrypoints
+# ----------------------------
+def evaluate_expression(
+    expression: Any, document: Any, variables: Variables | None = None
+) -> Any:
+    """
+    Evaluates an aggregation expression against a document.
+
+    Returns MISSING when the expression resolves to a missing field or to $$REMOVE.
+    """
+
+    context = {"ROOT": document, "CURRENT": document}
+    if variables:
+        context.update(variables)
+
+    return evaluate(expression, context)
+
+
+def evaluate(expression: Any, variables: Variables) -> Any:
+    """Evaluates an expression in a context of variables"""
+
+    if isinstance(expression, str):
+        output = _resolve_string(expression, variables)
+    elif isinstance(expression, list):
+        output = [evaluate(element, variables) for element in expression]
+    elif isinstance(expression, dict):
+        first_key = next(iter(expression), "")
+        if len(expression) == 1 and first_key.startswith("$"):
+            if first_key not in OPERATORS:
+                raise NotImplementedError(
+                    f"Operator {first_key} is not supported by the local engine"
+                )
+            output = OPERATORS[first_key](expression[first_key], variables)
+        else:
+            output = {}
+            for key, value in expression.items():
+                evaluated = evaluate(value, variables)
+                if evaluated is not MISSING:
+                    output[key] = evaluated
+    else:
+        output = expression
+
+    return output
+
+
+def is_true(value: Any) -> bool:
+    """Returns the truthiness of value in the aggregation framework sense"""
+
+    return value not in (None, False, 0) and value is not MISSING
+
+
+def _resolve_string(expression: str, variables: Variables) -> Any:
+    """Resolves field paths and variables"""
+
+    if expression.startswith("$$"):
+        name, _, rest = expression[2:].partition(".")
+        if name == "NOW":
+            value: Any = variables.get("NOW") or datetime.now(timezone.utc)
+        elif name == "REMOVE":
+            value = MISSING
+        elif name in variables:
+            value = variables[name]
+        else:
+            raise ValueError(f"Use of undefined variable: {name}")
+        output = get_path(value, rest) if rest else value
+    elif expression.startswith("$"):
+        output = get_path(variables["CURRENT"], expression)
+    else:
+        output = expression
+
+    return output
+
+
+def _arguments(arguments: Any, variables: Variables) -> list[Any]:
+    """Evaluates the arguments of an operator, which can be provided as a single value or a list"""
+
+    if not isinstance(arguments, list):
+        arguments = [arguments]
+
+    return [evaluate(argument, variables) for argument in arguments]
+
+
+def _nullish(value: Any) -> bool:
+    """Returns true if value is null or missing"""
+
+    return value is None or value is MISSING
+
+
+# Literals
+# ----------------------------
+@operator("$literal")
+def _literal(arguments: Any, variables: Variables) -> Any:
+    return arguments
+
+
+@operator("$meta")
+def _meta(arguments: Any, variables: Variables) -> Any:
+    return getattr(variables.get("ROOT"), "metadata", {}).get(arguments, MISSING)
+
+
+# Arithmetic
+# ----------------------------
+@operator("$add")
+def _add(arguments: Any, variables: Variables) -> Any:
+    values = _arguments(arguments, variables)
+    if any(_nullish(value) for value in values):
+        return None
+    return sum(values[1:], start=values[0]) if values else 0
+
+
+@operator("$subtract")
+def _subtract(arguments: Any, variables: Variables) -> Any:
+    left, right = _arguments(arguments, variables)
+    if _nullish(left) or _nullish(right):
+        return None
+    return left - right
+
+
+@operator("$multiply")
+def _multiply(arguments: Any, variables: Variables) -> Any:
+    values = _arguments(arguments, variables)
+    if any(_nullish(value) for value in values):
+        return None
+    return math.prod(values)
+
+
+@operator("$divide")
+def _divide(arguments: Any, variables: Variables) -> Any:
+    left, right = _arguments(arguments, variables)
+    if _nullish(left) or _nullish(right):
+        return None
+    return left / right
+
+
+@operator("$mod")
+def _mod(arguments: Any, variables: Variables) -> Any:
+    left, right = _arguments(arguments, variables)
+    if _nullish(left) or _nullish(right):
+        return None
+    return math.fmod(left, right)
+
+
+@operator("$pow")
+def _pow(arguments: Any, variables: Variables) -> Any:
+    base, exponent = _arguments(arguments, variables)
+    if _nullish(base) or _nullish(exponent):
+        return None
+    return base**exponent
+
+
+def _unary(function: Callable[[Any], Any]) -> OperatorFunction:
+    """Wraps a one argument math function into an operator"""
+
+    def implementation(arguments: Any, variables: Variables) -> Any:
+        (value,) = _arguments(arguments, variables)
+        return None if _nullish(value) else function(value)
+
+    return implementation
+
+
+OPERATORS.update(
+    {
+        "$abs": _unary(abs),
+        "$ceil": _unary(math.ceil),
+        "$floor": _unary(math.floor),
+        "$sqrt": _unary(math.sqrt),
+        "$exp": _unary(math.exp),
+        "$ln": _unary(math.log),
+        "$log10": _unary(math.log10),
+    }
+)
+
+
+@operator("$round")
+def _round(arguments: Any, variables: Variables) -> Any:
+    values = _arguments(arguments, variables)
+    value, place = values[0], values[1] if len(values) > 1 else 0
+    if _nullish(value):
+        return None
+    return round(value, place) if place else round(value)
+
+
+@operator("$trunc")
+def _trunc(arguments: Any, variables: Variables) -> Any:
+    values = _arguments(arguments, variables)
+    value, place = values[0], values[1] if len(values) > 1 else 0
+    if _nullish(value):
+        return None
+    factor = 10**place
+    return math.trunc(value * factor) / factor if place else math.trunc(value)
+
+
+# Comparison
+# ----------------------------
+def _comparison(predicate: Callable[[int], bool]) -> OperatorFunction:
+    """Builds a comparison operator from a predicate on the result of compare_values"""
+
+    def implementation(arguments: Any, variables: Variables) -> Any:
+        left, right = _arguments(arguments, variables)
+        return predicate(compare_values(left, right))
+
+    return implementation
+
+
+OPERATORS.update(
+    {
+        "$eq": _comparison(lambda result: result == 0),
+        "$ne": _comparison(lambda result: result != 0),
+        "$gt": _comparison(lambda result: result > 0),
+        "$gte": _comparison(lambda result: result >= 0),
+        "$lt": _comparison(lambda result: result < 0),
+        "$lte": _comparison(lambda result: result <= 0),
+    }
+)
+
+
+@operator("$cmp")
+def _cmp(arguments: Any, variables: Variables) -> Any:
+    left, right = _arguments(arguments, variables)
+    return compare_values(left, right)
+
+
+# Boolean
+# ----------------------------
+@operator("$and")
+def _and(arguments: Any, variables: Variables) -> Any:
+    return all(is_true(evaluate(argument, variables)) for argument in _as_list(arguments))
+
+
+@operator("$or")
+def _or(arguments: Any, variables: Variables) -> Any:
+    return any(is_true(evaluate(argument, variables)) for argument in _as_list(arguments))
+
+
+@operator("$not")
+def _not(arguments: Any, variables: Variables) -> Any:
+    (value,) = _arguments(arguments, variables)
+    return not is_true(value)
+
+
+def _as_list(arguments: Any) -> list[Any]:
+    """Wraps a single argument in a list"""
+
+    return arguments if isinstance(arguments, list) else [arguments]
+
+
+# Conditional
+# ----------------------------
+@operator("$cond")
+def _cond(arguments: Any, variables: Variables) -> Any:
+    if isinstance(arguments, dict):
+        if_, then, else_ = arguments["if"], arguments["then"], arguments["else"]
+    else:
+        if_, then, else_ = arguments
+
+    return evaluate(then if is_true(evaluate(if_, variables)) else else_, variables)
+
+
+@operator("$ifNull")
+def _if_null(arguments: Any, variables: Variables) -> Any:
+    output: Any = None
+    for argument in arguments:
+        output = evaluate(argument, variables)
+        if not _nullish(output):
+            break
+
+    return output
+
+
+@operator("$switch")
+def _switch(arguments: Any, variables: Variables) -> Any:
+    for branch in arguments["branches"]:
+        if is_true(evaluate(branch["case"], variables)):
+            return evaluate(branch["then"], variables)
+
+    if "default" not in arguments:
+        raise ValueError("$switch could not find a matching branch for an input, and no default was specified.")
+
+    return evaluate(arguments["default"], variables)
+
+
+# Variables
+# ----------------------------
+@operator("$let")
+def _let(arguments: Any, variables: Variables) -> Any:
+    scope = dict(variables)
+    for name, expression in arguments["vars"].items():
+        scope[name] = evaluate(expression, variables)
+
+    return evaluate(arguments["in"], scope)
+
+
+# Arrays
+# ----------------------------
+@operator("$size")
+def _size(arguments: Any, variables: Variables) -> Any:
+    (value,) = _arguments(arguments, variables)
+    if not isinstance(value, list):
+        raise TypeError("The argument to $size must be an array")
+    return len(value)
+
+
+@operator("$isArray")
+def _is_array(arguments: Any, variables: Variables) -> Any:
+    (value,) = _arguments(arguments, variables)
+    return isinstance(value, list)
+
+
+@operator("$in")
+def _in(arguments: Any, variables: Variables) -> Any:
+    value, array = _arguments(arguments, variables)
+    if not isinstance(array, list):
+        raise TypeError("$in requires an array as a second argument")
+    return freeze(value) in {freeze(element) for element in array}
+
+
+@operator("$arrayElemAt")
+def _array_elem_at(arguments: Any, variables: Variables) -> Any:
+    array, index = _arguments(arguments, variables)
+    if _nullish(array):
+        return None
+    try:
+        return array[index]
+    except IndexError:
+        return MISSING
+
+
+def _edge(position: int) -> OperatorFunction:
+    """Builds the $first/$last array operators"""
+
+    def implementation(arguments: Any, variables: Variables) -> Any:
+        (array,) = _arguments(arguments, variables)
+        if _nullish(array):
+            return None
+        return array[position] if array else MISSING
+
+    return implementation
+
+
+OPERATORS.update({"$first": _edge(0), "$last": _edge(-1)})
+
+
+@operator("$concatArrays")
+def _concat_arrays(arguments: Any, variables: Variables) -> Any:
+    arrays = _arguments(arguments, variables)
+    if any(_nullish(array) for array in arrays):
+        return None
+    return [element for array in arrays for element in array]
+
+
+@operator("$slice")
+def _slice(arguments: Any, variables: Variables) -> Any:
+    values = _arguments(arguments, variables)
+    array = values[0]
+    if _nullish(array):
+        return None
+    if len(values) == 2:
+        count = values[1]
+        return array[:count] if count >= 0 else array[count:]
+    position, count = values[1], values[2]
+    return array[position : position + count]
+
+
+@operator("$reverseArray")
+def _reverse_array(arguments: Any, variables: Variables) -> Any:
+    (array,) = _arguments(arguments, variables)
+    return None if _nullish(array) else list(reversed(array))
+
+
+@operator("$filter")
+def _filter(arguments: Any, variables: Variables) -> Any:
+    array = evaluate(arguments["input"], variables)
+    if _nullish(array):
+        return None
+    name = arguments.get("as", "this")
+    output = [
+        element
+        for element in array
+        if is_true(evaluate(arguments["cond"], variables | {name: element}))
+    ]
+    if "limit" in arguments:
+        output = output[: evaluate(arguments["limit"], variables)]
+    return output
+
+
+@operator("$map")
+def _map(arguments: Any, variables: Variables) -> Any:
+    array = evaluate(arguments["input"], variables)
+    if _nullish(array):
+        return None
+    name = arguments.get("as", "this")
+    return [evaluate(arguments["in"], variables | {name: element}) for element in array]
+
+
+@operator("$reduce")
+def _reduce(arguments: Any, variables: Variables) -> Any:
+    array = evaluate(arguments["input"], variables)
+    if _nullish(array):
+        return None
+    value = evaluate(arguments["initialValue"], variables)
+    for element in array:
+        value = evaluate(arguments["in"], variables | {"value": value, "this": element})
+    return value
+
+
+def _extreme_n(reverse: bool) -> OperatorFunction:
+    """Builds the $maxN/$minN array operators"""
+
+    def implementation(arguments: Any, variables: Variables) -> Any:
+        array = evaluate(arguments["input"], variables)
+        n = evaluate(arguments["n"], variables)
+        values = [value for value in array if not _nullish(value)]
+        values.sort(key=cmp_to_key(compare_values), reverse=reverse)
+        return values[:n]
+
+    return implementation
+
+
+OPERATORS.update({"$maxN": _extreme_n(True), "$minN": _extreme_n(False)})
+
+
+# Sets
+# ----------------------------
+def _distinct(array: list[Any]) -> list[Any]:
+    """Returns the distinct elements of an array, in order of first appearance"""
+
+    seen: set[Any] = set()
+    output = []
+    for element in array:
+        key = freeze(element)
+        if key not in seen:
+            seen.add(key)
+            output.append(element)
+    return output
+
+
+def _sets(name: str, arguments: Any, variables: Variables) -> list[Any] | None:
+    """Evaluates the arrays of a set operator, returns None if one of them is null or missing"""
+
+    arrays = _arguments(arguments, variables)
+    if any(_nullish(array) for array in arrays):
+        return None
+    if not all(isinstance(array, list) for array in arrays):
+        raise TypeError(f"All operands of {name} must be arrays")
+    return arrays
+
+
+@operator("$setUnion")
+def _set_union(arguments: Any, variables: Variables) -> Any:
+    arrays = _sets("$setUnion", arguments, variables)
+    return None if arrays is None else _distinct([element for array in arrays for element in array])
+
+
+@operator("$setIntersection")
+def _set_intersection(arguments: Any, variables: Variables) -> Any:
+    arrays = _sets("$setIntersection", arguments, variables)
+    if arrays is None:
+        return None
+    if not arrays:
+        return []
+    others = [{freeze(element) for element in array} for array in arrays[1:]]
+    return [element for element in _distinct(arrays[0]) if all(freeze(element) in other for other in others)]
+
+
+@operator("$setDifference")
+def _set_difference(arguments: Any, variables: Variables) -> Any:
+    arrays = _sets("$setDifference", arguments, variables)
+    if arrays is None:
+        return None
+    left, right = arrays
+    excluded = {freeze(element) for element in right}
+    return [element for element in _distinct(left) if freeze(element) not in excluded]
+
+
+@operator("$setEquals")
+def _set_equals(arguments: Any, variables: Variables) -> Any:
+    arrays = _sets("$setEquals", arguments, variables)
+    if arrays is None:
+        raise TypeError("All operands of $setEquals must be arrays")
+    first, *others = [{freeze(element) for element in array} for array in arrays]
+    return all(other == first for other in others)
+
+
+@operator("$setIsSubset")
+def _set_is_subset(arguments: Any, variables: Variables) -> Any:
+    arrays = _sets("$setIsSubset", arguments, variables)
+    if arrays is None:
+        raise TypeError("Both operands of $setIsSubset must be arrays")
+    left, right = ({freeze(element) for element in array} for array in arrays)
+    return left <= right
+
+
+@operator("$allElementsTrue")
+def _all_elements_true(arguments: Any, variables: Variables) -> Any:
+    (array,) = _arguments(arguments, variables)
+    if not isinstance(array, list):
+        raise TypeError("$allElementsTrue's argument must be an array")
+    return all(is_true(element) for element in array)
+
+
+@operator("$anyElementTrue")
+def _any_element_true(arguments: Any, variables: Variables) -> Any:
+    (array,) = _arguments(arguments, variables)
+    if not isinstance(array, list):
+        raise TypeError("$anyElementTrue's argument must be an array")
+    return any(is_true(element) for element in array)
+
+
+def _operands(arguments: Any, variables: Variables) -> list[Any]:
+    """Returns the operands of the accumulators used as expressions ($sum, $avg, $min, $max)"""
+
+    values = _arguments(arguments, variables)
+    if len(values) == 1 and isinstance(values[0], list):
+        values = values[0]
+    return values
+
+
+def _numbers(values: list[Any]) -> list[Any]:
+    """Filters the numbers out of values (booleans excluded)"""
+
+    return [value for value in values if isinstance(value, (int, float)) and not isinstance(value, bool)]
+
+
+@operator("$sum")
+def _sum(arguments: Any, variables: Variables) -> Any:
+    return sum(_numbers(_operands(arguments, variables)))
+
+
+@operator("$avg")
+def _avg(arguments: Any, variables: Variables) -> Any:
+    numbers = _numbers(_operands(arguments, variables))
+    return sum(numbers) / len(numbers) if numbers else None
+
+
+def _extreme(reverse: bool) -> OperatorFunction:
+    """Builds the $max/$min expression operators"""
+
+    def implementation(arguments: Any, variables: Variables) -> Any:
+        values = [value for value in _operands(arguments, variables) if not _nullish(value)]
+        if not values:
+            return None
+        key = cmp_to_key(compare_values)
+        return max(values, key=key) if reverse else min(values, key=key)
+
+    return implementation
+
+
+OPERATORS.update({"$max": _extreme(True), "$min": _extreme(False)})
+
+
+@operator("$sortArray")
+def _sort_array(arguments: Any, variables: Variables) -> Any:
+    array = evaluate(arguments["input"], variables)
+    if _nullish(array):
+        return None
+    sort_by = arguments["sortBy"]
+    if isinstance(sort_by, dict):
+        return sorted(array, key=sort_key(sort_by))
+    return sorted(array, key=cmp_to_key(compare_values), reverse=sort_by < 0)
+
+
+@operator("$arrayToObject")
+def _array_to_object(arguments: Any, variables: Variables) -> Any:
+    (array,) = _arguments(arguments, variables)
+    if _nullish(array):
+        return None
+    output = {}
+    for element in array:
+        if isinstance(element, dict):
+            output[element["k"]] = element["v"]
+        else:
+            output[element[0]] = element[1]
+    return output
+
+
+@operator("$objectToArray")
+def _object_to_array(arguments: Any, variables: Variables) -> Any:
+    (document,) = _arguments(arguments, variables)
+    if _nullish(document):
+        return None
+    return [{"k": key, "v": value} for key, value in document.items()]
+
+
+@operator("$mergeObjects")
+def _merge_objects(arguments: Any, variables: Variables) -> Any:
+    output: dict = {}
+    for document in _arguments(arguments, variables):
+        if isinstance(document, dict):
+            output.update(document)
+    return output
+
+
+# Strings
+# ----------------------------
+@operator("$concat")
+def _concat(arguments: Any, variables: Variables) -> Any:
+    values = _arguments(arguments, variables)
+    if any(_nullish(value) for value in values):
+        return None
+    return "".join(values)
+
+
+def _string(function: Callable[[str], str]) -> OperatorFunction:
+    """Builds a one argument string operator"""
+
+    def implementation(arguments: Any, variables: Variables) -> Any:
+        (value,) = _arguments(arguments, variables)
+        return "" if _nullish(value) else function(str(value))
+
+    return implementation
+
+
+OPERATORS.update({"$toLower": _string(str.lower), "$toUpper": _string(str.upper)})
+
+
+# Type
+# ----------------------------
+@operator("$type")
+def _type(arguments: Any, variables: Variables) -> Any:
+    (value,) = _arguments(arguments, variables)
+    if value is MISSING:
+        return "missing"
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "bool"
+    if isinstance(value, int):
+        return "int" if -(2**31) <= value < 2**31 else "long"
+    names: dict[type, str] = {
+        float: "double",
+        str: "string",
+        dict: "object",
+        list: "array",
+        bytes: "binData",
+        datetime: "date",
+    }
+    return names.get(type(value), type(value).__name__.lower())
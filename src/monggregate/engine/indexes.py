@@ -0,0 +1,388 @@
+"""
+Module defining the in-memory secondary indexes of the local engine.
+
+Indexes speed up the repeated evaluation of pipelines over the same documents:
+
+    * `HashIndex` maps the values of a field to the documents, for equality ($eq, $in)
+    * `SortedIndex` keeps the values of a field sorted and uses `bisect`, for equality, ranges and sorts
+
+Both indexes are multikey, that is arrays are indexed as a whole and element by element
+as in MongoDB. They are attached to an `IndexedCollection`, which `evaluate` recognizes to use
+them for a leading $match (and $sort) stage instead of scanning all the documents.
+
+Vector indexes (see `monggregate.engine.vector_index`) and search indexes (see `monggregate.engine.search_index`)
+are attached by name, as Atlas Vector Search and Atlas Search indexes, and answer a leading $vectorSearch,
+$search or $searchMeta stage.
+
+Index selection
+----------------------------
+As the server does with the ESR (Equality, Sort, Range) rule, indexes are chosen in the following order:
+
+    1. an index on a field of the query compared by equality
+    2. a sorted, non multikey, index on the field of the following $sort stage, which then doesn't need to run
+    3. a sorted index on a field of the query compared with a range
+
+The whole query is still applied to the documents returned by the index.
+
+Usage:
+----------------------------
+    >>> orders = IndexedCollection(documents)
+    >>> orders.create_index("status")
+    >>> orders.create_index("amount", kind="sorted")
+    >>> evaluate(pipeline, orders)
+
+    >>> orders.create_vector_index("embedding", name="vector_index", kind="hnsw")
+    >>> orders.create_search_index(name="default")
+
+"""
+
+# Standard Library imports
+# ----------------------------
+import re
+from abc import ABC, abstractmethod
+from bisect import bisect_left, bisect_right
+from functools import cmp_to_key
+from typing import Any, Iterable, Iterator, Literal
+
+# Package imports
+# ----------------------------
+from monggregate.engine.documents import AnnotatedDocument, compare_values, freeze, iter_values, type_rank
+from monggregate.engine.query import is_operator_condition, matches
+from monggregate.engine.search_index import SearchIndex
+from monggregate.engine.vector_index import VectorIndex
+
+_RANGE_OPERATORS = {"$gt", "$gte", "$lt", "$lte"}
+
+_key = cmp_to_key(compare_values)
+
+
+class Index(ABC):
+    """
+    Base class of the indexes.
+
+    Attributes:
+    ----------------------------
+        - field, str : the indexed field path
+        - multikey, bool : whether some documents have several values at field (i.e arrays)
+    """
+
+    def __init__(self, field: str, documents: list[dict]) -> None:
+        self.field = field
+        self.multikey = False
+        entries: list[tuple[Any, int]] = []
+        for position, document in enumerate(documents):
+            values = list(iter_values(document, field))
+            if not values:
+                values = [None]
+            if len(values) > 1 or isinstance(values[0], list):
+                self.multikey = True
+            entries.extend((value, position) for value in values)
+        self._build(entries)
+
+    @abstractmethod
+    def _build(self, entries: list[tuple[Any, int]]) -> None:
+        """Builds the index from (value, position) pairs"""
+
+    @abstractmethod
+    def equal(self, value: Any) -> set[int]:
+        """Returns the positions of the documents where field is equal to value"""
+
+    def equal_any(self, values: Iterable[Any]) -> set[int]:
+        """Returns the positions of the documents where field is equal to one of values"""
+
+        output: set[int] = set()
+        for value in values:
+            output |= self.equal(value)
+        return output
+
+
+class HashIndex(Index):
+    """Index for equality"""
+
+    def _build(self, entries: list[tuple[Any, int]]) -> None:
+        self._positions: dict[Any, set[int]] = {}
+        for value, position in entries:
+            self._positions.setdefault(freeze(value), set()).add(position)
+
+    def equal(self, value: Any) -> set[int]:
+        return self._positions.get(freeze(value), set())
+
+
+class SortedIndex(Index):
+    """Index for equality, ranges and sorts"""
+
+    def _build(self, entries: list[tuple[Any, int]]) -> None:
+        entries.sort(key=lambda entry: (_key(entry[0]), entry[1]))
+        self._values = [_key(value) for value, _ in entries]
+        self._ranks = [type_rank(value) for value, _ in entries]
+        self._positions = [position for _, position in entries]
+
+    def equal(self, value: Any) -> set[int]:
+        start = bisect_left(self._values, _key(value))
+        end = bisect_right(self._values, _key(value))
+        return set(self._positions[start:end])
+
+    def range(self, bounds: dict[str, Any]) -> set[int]:
+        """
+        Returns the positions of the documents matching range operators.
+
+        As in MongoDB queries, only the values of the same type bracket as the bounds are matched.
+        """
+
+        ranks = {type_rank(bound) for bound in bounds.values()}
+        if len(ranks) != 1:
+            return set()
+
+        (rank,) = ranks
+        start = bisect_left(self._ranks, rank)
+        end = bisect_right(self._ranks, rank)
+        for name, bound in bounds.items():
+            if name == "$gt":
+                start = max(start, bisect_right(self._values, _key(bound), start, end))
+            elif name == "$gte":
+                start = max(start, bisect_left(self._values, _key(bound), start, end))
+            elif name == "$lt":
+                end = min(end, bisect_left(self._values, _key(bound), start, end))
+            elif name == "$lte":
+                end = min(end, bisect_right(self._values, _key(bound), start, end))
+
+        return set(self._positions[start:end])
+
+    def ordered(self, direction: int) -> list[int]:
+        """Returns the positions of the documents sorted on field, ties being kept in the documents order"""
+
+        if direction > 0:
+            return list(self._positions)
+
+        output: list[int] = []
+        end = len(self._positions)
+        while end:
+            start = bisect_left(self._values, self._values[end - 1], 0, end)
+            output.extend(self._positions[start:end])
+            end = start
+        return output
+
+
+class IndexedCollection:
+    """
+    Documents with in-memory indexes.
+
+    The documents are expected not to change once indexed.
+    """
+
+    def __init__(self, documents: Iterable[dict]) -> None:
+        self.documents = list(documents)
+        self.indexes: dict[str, Index] = {}
+        self.vector_indexes: dict[str, VectorIndex] = {}
+        self.search_indexes: dict[str, SearchIndex] = {}
+
+    def __iter__(self) -> Iterator[dict]:
+        return iter(self.documents)
+
+    def __len__(self) -> int:
+        return len(self.documents)
+
+    def create_index(self, field: str, kind: Literal["hash", "sorted"] = "hash") -> Index:
+        """Creates an index on field, replacing any existing index on this field"""
+
+        if kind == "hash":
+            index: Index = HashIndex(field, self.documents)
+        elif kind == "sorted":
+            index = SortedIndex(field, self.documents)
+        else:
+            raise ValueError(f"Unknown index kind {kind}, expected 'hash' or 'sorted'")
+
+        self.indexes[field] = index
+        return index
+
+    def drop_index(self, field: str) -> None:
+        """Drops the index on field"""
+
+        del self.indexes[field]
+
+    def create_vector_index(self, path: str, name: str = "vector_index", **options: Any) -> VectorIndex:
+        """
+        Creates a vector index on path, named as the Atlas Vector Search index it stands for.
+
+        The options (similarity, kind, m, ef_construction, ef_factor, seed) are passed to `VectorIndex`.
+        """
+
+        index = VectorIndex(self.documents, path, **options)
+        self.vector_indexes[name] = index
+        return index
+
+    def drop_vector_index(self, name: str) -> None:
+        """Drops a vector index"""
+
+        del self.vector_indexes[name]
+
+    def create_search_index(self, name: str = "default", **options: Any) -> SearchIndex:
+        """
+        Creates a search index, named as the Atlas Search index it stands for.
+
+        The options (min_gram, max_gram, k1, b) are passed to `SearchIndex`.
+        """
+
+        index = SearchIndex(self.documents, **options)
+        self.search_indexes[name] = index
+        return index
+
+    def drop_search_index(self, name: str) -> None:
+        """Drops a search index"""
+
+        del self.search_indexes[name]
+
+    def search(self, name: str, specification: dict, variables: dict | None = None) -> list[dict]:
+        """
+        Runs a $search or $searchMeta stage.
+
+        The scores of the $search results are available as {"$meta": "searchScore"}, their pagination tokens
+        as {"$meta": "searchSequenceToken"}, and their metadata (counts and facets) is stored in the SEARCH_META
+        variable. $searchMeta returns the metadata document.
+        """
+
+        index_name = specification.get("index", "default")
+        index = self.search_indexes.get(index_name)
+        if index is None:
+            raise ValueError(f"No search index named {index_name} was created on the collection")
+
+        results, meta = index.run(specification)
+        if name == "$searchMeta":
+            return [meta]
+
+        if variables is not None:
+            variables["SEARCH_META"] = meta
+        return [
+            AnnotatedDocument(document, {"searchScore": score, "searchSequenceToken": token})
+            for score, document, token in results
+        ]
+
+    def vector_search(self, specification: dict) -> list[dict]:
+        """Runs a $vectorSearch stage. The scores of the results are available as {"$meta": "vectorSearchScore"}"""
+
+        name = specification.get("index")
+        index = self.vector_indexes.get(name)  # type: ignore[arg-type]
+        if index is None:
+            raise ValueError(f"No vector index named {name} was created on the collection")
+        if specification.get("path") != index.path:
+            raise ValueError(f"The vector index {name} indexes {index.path}, not {specification.get('path')}")
+
+        results = index.search(
+            specification["queryVector"],
+            specification["limit"],
+            num_candidates=specification.get("numCandidates"),
+            filter=specification.get("filter"),
+            exact=specification.get("exact", False),
+        )
+        return [AnnotatedDocument(document, {"vectorSearchScore": score}) for score, document in results]
+
+    def select_index(self, query: dict, sort: dict | None = None) -> Index | None:
+        """Selects the index to use for query and sort following the ESR rule"""
+
+        equalities, ranges = _predicates(query)
+        for field in equalities:
+            if field in self.indexes:
+                return self.indexes[field]
+
+        if sort and len(sort) == 1:
+            (field,) = sort
+            index = self.indexes.get(field)
+            if isinstance(index, SortedIndex) and not index.multikey:
+                return index
+
+        for field in ranges:
+            if isinstance(self.indexes.get(field), SortedIndex):
+                return self.indexes[field]
+
+        return None
+
+    def plan(self, stages: list[dict], variables: dict | None = None) -> tuple[list[dict], Iterable[dict]]:
+        """
+        Uses the indexes to run the leading $vectorSearch, $search, $searchMeta, or $match and $sort stages.
+
+        Returns the remaining stages and the documents to feed them with.
+        The metadata of $search results is stored in variables (as SEARCH_META).
+        """
+
+        if stages and "$vectorSearch" in stages[0]:
+            return stages[1:], self.vector_search(stages[0]["$vectorSearch"])
+        for name in ("$search", "$searchMeta"):
+            if stages and name in stages[0]:
+                return stages[1:], self.search(name, stages[0][name], variables)
+
+        query: dict = {}
+        sort: dict | None = None
+        consumed = 0
+        if stages and "$match" in stages[0]:
+            query = stages[0]["$match"]
+            consumed = 1
+        if len(stages) > consumed and "$sort" in stages[consumed]:
+            sort = stages[consumed]["$sort"]
+
+        index = self.select_index(query, sort)
+        if index is None:
+            return stages, self.documents
+
+        positions = self._positions(index, query)
+        if (
+            sort is not None
+            and list(sort) == [index.field]
+            and isinstance(index, SortedIndex)
+            and not index.multikey
+        ):
+            ordered = index.ordered(sort[index.field])
+            selected = [position for position in ordered if positions is None or position in positions]
+            consumed += 1
+        else:
+            selected = sorted(positions) if positions is not None else list(range(len(self.documents)))
+
+        documents = (self.documents[position] for position in selected)
+        if query:
+            documents = (document for document in documents if matches(document, query, variables))
+
+        return stages[consumed:], documents
+
+    def _positions(self, index: Index, query: dict) -> set[int] | None:
+        """Returns the candidate positions for query using index, None if the index doesn't restrict them"""
+
+        condition = query.get(index.field)
+        if condition is None and index.field not in query:
+            return None
+
+        if isinstance(condition, re.Pattern):
+            # Regular expressions are matched on the documents, the index only orders them
+            return None
+        if not isinstance(condition, dict) or not is_operator_condition(condition):
+            return index.equal(condition)
+
+        positions: set[int] | None = None
+        if "$eq" in condition:
+            positions = index.equal(condition["$eq"])
+        elif "$in" in condition and not any(isinstance(value, re.Pattern) for value in condition["$in"]):
+            positions = index.equal_any(condition["$in"])
+
+        bounds = {name: value for name, value in condition.items() if name in _RANGE_OPERATORS}
+        if bounds and isinstance(index, SortedIndex):
+            in_range = index.range(bounds)
+            positions = in_range if positions is None else positions & in_range
+
+        return positions
+
+
+def _predicates(query: dict) -> tuple[list[str], list[str]]:
+    """Returns the fields of query compared by equality and the fields compared with a range"""
+
+    equalities: list[str] = []
+    ranges: list[str] = []
+    for field, condition in query.items():
+        if field.startswith("$"):
+            continue
+        if not is_operator_condition(condition):
+            if not isinstance(condition, re.Pattern):
+                equalities.append(field)
+        elif "$eq" in condition or "$in" in condition:
+            equalities.append(field)
+        elif _RANGE_OPERATORS & set(condition):
+            ranges.append(field)
+
+    return equalities, ranges
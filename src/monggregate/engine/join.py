@@ -0,0 +1,334 @@
+"""
+Module defining client-side executors for the $lookup stage.
+
+$lookup can only join collections of the same database on the server.
+The executors below perform the equality join described by a `Lookup` stage
+(local_field/foreign_field form) on the client side, which allows to join data
+living in different databases or even in different clusters.
+
+Two modes are available:
+
+    * `hash_join` joins two in-memory iterables of documents. It builds a hash table on the
+      smaller side and streams the other one.
+
+    * `CollectionJoin` joins in-memory documents with a live collection (any object exposing
+      a pymongo-like `find` method). It batches the local keys into `$in` queries, runs the
+      batches concurrently and caches the foreign documents per key, so that N local documents
+      cost about N / batch_size round trips instead of N.
+
+Both modes follow $lookup semantics:
+
+    * When the local field is an array, its elements are matched against the foreign field.
+    * When the foreign field is an array, its elements match as well as the array as a whole.
+    * When the local field is missing or null, it matches foreign documents where the
+      foreign field is missing or null.
+    * The matches are stored in an array under the `as` field, in the foreign documents order.
+
+"""
+
+# Standard Library imports
+# ----------------------------
+from collections import OrderedDict
+from collections.abc import Sized
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Any, Iterable, Iterator, Protocol, runtime_checkable
+
+# Package imports
+# ----------------------------
+from monggregate.engine.documents import MISSING, freeze, get_path, iter_values, set_path
+from monggregate.stages.lookup import Lookup, LookupTypeEnum
+
+
+@runtime_checkable
+class FindableCollection(Protocol):
+    """Protocol of the collections supported by `CollectionJoin` (ex: pymongo.collection.Collection)"""
+
+    def find(self, filter: dict, projection: Any = None) -> Iterable[dict]:
+        """Returns the documents matching filter"""
+
+
+# Helpers
+# ----------------------------
+def _join_fields(lookup: Lookup) -> tuple[str, str, str]:
+    """Returns the local field, the foreign field and the output field of a lookup"""
+
+    if lookup.type_ != LookupTypeEnum.SIMPLE or not (lookup.left_on and lookup.right_on):
+        raise ValueError(
+            "Client-side joins only support the local_field/foreign_field form of $lookup"
+        )
+
+    return lookup.left_on, lookup.right_on, lookup.name
+
+
+def _local_keys(document: dict, path: str) -> list[Any]:
+    """Returns the raw values of a local document to look up, null when the field is missing"""
+
+    value = get_path(document, path)
+    if value is MISSING:
+        values = [None]
+    elif isinstance(value, list):
+        values = value
+    else:
+        values = [value]
+
+    return values
+
+
+def _foreign_keys(document: dict, path: str) -> set[Any]:
+    """Returns the hashed values under which a foreign document can be matched"""
+
+    keys = {freeze(value) for value in iter_values(document, path)}
+    return keys or {None}
+
+
+# Local mode
+# ----------------------------
+def hash_join(
+    lookup: Lookup, documents: Iterable[dict], foreign: Iterable[dict]
+) -> list[dict]:
+    """
+    Performs the lookup between two iterables of documents.
+
+    The hash table is built on the smaller side. When the size of foreign cannot be known
+    (ex: a generator), the table is built on documents and foreign is streamed.
+
+    Arguments:
+    ---------------------------
+        - lookup, Lookup : the lookup stage describing the join
+        - documents, Iterable[dict] : the local documents
+        - foreign, Iterable[dict] : the documents of the "joined" collection
+
+    Returns the local documents, in order, with the matches added under the `as` field.
+    """
+
+    local_field, foreign_field, name = _join_fields(lookup)
+    documents = list(documents)
+
+    if isinstance(foreign, Sized) and len(foreign) < len(documents):
+        matches = _build_foreign(documents, foreign, local_field, foreign_field)
+    else:
+        matches = _build_local(documents, foreign, local_field, foreign_field)
+
+    return [set_path(doc, name, found) for doc, found in zip(documents, matches)]
+
+
+def _build_local(
+    documents: list[dict], foreign: Iterable[dict], local_field: str, foreign_field: str
+) -> list[list[dict]]:
+    """Hashes the local documents and streams the foreign ones"""
+
+    table: dict[Any, list[int]] = {}
+    for position, doc in enumerate(documents):
+        for key in {freeze(value) for value in _local_keys(doc, local_field)}:
+            table.setdefault(key, []).append(position)
+
+    matches: list[list[dict]] = [[] for _ in documents]
+    for foreign_doc in foreign:
+        positions = {
+            position
+            for key in _foreign_keys(foreign_doc, foreign_field)
+            for position in table.get(key, ())
+        }
+        for position in positions:
+            matches[position].append(foreign_doc)
+
+    return matches
+
+
+def _build_foreign(
+    documents: list[dict], foreign: Iterable[dict], local_field: str, foreign_field: str
+) -> list[list[dict]]:
+    """Hashes the foreign documents and streams the local ones"""
+
+    foreign = list(foreign)
+    table: dict[Any, list[int]] = {}
+    for position, foreign_doc in enumerate(foreign):
+        for key in _foreign_keys(foreign_doc, foreign_field):
+            table.setdefault(key, []).append(position)
+
+    matches: list[list[dict]] = []
+    for doc in documents:
+        positions = {
+            position
+            for value in _local_keys(doc, local_field)
+            for position in table.get(freeze(value), ())
+        }
+        matches.append([foreign[position] for position in sorted(positions)])
+
+    return matches
+
+
+# Live mode
+# ----------------------------
+class CollectionJoin:
+    """
+    Performs a lookup against a live collection using batched `$in` queries.
+
+    Attributes:
+    ---------------------------
+        - lookup, Lookup : the lookup stage describing the join
+        - collection, FindableCollection : the "joined" collection. Can live in another database or cluster.
+        - batch_size, int : maximum number of keys per `$in` query. Defaults to 1000.
+        - max_workers, int : number of queries run concurrently. Defaults to 4.
+        - cache_size, int | None : maximum number of keys kept in the cache.
+                                   None (default) keeps all of them, 0 disables the cache.
+        - projection, dict | None : projection applied to the foreign documents.
+                                    The foreign field is always kept as it is needed to dispatch the matches.
+
+    The cache is kept between calls to `join`, so that a same executor can be reused on successive
+    batches of local documents. Keys without matches are cached as well.
+
+    Usage:
+    ---------------------------
+        >>> join = CollectionJoin(lookup, other_client["db"]["orders"], batch_size=500)
+        >>> for document in join(customers):
+        ...     ...
+
+    """
+
+    def __init__(
+        self,
+        lookup: Lookup,
+        collection: FindableCollection,
+        *,
+        batch_size: int = 1000,
+        max_workers: int = 4,
+        cache_size: int | None = None,
+        projection: dict | None = None,
+    ) -> None:
+        if batch_size < 1:
+            raise ValueError("batch_size must be a positive integer")
+        if max_workers < 1:
+            raise ValueError("max_workers must be a positive integer")
+
+        self.lookup = lookup
+        self.local_field, self.foreign_field, self.name = _join_fields(lookup)
+        self.collection = collection
+        self.batch_size = batch_size
+        self.max_workers = max_workers
+        self.cache_size = cache_size
+        self.projection = projection
+        if projection and any(bool(value) for value in projection.values()):
+            self.projection = projection | {self.foreign_field: 1}
+
+        self._cache: OrderedDict[Any, list[dict]] = OrderedDict()
+
+    def __call__(self, documents: Iterable[dict]) -> Iterator[dict]:
+        """Makes the executor callable, see join"""
+
+        return self.join(documents)
+
+    def join(self, documents: Iterable[dict]) -> Iterator[dict]:
+        """
+        Lazily yields the local documents with their matches added under the `as` field.
+
+        The local documents are consumed by chunks of batch_size * max_workers documents
+        so that the memory footprint stays bounded on large inputs.
+        """
+
+        iterator = iter(documents)
+        chunk_size = self.batch_size * self.max_workers
+        while chunk := list(islice(iterator, chunk_size)):
+            keys = [_local_keys(doc, self.local_field) for doc in chunk]
+            matches = self._resolve([value for values in keys for value in values])
+            for doc, values in zip(chunk, keys):
+                yield set_path(doc, self.name, self._collect(values, matches))
+
+    def clear_cache(self) -> None:
+        """Empties the key cache"""
+
+        self._cache.clear()
+
+    # Internals
+    # ----------------------------
+    def _resolve(self, values: list[Any]) -> dict[Any, list[dict]]:
+        """Returns the foreign documents of each value, querying the ones that are not cached"""
+
+        resolved: dict[Any, list[dict]] = {}
+        to_query: dict[Any, Any] = {}
+        for value in values:
+            key = freeze(value)
+            if key in resolved or key in to_query:
+                continue
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                resolved[key] = self._cache[key]
+            else:
+                to_query[key] = value
+
+        batches = [
+            list(islice(to_query.values(), start, start + self.batch_size))
+            for start in range(0, len(to_query), self.batch_size)
+        ]
+        if len(batches) > 1 and self.max_workers > 1:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                results = list(executor.map(self._find, batches))
+        else:
+            results = [self._find(batch) for batch in batches]
+
+        for key in to_query:
+            resolved[key] = []
+        for batch_results in results:
+            for foreign_doc in batch_results:
+                for key in _foreign_keys(foreign_doc, self.foreign_field):
+                    if key in to_query:
+                        resolved[key].append(foreign_doc)
+
+        for key in to_query:
+            self._store(key, resolved[key])
+
+        return resolved
+
+    def _find(self, values: list[Any]) -> list[dict]:
+        """Runs one $in query"""
+
+        query = {self.foreign_field: {"$in": values}}
+        return list(self.collection.find(query, self.projection))
+
+    def _store(self, key: Any, documents: list[dict]) -> None:
+        """Adds an entry to the cache, evicting the least recently used ones if needed"""
+
+        if self.cache_size == 0:
+            return
+
+        self._cache[key] = documents
+        if self.cache_size is not None:
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    @staticmethod
+    def _collect(values: list[Any], matches: dict[Any, list[dict]]) -> list[dict]:
+        """Gathers the matches of the values of a local document, without duplicates"""
+
+        output: list[dict] = []
+        seen: set[Any] = set()
+        for value in values:
+            for foreign_doc in matches[freeze(value)]:
+                identity = freeze(foreign_doc.get("_id", id(foreign_doc)))
+                if identity not in seen:
+                    seen.add(identity)
+                    output.append(foreign_doc)
+
+        return output
+
+
+def join(
+    lookup: Lookup,
+    documents: Iterable[dict],
+    foreign: Iterable[dict] | FindableCollection,
+    **kwargs: Any,
+) -> list[dict]:
+    """
+    Performs the lookup on the client side.
+
+    Dispatches to `CollectionJoin` when foreign is a collection (i.e has a find method)
+    and to `hash_join` otherwise. kwargs are forwarded to `CollectionJoin`.
+    """
+
+    if isinstance(foreign, FindableCollection):
+        output = list(CollectionJoin(lookup, foreign, **kwargs).join(documents))
+    else:
+        output = hash_join(lookup, documents, foreign)
+
+    return output
@@ -0,0 +1,201 @@
+"""
+Module defining the local evaluation of MongoDB queries, as used in $match.
+
+Supported query operators:
+    * logical : $and, $or, $nor, $not, $expr
+    * comparison : $eq, $ne, $gt, $gte, $lt, $lte, $in, $nin
+    * element : $exists, $type (by alias)
+    * evaluation : $regex (and $options), $mod
+    * array : $all, $elemMatch, $size
+
+As in MongoDB, comparison operators only match values of the same type bracket
+(i.e a number is never greater than a string).
+
+"""
+
+# Standard Library imports
+# ----------------------------
+import re
+from typing import Any, Callable
+
+# Package imports
+# ----------------------------
+from monggregate.engine.documents import compare_values, freeze, iter_values, type_rank
+from monggregate.engine.expressions import Variables, evaluate_expression, is_true
+
+
+def matches(document: dict, query: dict, variables: Variables | None = None) -> bool:
+    """Returns true if document matches query"""
+
+    for key, condition in query.items():
+        if key == "$and":
+            matched = all(matches(document, clause, variables) for clause in condition)
+        elif key == "$or":
+            matched = any(matches(document, clause, variables) for clause in condition)
+        elif key == "$nor":
+            matched = not any(matches(document, clause, variables) for clause in condition)
+        elif key == "$expr":
+            matched = is_true(evaluate_expression(condition, document, variables))
+        elif key.startswith("$"):
+            raise NotImplementedError(f"Query operator {key} is not supported by the local engine")
+        else:
+            matched = match_values(list(iter_values(document, key)), condition)
+
+        if not matched:
+            return False
+
+    return True
+
+
+def is_operator_condition(condition: Any) -> bool:
+    """Returns true if condition is made of query operators (ex: {"$gt":1}) rather than a value"""
+
+    return (
+        isinstance(condition, dict)
+        and bool(condition)
+        and all(key.startswith("$") for key in condition)
+    )
+
+
+def match_values(values: list[Any], condition: Any) -> bool:
+    """Returns true if the values found at a path match condition"""
+
+    if is_operator_condition(condition):
+        return all(
+            _match_operator(values, name, argument, condition)
+            for name, argument in condition.items()
+            if name != "$options"
+        )
+
+    return _equals(values, condition)
+
+
+# Operators
+# ----------------------------
+def _equals(values: list[Any], argument: Any) -> bool:
+    """Implements $eq"""
+
+    if isinstance(argument, re.Pattern):
+        return any(isinstance(value, str) and argument.search(value) for value in values)
+
+    if argument is None and not values:
+        return True
+
+    key = freeze(argument)
+    return any(freeze(value) == key for value in values)
+
+
+def _compare(values: list[Any], argument: Any, predicate: Callable[[int], bool]) -> bool:
+    """Implements the range operators, restricted to values of the same type bracket"""
+
+    rank = type_rank(argument)
+    return any(
+        type_rank(value) == rank and predicate(compare_values(value, argument))
+        for value in values
+    )
+
+
+def _in(values: list[Any], argument: list[Any]) -> bool:
+    """Implements $in"""
+
+    return any(_equals(values, element) for element in argument)
+
+
+def _regex(values: list[Any], pattern: Any, options: str = "") -> bool:
+    """Implements $regex"""
+
+    if not isinstance(pattern, re.Pattern):
+        flags = 0
+        for option, flag in {"i": re.I, "m": re.M, "s": re.S, "x": re.X}.items():
+            if option in options:
+                flags |= flag
+        pattern = re.compile(pattern, flags)
+
+    return _equals(values, pattern)
+
+
+def _elem_match(values: list[Any], condition: dict) -> bool:
+    """Implements $elemMatch"""
+
+    for value in values:
+        if not isinstance(value, list):
+            continue
+        for element in value:
+            if is_operator_condition(condition):
+                if match_values([element], condition):
+                    return True
+            elif isinstance(element, dict) and matches(element, condition):
+                return True
+
+    return False
+
+
+_TYPE_ALIASES: dict[str, int] = {
+    "null": 1,
+    "double": 2,
+    "int": 2,
+    "long": 2,
+    "decimal": 2,
+    "number": 2,
+    "string": 3,
+    "object": 4,
+    "array": 5,
+    "binData": 6,
+    "objectId": 7,
+    "bool": 8,
+    "date": 9,
+    "timestamp": 10,
+    "regex": 11,
+}
+
+
+def _type(values: list[Any], alias: str | list[str]) -> bool:
+    """Implements $type with string aliases"""
+
+    aliases = alias if isinstance(alias, list) else [alias]
+    ranks = {_TYPE_ALIASES[name] for name in aliases}
+    return any(type_rank(value) in ranks for value in values)
+
+
+def _match_operator(values: list[Any], name: str, argument: Any, condition: dict) -> bool:
+    """Dispatches a query operator"""
+
+    if name == "$eq":
+        matched = _equals(values, argument)
+    elif name == "$ne":
+        matched = not _equals(values, argument)
+    elif name == "$gt":
+        matched = _compare(values, argument, lambda result: result > 0)
+    elif name == "$gte":
+        matched = _compare(values, argument, lambda result: result >= 0)
+    elif name == "$lt":
+        matched = _compare(values, argument, lambda result: result < 0)
+    elif name == "$lte":
+        matched = _compare(values, argument, lambda result: result <= 0)
+    elif name == "$in":
+        matched = _in(values, argument)
+    elif name == "$nin":
+        matched = not _in(values, argument)
+    elif name == "$exists":
+        matched = bool(values) == bool(argument)
+    elif name == "$regex":
+        matched = _regex(values, argument, condition.get("$options", ""))
+    elif name == "$not":
+        matched = not match_values(values, argument)
+    elif name == "$size":
+        matched = any(isinstance(value, list) and len(value) == argument for value in values)
+    elif name == "$all":
+        matched = all(_equals(values, element) for element in argument)
+    elif name == "$elemMatch":
+        matched = _elem_match(values, argument)
+    elif name == "$mod":
+        divisor, remainder = argument
+        matched = any(
+            type_rank(value) == 2 and int(value) % divisor == remainder for value in values
+        )
+    elif name == "$type":
+        matched = _type(values, argument)
+    else:
+        raise NotImplementedError(f"Query operator {name} is not supported by the local engine")
+
+    return matched
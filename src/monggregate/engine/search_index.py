@@ -0,0 +1,741 @@
+"""
+Module defining the in-memory full-text indexes of the local engine, a stand-in for Atlas Search indexes.
+
+A `SearchIndex` evaluates the $search and $searchMeta stages in their exported form. The fields are indexed
+dynamically, the first time an operator references them:
+
+    * the text indexes tokenize the string values (lower cased words) and keep the positions of the tokens
+    * the autocomplete indexes are made of the edge n-grams of the tokens (edgeGram tokenization)
+
+Supported operators
+----------------------------
+    * text : BM25 scoring, fuzzy matching (bounded Damerau-Levenshtein distance) with maxEdits,
+             prefixLength and maxExpansions
+    * autocomplete : BM25 scoring of the edge n-grams, tokenOrder "any" and "sequential", fuzzy matching
+    * regex, wildcard : matched against the whole string values (or the tokens when allowAnalyzedField is true)
+    * phrase : BM25 scoring of the documents containing the tokens in order, at most slop positions apart
+    * equals, in, range, exists
+    * near : pivot / (pivot + distance) scoring of numbers, dates (distance in milliseconds)
+             and GeoJSON points (distance in meters)
+    * compound : must, mustNot, should (with minimumShouldMatch) and filter clauses
+
+Each operator can modify its scores with the boost and constant score options.
+The facet collector computes string, number and date facets over the matching documents.
+
+The results can be sorted by the sort option (fields or score, with the noData option) and paginated with
+searchAfter and searchBefore. The tokens, exposed as {"$meta": "searchSequenceToken"}, reference the results
+by their position in the index rather than by their sort values as Atlas Search does.
+
+NOTE : The scores follow the same principles as Atlas Search (Lucene) but are not expected to be identical.
+Regular expressions use the python syntax, which covers the Lucene one for common patterns.
+
+Usage:
+----------------------------
+    >>> movies = IndexedCollection(documents)
+    >>> movies.create_search_index()
+    >>> evaluate(Pipeline().search(path="title", query="star wars").limit(10), movies)
+
+"""
+
+# Standard Library imports
+# ----------------------------
+import base64
+import binascii
+import math
+import re
+from datetime import datetime
+from functools import cmp_to_key
+from typing import Any, Callable, Iterable
+
+# Package imports
+# ----------------------------
+from monggregate.engine.documents import MISSING, compare_values, get_path, iter_values, sort_value, type_rank
+
+SearchOperatorFunction = Callable[["SearchIndex", dict], dict[int, float]]
+
+SEARCH_OPERATORS: dict[str, SearchOperatorFunction] = {}
+
+# Options of the $search and $searchMeta stages, the other keys being the operator or the collector
+SEARCH_OPTIONS = {
+    "index",
+    "highlight",
+    "count",
+    "returnStoredSource",
+    "scoreDetails",
+    "concurrent",
+    "sort",
+    "searchAfter",
+    "searchBefore",
+}
+
+_TOKEN = re.compile(r"\w+")
+
+# Mean radius of the Earth in meters, used for the distances between GeoJSON points
+_EARTH_RADIUS = 6_371_008.8
+
+
+def search_operator(*names: str) -> Callable[[SearchOperatorFunction], SearchOperatorFunction]:
+    """Registers a search operator implementation under the provided names"""
+
+    def decorator(function: SearchOperatorFunction) -> SearchOperatorFunction:
+        for name in names:
+            SEARCH_OPERATORS[name] = function
+        return function
+
+    return decorator
+
+
+# Analysis
+# ----------------------------
+def tokenize(text: str) -> list[str]:
+    """Splits a text into lower cased words, as the standard analyzer does"""
+
+    return [token.lower() for token in _TOKEN.findall(text)]
+
+
+def edit_distance(left: str, right: str, bound: int) -> int:
+    """
+    Returns the Damerau-Levenshtein (optimal string alignment) distance between two strings,
+    or bound + 1 as soon as the distance is known to exceed bound.
+    """
+
+    if abs(len(left) - len(right)) > bound:
+        return bound + 1
+
+    previous: list[int] = []
+    current = list(range(len(right) + 1))
+    for i, left_char in enumerate(left, start=1):
+        before, previous, current = previous, current, [i] + [0] * len(right)
+        for j, right_char in enumerate(right, start=1):
+            cost = left_char != right_char
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if i > 1 and j > 1 and left_char == right[j - 2] and left[i - 2] == right_char:
+                current[j] = min(current[j], before[j - 2] + 1)
+        if min(current) > bound:
+            return bound + 1
+
+    return current[-1] if current[-1] <= bound else bound + 1
+
+
+class FieldIndex:
+    """
+    Inverted index of the tokens of a field.
+
+    Attributes:
+    ----------------------------
+        - tokens, list[list[str]] : the tokens of each document, in order
+        - postings, dict[str, dict[int, int]] : the number of occurrences of each token in each document
+    """
+
+    def __init__(self, tokens: list[list[str]], k1: float, b: float) -> None:
+        self.tokens = tokens
+        self.k1 = k1
+        self.b = b
+        self.postings: dict[str, dict[int, int]] = {}
+        for node, document_tokens in enumerate(tokens):
+            for token in document_tokens:
+                occurrences = self.postings.setdefault(token, {})
+                occurrences[node] = occurrences.get(node, 0) + 1
+
+        indexed = [len(document_tokens) for document_tokens in tokens if document_tokens]
+        self.documents_count = len(indexed)
+        self.average_length = sum(indexed) / len(indexed) if indexed else 0.0
+
+    def bm25(self, term: str) -> dict[int, float]:
+        """Returns the BM25 scores of the documents containing term"""
+
+        occurrences = self.postings.get(term, {})
+        if not occurrences:
+            return {}
+
+        frequency = len(occurrences)
+        idf = math.log(1 + (self.documents_count - frequency + 0.5) / (frequency + 0.5))
+        scores = {}
+        for node, count in occurrences.items():
+            norm = 1 - self.b + self.b * len(self.tokens[node]) / self.average_length
+            scores[node] = idf * count * (self.k1 + 1) / (count + self.k1 * norm)
+
+        return scores
+
+    def expand(self, term: str, fuzzy: dict | None) -> list[tuple[str, float]]:
+        """
+        Returns the indexed terms matching term with their weights.
+
+        Without fuzzy options, only term itself matches. Otherwise, the terms sharing the first prefixLength characters
+        of term within maxEdits edits match, the closest maxExpansions ones being kept.
+        Their weights decrease with their distance to term.
+        """
+
+        if not fuzzy:
+            return [(term, 1.0)]
+
+        max_edits = min(fuzzy.get("maxEdits", 2), 2)
+        prefix = term[: fuzzy.get("prefixLength", 0)]
+        matches: list[tuple[int, str]] = []
+        for candidate in self.postings:
+            if candidate.startswith(prefix):
+                distance = edit_distance(term, candidate, max_edits)
+                if distance <= max_edits:
+                    matches.append((distance, candidate))
+
+        matches.sort()
+        return [
+            (candidate, 1 - distance / (len(term) + 1))
+            for distance, candidate in matches[: fuzzy.get("maxExpansions", 50)]
+        ]
+
+    def score(self, term: str, fuzzy: dict | None = None) -> dict[int, float]:
+        """Returns the scores of the documents matching term, keeping the best expansion of each document"""
+
+        scores: dict[int, float] = {}
+        for expansion, weight in self.expand(term, fuzzy):
+            for node, score in self.bm25(expansion).items():
+                scores[node] = max(scores.get(node, 0.0), score * weight)
+
+        return scores
+
+
+class SearchIndex:
+    """
+    In-memory stand-in for an Atlas Search index with dynamic mappings.
+
+    Attributes:
+    ----------------------------
+        - documents, list[dict] : the indexed documents
+        - min_gram, int : minimum length of the edge n-grams of the autocomplete indexes. Defaults to 2.
+        - max_gram, int : maximum length of the edge n-grams of the autocomplete indexes. Defaults to 15.
+        - k1, float : BM25 term frequency saturation. Defaults to 1.2.
+        - b, float : BM25 length normalization. Defaults to 0.75.
+    """
+
+    def __init__(
+        self,
+        documents: Iterable[dict],
+        *,
+        min_gram: int = 2,
+        max_gram: int = 15,
+        k1: float = 1.2,
+        b: float = 0.75,
+    ) -> None:
+        if not 0 < min_gram <= max_gram:
+            raise ValueError("min_gram must be positive and less than or equal to max_gram")
+
+        self.documents = list(documents)
+        self.min_gram = min_gram
+        self.max_gram = max_gram
+        self.k1 = k1
+        self.b = b
+        self._text: dict[str, FieldIndex] = {}
+        self._autocomplete: dict[str, FieldIndex] = {}
+
+    def __len__(self) -> int:
+        return len(self.documents)
+
+    # Fields
+    # ----------------------------
+    def values(self, node: int, path: str) -> list[Any]:
+        """Returns the scalar values found at path in a document (arrays are flattened)"""
+
+        return [value for value in iter_values(self.documents[node], path) if not isinstance(value, (list, dict))]
+
+    def strings(self, node: int, path: str) -> list[str]:
+        """Returns the strings found at path in a document"""
+
+        return [value for value in self.values(node, path) if isinstance(value, str)]
+
+    def text_field(self, path: str) -> FieldIndex:
+        """Returns the text index of a field, built on first use"""
+
+        if path not in self._text:
+            tokens = [
+                [token for value in self.strings(node, path) for token in tokenize(value)]
+                for node in range(len(self.documents))
+            ]
+            self._text[path] = FieldIndex(tokens, self.k1, self.b)
+
+        return self._text[path]
+
+    def autocomplete_field(self, path: str) -> FieldIndex:
+        """Returns the autocomplete (edge n-grams) index of a field, built on first use"""
+
+        if path not in self._autocomplete:
+            grams = [
+                [
+                    token[:size]
+                    for token in document_tokens
+                    for size in range(self.min_gram, min(len(token), self.max_gram) + 1)
+                ]
+                for document_tokens in self.text_field(path).tokens
+            ]
+            self._autocomplete[path] = FieldIndex(grams, self.k1, self.b)
+
+        return self._autocomplete[path]
+
+    # Evaluation
+    # ----------------------------
+    def run(self, specification: dict) -> tuple[list[tuple[float, dict, str]], dict]:
+        """
+        Runs the specification of a $search or $searchMeta stage.
+
+        Returns the matching documents with their scores and pagination tokens, in the order of the sort option
+        (best first by default), and the metadata of the results (i.e the value of $$SEARCH_META).
+        """
+
+        if specification.get("highlight"):
+            raise NotImplementedError("highlight is not supported by the local engine")
+
+        collector = specification.get("facet")
+        if collector is not None:
+            operator = collector.get("operator")
+        else:
+            names = [key for key in specification if key not in SEARCH_OPTIONS]
+            if len(names) != 1:
+                raise ValueError(f"A search stage requires exactly one operator or collector, got {names}")
+            operator = {names[0]: specification[names[0]]}
+
+        scores = self.evaluate(operator) if operator else dict.fromkeys(range(len(self.documents)), 0.0)
+        ranked = sorted(scores.items(), key=lambda entry: (-entry[1], entry[0]))
+
+        count = specification.get("count") or {}
+        meta: dict[str, Any] = {"count": {count.get("type", "lowerBound"): len(ranked)}}
+        if collector is not None:
+            meta["facet"] = self.facets([node for node, _ in ranked], collector.get("facets", {}))
+
+        if specification.get("sort"):
+            ranked.sort(key=self._sort_key(specification["sort"]))
+        ranked = _paginate(ranked, specification.get("searchAfter"), specification.get("searchBefore"))
+
+        return [(score, self.documents[node], _sequence_token(node)) for node, score in ranked], meta
+
+    def _sort_key(self, sort: dict[str, Any]) -> Callable[[tuple[int, float]], Any]:
+        """Returns a key function sorting the (node, score) results according to the sort option of $search"""
+
+        def compare_results(left: tuple[int, float], right: tuple[int, float]) -> int:
+            for path, order in sort.items():
+                options = order if isinstance(order, dict) else {"order": order}
+                if "$meta" in options:
+                    direction = options.get("order", -1)
+                    output = compare_values(left[1], right[1]) * direction
+                else:
+                    direction = options["order"]
+                    output = self._compare_sort_values(left[0], right[0], path, direction, options.get("noData"))
+                if output:
+                    return output
+            return compare_values(right[1], left[1]) or left[0] - right[0]
+
+        return cmp_to_key(compare_results)
+
+    def _compare_sort_values(self, left: int, right: int, path: str, direction: int, no_data: str | None) -> int:
+        """Compares the values of path in two documents. Missing and null values sort lowest unless noData is highest"""
+
+        values = [sort_value(get_path(self.documents[node], path), direction) for node in (left, right)]
+        missing = [value is MISSING or value is None for value in values]
+        if missing[0] or missing[1]:
+            output = (missing[1] - missing[0]) * (-1 if no_data == "highest" else 1)
+            return output * direction
+
+        return compare_values(values[0], values[1]) * direction
+
+    def evaluate(self, operator: dict) -> dict[int, float]:
+        """Returns the scores of the documents matching a search operator"""
+
+        ((name, specification),) = operator.items()
+        if name not in SEARCH_OPERATORS:
+            raise NotImplementedError(f"Search operator {name} is not supported by the local engine")
+
+        scores = SEARCH_OPERATORS[name](self, specification)
+        return _apply_score(scores, specification.get("score") if isinstance(specification, dict) else None)
+
+    # Facets
+    # ----------------------------
+    def facets(self, nodes: list[int], definitions: dict[str, dict]) -> dict[str, dict]:
+        """Computes the buckets of facets over the documents"""
+
+        output = {}
+        for name, definition in definitions.items():
+            if definition.get("type", "string") == "string":
+                buckets = self._string_buckets(nodes, definition)
+            else:
+                buckets = self._range_buckets(nodes, definition)
+            output[name] = {"buckets": buckets}
+
+        return output
+
+    def _string_buckets(self, nodes: list[int], definition: dict) -> list[dict]:
+        """Counts the documents per string value, most frequent values first"""
+
+        counts: dict[str, int] = {}
+        for node in nodes:
+            for value in set(self.strings(node, definition["path"])):
+                counts[value] = counts.get(value, 0) + 1
+
+        ranked = sorted(counts.items(), key=lambda entry: (-entry[1], entry[0]))
+        return [{"_id": value, "count": count} for value, count in ranked[: definition.get("numBuckets", 10)]]
+
+    def _range_buckets(self, nodes: list[int], definition: dict) -> list[dict]:
+        """Counts the documents per range of boundaries, the others going to the default bucket if any"""
+
+        boundaries = definition["boundaries"]
+        counts = [0] * (len(boundaries) - 1)
+        others = 0
+        for node in nodes:
+            values = [
+                value for value in self.values(node, definition["path"]) if _is_faceted(value, definition["type"])
+            ]
+            hits = {
+                position
+                for value in values
+                for position in range(len(counts))
+                if boundaries[position] <= value < boundaries[position + 1]
+            }
+            for position in hits:
+                counts[position] += 1
+            if values and not hits:
+                others += 1
+
+        buckets = [{"_id": boundary, "count": count} for boundary, count in zip(boundaries, counts)]
+        if definition.get("default") is not None:
+            buckets.append({"_id": definition["default"], "count": others})
+
+        return buckets
+
+
+# Operators
+# ----------------------------
+@search_operator("text")
+def _text(index: SearchIndex, specification: dict) -> dict[int, float]:
+    if specification.get("synonyms"):
+        raise NotImplementedError("synonyms are not supported by the local engine")
+
+    tokens = [token for query in _as_list(specification["query"]) for token in tokenize(query)]
+    scores: dict[int, float] = {}
+    for path in _as_list(specification["path"]):
+        field = index.text_field(path)
+        for token in tokens:
+            _add_scores(scores, field.score(token, specification.get("fuzzy")))
+
+    return scores
+
+
+@search_operator("autocomplete")
+def _autocomplete(index: SearchIndex, specification: dict) -> dict[int, float]:
+    path = specification["path"]
+    field = index.autocomplete_field(path)
+    sequential = specification.get("tokenOrder", "any") == "sequential"
+    scores: dict[int, float] = {}
+    for query in _as_list(specification["query"]):
+        tokens = tokenize(query)
+        query_scores: dict[int, float] = {}
+        for token in tokens:
+            if len(token) >= index.min_gram:
+                _add_scores(query_scores, field.score(token[: index.max_gram], specification.get("fuzzy")))
+        if sequential:
+            words = index.text_field(path).tokens
+            query_scores = {node: score for node, score in query_scores.items() if _in_sequence(tokens, words[node])}
+        _add_scores(scores, query_scores)
+
+    return scores
+
+
+@search_operator("phrase")
+def _phrase(index: SearchIndex, specification: dict) -> dict[int, float]:
+    if specification.get("synonyms"):
+        raise NotImplementedError("synonyms are not supported by the local engine")
+
+    slop = specification.get("slop", 0)
+    scores: dict[int, float] = {}
+    for query in _as_list(specification["query"]):
+        tokens = tokenize(query)
+        if not tokens:
+            continue
+        for path in _as_list(specification["path"]):
+            field = index.text_field(path)
+            query_scores: dict[int, float] = {}
+            for token in tokens:
+                _add_scores(query_scores, field.score(token))
+            _add_scores(
+                scores,
+                {node: score for node, score in query_scores.items() if _within_slop(tokens, field.tokens[node], slop)},
+            )
+
+    return scores
+
+
+@search_operator("regex")
+def _regex(index: SearchIndex, specification: dict) -> dict[int, float]:
+    patterns = [re.compile(query) for query in _as_list(specification["query"])]
+    return _match_strings(index, specification, patterns)
+
+
+@search_operator("wildcard")
+def _wildcard(index: SearchIndex, specification: dict) -> dict[int, float]:
+    patterns = [re.compile(_wildcard_pattern(query)) for query in _as_list(specification["query"])]
+    return _match_strings(index, specification, patterns)
+
+
+@search_operator("equals")
+def _equals(index: SearchIndex, specification: dict) -> dict[int, float]:
+    value = specification["value"]
+    return {
+        node: 1.0
+        for node in range(len(index))
+        if any(compare_values(candidate, value) == 0 for candidate in index.values(node, specification["path"]))
+    }
+
+
+@search_operator("in")
+def _in(index: SearchIndex, specification: dict) -> dict[int, float]:
+    values = _as_list(specification["value"])
+    return {
+        node: 1.0
+        for path in _as_list(specification["path"])
+        for node in range(len(index))
+        if any(compare_values(candidate, value) == 0 for candidate in index.values(node, path) for value in values)
+    }
+
+
+@search_operator("near")
+def _near(index: SearchIndex, specification: dict) -> dict[int, float]:
+    origin, pivot = specification["origin"], specification["pivot"]
+    scores: dict[int, float] = {}
+    for path in _as_list(specification["path"]):
+        for node, document in enumerate(index.documents):
+            if isinstance(origin, dict):
+                point = get_path(document, path)
+                distances = [_geo_distance(origin, point)] if isinstance(point, dict) and point.get("type") == "Point" else []
+            else:
+                distances = [
+                    distance for value in index.values(node, path) if (distance := _distance(origin, value)) is not None
+                ]
+            if distances:
+                scores[node] = max(scores.get(node, 0.0), pivot / (pivot + min(distances)))
+
+    return scores
+
+
+@search_operator("range")
+def _range(index: SearchIndex, specification: dict) -> dict[int, float]:
+    bounds = {name: specification[name] for name in ("gt", "gte", "lt", "lte") if specification.get(name) is not None}
+    return {
+        node: 1.0
+        for path in _as_list(specification["path"])
+        for node in range(len(index))
+        if any(_in_range(value, bounds) for value in index.values(node, path))
+    }
+
+
+@search_operator("exists")
+def _exists(index: SearchIndex, specification: dict) -> dict[int, float]:
+    return {
+        node: 1.0
+        for node, document in enumerate(index.documents)
+        if get_path(document, specification["path"]) not in (MISSING, None, [])
+    }
+
+
+@search_operator("compound")
+def _compound(index: SearchIndex, specification: dict) -> dict[int, float]:
+    must = [index.evaluate(clause) for clause in specification.get("must", [])]
+    filters = [index.evaluate(clause) for clause in specification.get("filter", [])]
+    should = [index.evaluate(clause) for clause in specification.get("should", [])]
+    excluded: set[int] = set()
+    for clause in specification.get("mustNot", []):
+        excluded.update(index.evaluate(clause))
+
+    required = must + filters
+    minimum = specification.get("minimumShouldMatch", 0)
+    if required:
+        candidates = set.intersection(*(set(scores) for scores in required))
+    elif should:
+        # Without must and filter clauses, at least one should clause has to match
+        minimum = max(minimum, 1)
+        candidates = set().union(*should)
+    else:
+        candidates = set(range(len(index)))
+
+    output: dict[int, float] = {}
+    for node in candidates - excluded:
+        matched = [scores[node] for scores in should if node in scores]
+        if len(matched) >= minimum:
+            output[node] = sum(scores[node] for scores in must) + sum(matched)
+
+    return output
+
+
+# Helpers
+# ----------------------------
+def _sequence_token(node: int) -> str:
+    """Returns the pagination token of a result, exposed as {"$meta": "searchSequenceToken"}"""
+
+    return base64.b64encode(f"node:{node}".encode()).decode()
+
+
+def _paginate(ranked: list[tuple[int, float]], after: str | None, before: str | None) -> list[tuple[int, float]]:
+    """Returns the results after or before (in reverse order) the result of a pagination token"""
+
+    if after is None and before is None:
+        return ranked
+
+    token = after if after is not None else before
+    try:
+        node = int(base64.b64decode(token, validate=True).decode().removeprefix("node:"))  # type: ignore[arg-type]
+    except (binascii.Error, UnicodeDecodeError, ValueError) as error:
+        raise ValueError(f"Invalid pagination token {token}") from error
+
+    positions = [position for position, (other, _) in enumerate(ranked) if other == node]
+    if not positions:
+        raise ValueError(f"The pagination token {token} does not reference a result of the search")
+
+    if after is not None:
+        return ranked[positions[0] + 1 :]
+    return ranked[: positions[0]][::-1]
+
+
+def _as_list(value: Any) -> list[Any]:
+    """Wraps single values in a list"""
+
+    return value if isinstance(value, list) else [value]
+
+
+def _add_scores(scores: dict[int, float], other: dict[int, float]) -> None:
+    """Adds the scores of other to scores"""
+
+    for node, score in other.items():
+        scores[node] = scores.get(node, 0.0) + score
+
+
+def _apply_score(scores: dict[int, float], options: dict | None) -> dict[int, float]:
+    """Applies the boost and constant score options"""
+
+    if not options:
+        return scores
+
+    if "constant" in options:
+        return dict.fromkeys(scores, options["constant"]["value"])
+    if "boost" in options and "value" in options["boost"]:
+        factor = options["boost"]["value"]
+        return {node: score * factor for node, score in scores.items()}
+
+    raise NotImplementedError(f"Score options {options} are not supported by the local engine")
+
+
+def _in_sequence(tokens: list[str], words: list[str]) -> bool:
+    """Returns true if tokens appear consecutively in words, the last one being a prefix"""
+
+    if not tokens:
+        return False
+
+    size = len(tokens)
+    for start in range(len(words) - size + 1):
+        if words[start : start + size - 1] == tokens[:-1] and words[start + size - 1].startswith(tokens[-1]):
+            return True
+
+    return False
+
+
+def _within_slop(tokens: list[str], words: list[str], slop: int) -> bool:
+    """Returns true if tokens appear in order in words, with at most slop other words between them in total"""
+
+    size = len(tokens)
+    for start, word in enumerate(words):
+        if word != tokens[0]:
+            continue
+        position, gaps, matched = start, 0, 1
+        while matched < size and gaps <= slop:
+            position += 1
+            if position >= len(words):
+                break
+            if words[position] == tokens[matched]:
+                matched += 1
+            else:
+                gaps += 1
+        if matched == size and gaps <= slop:
+            return True
+
+    return False
+
+
+def _distance(origin: Any, value: Any) -> float | None:
+    """Returns the distance between two numbers or two dates (in milliseconds), None for other values"""
+
+    if isinstance(origin, datetime):
+        return abs((value - origin).total_seconds()) * 1000 if isinstance(value, datetime) else None
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return abs(value - origin)
+
+    return None
+
+
+def _geo_distance(origin: dict, point: dict) -> float:
+    """Returns the haversine distance in meters between two GeoJSON points"""
+
+    (longitude_1, latitude_1), (longitude_2, latitude_2) = origin["coordinates"], point["coordinates"]
+    phi_1, phi_2 = math.radians(latitude_1), math.radians(latitude_2)
+    haversine = (
+        math.sin((phi_2 - phi_1) / 2) ** 2
+        + math.cos(phi_1) * math.cos(phi_2) * math.sin(math.radians(longitude_2 - longitude_1) / 2) ** 2
+    )
+
+    return 2 * _EARTH_RADIUS * math.asin(math.sqrt(haversine))
+
+
+def _wildcard_pattern(query: str) -> str:
+    """Translates a wildcard query (*, ? and \\ escapes) to a regular expression"""
+
+    output = []
+    escaped = False
+    for char in query:
+        if escaped:
+            output.append(re.escape(char))
+            escaped = False
+        elif char == "\\":
+            escaped = True
+        elif char == "*":
+            output.append(".*")
+        elif char == "?":
+            output.append(".")
+        else:
+            output.append(re.escape(char))
+
+    return "".join(output)
+
+
+def _match_strings(index: SearchIndex, specification: dict, patterns: list[re.Pattern]) -> dict[int, float]:
+    """Returns the documents with a string (or a token when allowAnalyzedField is true) fully matching a pattern"""
+
+    analyzed = specification.get("allowAnalyzedField", False)
+    output: dict[int, float] = {}
+    for path in _as_list(specification["path"]):
+        for node in range(len(index)):
+            candidates = index.text_field(path).tokens[node] if analyzed else index.strings(node, path)
+            if any(pattern.fullmatch(candidate) for pattern in patterns for candidate in candidates):
+                output[node] = 1.0
+
+    return output
+
+
+def _in_range(value: Any, bounds: dict[str, Any]) -> bool:
+    """Returns true if value is within bounds, values of other types never matching"""
+
+    for name, bound in bounds.items():
+        if type_rank(value) != type_rank(bound):
+            return False
+        comparison = compare_values(value, bound)
+        if (
+            (name == "gt" and comparison <= 0)
+            or (name == "gte" and comparison < 0)
+            or (name == "lt" and comparison >= 0)
+            or (name == "lte" and comparison > 0)
+        ):
+            return False
+
+    return True
+
+
+def _is_faceted(value: Any, facet_type: str) -> bool:
+    """Returns true if value can be counted in a facet of type facet_type"""
+
+    if facet_type == "date":
+        return isinstance(value, datetime)
+
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
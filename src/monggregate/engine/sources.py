@@ -0,0 +1,427 @@
+"""
+Module defining the dataset sources of the local engine.
+
+Sources read documents from files through `mmap` and decode them lazily, batch by batch,
+so that large exports can be evaluated without loading them into memory:
+
+    * `NDJSONSource` reads newline-delimited (Extended) JSON files, as written by mongoexport
+    * `BSONSource` reads concatenated BSON documents, as written by mongodump
+
+Projection pushdown
+----------------------------
+Sources can be restricted to the top-level fields a pipeline depends on (see `pushdown_fields`).
+`BSONSource` skips the other elements from their length prefixes and never decodes them.
+JSON has no length prefixes, so `NDJSONSource` drops them right after decoding each line,
+which keeps the batches small but does not save the parsing cost.
+
+Usage:
+----------------------------
+    >>> source = open_source("orders.bson", batch_size=10_000).for_pipeline(pipeline)
+    >>> evaluate(pipeline, source)
+
+"""
+
+# Standard Library imports
+# ----------------------------
+import json
+import mmap
+import struct
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+# Package imports
+# ----------------------------
+from monggregate.engine.evaluator import to_stages
+
+# Constants
+# ----------------------------
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+# Stages after which the fields of the input documents are no longer reachable
+_SHAPING_STAGES = {"$count", "$group", "$replaceRoot", "$replaceWith", "$sortByCount"}
+
+# Stages that only read fields of the documents, with the keys of their specification being paths
+_QUERY_STAGES = {"$match", "$sort"}
+
+
+class DataSource(ABC):
+    """
+    Base class of the dataset sources.
+
+    Attributes:
+    ----------------------------
+        - path, str | Path : path to the file to read
+        - batch_size, int : number of documents decoded at once. Defaults to 1000.
+        - fields, set[str] | None : top-level fields to decode. Defaults to None, i.e all the fields.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        batch_size: int = 1000,
+        fields: Iterable[str] | None = None,
+    ) -> None:
+        if batch_size < 1:
+            raise ValueError("batch_size must be strictly positive")
+
+        self.path = Path(path)
+        self.batch_size = batch_size
+        self.fields = None if fields is None else {field.split(".")[0] for field in fields}
+
+    def __iter__(self) -> Iterator[dict]:
+        for batch in self.batches():
+            yield from batch
+
+    def batches(self) -> Iterator[list[dict]]:
+        """Yields the documents of the file by batches of batch_size"""
+
+        with open(self.path, "rb") as file:
+            if not self.path.stat().st_size:
+                return
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                records: list[bytes] = []
+                for record in self._records(buffer):
+                    records.append(record)
+                    if len(records) == self.batch_size:
+                        yield [self._decode(record) for record in records]
+                        records = []
+                if records:
+                    yield [self._decode(record) for record in records]
+
+    def project(self, fields: Iterable[str] | None) -> "DataSource":
+        """Returns a copy of the source restricted to fields"""
+
+        return type(self)(self.path, batch_size=self.batch_size, fields=fields)
+
+    def for_pipeline(self, pipeline: Any) -> "DataSource":
+        """Returns a copy of the source restricted to the fields pipeline depends on"""
+
+        return self.project(pushdown_fields(pipeline))
+
+    @abstractmethod
+    def _records(self, buffer: mmap.mmap) -> Iterator[bytes]:
+        """Yields the raw bytes of the documents of the file"""
+
+    @abstractmethod
+    def _decode(self, record: bytes) -> dict:
+        """Decodes a document, restricted to the fields of the source"""
+
+
+class NDJSONSource(DataSource):
+    """Source reading newline-delimited JSON files, Extended JSON values are converted to python types"""
+
+    def _records(self, buffer: mmap.mmap) -> Iterator[bytes]:
+        start = 0
+        size = len(buffer)
+        while start < size:
+            end = buffer.find(b"\n", start)
+            if end == -1:
+                end = size
+            record = buffer[start:end].strip()
+            if record:
+                yield record
+            start = end + 1
+
+    def _decode(self, record: bytes) -> dict:
+        document = json.loads(record, object_hook=_extended_json)
+        if self.fields is not None:
+            document = {key: value for key, value in document.items() if key in self.fields}
+        return document
+
+
+class BSONSource(DataSource):
+    """Source reading concatenated BSON documents"""
+
+    def _records(self, buffer: mmap.mmap) -> Iterator[bytes]:
+        start = 0
+        size = len(buffer)
+        while start < size:
+            (length,) = _INT32.unpack_from(buffer, start)
+            if length < 5 or start + length > size:
+                raise ValueError(f"Corrupted BSON document at offset {start} in {self.path}")
+            yield buffer[start : start + length]
+            start += length
+
+    def _decode(self, record: bytes) -> dict:
+        return _decode_document(record, 0, self.fields)
+
+
+def open_source(path: str | Path, **kwargs: Any) -> DataSource:
+    """Opens a source according to the extension of path (.bson or .json/.jsonl/.ndjson)"""
+
+    suffix = Path(path).suffix.lower()
+    if suffix == ".bson":
+        source: DataSource = BSONSource(path, **kwargs)
+    elif suffix in {".json", ".jsonl", ".ndjson"}:
+        source = NDJSONSource(path, **kwargs)
+    else:
+        raise ValueError(f"Cannot infer the format of {path}, use NDJSONSource or BSONSource directly")
+
+    return source
+
+
+# Projection pushdown
+# ----------------------------
+def pushdown_fields(pipeline: Any) -> set[str] | None:
+    """
+    Returns the top-level fields of the input documents that pipeline depends on.
+
+    Returns None when the whole documents are needed, that is when the documents reach the
+    end of the pipeline without being reshaped, when $$ROOT or $$CURRENT are referenced
+    or when a stage cannot be analyzed.
+    """
+
+    fields: set[str] = {"_id"}
+    for statement in to_stages(pipeline):
+        ((name, specification),) = statement.items()
+        reshaped = name in _SHAPING_STAGES
+        if name in _QUERY_STAGES:
+            references = _query_references(specification)
+        elif name == "$project":
+            reshaped = not _is_exclusion(specification)
+            references = _references(specification) if reshaped else set()
+            if reshaped and references is not None:
+                references |= {key.split(".")[0] for key in specification}
+        elif name in {"$set", "$addFields"} or reshaped:
+            references = _references(specification)
+        elif name == "$unwind":
+            path = specification if isinstance(specification, str) else specification["path"]
+            references = _references(path)
+        elif name == "$lookup":
+            references = _references(specification.get("let") or {})
+            if references is not None and specification.get("localField"):
+                references.add(specification["localField"].split(".")[0])
+        elif name in {"$unset", "$limit", "$skip", "$sample"}:
+            references = set()
+        else:
+            references = None
+
+        if references is None:
+            return None
+        fields |= references
+        if reshaped:
+            return fields
+
+    return None
+
+
+def _is_exclusion(specification: dict) -> bool:
+    """Returns true if a $project specification only excludes fields"""
+
+    return all(value in (0, False) for key, value in specification.items() if key != "_id")
+
+
+def _query_references(query: dict) -> set[str] | None:
+    """Returns the top-level fields referenced by a query"""
+
+    output: set[str] = set()
+    for key, value in query.items():
+        if key == "$expr":
+            references = _references(value)
+        elif key in {"$and", "$or", "$nor"}:
+            references = set()
+            for clause in value:
+                clause_references = _query_references(clause)
+                if clause_references is None:
+                    return None
+                references |= clause_references
+        else:
+            references = {key.split(".")[0]}
+        if references is None:
+            return None
+        output |= references
+
+    return output
+
+
+def _references(expression: Any) -> set[str] | None:
+    """Returns the top-level fields referenced by an expression, None if the whole document is referenced"""
+
+    output: set[str] = set()
+    if isinstance(expression, str):
+        if expression.startswith("$$"):
+            variable = expression[2:].split(".")[0]
+            if variable in {"ROOT", "CURRENT"}:
+                return None
+        elif expression.startswith("$"):
+            output.add(expression[1:].split(".")[0])
+    elif isinstance(expression, (dict, list)):
+        values = expression.values() if isinstance(expression, dict) else expression
+        for value in values:
+            references = _references(value)
+            if references is None:
+                return None
+            output |= references
+
+    return output
+
+
+# Extended JSON
+# ----------------------------
+def _extended_json(document: dict) -> Any:
+    """Converts the Extended JSON wrappers written by mongoexport into python values"""
+
+    if len(document) != 1:
+        return document
+
+    ((key, value),) = document.items()
+    if key == "$oid":
+        output: Any = _object_id(bytes.fromhex(value))
+    elif key == "$date":
+        output = _extended_date(value)
+    elif key in {"$numberInt", "$numberLong"}:
+        output = int(value)
+    elif key == "$numberDouble":
+        output = float(value)
+    elif key == "$numberDecimal":
+        output = Decimal(value)
+    else:
+        output = document
+
+    return output
+
+
+def _extended_date(value: Any) -> datetime:
+    """Converts the value of a $date wrapper into a datetime"""
+
+    if isinstance(value, dict):
+        value = int(value["$numberLong"])
+    if isinstance(value, str):
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+    return _EPOCH + timedelta(milliseconds=value)
+
+
+def _object_id(value: bytes) -> Any:
+    """Returns a bson.ObjectId when pymongo is installed, the hexadecimal string otherwise"""
+
+    try:
+        from bson import ObjectId  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        return value.hex()
+
+    return ObjectId(value)
+
+
+# BSON
+# ----------------------------
+_INT32 = struct.Struct("<i")
+_INT64 = struct.Struct("<q")
+_DOUBLE = struct.Struct("<d")
+
+# Sizes of the fixed-size BSON types
+_FIXED_SIZES = {
+    0x01: 8,  # double
+    0x06: 0,  # undefined
+    0x07: 12,  # ObjectId
+    0x08: 1,  # boolean
+    0x09: 8,  # UTC datetime
+    0x0A: 0,  # null
+    0x10: 4,  # int32
+    0x11: 8,  # timestamp
+    0x12: 8,  # int64
+    0x13: 16,  # decimal128
+    0x7F: 0,  # max key
+    0xFF: 0,  # min key
+}
+
+
+def _decode_document(data: bytes, offset: int, fields: set[str] | None = None) -> dict:
+    """Decodes the BSON document starting at offset, restricted to fields when provided"""
+
+    (length,) = _INT32.unpack_from(data, offset)
+    end = offset + length - 1
+    position = offset + 4
+    output: dict = {}
+    while position < end:
+        kind = data[position]
+        name_end = data.index(b"\x00", position + 1)
+        name = data[position + 1 : name_end].decode()
+        position = name_end + 1
+        if fields is None or name in fields:
+            output[name] = _decode_value(data, position, kind)
+        position += _value_size(data, position, kind)
+
+    return output
+
+
+def _value_size(data: bytes, offset: int, kind: int) -> int:
+    """Returns the size of the value of type kind starting at offset, without decoding it"""
+
+    if kind in _FIXED_SIZES:
+        size = _FIXED_SIZES[kind]
+    elif kind in {0x02, 0x0D, 0x0E}:  # string, javascript, symbol
+        size = 4 + _INT32.unpack_from(data, offset)[0]
+    elif kind in {0x03, 0x04, 0x0F}:  # document, array, javascript with scope
+        size = _INT32.unpack_from(data, offset)[0]
+    elif kind == 0x05:  # binary
+        size = 5 + _INT32.unpack_from(data, offset)[0]
+    elif kind == 0x0B:  # regular expression
+        options_start = data.index(b"\x00", offset) + 1
+        size = data.index(b"\x00", options_start) + 1 - offset
+    elif kind == 0x0C:  # DBPointer
+        size = 4 + _INT32.unpack_from(data, offset)[0] + 12
+    else:
+        raise ValueError(f"Unsupported BSON type {kind:#x}")
+
+    return size
+
+
+def _decode_value(data: bytes, offset: int, kind: int) -> Any:
+    """Decodes the value of type kind starting at offset"""
+
+    if kind == 0x01:
+        output: Any = _DOUBLE.unpack_from(data, offset)[0]
+    elif kind in {0x02, 0x0D, 0x0E}:
+        (length,) = _INT32.unpack_from(data, offset)
+        output = data[offset + 4 : offset + 3 + length].decode()
+    elif kind == 0x03:
+        output = _decode_document(data, offset)
+    elif kind == 0x04:
+        output = list(_decode_document(data, offset).values())
+    elif kind == 0x05:
+        (length,) = _INT32.unpack_from(data, offset)
+        output = bytes(data[offset + 5 : offset + 5 + length])
+    elif kind == 0x07:
+        output = _object_id(bytes(data[offset : offset + 12]))
+    elif kind == 0x08:
+        output = data[offset] == 1
+    elif kind == 0x09:
+        output = _EPOCH + timedelta(milliseconds=_INT64.unpack_from(data, offset)[0])
+    elif kind == 0x0B:
+        pattern_end = data.index(b"\x00", offset)
+        options_end = data.index(b"\x00", pattern_end + 1)
+        output = {
+            "$regex": data[offset:pattern_end].decode(),
+            "$options": data[pattern_end + 1 : options_end].decode(),
+        }
+    elif kind == 0x10:
+        output = _INT32.unpack_from(data, offset)[0]
+    elif kind == 0x11:
+        increment, time = struct.unpack_from("<II", data, offset)
+        output = {"t": time, "i": increment}
+    elif kind == 0x12:
+        output = _INT64.unpack_from(data, offset)[0]
+    elif kind == 0x13:
+        output = _decimal128(bytes(data[offset : offset + 16]))
+    elif kind in {0x06, 0x0A}:
+        output = None
+    else:
+        raise ValueError(f"Unsupported BSON type {kind:#x}")
+
+    return output
+
+
+def _decimal128(value: bytes) -> Any:
+    """Returns a bson.Decimal128 when pymongo is installed, the raw bytes otherwise"""
+
+    try:
+        from bson.decimal128 import Decimal128  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        return value
+
+    return Decimal128.from_bid(value)
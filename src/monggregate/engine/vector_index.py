@@ -0,0 +1,302 @@
+"""
+Module defining the in-memory vector indexes of the local engine, a stand-in for Atlas Vector Search indexes.
+
+The vectors found at a path of the documents are stored in a contiguous float32 matrix (an `array.array`,
+viewed as a NumPy matrix without copy when NumPy is installed) and searched in one of two ways:
+
+    * exactly (ENN), by scoring every vector matching the filter. This is what `exact=True` does,
+      and what the "flat" indexes always do.
+    * approximately (aNN), by walking a HNSW (Hierarchical Navigable Small World) graph as Atlas does.
+      numCandidates is the size of the list of nearest neighbors kept while walking the graph (ef),
+      so that the recall increases with numCandidates as on Atlas. ef_factor scales it to calibrate
+      the stand-in against the recall measured on a cluster.
+
+The filter of $vectorSearch is applied before the search: only the matching documents are scored
+by exact searches and returned by the graph walk, which still goes through the other ones.
+
+The scores are normalized as Atlas Vector Search does (see `monggregate.vectors.similarity_score`).
+
+Usage:
+----------------------------
+    >>> movies = IndexedCollection(documents)
+    >>> movies.create_vector_index("plot_embedding", name="vector_index", similarity="dotProduct", kind="hnsw")
+    >>> pipeline = Pipeline().vector_search("vector_index", "plot_embedding", query_vector, 100, 10)
+    >>> evaluate(pipeline.set(score={"$meta": "vectorSearchScore"}).project(include=["title", "score"]), movies)
+
+NOTE : Without NumPy, the vectors are scored in pure Python, which is enough for tests and small benchmarks.
+
+"""
+
+# Standard Library imports
+# ----------------------------
+import heapq
+import math
+import random
+from array import array
+from operator import mul
+from typing import Any, Iterable, Literal
+
+# Package imports
+# ----------------------------
+from monggregate.engine.documents import get_path
+from monggregate.engine.query import matches
+from monggregate.vectors import BinaryVector, VectorSimilarity, is_buffer_vector, vector_values
+
+
+class VectorIndex:
+    """
+    Vector index over the documents with a vector at path.
+
+    Attributes:
+    ----------------------------
+        - path, str : the indexed vector field path
+        - similarity, VectorSimilarity : similarity function used to score the vectors. Defaults to cosine.
+        - kind, "flat" | "hnsw" : whether aNN searches are exact ("flat") or walk a HNSW graph ("hnsw")
+        - dimensions, int : number of dimensions of the vectors
+        - m, int : maximum number of neighbors of a node in the upper layers of the graph (twice as many in the lowest one)
+        - ef_construction, int : number of nearest neighbors considered when inserting a node in the graph
+        - ef_factor, float : ratio between the ef of the graph searches and numCandidates. Defaults to 1.
+    """
+
+    def __init__(
+        self,
+        documents: Iterable[dict],
+        path: str,
+        *,
+        similarity: VectorSimilarity | str = VectorSimilarity.COSINE,
+        kind: Literal["flat", "hnsw"] = "flat",
+        m: int = 16,
+        ef_construction: int = 100,
+        ef_factor: float = 1.0,
+        seed: int | None = 0,
+    ) -> None:
+        if kind not in ("flat", "hnsw"):
+            raise ValueError(f"Unknown vector index kind {kind}, expected 'flat' or 'hnsw'")
+        if m < 2 or ef_construction < 1 or ef_factor <= 0:
+            raise ValueError("m must be at least 2, ef_construction and ef_factor must be positive")
+
+        self.path = path
+        self.similarity = VectorSimilarity(similarity)
+        self.kind = kind
+        self.m = m
+        self.ef_construction = ef_construction
+        self.ef_factor = ef_factor
+        self.documents: list[dict] = []
+        self.dimensions = 0
+        self._matrix = array("f")
+        for document in documents:
+            vector = get_path(document, path)
+            if not isinstance(vector, (list, bytes, BinaryVector)) and not is_buffer_vector(vector):
+                continue
+            self._add(document, vector_values(vector))
+
+        self._view = _numpy_view(self._matrix, self.dimensions)
+        self._layers: list[dict[int, list[int]]] = []
+        self._entry = 0
+        if kind == "hnsw":
+            generator = random.Random(seed)
+            for node in range(len(self.documents)):
+                self._insert(node, generator)
+
+    def __len__(self) -> int:
+        return len(self.documents)
+
+    def search(
+        self,
+        query_vector: Any,
+        limit: int,
+        *,
+        num_candidates: int | None = None,
+        filter: dict | None = None,
+        exact: bool = False,
+    ) -> list[tuple[float, dict]]:
+        """
+        Returns the limit documents the most similar to query_vector, with their scores, best first.
+
+        numCandidates is required for aNN searches (exact=False) as for $vectorSearch.
+        """
+
+        if not exact and num_candidates is None:
+            raise ValueError("num_candidates is required unless exact is true")
+
+        query = self._prepare(vector_values(query_vector))
+        allowed = None
+        if filter:
+            allowed = {node for node, document in enumerate(self.documents) if matches(document, filter)}
+
+        if exact or self.kind == "flat" or not self.documents:
+            nodes = list(range(len(self.documents))) if allowed is None else sorted(allowed)
+            scored = list(zip(self._scores(query, nodes), nodes))
+            best = heapq.nlargest(limit, scored, key=lambda entry: (entry[0], -entry[1]))
+        else:
+            ef = max(limit, math.ceil(num_candidates * self.ef_factor))  # type: ignore[operator]
+            best = self._search_graph(query, ef, allowed)[:limit]
+
+        return [(score, self.documents[node]) for score, node in best]
+
+    # Storage and scoring
+    # ----------------------------
+    def _add(self, document: dict, values: list) -> None:
+        """Appends a vector to the matrix"""
+
+        if not self.dimensions:
+            self.dimensions = len(values)
+        elif len(values) != self.dimensions:
+            raise ValueError(
+                f"The vector of document {document.get('_id')} has {len(values)} dimensions, expected {self.dimensions}"
+            )
+
+        self._matrix.extend(self._prepare(values))
+        self.documents.append(document)
+
+    def _prepare(self, values: list) -> list[float]:
+        """Normalizes the vectors for cosine similarity, so that it reduces to a dot product"""
+
+        if self.similarity == VectorSimilarity.COSINE:
+            norm = math.hypot(*values)
+            if norm:
+                return [value / norm for value in values]
+
+        return [float(value) for value in values]
+
+    def _row(self, node: int) -> array:
+        """Returns the vector of a node"""
+
+        return self._matrix[node * self.dimensions : (node + 1) * self.dimensions]
+
+    def _score(self, query: list[float], node: int) -> float:
+        """Returns the score of a node"""
+
+        if self.similarity == VectorSimilarity.EUCLIDEAN:
+            return 1 / (1 + math.dist(query, self._row(node)))
+
+        return (1 + sum(map(mul, query, self._row(node)))) / 2
+
+    def _scores(self, query: list[float], nodes: list[int]) -> list[float]:
+        """Returns the scores of nodes, computed on the matrix at once when NumPy is installed"""
+
+        if self._view is None or not nodes:
+            return [self._score(query, node) for node in nodes]
+
+        rows = self._view[nodes]
+        target = _numpy().asarray(query, dtype="float32")
+        if self.similarity == VectorSimilarity.EUCLIDEAN:
+            return (1 / (1 + ((rows - target) ** 2).sum(axis=1) ** 0.5)).tolist()
+
+        return ((1 + rows @ target) / 2).tolist()
+
+    # HNSW graph
+    # ----------------------------
+    def _insert(self, node: int, generator: random.Random) -> None:
+        """Inserts a node in the graph"""
+
+        level = int(-math.log(1 - generator.random()) / math.log(self.m))
+        while len(self._layers) <= level:
+            self._layers.append({})
+
+        if node == 0:
+            for layer_links in self._layers:
+                layer_links[node] = []
+            self._entry = node
+            return
+
+        query = list(self._row(node))
+        top = max(self._levels(self._entry), default=0)
+        entry_points = [(self._score(query, self._entry), self._entry)]
+        for layer in range(top, level, -1):
+            entry_points = self._search_layer(query, entry_points, 1, layer)
+
+        for layer in range(min(top, level), -1, -1):
+            candidates = self._search_layer(query, entry_points, self.ef_construction, layer)
+            capacity = self.m * 2 if layer == 0 else self.m
+            neighbors = [neighbor for _, neighbor in candidates[:capacity]]
+            self._layers[layer][node] = neighbors
+            for neighbor in neighbors:
+                links = self._layers[layer][neighbor]
+                links.append(node)
+                if len(links) > capacity:
+                    vector = list(self._row(neighbor))
+                    links.sort(key=lambda other: self._score(vector, other), reverse=True)
+                    del links[capacity:]
+            entry_points = candidates
+
+        for layer in range(level + 1):
+            self._layers[layer].setdefault(node, [])
+        if level > top:
+            self._entry = node
+
+    def _levels(self, node: int) -> list[int]:
+        """Returns the layers a node belongs to"""
+
+        return [level for level, layer in enumerate(self._layers) if node in layer]
+
+    def _search_graph(self, query: list[float], ef: int, allowed: set[int] | None) -> list[tuple[float, int]]:
+        """Walks the graph down to the lowest layer and returns the ef best allowed nodes found there"""
+
+        entry_points = [(self._score(query, self._entry), self._entry)]
+        for layer in range(max(self._levels(self._entry)), 0, -1):
+            entry_points = self._search_layer(query, entry_points, 1, layer)
+
+        return self._search_layer(query, entry_points, ef, 0, allowed)
+
+    def _search_layer(
+        self,
+        query: list[float],
+        entry_points: list[tuple[float, int]],
+        ef: int,
+        layer: int,
+        allowed: set[int] | None = None,
+    ) -> list[tuple[float, int]]:
+        """
+        Returns the ef allowed nodes of a layer closest to query found by a best first search from entry_points, best first.
+
+        The nodes that are not allowed are walked through but not returned.
+        """
+
+        links = self._layers[layer]
+        visited = {node for _, node in entry_points}
+        candidates = [(-score, node) for score, node in entry_points]
+        heapq.heapify(candidates)
+        found = [(score, node) for score, node in entry_points if allowed is None or node in allowed]
+        heapq.heapify(found)
+        while len(found) > ef:
+            heapq.heappop(found)
+
+        while candidates:
+            score, node = heapq.heappop(candidates)
+            if len(found) >= ef and -score < found[0][0]:
+                break
+            for neighbor in links.get(node, []):
+                if neighbor in visited:
+                    continue
+                visited.add(neighbor)
+                neighbor_score = self._score(query, neighbor)
+                if len(found) < ef or neighbor_score > found[0][0]:
+                    heapq.heappush(candidates, (-neighbor_score, neighbor))
+                    if allowed is None or neighbor in allowed:
+                        heapq.heappush(found, (neighbor_score, neighbor))
+                        if len(found) > ef:
+                            heapq.heappop(found)
+
+        return sorted(found, key=lambda entry: (-entry[0], entry[1]))
+
+
+def _numpy() -> Any:
+    """Returns the numpy module, None when it is not installed"""
+
+    try:
+        import numpy  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        return None
+
+    return numpy
+
+
+def _numpy_view(matrix: array, dimensions: int) -> Any:
+    """Returns a NumPy matrix sharing the memory of the vectors, None when NumPy is not installed"""
+
+    numpy = _numpy()
+    if numpy is None or not dimensions:
+        return None
+
+    return numpy.frombuffer(matrix, dtype="float32").reshape(-1, dimensions)
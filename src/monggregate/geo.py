@@ -0,0 +1,69 @@
+"""
+Module defining GeoJSON objects used by geospatial stages and operators.
+
+Online MongoDB documentation:
+--------------------------------------------------------------------------------------------------------------------
+
+Last Updated (in this package) : 19/10/2026
+Source : https://www.mongodb.com/docs/manual/reference/geojson/
+
+MongoDB supports the GeoJSON object types listed on this page. To specify GeoJSON data, use an embedded document with:
+
+    * a field named type that specifies the GeoJSON object type and
+
+    * a field named coordinates that specifies the object's coordinates.
+
+If specifying latitude and longitude coordinates, list the longitude first and then latitude:
+
+    * Valid longitude values are between -180 and 180, both inclusive.
+
+    * Valid latitude values are between -90 and 90, both inclusive.
+
+>>> { type: "Point", coordinates: [ 40, 5 ] }
+
+"""
+
+from typing import Literal
+from monggregate.base import pyd, BaseModel, Expression
+
+
+class GeoJSONPoint(BaseModel):
+    """
+    GeoJSON point.
+
+    Attributes:
+    -----------
+        - type, "Point" : the GeoJSON object type
+        - coordinates, list[float] : longitude and latitude of the point, in this order
+    """
+
+    type: Literal["Point"] = "Point"
+    coordinates: list[float]
+
+    @pyd.validator("coordinates")
+    @classmethod
+    def validate_coordinates(cls, coordinates: list[float]) -> list[float]:
+        """Validates that coordinates are a valid [longitude, latitude] pair"""
+
+        if len(coordinates) != 2:
+            raise ValueError("coordinates must be a [longitude, latitude] pair")
+
+        longitude, latitude = coordinates
+        if not -180 <= longitude <= 180:
+            raise ValueError(f"longitude must be between -180 and 180, got {longitude}")
+        if not -90 <= latitude <= 90:
+            raise ValueError(f"latitude must be between -90 and 90, got {latitude}")
+
+        return coordinates
+
+    @classmethod
+    def from_lon_lat(cls, longitude: float, latitude: float) -> "GeoJSONPoint":
+        """Builds a point from its longitude and latitude"""
+
+        return cls(coordinates=[longitude, latitude])
+
+    @property
+    def expression(self) -> Expression:
+        """Generates statement from attributes"""
+
+        return self.express({"type": self.type, "coordinates": self.coordinates})
@@ -5,13 +5,21 @@ from monggregate.operators.operator import Operator
 
 from monggregate.operators.accumulators import(
     Average, Avg, average, avg,
+    Bottom, bottom,
+    BottomN, bottom_n,
     Count, count,
     First, first,
+    FirstN, first_n,
     Last, last,
+    LastN, last_n,
     Max, max,
+#    MaxN, max_n, #Commented as the array operator has the same name, syntax and does the same thing
     Min, min,
+#    MinN, min_n, #Commented as the array operator has the same name, syntax and does the same thing
     Push, push,
-    Sum, sum
+    Sum, sum,
+    Top, top,
+    TopN, top_n
 )
 
 from monggregate.operators.array import(
@@ -48,4 +56,23 @@ from monggregate.operators.objects import(
     ObjectToArray, object_to_array
 )
 
-from monggregate.operators.type_ import type_
\ No newline at end of file
+from monggregate.operators.set_ import(
+    AllElementsTrue, all_elements_true,
+    AnyElementTrue, any_element_true,
+    SetDifference, set_difference,
+    SetEquals, set_equals,
+    SetIntersection, set_intersection,
+    SetIsSubset, set_is_subset,
+    SetUnion, set_union
+)
+
+from monggregate.operators.type_ import type_
+
+from monggregate.operators.window import(
+    DenseRank, dense_rank,
+    Derivative, derivative,
+    ExpMovingAvg, exp_moving_avg,
+    Integral, integral,
+    Rank, rank,
+    Shift, shift
+)
\ No newline at end of file
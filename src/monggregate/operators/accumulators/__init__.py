@@ -1,24 +1,25 @@
 """Accumulator Operators Subpackage"""
 
 from monggregate.operators.accumulators.avg import Average, Avg, average, avg
+from monggregate.operators.accumulators.bottom import Bottom, bottom
+from monggregate.operators.accumulators.bottom_n import BottomN, bottom_n
 from monggregate.operators.accumulators.count import Count, count
 from monggregate.operators.accumulators.first import First, first
+from monggregate.operators.accumulators.first_n import FirstN, first_n
 from monggregate.operators.accumulators.last import Last, last
+from monggregate.operators.accumulators.last_n import LastN, last_n
 from monggregate.operators.accumulators.min import Min, min
+from monggregate.operators.accumulators.min_n import MinN, min_n
 from monggregate.operators.accumulators.max import Max, max
+from monggregate.operators.accumulators.max_n import MaxN, max_n
 from monggregate.operators.accumulators.push import Push, push
 from monggregate.operators.accumulators.sum import Sum, sum
+from monggregate.operators.accumulators.top import Top, top
+from monggregate.operators.accumulators.top_n import TopN, top_n
 
 # TODO  :
 # * $accumulator
 # * $addToSet
-# * $bottom
-# * $bottomN
-# * $firstN
-# * $lastN
-# * $maxN
 # * $mergeObjects
 # * $stdDedPop
 # * $stdDevSamp
-# * $top
-# * $topN
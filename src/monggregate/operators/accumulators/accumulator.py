@@ -44,6 +44,30 @@ class Accumulator(Operator, ABC):
     """Base class for accumulators"""
 
 
+# Validators
+# -----------------------------------------
+def validate_n(n: Any) -> Any:
+    """Validates the number of results of the N accumulators ($topN, $firstN, $maxN, ...)"""
+
+    if isinstance(n, bool) or (isinstance(n, (int, float)) and (n < 1 or n != int(n))):
+        raise ValueError(f"n must be a positive integer, got {n!r}")
+
+    return n
+
+
+def validate_sort_by(sort_by: dict) -> dict:
+    """Validates the sortBy document of the $top, $topN, $bottom and $bottomN accumulators"""
+
+    if not sort_by:
+        raise ValueError("sortBy must contain at least one field")
+
+    for field, direction in sort_by.items():
+        if direction not in (1, -1) and not isinstance(direction, dict):
+            raise ValueError(f"Invalid sort direction for {field}: {direction!r}. Expected 1 or -1")
+
+    return sort_by
+
+
 # Type aliases
 # -----------------------------------------
 AccumulatorExpression = dict[AccumulatorEnum, Any]
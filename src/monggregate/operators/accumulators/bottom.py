@@ -0,0 +1,82 @@
+"""
+Module defining an interface to the $bottom accumulator
+
+Online MongoDB documentation:
+--------------------------------------------------------------------------------------------------------------------
+Last Updated (in this package) : 19/10/2026
+Source : https://www.mongodb.com/docs/manual/reference/operator/aggregation/bottom/#mongodb-group-grp.-bottom
+
+Definition
+-------------------
+New in version 5.2.
+
+Returns the bottom element within a group according to the specified sort order.
+
+$bottom has the following syntax:
+
+    >>> {
+            $bottom:
+            {
+                sortBy: { <field1>: <sort order>, <field2>: <sort order> ... },
+                output: <expression>
+            }
+        }
+
+$bottom is available in these stages:
+
+    * $group
+    * $setWindowFields
+
+Behavior
+-------------------
+$bottom is not supported as an aggregation expression.
+
+$bottom does not filter out null values, and converts missing output fields to null.
+
+Unlike $sort followed by a $group using $last, $bottom does not sort the whole input:
+it only keeps the current bottom document of each group.
+
+"""
+
+from typing import Any
+from monggregate.base import pyd, Expression
+from monggregate.operators.accumulators.accumulator import Accumulator, validate_sort_by
+
+class Bottom(Accumulator):
+    """
+    Abstraction of MongoDB $bottom accumulator which returns the last document of the group according to sort_by.
+
+    Attributes
+    ------------------------
+        - sort_by, dict : specifies the order of results, with syntax similar to $sort
+        - output, Any : represents the output for each element in the group and can be any expression
+
+    Online MongoDB documentation:
+    ------------------------------
+    Returns the bottom element within a group according to the specified sort order.
+
+    [Source](https://www.mongodb.com/docs/manual/reference/operator/aggregation/bottom/#mongodb-group-grp.-bottom)
+    """
+
+    sort_by : dict
+    output : Any
+
+    _validates_sort_by = pyd.validator("sort_by", allow_reuse=True)(validate_sort_by)
+
+    @property
+    def expression(self) -> Expression:
+
+        return self.express({
+            "$bottom" : {
+                "sortBy" : self.sort_by,
+                "output" : self.output
+            }
+        })
+
+def bottom(sort_by:dict, output:Any)->Bottom:
+    """Returns a $bottom operator"""
+
+    return Bottom(
+        sort_by=sort_by,
+        output=output
+    )
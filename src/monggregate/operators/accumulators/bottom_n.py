@@ -0,0 +1,87 @@
+"""
+Module defining an interface to the $bottomN accumulator
+
+Online MongoDB documentation:
+--------------------------------------------------------------------------------------------------------------------
+Last Updated (in this package) : 19/10/2026
+Source : https://www.mongodb.com/docs/manual/reference/operator/aggregation/bottomN/#mongodb-group-grp.-bottomN
+
+Definition
+-------------------
+New in version 5.2.
+
+Returns an aggregation of the bottom n elements within a group, according to the specified sort order.
+If the group contains fewer than n elements, $bottomN returns all elements in the group.
+
+$bottomN has the following syntax:
+
+    >>> {
+            $bottomN:
+            {
+                n: <expression>,
+                sortBy: { <field1>: <sort order>, <field2>: <sort order> ... },
+                output: <expression>
+            }
+        }
+
+$bottomN is available in these stages:
+
+    * $group
+    * $setWindowFields
+
+Behavior
+-------------------
+$bottomN is not supported as an aggregation expression.
+
+$bottomN does not filter out null values, and converts missing output fields to null.
+
+"""
+
+from typing import Any
+from monggregate.base import pyd, Expression
+from monggregate.operators.accumulators.accumulator import Accumulator, validate_n, validate_sort_by
+
+class BottomN(Accumulator):
+    """
+    Abstraction of MongoDB $bottomN accumulator which returns the n last documents of the group according to sort_by.
+
+    Attributes
+    ------------------------
+        - n, Any : expression that resolves to a positive integer, the number of results per group
+        - sort_by, dict : specifies the order of results, with syntax similar to $sort
+        - output, Any : represents the output for each element in the group and can be any expression
+
+    Online MongoDB documentation:
+    ------------------------------
+    Returns an aggregation of the bottom n elements within a group, according to the specified sort order.
+    If the group contains fewer than n elements, $bottomN returns all elements in the group.
+
+    [Source](https://www.mongodb.com/docs/manual/reference/operator/aggregation/bottomN/#mongodb-group-grp.-bottomN)
+    """
+
+    n : Any
+    sort_by : dict
+    output : Any
+
+    _validates_n = pyd.validator("n", allow_reuse=True)(validate_n)
+    _validates_sort_by = pyd.validator("sort_by", allow_reuse=True)(validate_sort_by)
+
+    @property
+    def expression(self) -> Expression:
+
+        return self.express({
+            "$bottomN" : {
+                "n" : self.n,
+                "sortBy" : self.sort_by,
+                "output" : self.output
+            }
+        })
+
+def bottom_n(n:Any, sort_by:dict, output:Any)->BottomN:
+    """Returns a $bottomN operator"""
+
+    return BottomN(
+        n=n,
+        sort_by=sort_by,
+        output=output
+    )
@@ -0,0 +1,84 @@
+"""
+Module defining an interface to the $lastN accumulator
+
+Online MongoDB documentation:
+--------------------------------------------------------------------------------------------------------------------
+Last Updated (in this package) : 19/10/2026
+Source : https://www.mongodb.com/docs/manual/reference/operator/aggregation/lastN/#mongodb-group-grp.-lastN
+
+Definition
+-------------------
+New in version 5.2.
+
+Returns an aggregation of the last n elements within a group.
+The elements returned are meaningful only if in a specified sort order.
+If the group contains fewer than n elements, $lastN returns all elements in the group.
+
+$lastN has the following syntax:
+
+    >>> {
+            $lastN:
+                {
+                    input: <expression>,
+                    n: <expression>
+                }
+        }
+
+    * input specifies the field(s) from the document to take the $lastN of. Input can be any expression.
+    * n has to be a positive integral expression that is either a constant or depends on the _id value for $group.
+
+$lastN is available in these stages:
+
+    * $group
+    * $setWindowFields
+
+Behavior
+-------------------
+$lastN does not filter out null values, and converts missing values to null.
+
+"""
+
+from typing import Any
+from monggregate.base import pyd, Expression
+from monggregate.operators.accumulators.accumulator import Accumulator, validate_n
+
+class LastN(Accumulator):
+    """
+    Abstraction of MongoDB $lastN accumulator which returns the n last values of a group.
+
+    Attributes
+    ------------------------
+        - operand / input, Any : any valid expression
+        - n, Any : expression that resolves to a positive integer, the number of values per group
+
+    Online MongoDB documentation:
+    ------------------------------
+    Returns an aggregation of the last n elements within a group.
+    The elements returned are meaningful only if in a specified sort order.
+    If the group contains fewer than n elements, $lastN returns all elements in the group.
+
+    [Source](https://www.mongodb.com/docs/manual/reference/operator/aggregation/lastN/#mongodb-group-grp.-lastN)
+    """
+
+    operand : Any = pyd.Field(alias="input")
+    n : Any
+
+    _validates_n = pyd.validator("n", allow_reuse=True)(validate_n)
+
+    @property
+    def expression(self) -> Expression:
+
+        return self.express({
+            "$lastN" : {
+                "input" : self.operand,
+                "n" : self.n
+            }
+        })
+
+def last_n(operand:Any, n:Any)->LastN:
+    """Returns a $lastN operator"""
+
+    return LastN(
+        operand=operand,
+        n=n
+    )
@@ -0,0 +1,85 @@
+"""
+Module defining an interface to the $maxN accumulator
+
+Online MongoDB documentation:
+--------------------------------------------------------------------------------------------------------------------
+Last Updated (in this package) : 19/10/2026
+Source : https://www.mongodb.com/docs/manual/reference/operator/aggregation/maxN/#mongodb-group-grp.-maxN
+
+Definition
+-------------------
+New in version 5.2.
+
+Returns an aggregation of the maximum value n elements within a group.
+If the group contains fewer than n elements, $maxN returns all elements in the group.
+
+$maxN has the following syntax:
+
+    >>> {
+            $maxN:
+                {
+                    input: <expression>,
+                    n: <expression>
+                }
+        }
+
+    * input specifies the field(s) from the document to take the $maxN of. Input can be any expression.
+    * n has to be a positive integral expression that is either a constant or depends on the _id value for $group.
+
+$maxN is available in these stages:
+
+    * $group
+    * $setWindowFields
+
+Behavior
+-------------------
+$maxN filters out null and missing values.
+
+NOTE : This page describes the $maxN accumulator. The $maxN array operator has the same syntax
+(see monggregate.operators.array).
+
+"""
+
+from typing import Any
+from monggregate.base import pyd, Expression
+from monggregate.operators.accumulators.accumulator import Accumulator, validate_n
+
+class MaxN(Accumulator):
+    """
+    Abstraction of MongoDB $maxN accumulator which returns the n largest values of a group, in descending order.
+
+    Attributes
+    ------------------------
+        - operand / input, Any : any valid expression
+        - n, Any : expression that resolves to a positive integer, the number of values per group
+
+    Online MongoDB documentation:
+    ------------------------------
+    Returns an aggregation of the maximum value n elements within a group.
+    If the group contains fewer than n elements, $maxN returns all elements in the group.
+
+    [Source](https://www.mongodb.com/docs/manual/reference/operator/aggregation/maxN/#mongodb-group-grp.-maxN)
+    """
+
+    operand : Any = pyd.Field(alias="input")
+    n : Any
+
+    _validates_n = pyd.validator("n", allow_reuse=True)(validate_n)
+
+    @property
+    def expression(self) -> Expression:
+
+        return self.express({
+            "$maxN" : {
+                "input" : self.operand,
+                "n" : self.n
+            }
+        })
+
+def max_n(operand:Any, n:Any)->MaxN:
+    """Returns a $maxN operator"""
+
+    return MaxN(
+        operand=operand,
+        n=n
+    )
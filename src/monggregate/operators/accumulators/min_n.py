@@ -0,0 +1,85 @@
+"""
+Module defining an interface to the $minN accumulator
+
+Online MongoDB documentation:
+--------------------------------------------------------------------------------------------------------------------
+Last Updated (in this package) : 19/10/2026
+Source : https://www.mongodb.com/docs/manual/reference/operator/aggregation/minN/#mongodb-group-grp.-minN
+
+Definition
+-------------------
+New in version 5.2.
+
+Returns an aggregation of the minimum value n elements within a group.
+If the group contains fewer than n elements, $minN returns all elements in the group.
+
+$minN has the following syntax:
+
+    >>> {
+            $minN:
+                {
+                    input: <expression>,
+                    n: <expression>
+                }
+        }
+
+    * input specifies the field(s) from the document to take the $minN of. Input can be any expression.
+    * n has to be a positive integral expression that is either a constant or depends on the _id value for $group.
+
+$minN is available in these stages:
+
+    * $group
+    * $setWindowFields
+
+Behavior
+-------------------
+$minN filters out null and missing values.
+
+NOTE : This page describes the $minN accumulator. The $minN array operator has the same syntax
+(see monggregate.operators.array).
+
+"""
+
+from typing import Any
+from monggregate.base import pyd, Expression
+from monggregate.operators.accumulators.accumulator import Accumulator, validate_n
+
+class MinN(Accumulator):
+    """
+    Abstraction of MongoDB $minN accumulator which returns the n smallest values of a group, in ascending order.
+
+    Attributes
+    ------------------------
+        - operand / input, Any : any valid expression
+        - n, Any : expression that resolves to a positive integer, the number of values per group
+
+    Online MongoDB documentation:
+    ------------------------------
+    Returns an aggregation of the minimum value n elements within a group.
+    If the group contains fewer than n elements, $minN returns all elements in the group.
+
+    [Source](https://www.mongodb.com/docs/manual/reference/operator/aggregation/minN/#mongodb-group-grp.-minN)
+    """
+
+    operand : Any = pyd.Field(alias="input")
+    n : Any
+
+    _validates_n = pyd.validator("n", allow_reuse=True)(validate_n)
+
+    @property
+    def expression(self) -> Expression:
+
+        return self.express({
+            "$minN" : {
+                "input" : self.operand,
+                "n" : self.n
+            }
+        })
+
+def min_n(operand:Any, n:Any)->MinN:
+    """Returns a $minN operator"""
+
+    return MinN(
+        operand=operand,
+        n=n
+    )
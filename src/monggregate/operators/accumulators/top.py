@@ -0,0 +1,82 @@
+"""
+Module defining an interface to the $top accumulator
+
+Online MongoDB documentation:
+--------------------------------------------------------------------------------------------------------------------
+Last Updated (in this package) : 19/10/2026
+Source : https://www.mongodb.com/docs/manual/reference/operator/aggregation/top/#mongodb-group-grp.-top
+
+Definition
+-------------------
+New in version 5.2.
+
+Returns the top element within a group according to the specified sort order.
+
+$top has the following syntax:
+
+    >>> {
+            $top:
+            {
+                sortBy: { <field1>: <sort order>, <field2>: <sort order> ... },
+                output: <expression>
+            }
+        }
+
+$top is available in these stages:
+
+    * $group
+    * $setWindowFields
+
+Behavior
+-------------------
+$top is not supported as an aggregation expression.
+
+$top does not filter out null values, and converts missing output fields to null.
+
+Unlike $sort followed by a $group using $first, $top does not sort the whole input:
+it only keeps the current top document of each group.
+
+"""
+
+from typing import Any
+from monggregate.base import pyd, Expression
+from monggregate.operators.accumulators.accumulator import Accumulator, validate_sort_by
+
+class Top(Accumulator):
+    """
+    Abstraction of MongoDB $top accumulator which returns the first document of the group according to sort_by.
+
+    Attributes
+    ------------------------
+        - sort_by, dict : specifies the order of results, with syntax similar to $sort
+        - output, Any : represents the output for each element in the group and can be any expression
+
+    Online MongoDB documentation:
+    ------------------------------
+    Returns the top element within a group according to the specified sort order.
+
+    [Source](https://www.mongodb.com/docs/manual/reference/operator/aggregation/top/#mongodb-group-grp.-top)
+    """
+
+    sort_by : dict
+    output : Any
+
+    _validates_sort_by = pyd.validator("sort_by", allow_reuse=True)(validate_sort_by)
+
+    @property
+    def expression(self) -> Expression:
+
+        return self.express({
+            "$top" : {
+                "sortBy" : self.sort_by,
+                "output" : self.output
+            }
+        })
+
+def top(sort_by:dict, output:Any)->Top:
+    """Returns a $top operator"""
+
+    return Top(
+        sort_by=sort_by,
+        output=output
+    )
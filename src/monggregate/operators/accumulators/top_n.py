@@ -0,0 +1,90 @@
+"""
+Module defining an interface to the $topN accumulator
+
+Online MongoDB documentation:
+--------------------------------------------------------------------------------------------------------------------
+Last Updated (in this package) : 19/10/2026
+Source : https://www.mongodb.com/docs/manual/reference/operator/aggregation/topN/#mongodb-group-grp.-topN
+
+Definition
+-------------------
+New in version 5.2.
+
+Returns an aggregation of the top n elements within a group, according to the specified sort order.
+If the group contains fewer than n elements, $topN returns all elements in the group.
+
+$topN has the following syntax:
+
+    >>> {
+            $topN:
+            {
+                n: <expression>,
+                sortBy: { <field1>: <sort order>, <field2>: <sort order> ... },
+                output: <expression>
+            }
+        }
+
+$topN is available in these stages:
+
+    * $group
+    * $setWindowFields
+
+Behavior
+-------------------
+$topN is not supported as an aggregation expression.
+
+$topN does not filter out null values, and converts missing output fields to null.
+
+Unlike $push followed by $slice (or $sort followed by $first), $topN keeps at most n values per group
+instead of materializing every document of the group, which keeps the memory usage of $group bounded.
+
+"""
+
+from typing import Any
+from monggregate.base import pyd, Expression
+from monggregate.operators.accumulators.accumulator import Accumulator, validate_n, validate_sort_by
+
+class TopN(Accumulator):
+    """
+    Abstraction of MongoDB $topN accumulator which returns the n first documents of the group according to sort_by.
+
+    Attributes
+    ------------------------
+        - n, Any : expression that resolves to a positive integer, the number of results per group
+        - sort_by, dict : specifies the order of results, with syntax similar to $sort
+        - output, Any : represents the output for each element in the group and can be any expression
+
+    Online MongoDB documentation:
+    ------------------------------
+    Returns an aggregation of the top n elements within a group, according to the specified sort order.
+    If the group contains fewer than n elements, $topN returns all elements in the group.
+
+    [Source](https://www.mongodb.com/docs/manual/reference/operator/aggregation/topN/#mongodb-group-grp.-topN)
+    """
+
+    n : Any
+    sort_by : dict
+    output : Any
+
+    _validates_n = pyd.validator("n", allow_reuse=True)(validate_n)
+    _validates_sort_by = pyd.validator("sort_by", allow_reuse=True)(validate_sort_by)
+
+    @property
+    def expression(self) -> Expression:
+
+        return self.express({
+            "$topN" : {
+                "n" : self.n,
+                "sortBy" : self.sort_by,
+                "output" : self.output
+            }
+        })
+
+def top_n(n:Any, sort_by:dict, output:Any)->TopN:
+    """Returns a $topN operator"""
+
+    return TopN(
+        n=n,
+        sort_by=sort_by,
+        output=output
+    )
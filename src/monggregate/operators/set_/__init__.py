@@ -0,0 +1,9 @@
+"""Set operators subpackage"""
+
+from monggregate.operators.set_.all_elements_true import AllElementsTrue, all_elements_true
+from monggregate.operators.set_.any_element_true import AnyElementTrue, any_element_true
+from monggregate.operators.set_.set_difference import SetDifference, set_difference
+from monggregate.operators.set_.set_equals import SetEquals, set_equals
+from monggregate.operators.set_.set_intersection import SetIntersection, set_intersection
+from monggregate.operators.set_.set_is_subset import SetIsSubset, set_is_subset
+from monggregate.operators.set_.set_union import SetUnion, set_union
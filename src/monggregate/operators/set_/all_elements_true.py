@@ -0,0 +1,68 @@
+"""
+Module defining an interface to the $allElementsTrue operator
+
+Online MongoDB documentation:
+--------------------------------------------------------------------------------------------------------------------
+Last Updated (in this package) : 19/10/2026
+Source : https://www.mongodb.com/docs/manual/reference/operator/aggregation/allElementsTrue/#mongodb-expression-exp.-allElementsTrue
+
+Definition
+-------------------
+$allElementsTrue
+Evaluates an array as a set and returns true if no element in the array is false. Otherwise, returns false.
+An empty array returns true.
+
+$allElementsTrue has the following syntax:
+
+    >>> { $allElementsTrue: [ <expression> ] }
+
+The <expression> itself must resolve to an array, separate from the outer array that denotes the argument list.
+
+Behavior
+-------------------
+If a set contains a nested array element, $allElementsTrue does not descend into the nested array
+but evaluates the array at top-level.
+
+In addition to the false boolean value, $allElementsTrue evaluates as false the following: null, 0, and undefined values.
+The $allElementsTrue evaluates all other values as true, including non-zero numeric values and arrays.
+
+"""
+
+from typing import Any
+from monggregate.base import Expression
+from monggregate.operators.set_.set_ import SetOperator
+
+class AllElementsTrue(SetOperator):
+    """
+    Abstraction of MongoDB $allElementsTrue operator which returns true if no element of an array is false.
+
+    Attributes
+    -------------------
+        - operand, Any : any valid expression that resolves to an array
+
+    Online MongoDB documentation
+    ----------------------------
+    Evaluates an array as a set and returns true if no element in the array is false. Otherwise, returns false.
+    An empty array returns true.
+
+    $allElementsTrue has the following syntax:
+
+        >>> { $allElementsTrue: [ <expression> ] }
+
+    [Source](https://www.mongodb.com/docs/manual/reference/operator/aggregation/allElementsTrue/#mongodb-expression-exp.-allElementsTrue)
+    """
+
+    operand : Any
+
+    @property
+    def expression(self) -> Expression:
+        return self.express({
+            "$allElementsTrue" : [self.operand]
+        })
+
+def all_elements_true(operand:Any)->AllElementsTrue:
+    """Returns an $allElementsTrue operator"""
+
+    return AllElementsTrue(
+        operand=operand
+    )
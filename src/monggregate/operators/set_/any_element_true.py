@@ -0,0 +1,68 @@
+"""
+Module defining an interface to the $anyElementTrue operator
+
+Online MongoDB documentation:
+--------------------------------------------------------------------------------------------------------------------
+Last Updated (in this package) : 19/10/2026
+Source : https://www.mongodb.com/docs/manual/reference/operator/aggregation/anyElementTrue/#mongodb-expression-exp.-anyElementTrue
+
+Definition
+-------------------
+$anyElementTrue
+Evaluates an array as a set and returns true if any of the elements are true and false otherwise.
+An empty array returns false.
+
+$anyElementTrue has the following syntax:
+
+    >>> { $anyElementTrue: [ <expression> ] }
+
+The <expression> itself must resolve to an array, separate from the outer array that denotes the argument list.
+
+Behavior
+-------------------
+If a set contains a nested array element, $anyElementTrue does not descend into the nested array
+but evaluates the array at top-level.
+
+In addition to the false boolean value, $anyElementTrue evaluates as false the following: null, 0, and undefined values.
+The $anyElementTrue evaluates all other values as true, including non-zero numeric values and arrays.
+
+"""
+
+from typing import Any
+from monggregate.base import Expression
+from monggregate.operators.set_.set_ import SetOperator
+
+class AnyElementTrue(SetOperator):
+    """
+    Abstraction of MongoDB $anyElementTrue operator which returns true if any element of an array is true.
+
+    Attributes
+    -------------------
+        - operand, Any : any valid expression that resolves to an array
+
+    Online MongoDB documentation
+    ----------------------------
+    Evaluates an array as a set and returns true if any of the elements are true and false otherwise.
+    An empty array returns false.
+
+    $anyElementTrue has the following syntax:
+
+        >>> { $anyElementTrue: [ <expression> ] }
+
+    [Source](https://www.mongodb.com/docs/manual/reference/operator/aggregation/anyElementTrue/#mongodb-expression-exp.-anyElementTrue)
+    """
+
+    operand : Any
+
+    @property
+    def expression(self) -> Expression:
+        return self.express({
+            "$anyElementTrue" : [self.operand]
+        })
+
+def any_element_true(operand:Any)->AnyElementTrue:
+    """Returns an $anyElementTrue operator"""
+
+    return AnyElementTrue(
+        operand=operand
+    )
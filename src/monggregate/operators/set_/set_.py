@@ -0,0 +1,35 @@
+"""Base set operator module"""
+
+# Standard Library Imports
+# -----------------------------------------
+from abc import ABC
+from typing import Any
+
+# Local imports
+# -----------------------------------------
+from monggregate.operators import Operator
+from monggregate.utils import StrEnum
+
+# Enums
+# -----------------------------------------
+class SetOperatorEnum(StrEnum):
+    """Enumeration of available set operators"""
+
+    ALL_ELEMENTS_TRUE = "$allElementsTrue" # Returns true if no element of a set evaluates to false, otherwise, returns false. Accepts a single argument expression.
+    ANY_ELEMENT_TRUE = "$anyElementTrue" # Returns true if any elements of a set evaluate to true; otherwise, returns false. Accepts a single argument expression.
+    SET_DIFFERENCE = "$setDifference" # Returns a set with elements that appear in the first set but not in the second set; i.e. performs a relative complement of the second set relative to the first. Accepts exactly two argument expressions.
+    SET_EQUALS = "$setEquals" # Returns true if the input sets have the same distinct elements. Accepts two or more argument expressions.
+    SET_INTERSECTION = "$setIntersection" # Returns a set with elements that appear in all of the input sets. Accepts any number of argument expressions.
+    SET_IS_SUBSET = "$setIsSubset" # Returns true if all elements of the first set appear in the second set, including when the first set equals the second set; i.e. not a strict subset. Accepts exactly two argument expressions.
+    SET_UNION = "$setUnion" # Returns a set with elements that appear in any of the input sets.
+
+
+# Classes
+# -----------------------------------------
+class SetOperator(Operator, ABC):
+    """Base class for set operators"""
+
+
+# Type aliases
+# -----------------------------------------
+SetOperatorExpression = dict[SetOperatorEnum, Any]
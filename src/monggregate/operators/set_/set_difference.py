@@ -0,0 +1,71 @@
+"""
+Module defining an interface to the $setDifference operator
+
+Online MongoDB documentation:
+--------------------------------------------------------------------------------------------------------------------
+Last Updated (in this package) : 19/10/2026
+Source : https://www.mongodb.com/docs/manual/reference/operator/aggregation/setDifference/#mongodb-expression-exp.-setDifference
+
+Definition
+-------------------
+$setDifference
+Takes two sets and returns an array containing the elements that only exist in the first set;
+that is, performs a relative complement of the second set relative to the first.
+
+$setDifference has the following syntax:
+
+    >>> { $setDifference: [ <expression1>, <expression2> ] }
+
+The arguments can be any valid expression as long as they each resolve to an array.
+
+Behavior
+-------------------
+Set operations treat arrays as sets. If an array contains duplicate entries, the set operator ignores the duplicate entries.
+The set operator ignores the order of the elements.
+
+If a set contains a nested array element, the set operator does not descend into the nested array
+but evaluates the array at top-level.
+
+"""
+
+from typing import Any
+from monggregate.base import Expression
+from monggregate.operators.set_.set_ import SetOperator
+
+class SetDifference(SetOperator):
+    """
+    Abstraction of MongoDB $setDifference operator which returns the elements of the first array that do not appear in the second one.
+
+    Attributes
+    -------------------
+        - left, Any : any valid expression that resolves to an array (the array whose elements are returned)
+        - right, Any : any valid expression that resolves to an array (the array whose elements are removed from left)
+
+    Online MongoDB documentation
+    ----------------------------
+    Takes two sets and returns an array containing the elements that only exist in the first set;
+    that is, performs a relative complement of the second set relative to the first.
+
+    $setDifference has the following syntax:
+
+        >>> { $setDifference: [ <expression1>, <expression2> ] }
+
+    [Source](https://www.mongodb.com/docs/manual/reference/operator/aggregation/setDifference/#mongodb-expression-exp.-setDifference)
+    """
+
+    left : Any
+    right : Any
+
+    @property
+    def expression(self) -> Expression:
+        return self.express({
+            "$setDifference" : [self.left, self.right]
+        })
+
+def set_difference(left:Any, right:Any)->SetDifference:
+    """Returns a $setDifference operator"""
+
+    return SetDifference(
+        left=left,
+        right=right
+    )
@@ -0,0 +1,76 @@
+"""
+Module defining an interface to the $setEquals operator
+
+Online MongoDB documentation:
+--------------------------------------------------------------------------------------------------------------------
+Last Updated (in this package) : 19/10/2026
+Source : https://www.mongodb.com/docs/manual/reference/operator/aggregation/setEquals/#mongodb-expression-exp.-setEquals
+
+Definition
+-------------------
+$setEquals
+Compares two or more arrays and returns true if they have the same distinct elements and false otherwise.
+
+$setEquals has the following syntax:
+
+    >>> { $setEquals: [ <expression1>, <expression2>, ... ] }
+
+The arguments can be any valid expression as long as they each resolve to an array.
+
+Behavior
+-------------------
+Set operations treat arrays as sets. If an array contains duplicate entries, the set operator ignores the duplicate entries.
+The set operator ignores the order of the elements.
+
+If a set contains a nested array element, the set operator does not descend into the nested array
+but evaluates the array at top-level.
+
+"""
+
+from typing import Any
+from monggregate.base import pyd, Expression
+from monggregate.operators.set_.set_ import SetOperator
+
+class SetEquals(SetOperator):
+    """
+    Abstraction of MongoDB $setEquals operator which returns true if the input arrays have the same distinct elements.
+
+    Attributes
+    -------------------
+        - operands, list[Any] : list of valid expressions that each resolve to an array
+
+    Online MongoDB documentation
+    ----------------------------
+    Compares two or more arrays and returns true if they have the same distinct elements and false otherwise.
+
+    $setEquals has the following syntax:
+
+        >>> { $setEquals: [ <expression1>, <expression2>, ... ] }
+
+    [Source](https://www.mongodb.com/docs/manual/reference/operator/aggregation/setEquals/#mongodb-expression-exp.-setEquals)
+    """
+
+    operands : list[Any]
+
+    @pyd.validator("operands")
+    @classmethod
+    def validate_operands(cls, operands:list[Any])->list[Any]:
+        """Checks that at least two arrays are compared"""
+
+        if len(operands) < 2:
+            raise ValueError("$setEquals requires at least two arrays")
+
+        return operands
+
+    @property
+    def expression(self) -> Expression:
+        return self.express({
+            "$setEquals" : self.operands
+        })
+
+def set_equals(*args:Any)->SetEquals:
+    """Returns a $setEquals operator"""
+
+    return SetEquals(
+        operands=list(args)
+    )
@@ -0,0 +1,66 @@
+"""
+Module defining an interface to the $setIntersection operator
+
+Online MongoDB documentation:
+--------------------------------------------------------------------------------------------------------------------
+Last Updated (in this package) : 19/10/2026
+Source : https://www.mongodb.com/docs/manual/reference/operator/aggregation/setIntersection/#mongodb-expression-exp.-setIntersection
+
+Definition
+-------------------
+$setIntersection
+Takes two or more arrays and returns an array that contains the elements that appear in every input array.
+
+$setIntersection has the following syntax:
+
+    >>> { $setIntersection: [ <array1>, <array2>, ... ] }
+
+The arguments can be any valid expression as long as they each resolve to an array.
+
+Behavior
+-------------------
+Set operations treat arrays as sets. If an array contains duplicate entries, the set operator ignores the duplicate entries.
+The set operator ignores the order of the elements.
+
+If a set contains a nested array element, the set operator does not descend into the nested array
+but evaluates the array at top-level.
+
+"""
+
+from typing import Any
+from monggregate.base import Expression
+from monggregate.operators.set_.set_ import SetOperator
+
+class SetIntersection(SetOperator):
+    """
+    Abstraction of MongoDB $setIntersection operator which returns the elements that appear in all of the input arrays.
+
+    Attributes
+    -------------------
+        - operands, list[Any] : list of valid expressions that each resolve to an array
+
+    Online MongoDB documentation
+    ----------------------------
+    Takes two or more arrays and returns an array that contains the elements that appear in every input array.
+
+    $setIntersection has the following syntax:
+
+        >>> { $setIntersection: [ <array1>, <array2>, ... ] }
+
+    [Source](https://www.mongodb.com/docs/manual/reference/operator/aggregation/setIntersection/#mongodb-expression-exp.-setIntersection)
+    """
+
+    operands : list[Any]
+
+    @property
+    def expression(self) -> Expression:
+        return self.express({
+            "$setIntersection" : self.operands
+        })
+
+def set_intersection(*args:Any)->SetIntersection:
+    """Returns a $setIntersection operator"""
+
+    return SetIntersection(
+        operands=list(args)
+    )
@@ -0,0 +1,71 @@
+"""
+Module defining an interface to the $setIsSubset operator
+
+Online MongoDB documentation:
+--------------------------------------------------------------------------------------------------------------------
+Last Updated (in this package) : 19/10/2026
+Source : https://www.mongodb.com/docs/manual/reference/operator/aggregation/setIsSubset/#mongodb-expression-exp.-setIsSubset
+
+Definition
+-------------------
+$setIsSubset
+Takes two arrays and returns true when the first array is a subset of the second,
+including when the first array equals the second array, and false otherwise.
+
+$setIsSubset has the following syntax:
+
+    >>> { $setIsSubset: [ <expression1>, <expression2> ] }
+
+The arguments can be any valid expression as long as they each resolve to an array.
+
+Behavior
+-------------------
+Set operations treat arrays as sets. If an array contains duplicate entries, the set operator ignores the duplicate entries.
+The set operator ignores the order of the elements.
+
+If a set contains a nested array element, the set operator does not descend into the nested array
+but evaluates the array at top-level.
+
+"""
+
+from typing import Any
+from monggregate.base import Expression
+from monggregate.operators.set_.set_ import SetOperator
+
+class SetIsSubset(SetOperator):
+    """
+    Abstraction of MongoDB $setIsSubset operator which returns true if all the elements of the first array appear in the second one.
+
+    Attributes
+    -------------------
+        - left, Any : any valid expression that resolves to an array (the array to check)
+        - right, Any : any valid expression that resolves to an array (the array expected to contain left)
+
+    Online MongoDB documentation
+    ----------------------------
+    Takes two arrays and returns true when the first array is a subset of the second,
+    including when the first array equals the second array, and false otherwise.
+
+    $setIsSubset has the following syntax:
+
+        >>> { $setIsSubset: [ <expression1>, <expression2> ] }
+
+    [Source](https://www.mongodb.com/docs/manual/reference/operator/aggregation/setIsSubset/#mongodb-expression-exp.-setIsSubset)
+    """
+
+    left : Any
+    right : Any
+
+    @property
+    def expression(self) -> Expression:
+        return self.express({
+            "$setIsSubset" : [self.left, self.right]
+        })
+
+def set_is_subset(left:Any, right:Any)->SetIsSubset:
+    """Returns a $setIsSubset operator"""
+
+    return SetIsSubset(
+        left=left,
+        right=right
+    )
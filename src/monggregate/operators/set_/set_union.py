@@ -0,0 +1,66 @@
+"""
+Module defining an interface to the $setUnion operator
+
+Online MongoDB documentation:
+--------------------------------------------------------------------------------------------------------------------
+Last Updated (in this package) : 19/10/2026
+Source : https://www.mongodb.com/docs/manual/reference/operator/aggregation/setUnion/#mongodb-expression-exp.-setUnion
+
+Definition
+-------------------
+$setUnion
+Takes two or more arrays and returns an array containing the elements that appear in any input array.
+
+$setUnion has the following syntax:
+
+    >>> { $setUnion: [ <expression1>, <expression2>, ... ] }
+
+The arguments can be any valid expression as long as they each resolve to an array.
+
+Behavior
+-------------------
+Set operations treat arrays as sets. If an array contains duplicate entries, the set operator ignores the duplicate entries.
+The set operator ignores the order of the elements.
+
+If a set contains a nested array element, the set operator does not descend into the nested array
+but evaluates the array at top-level.
+
+"""
+
+from typing import Any
+from monggregate.base import Expression
+from monggregate.operators.set_.set_ import SetOperator
+
+class SetUnion(SetOperator):
+    """
+    Abstraction of MongoDB $setUnion operator which returns the elements that appear in any of the input arrays.
+
+    Attributes
+    -------------------
+        - operands, list[Any] : list of valid expressions that each resolve to an array
+
+    Online MongoDB documentation
+    ----------------------------
+    Takes two or more arrays and returns an array containing the elements that appear in any input array.
+
+    $setUnion has the following syntax:
+
+        >>> { $setUnion: [ <expression1>, <expression2>, ... ] }
+
+    [Source](https://www.mongodb.com/docs/manual/reference/operator/aggregation/setUnion/#mongodb-expression-exp.-setUnion)
+    """
+
+    operands : list[Any]
+
+    @property
+    def expression(self) -> Expression:
+        return self.express({
+            "$setUnion" : self.operands
+        })
+
+def set_union(*args:Any)->SetUnion:
+    """Returns a $setUnion operator"""
+
+    return SetUnion(
+        operands=list(args)
+    )
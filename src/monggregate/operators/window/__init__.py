@@ -0,0 +1,15 @@
+"""Window Operators subpackage"""
+
+from monggregate.operators.window.dense_rank import DenseRank, dense_rank
+from monggregate.operators.window.derivative import Derivative, derivative
+from monggregate.operators.window.exp_moving_avg import ExpMovingAvg, exp_moving_avg
+from monggregate.operators.window.integral import Integral, integral
+from monggregate.operators.window.rank import Rank, rank
+from monggregate.operators.window.shift import Shift, shift
+from monggregate.operators.window.window import TimeUnitEnum
+
+# TODO:
+# * $covariancePop
+# * $covarianceSamp
+# * $documentNumber
+# * $locf
@@ -0,0 +1,54 @@
+"""
+Module defining an interface to $denseRank operator
+
+Online MongoDB documentation:
+--------------------------------------------------------------------------------------
+
+Last Updated (in this package) : 19/10/2026
+Source : https://www.mongodb.com/docs/manual/reference/operator/aggregation/denseRank/#mongodb-group-grp.-denseRank
+
+Definition
+-----------------------------
+New in version 5.0.
+
+Returns the document position (known as the rank) relative to other documents in the $setWindowFields stage partition.
+
+The $setWindowFields stage sortBy field value determines the document rank.
+Documents with the same sortBy field value are assigned the same rank, and there are no gaps in the ranks
+(ex: 1, 2, 2, 3).
+
+$denseRank is only available in the $setWindowFields stage and has the following syntax:
+
+    >>> { $denseRank: { } }
+
+$denseRank does not accept any parameter and the sortBy field of $setWindowFields must contain a single field.
+$denseRank does not accept a window.
+
+"""
+
+from monggregate.base import Expression
+from monggregate.operators.window.window import WindowOperator
+
+
+class DenseRank(WindowOperator):
+    """
+    Abstraction of MongoDB $denseRank operator which returns the position of a document
+    relative to other documents in the $setWindowFields stage partition, without gaps.
+
+    Online MongoDB documentation
+    ----------------------------
+    Returns the document position (known as the rank) relative to other documents in the $setWindowFields stage partition.
+    Tied documents get the same rank and there are no gaps in the ranks.
+
+    [Source](https://www.mongodb.com/docs/manual/reference/operator/aggregation/denseRank/#mongodb-group-grp.-denseRank)
+    """
+
+    @property
+    def expression(self) -> Expression:
+        return self.express({"$denseRank": {}})
+
+
+def dense_rank() -> DenseRank:
+    """Returns a $denseRank operator"""
+
+    return DenseRank()
@@ -0,0 +1,77 @@
+"""
+Module defining an interface to $derivative operator
+
+Online MongoDB documentation:
+--------------------------------------------------------------------------------------
+
+Last Updated (in this package) : 19/10/2026
+Source : https://www.mongodb.com/docs/manual/reference/operator/aggregation/derivative/#mongodb-group-grp.-derivative
+
+Definition
+-----------------------------
+New in version 5.0.
+
+Returns the average rate of change within the specified window, which is calculated using the:
+
+    * First and last documents in the $setWindowFields stage window.
+
+    * Numerator, which is set to the result of subtracting the numeric expression value for the first document from the expression value for the last document.
+
+    * Denominator, which is set to the result of subtracting the sortBy field value for the first document from the sortBy field value for the last document.
+
+$derivative is only available in the $setWindowFields stage, requires a window and has the following syntax:
+
+    >>> {
+            $derivative: {
+                input: <expression>,
+                unit: <time unit>
+            },
+            window: {
+                range: [ <lower limit>, <upper limit> ],
+                unit: <time unit>
+            }
+        }
+
+    * input : Specifies the expression to evaluate. The expression must evaluate to a number.
+
+    * unit : A string that specifies the time unit. Required if the sortBy field is a date.
+
+"""
+
+from typing import Any
+from monggregate.base import pyd, Expression
+from monggregate.operators.window.window import TimeUnitEnum, WindowOperator
+
+
+class Derivative(WindowOperator):
+    """
+    Abstraction of MongoDB $derivative operator which returns the average rate of change within a window.
+
+    Attributes
+    --------------------------
+        - operand / input, Any : expression to evaluate, must resolve to a number
+        - unit, TimeUnitEnum | None : time unit of the rate of change. Required if the sortBy field is a date.
+
+    Online MongoDB documentation
+    ----------------------------
+    Returns the average rate of change within the specified window.
+
+    [Source](https://www.mongodb.com/docs/manual/reference/operator/aggregation/derivative/#mongodb-group-grp.-derivative)
+    """
+
+    operand: Any = pyd.Field(alias="input")
+    unit: TimeUnitEnum | None = None
+
+    @property
+    def expression(self) -> Expression:
+        statement: dict[str, Any] = {"input": self.operand}
+        if self.unit:
+            statement["unit"] = self.unit
+
+        return self.express({"$derivative": statement})
+
+
+def derivative(operand: Any, unit: TimeUnitEnum | None = None) -> Derivative:
+    """Returns a $derivative operator"""
+
+    return Derivative(operand=operand, unit=unit)
@@ -0,0 +1,93 @@
+"""
+Module defining an interface to $expMovingAvg operator
+
+Online MongoDB documentation:
+--------------------------------------------------------------------------------------
+
+Last Updated (in this package) : 19/10/2026
+Source : https://www.mongodb.com/docs/manual/reference/operator/aggregation/expMovingAvg/#mongodb-group-grp.-expMovingAvg
+
+Definition
+-----------------------------
+New in version 5.0.
+
+Returns the exponential moving average of numeric expressions applied to documents in a partition defined
+in the $setWindowFields stage.
+
+$expMovingAvg is only available in the $setWindowFields stage and has the following syntax:
+
+    >>> {
+            $expMovingAvg: {
+                input: <input expression>,
+                N: <integer>,
+                alpha: <float>
+            }
+        }
+
+    * input : Specifies the expression to evaluate. Non-numeric expressions are ignored.
+
+    * N : An integer that specifies the number of historical documents that have a significant mathematical weight
+          in the exponential moving average calculation, with the most recent documents contributing the most weight.
+          You must specify either N or alpha. You cannot specify both.
+
+    * alpha : A double that specifies the exponential decay value to use in the exponential moving average calculation.
+              A higher alpha value assigns a lower mathematical significance to previous results from the calculation.
+              You must specify either N or alpha. You cannot specify both.
+
+$expMovingAvg does not accept a window.
+
+"""
+
+from typing import Any
+from monggregate.base import pyd, Expression
+from monggregate.operators.window.window import WindowOperator
+
+
+class ExpMovingAvg(WindowOperator):
+    """
+    Abstraction of MongoDB $expMovingAvg operator which returns the exponential moving average of an expression.
+
+    Attributes
+    --------------------------
+        - operand / input, Any : expression to evaluate, non-numeric values are ignored
+        - n / N, int | None : number of historical documents with a significant weight
+        - alpha, float | None : exponential decay value
+
+        NOTE : Exactly one of n and alpha must be provided.
+
+    Online MongoDB documentation
+    ----------------------------
+    Returns the exponential moving average of numeric expressions applied to documents in a partition defined in the $setWindowFields stage.
+
+    [Source](https://www.mongodb.com/docs/manual/reference/operator/aggregation/expMovingAvg/#mongodb-group-grp.-expMovingAvg)
+    """
+
+    operand: Any = pyd.Field(alias="input")
+    n: int | None = pyd.Field(None, alias="N", gt=0)
+    alpha: float | None = pyd.Field(None, gt=0, lt=1)
+
+    @pyd.validator("alpha", always=True)
+    @classmethod
+    def validate_alpha(cls, alpha: float | None, values: dict) -> float | None:
+        """Validates that exactly one of n and alpha is provided"""
+
+        if (values.get("n") is None) == (alpha is None):
+            raise ValueError("Exactly one of n and alpha must be provided")
+
+        return alpha
+
+    @property
+    def expression(self) -> Expression:
+        statement: dict[str, Any] = {"input": self.operand}
+        if self.n is not None:
+            statement["N"] = self.n
+        else:
+            statement["alpha"] = self.alpha
+
+        return self.express({"$expMovingAvg": statement})
+
+
+def exp_moving_avg(operand: Any, n: int | None = None, alpha: float | None = None) -> ExpMovingAvg:
+    """Returns a $expMovingAvg operator"""
+
+    return ExpMovingAvg(operand=operand, n=n, alpha=alpha)
@@ -0,0 +1,76 @@
+"""
+Module defining an interface to $integral operator
+
+Online MongoDB documentation:
+--------------------------------------------------------------------------------------
+
+Last Updated (in this package) : 19/10/2026
+Source : https://www.mongodb.com/docs/manual/reference/operator/aggregation/integral/#mongodb-group-grp.-integral
+
+Definition
+-----------------------------
+New in version 5.0.
+
+Returns the approximation of the area under a curve, which is calculated using the trapezoidal rule
+where each set of adjacent documents form a trapezoid using the:
+
+    * sortBy field values in the $setWindowFields stage for the integral intervals.
+
+    * Expression result values in the input field for the y axis values.
+
+$integral is only available in the $setWindowFields stage and has the following syntax:
+
+    >>> {
+            $integral: {
+                input: <expression>,
+                unit: <time unit>
+            },
+            window: {
+                range: [ <lower limit>, <upper limit> ],
+                unit: <time unit>
+            }
+        }
+
+    * input : Specifies the expression to evaluate. The expression must evaluate to a number.
+
+    * unit : A string that specifies the time unit. Required if the sortBy field is a date.
+
+"""
+
+from typing import Any
+from monggregate.base import pyd, Expression
+from monggregate.operators.window.window import TimeUnitEnum, WindowOperator
+
+
+class Integral(WindowOperator):
+    """
+    Abstraction of MongoDB $integral operator which returns the approximation of the area under a curve within a window.
+
+    Attributes
+    --------------------------
+        - operand / input, Any : expression to evaluate, must resolve to a number
+        - unit, TimeUnitEnum | None : time unit of the sortBy axis. Required if the sortBy field is a date.
+
+    Online MongoDB documentation
+    ----------------------------
+    Returns the approximation of the area under a curve, calculated using the trapezoidal rule.
+
+    [Source](https://www.mongodb.com/docs/manual/reference/operator/aggregation/integral/#mongodb-group-grp.-integral)
+    """
+
+    operand: Any = pyd.Field(alias="input")
+    unit: TimeUnitEnum | None = None
+
+    @property
+    def expression(self) -> Expression:
+        statement: dict[str, Any] = {"input": self.operand}
+        if self.unit:
+            statement["unit"] = self.unit
+
+        return self.express({"$integral": statement})
+
+
+def integral(operand: Any, unit: TimeUnitEnum | None = None) -> Integral:
+    """Returns a $integral operator"""
+
+    return Integral(operand=operand, unit=unit)
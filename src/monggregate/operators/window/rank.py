@@ -0,0 +1,54 @@
+"""
+Module defining an interface to $rank operator
+
+Online MongoDB documentation:
+--------------------------------------------------------------------------------------
+
+Last Updated (in this package) : 19/10/2026
+Source : https://www.mongodb.com/docs/manual/reference/operator/aggregation/rank/#mongodb-group-grp.-rank
+
+Definition
+-----------------------------
+New in version 5.0.
+
+Returns the document position (known as the rank) relative to other documents in the $setWindowFields stage partition.
+
+The $setWindowFields stage sortBy field value determines the document rank.
+Documents with the same sortBy field value are assigned the same rank, and the next rank skips the tied positions
+(ex: 1, 2, 2, 4).
+
+$rank is only available in the $setWindowFields stage and has the following syntax:
+
+    >>> { $rank: { } }
+
+$rank does not accept any parameter and the sortBy field of $setWindowFields must contain a single field.
+$rank does not accept a window.
+
+"""
+
+from monggregate.base import Expression
+from monggregate.operators.window.window import WindowOperator
+
+
+class Rank(WindowOperator):
+    """
+    Abstraction of MongoDB $rank operator which returns the position of a document
+    relative to other documents in the $setWindowFields stage partition.
+
+    Online MongoDB documentation
+    ----------------------------
+    Returns the document position (known as the rank) relative to other documents in the $setWindowFields stage partition.
+    Tied documents get the same rank and the following ranks have gaps.
+
+    [Source](https://www.mongodb.com/docs/manual/reference/operator/aggregation/rank/#mongodb-group-grp.-rank)
+    """
+
+    @property
+    def expression(self) -> Expression:
+        return self.express({"$rank": {}})
+
+
+def rank() -> Rank:
+    """Returns a $rank operator"""
+
+    return Rank()
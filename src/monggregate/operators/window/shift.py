@@ -0,0 +1,81 @@
+"""
+Module defining an interface to $shift operator
+
+Online MongoDB documentation:
+--------------------------------------------------------------------------------------
+
+Last Updated (in this package) : 19/10/2026
+Source : https://www.mongodb.com/docs/manual/reference/operator/aggregation/shift/#mongodb-group-grp.-shift
+
+Definition
+-----------------------------
+New in version 5.0.
+
+Returns the value from an expression applied to a document in a specified position relative to the
+current document in the $setWindowFields stage partition.
+
+The $setWindowFields stage sortBy field value determines the document order.
+
+$shift is only available in the $setWindowFields stage and has the following syntax:
+
+    >>> {
+            $shift: {
+                output: <output expression>,
+                by: <integer>,
+                default: <default expression>
+            }
+        }
+
+    * output : Specifies an expression to evaluate and return in the output.
+
+    * by : Specifies an integer with a numeric document position relative to the current document in the output.
+           For example, 1 specifies the document position after the current document, and -1 the document position before.
+
+    * default : Optional. Specifies an optional default expression to evaluate if the document position is outside
+                of the implicit $setWindowFields stage window. Defaults to null.
+
+$shift does not accept a window.
+
+"""
+
+from typing import Any
+from monggregate.base import Expression
+from monggregate.operators.window.window import WindowOperator
+
+
+class Shift(WindowOperator):
+    """
+    Abstraction of MongoDB $shift operator which returns the value of an expression applied
+    to a document at a position relative to the current document (i.e lag/lead).
+
+    Attributes
+    --------------------------
+        - output, Any : expression to evaluate on the shifted document
+        - by, int : position of the shifted document relative to the current document
+        - default, Any : expression to evaluate when the shifted position is outside of the partition. Defaults to null.
+
+    Online MongoDB documentation
+    ----------------------------
+    Returns the value from an expression applied to a document in a specified position relative to the
+    current document in the $setWindowFields stage partition.
+
+    [Source](https://www.mongodb.com/docs/manual/reference/operator/aggregation/shift/#mongodb-group-grp.-shift)
+    """
+
+    output: Any
+    by: int
+    default: Any = None
+
+    @property
+    def expression(self) -> Expression:
+        statement = {"output": self.output, "by": self.by}
+        if self.default is not None:
+            statement["default"] = self.default
+
+        return self.express({"$shift": statement})
+
+
+def shift(output: Any, by: int, default: Any = None) -> Shift:
+    """Returns a $shift operator"""
+
+    return Shift(output=output, by=by, default=default)
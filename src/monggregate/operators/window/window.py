@@ -0,0 +1,53 @@
+"""
+Module defining the base class and enums of the window operators
+
+Window operators can only be used in the output of the $setWindowFields stage.
+
+Online MongoDB documentation:
+--------------------------------------------------------------------------------------
+
+Last Updated (in this package) : 19/10/2026
+Source : https://www.mongodb.com/docs/manual/reference/operator/aggregation/setWindowFields/#window-operators
+
+"""
+
+from abc import ABC
+
+# Local imports
+# -----------------------------------------
+from monggregate.operators import Operator
+from monggregate.utils import StrEnum
+
+
+# Enums
+# -----------------------------------------
+class WindowOperatorEnum(StrEnum):
+    """Enumeration of available window only operators"""
+
+    COVARIANCE_POP = "$covariancePop"  # Returns the population covariance of two numeric expressions.
+    COVARIANCE_SAMP = "$covarianceSamp"  # Returns the sample covariance of two numeric expressions.
+    DENSE_RANK = "$denseRank"  # Returns the document position (rank) relative to other documents. There are no gaps in the ranks.
+    DERIVATIVE = "$derivative"  # Returns the average rate of change within the specified window.
+    DOCUMENT_NUMBER = "$documentNumber"  # Returns the position of a document in the partition.
+    EXP_MOVING_AVG = "$expMovingAvg"  # Returns the exponential moving average for the numeric expression.
+    INTEGRAL = "$integral"  # Returns the approximation of the area under a curve.
+    LOCF = "$locf"  # Last observation carried forward.
+    RANK = "$rank"  # Returns the document position (rank) relative to other documents. There can be gaps in the ranks.
+    SHIFT = "$shift"  # Returns the value from an expression applied to a document in a specified position relative to the current document.
+
+
+class TimeUnitEnum(StrEnum):
+    """Enumeration of the time units usable in windows and window operators"""
+
+    WEEK = "week"
+    DAY = "day"
+    HOUR = "hour"
+    MINUTE = "minute"
+    SECOND = "second"
+    MILLISECOND = "millisecond"
+
+
+# Classes
+# -----------------------------------------
+class WindowOperator(Operator, ABC):
+    """Base class for window operators"""
@@ -13,18 +13,28 @@ from monggregate.stages import (
     GranularityEnum,
     Bucket,
     Count,
+    Densify,
+    DensifyRange,
+    Documents,
+    Facet as FacetStage,
+    Fill,
+    GeoNear,
+    GraphLookup,
     Group,
     Limit,
     Lookup,
     Match,
+    Merge,
     Out,
     Project,
+    Redact,
     ReplaceRoot,
     Sample,
     Search,
     SearchMeta,
     SearchStageMap,
     Set,
+    SetWindowFields,
     Skip,
     SortByCount,
     Sort,
@@ -33,13 +43,17 @@ from monggregate.stages import (
     Unset,
     VectorSearch,
 )
-from monggregate.stages.search.base import OperatorLiteral
+from monggregate.stages.search.base import OperatorLiteral, SearchConfig
 from monggregate.search.operators import OperatorMap
 from monggregate.search.operators.compound import Compound, ClauseType
-from monggregate.search.collectors.facet import Facet, FacetType
+from monggregate.search.collectors.facet import Facet, Facets, FacetType
 from monggregate.search.commons import CountOptions, HighlightOptions
-from monggregate.operators import MergeObjects
-from monggregate.dollar import ROOT
+from monggregate.search.commons.stored_source import StoredSource, uncovered_fields
+from monggregate.geo import GeoJSONPoint
+from monggregate.vectors import BinaryVector
+from monggregate.operators import First, MergeObjects
+from monggregate.operators.conditional import Cond
+from monggregate.dollar import DESCEND, PRUNE, ROOT, SEARCH_META
 
 
 class Pipeline(BaseModel):  # pylint: disable=too-many-public-methods
@@ -83,7 +97,17 @@ class Pipeline(BaseModel):  # pylint: disable=too-many-public-methods
     def expression(self) -> list[Expression]:
         """Returns the pipeline statement"""
 
-        return express(self.stages)
+        statements = express(self.stages)
+        for statement in statements[:-1]:
+            for name in ("$merge", "$out"):
+                if isinstance(statement, dict) and name in statement:
+                    raise ValueError(f"{name} must be the last stage of the pipeline")
+        for statement in statements[1:]:
+            for name in ("$documents", "$geoNear"):
+                if isinstance(statement, dict) and name in statement:
+                    raise ValueError(f"{name} must be the first stage of the pipeline")
+
+        return statements
 
     # ------------------------------------------------
     # Pipeline Internal Methods
@@ -99,6 +123,67 @@ class Pipeline(BaseModel):  # pylint: disable=too-many-public-methods
 
         return self.expression
 
+    def rewrite_lookups(self) -> Self:
+        """
+        Rewrites the equality-correlated Lookup stages of the pipeline to the concise (MongoDB 5.0+) syntax.
+
+        See `Lookup.to_concise` for the conditions under which a lookup is rewritten.
+
+            >>> pipeline.rewrite_lookups().export()
+
+        """
+
+        self.stages = [
+            stage.to_concise() if isinstance(stage, Lookup) else stage
+            for stage in self.stages
+        ]
+        return self
+
+    def suggest_indexes(self) -> dict[str, list[dict[str, int]]]:
+        """
+        Returns the indexes supporting the Lookup stages of the pipeline, by foreign collection.
+
+            >>> for collection, indexes in pipeline.suggest_indexes().items():
+                    for keys in indexes:
+                        db[collection].create_index(list(keys.items()))
+
+        """
+
+        suggestions: dict[str, list[dict[str, int]]] = {}
+        for stage in self.stages:
+            if isinstance(stage, Lookup) and stage.right:
+                keys = stage.index_suggestion()
+                if keys and keys not in suggestions.setdefault(stage.right, []):
+                    suggestions[stage.right].append(keys)
+
+        return {collection: indexes for collection, indexes in suggestions.items() if indexes}
+
+    def check_stored_source(self, stored_source: StoredSource | list[str] | bool) -> list[str]:
+        """
+        Returns the fields referenced after the search stage of the pipeline which are not stored in the search index.
+
+        When the search stage returns the stored source, warns that those fields will be missing from the documents.
+        stored_source is the storedSource definition of the index (see `StoredSource`).
+
+            >>> pipeline = Pipeline().search(path="title", query="matrix", return_stored_source=True)
+            >>> pipeline.project(include=["title", "plot"]).check_stored_source(["title"])
+            ['plot']
+
+        """
+
+        if not self.stages or not isinstance(self.stages[0], Search):
+            raise TypeError("The pipeline must start with a search stage")
+
+        uncovered = uncovered_fields(self.export()[1:], stored_source)
+        if uncovered and self.stages[0].return_stored_source:
+            warn(
+                f"The fields {uncovered} are referenced after $search but are not stored in the search index. "
+                "They will be missing from the documents returned with return_stored_source=True, "
+                "store them in the index or do not return the stored source."
+            )
+
+        return uncovered
+
     # --------------------------------------------------
     # Pipeline List Methods
     # ---------------------------------------------------
@@ -319,6 +404,86 @@ class Pipeline(BaseModel):  # pylint: disable=too-many-public-methods
         self.stages.append(Count(name=name))
         return self
 
+    def densify(
+        self,
+        field: str,
+        *,
+        step: int | float | None = None,
+        unit: str | None = None,
+        bounds: Literal["full", "partition"] | list[Any] = "full",
+        partition_by_fields: list[str] | None = None,
+        range: DensifyRange | dict | None = None,  # pylint: disable=redefined-builtin
+    ) -> Self:
+        """
+        Adds a densify stage to the current pipeline.
+        Creates new documents in a sequence of documents where certain values in a field are missing.
+
+        Arguments:
+        ---------------------------
+        - field, str : the field to densify. Its values must either be all numeric values or all dates.
+        - partition_by_fields, list[str] | None : fields to group the documents into partitions. Defaults to a single partition.
+        - range, DensifyRange : step, unit and bounds of the values to add.
+
+        Online MongoDB documentation:
+        -----------------------------
+        Creates new documents in a sequence of documents where certain values in a field are missing.
+
+        Source : https://www.mongodb.com/docs/manual/reference/operator/aggregation/densify/#mongodb-pipeline-pipe.-densify
+
+        Usage:
+        -----------------------------
+        The range can be provided either as a DensifyRange or through the step, unit and bounds arguments:
+
+            >>> pipeline.densify("timestamp", step=1, unit="hour", partition_by_fields=["sensor"], bounds="partition")
+        """
+
+        if range is None:
+            range = DensifyRange(step=step, unit=unit, bounds=bounds)
+
+        self.stages.append(
+            Densify(field=field, partition_by_fields=partition_by_fields, range=range)
+        )
+        return self
+
+    def documents(self, documents: list[dict] | Any) -> Self:
+        """
+        Adds a documents stage to the current pipeline.
+        Returns literal documents from input values.
+
+        Arguments:
+        ---------------------------
+        - documents, list[dict] | Any : the literal documents, or an expression resolving to an array of documents.
+                                        Literal documents are emitted as is (they are neither validated nor copied),
+                                        so that large batches can be injected cheaply.
+
+        Online MongoDB documentation:
+        -----------------------------
+        Returns literal documents from input values.
+        You must use documents as the first stage of an aggregation pipeline.
+
+        Source : https://www.mongodb.com/docs/manual/reference/operator/aggregation/documents/#mongodb-pipeline-pipe.-documents
+
+        Usage:
+        -----------------------------
+        Joining a batch of client-side ids with a collection, without a temporary collection:
+
+            >>> Pipeline().documents([{"sku": sku} for sku in skus]).lookup(
+                    right="products", on="sku", name="product"
+                )
+
+        The pipeline must then be run at the database level (ex: db.aggregate(pipeline.export())).
+        The stage can also be used inside the pipeline of a lookup or union_with stage, in which case
+        the foreign collection can be omitted:
+
+            >>> pipeline.lookup(name="rates", pipeline=Pipeline().documents(rates), let={"currency": "$currency"})
+        """
+
+        if self.stages:
+            raise ValueError("documents must be the first stage of the pipeline")
+
+        self.stages.append(Documents(documents=documents))
+        return self
+
     def explode(
         self,
         path_to_array: str | None = None,
@@ -356,6 +521,213 @@ class Pipeline(BaseModel):  # pylint: disable=too-many-public-methods
         )
         return self
 
+    def facet(self, pipelines: dict[str, Any] = {}, **kwargs: Any) -> Self:
+        """
+        Adds a facet stage to the current pipeline.
+        Processes multiple aggregation pipelines within a single stage on the same set of input documents.
+
+        Arguments:
+        ---------------------------
+        - pipelines, dict[str, Pipeline | list[Stage | dict]] : sub-pipelines mapped to the name of the output field storing their results.
+                                                               The sub-pipelines cannot contain $collStats, $facet, $geoNear, $indexStats,
+                                                               $out, $merge, $planCacheStats, $search, $searchMeta or $vectorSearch stages.
+
+        Online MongoDB documentation:
+        -----------------------------
+        Processes multiple aggregation pipelines within a single stage on the same set of input documents.
+        Each sub-pipeline has its own field in the output document where its results are stored as an array of documents.
+
+        Source : https://www.mongodb.com/docs/manual/reference/operator/aggregation/facet/#mongodb-pipeline-pipe.-facet
+
+        Usage:
+        -----------------------------
+        Sub-pipelines can also be passed as keyword arguments:
+
+            >>> pipeline.match(category="books").facet(
+                    results=Pipeline().sort(by="price", descending=True).skip(20).limit(10),
+                    total=Pipeline().count("count"),
+                    categories=Pipeline().sort_by_count("$genre"),
+                )
+        """
+
+        pipelines = pipelines | kwargs
+        self.stages.append(FacetStage(pipelines=pipelines))
+        return self
+
+    def fill(
+        self,
+        output: dict[str, Any] = {},
+        *,
+        sort_by: dict[str, Literal[1, -1]] | None = None,
+        partition_by: Any = None,
+        partition_by_fields: list[str] | None = None,
+        **kwargs: Any,
+    ) -> Self:
+        """
+        Adds a fill stage to the current pipeline.
+        Populates null and missing field values within documents.
+
+        Arguments:
+        ---------------------------
+        - output, dict[str, Any] : fields to fill, mapped to {"value": <expression>} or {"method": "linear" | "locf"}
+        - sort_by, dict[str, Literal[1, -1]] | None : fields to sort the documents by in the partitions. Required by the linear and locf methods.
+        - partition_by, Any : expression to group the documents into partitions. Defaults to a single partition.
+        - partition_by_fields, list[str] | None : fields to group the documents into partitions. Cannot be used with partition_by.
+
+        Online MongoDB documentation:
+        -----------------------------
+        Populates null and missing field values within documents.
+
+        Source : https://www.mongodb.com/docs/manual/reference/operator/aggregation/fill/#mongodb-pipeline-pipe.-fill
+
+        Usage:
+        -----------------------------
+        Fields to fill can also be passed as keyword arguments:
+
+            >>> pipeline.densify("timestamp", step=1, unit="hour").fill(
+                    sort_by={"timestamp": 1},
+                    temperature={"method": "linear"},
+                    status={"value": "missing"},
+                )
+        """
+
+        output = output | kwargs
+        self.stages.append(
+            Fill(
+                output=output,
+                sort_by=sort_by,
+                partition_by=partition_by,
+                partition_by_fields=partition_by_fields,
+            )
+        )
+        return self
+
+    def geo_near(
+        self,
+        near: GeoJSONPoint | list[float] | dict,
+        *,
+        distance_field: str,
+        spherical: bool = False,
+        max_distance: float | None = None,
+        min_distance: float | None = None,
+        query: dict | None = None,
+        key: str | None = None,
+        distance_multiplier: float | None = None,
+    ) -> Self:
+        """
+        Adds a geo_near stage to the current pipeline.
+        Outputs documents in order of nearest to farthest from a specified point.
+
+        Arguments:
+        ----------------------------
+            - near, GeoJSONPoint | list[float] : the point for which to find the closest documents.
+                                                 Either a GeoJSON point or a legacy [x, y] coordinate pair.
+            - distance_field, str : output field containing the calculated distance
+            - spherical, bool : whether to use spherical geometry to compute the distances. Defaults to False.
+            - max_distance, float | None : maximum distance from near of the documents.
+                                           In meters for GeoJSON points, in radians for legacy coordinate pairs.
+            - min_distance, float | None : minimum distance from near of the documents. Requires a GeoJSON point or spherical.
+            - query, dict | None : query the documents must match. Cannot contain $near or $nearSphere.
+            - key, str | None : geospatial indexed field to use. Required if the collection has several geospatial indexes.
+            - distance_multiplier, float | None : factor to multiply the distances with (ex: to convert radians to kilometers).
+
+        Online MongoDB documentation:
+        -----------------------------
+        Outputs documents in order of nearest to farthest from a specified point.
+        You can only use geoNear as the first stage of a pipeline.
+
+        Source : https://www.mongodb.com/docs/manual/reference/operator/aggregation/geoNear/#mongodb-pipeline-pipe.-geoNear
+
+        Usage:
+        -----------------------------
+        Restaurants within 1 km, nearest first:
+
+            >>> Pipeline().geo_near(
+                    GeoJSONPoint.from_lon_lat(-73.99279, 40.719296),
+                    distance_field="distance",
+                    max_distance=1000,
+                    query={"category": "restaurant"},
+                )
+        """
+
+        if self.stages:
+            raise ValueError("geo_near must be the first stage of the pipeline")
+
+        self.stages.append(
+            GeoNear(
+                near=near,
+                distance_field=distance_field,
+                spherical=spherical,
+                max_distance=max_distance,
+                min_distance=min_distance,
+                query=query,
+                key=key,
+                distance_multiplier=distance_multiplier,
+            )
+        )
+        return self
+
+    def graph_lookup(
+        self,
+        *,
+        right: str,
+        start_with: Any,
+        connect_from_field: str,
+        connect_to_field: str,
+        name: str,
+        max_depth: int | None = None,
+        depth_field: str | None = None,
+        restrict_search_with_match: dict | None = None,
+    ) -> Self:
+        """
+        Adds a graph_lookup stage to the current pipeline.
+        Performs a recursive search on a collection, with options for restricting the search by recursion depth and query filter.
+
+        Arguments:
+        ----------------------------
+            - right / from (official MongoDB name), str : collection to search recursively
+            - start_with, Any : expression giving the value(s) of connect_from_field to start the search with
+            - connect_from_field, str : field whose value is recursively matched against connect_to_field
+            - connect_to_field, str : field of the documents of the from collection to match against
+            - name / as, str : name of the array field containing the traversed documents
+            - max_depth, int | None : maximum recursion depth. Defaults to an unlimited depth.
+            - depth_field, str | None : name of the field storing the recursion depth of the traversed documents
+            - restrict_search_with_match, dict | None : additional query filter the traversed documents must match
+
+        Online MongoDB documentation:
+        -----------------------------
+        Performs a recursive search on a collection, with options for restricting the search by recursion depth and query filter.
+
+        Source : https://www.mongodb.com/docs/manual/reference/operator/aggregation/graphLookup/#mongodb-pipeline-pipe.-graphLookup
+
+        Usage:
+        -----------------------------
+        Retrieving the management chain of each employee:
+
+            >>> pipeline.graph_lookup(
+                    right="employees",
+                    start_with="$reportsTo",
+                    connect_from_field="reportsTo",
+                    connect_to_field="name",
+                    name="reportingHierarchy",
+                    depth_field="level",
+                )
+        """
+
+        self.stages.append(
+            GraphLookup(
+                right=right,
+                start_with=start_with,
+                connect_from_field=connect_from_field,
+                connect_to_field=connect_to_field,
+                name=name,
+                max_depth=max_depth,
+                depth_field=depth_field,
+                restrict_search_with_match=restrict_search_with_match,
+            )
+        )
+        return self
+
     def group(
         self, *, by: Any | None = None, _id: Any | None = None, query: dict = {}
     ) -> Self:
@@ -389,6 +761,109 @@ class Pipeline(BaseModel):  # pylint: disable=too-many-public-methods
         self.stages.append(Group(by=by or _id, query=query))
         return self
 
+    def hybrid_search(
+        self,
+        collection: str,
+        *,
+        text: Search | dict[str, Any],
+        vector: VectorSearch | dict[str, Any],
+        weights: dict[str, float] | None = None,
+        k: int = 60,
+        limit: int | None = None,
+        text_limit: int | None = None,
+    ) -> Self:
+        """
+        Adds a combination of stages that merges a full-text search and a vector search with reciprocal rank fusion (RRF).
+        This is a virtual and unofficial stage. It is not documented on MongoDB aggregation pipeline reference page.
+
+        The vector search starts the pipeline and the full-text search is run in a $unionWith sub-pipeline.
+        Each branch ranks its results with $setWindowFields and scores them weight / (k + rank).
+        The results are then grouped by _id and sorted by the sum of their scores in score,
+        the score of each branch being kept in vector_score and text_score.
+
+        Arguments:
+        -------------------
+            - collection, str : the collection the pipeline runs on, searched again by the $unionWith sub-pipeline
+            - text, Search | dict : the full-text search, or the arguments of `Pipeline.search` to build it
+            - vector, VectorSearch | dict : the vector search, or the arguments of `Pipeline.vector_search` to build it
+            - weights, dict[str, float] | None : weights of the "text" and "vector" branches. Both default to 1.
+            - k, int : the RRF constant, dampening the weight of the first ranks. Defaults to 60.
+            - limit, int | None : number of fused results to return. Defaults to all of them.
+            - text_limit, int | None : number of full-text results to rank. Defaults to the limit of the vector search.
+
+        NOTE : $search and $vectorSearch must be the first stage of the pipeline, which must therefore be empty.
+        """
+
+        if self.stages:
+            raise ValueError("hybrid_search must start the pipeline, as $vectorSearch must be the first stage")
+        if k < 1:
+            raise ValueError("k must be a positive integer")
+
+        weights = {"text": 1.0, "vector": 1.0, **(weights or {})}
+        if set(weights) != {"text", "vector"} or any(weight < 0 for weight in weights.values()):
+            raise ValueError('weights must map "text" and "vector" to non-negative numbers')
+
+        if isinstance(vector, dict):
+            vector = VectorSearch(**vector)
+        if isinstance(text, Search):
+            text_stages: list[AnyStage | Expression] = [text]
+        else:
+            text_stages = Pipeline().search(**text).stages
+        text_stages.append(Limit(value=text_limit or vector.limit))
+
+        self.stages.append(vector)
+        self.stages.extend(self.__reciprocal_rank("vectorSearchScore", "vector_score", weights["vector"], k))
+        self.stages.append(
+            UnionWith(
+                collection=collection,
+                pipeline=text_stages + self.__reciprocal_rank("searchScore", "text_score", weights["text"], k),
+            )
+        )
+
+        document_field = "__document__"
+        self.stages.extend(
+            [
+                Group(
+                    by="_id",
+                    query={
+                        document_field: {"$first": ROOT},
+                        "vector_score": {"$max": "$vector_score"},
+                        "text_score": {"$max": "$text_score"},
+                    },
+                ),
+                ReplaceRoot(
+                    document=MergeObjects(
+                        operand=[
+                            "$" + document_field,
+                            {
+                                "vector_score": {"$ifNull": ["$vector_score", 0]},
+                                "text_score": {"$ifNull": ["$text_score", 0]},
+                                "score": {
+                                    "$add": [{"$ifNull": ["$vector_score", 0]}, {"$ifNull": ["$text_score", 0]}]
+                                },
+                            },
+                        ]
+                    ).expression
+                ),
+                Sort(descending=["score"]),
+            ]
+        )
+        if limit:
+            self.stages.append(Limit(value=limit))
+
+        return self
+
+    @staticmethod
+    def __reciprocal_rank(meta: str, field: str, weight: float, k: int) -> list[AnyStage]:
+        """Returns the stages scoring the results of a search by weight / (k + rank) in field"""
+
+        return [
+            Set(document={"__score__": {"$meta": meta}}),
+            SetWindowFields(sort_by={"__score__": -1}, output={"__rank__": {"$documentNumber": {}}}),
+            Set(document={field: {"$divide": [weight, {"$add": [k, "$__rank__"]}]}}),
+            Unset(fields=["__score__", "__rank__"]),
+        ]
+
     def limit(self, value: int) -> Self:
         """
         Adds a limit stage to the current pipeline.
@@ -425,6 +900,8 @@ class Pipeline(BaseModel):  # pylint: disable=too-many-public-methods
         local_field: str | None = None,
         right_on: str | None = None,
         foreign_field: str | None = None,
+        let: dict | None = None,
+        pipeline: list[Any] | None = None,
     ) -> Self:
         """
         Adds a lookup stage to the current pipeline.
@@ -434,7 +911,7 @@ class Pipeline(BaseModel):  # pylint: disable=too-many-public-methods
 
         Arguments:
         ----------------------------
-            - right / from (official MongoDB name), str : foreign collection
+            - right / from (official MongoDB name), str | None : foreign collection. Can be omitted when the pipeline starts with a $documents stage.
             - left_on / local_field (official MongoDB name)), str | None : field of the current collection to join on
             - right_on / foreign_field (official MongoDB name), str | None : field of the foreign collection to join on
             - let, dict | None : variables to be used in the inner pipeline
@@ -479,6 +956,8 @@ class Pipeline(BaseModel):  # pylint: disable=too-many-public-methods
                 on=on,
                 left_on=left_on or local_field,
                 right_on=right_on or foreign_field,
+                let=let,
+                pipeline=pipeline,
                 name=name,
             )
         )
@@ -607,6 +1086,52 @@ class Pipeline(BaseModel):  # pylint: disable=too-many-public-methods
         self.stages.append(Match(query=query, expr=expr))
         return self
 
+    def merge(
+        self,
+        into: str,
+        *,
+        db: str | None = None,
+        on: str | list[str] | None = None,
+        let: dict | None = None,
+        when_matched: Literal["replace", "keepExisting", "merge", "fail"] | list[dict] | None = None,
+        when_not_matched: Literal["insert", "discard", "fail"] | None = None,
+    ) -> Self:
+        """
+        Adds a merge stage to the current pipeline.
+        Writes the documents returned by the aggregation pipeline into a collection, incrementally updating it.
+
+        Arguments:
+        ---------------------------
+        - into, str : name of the output collection
+        - db, str|None : name of the db of the output collection. Defaults to the current db.
+        - on, str|list[str]|None : field or fields that act as a unique identifier for a document. Defaults to _id.
+        - let, dict|None : variables accessible in the whenMatched pipeline. The merged document is available as $$new.
+        - when_matched, WhenMatchedEnum|list[dict]|None : action or update pipeline to apply when a document matches an existing document.
+                                                           Defaults to merge.
+        - when_not_matched, WhenNotMatchedEnum|None : action to apply when a document does not match an existing document.
+                                                     Defaults to insert.
+
+        Online MongoDB documentation:
+        -----------------------------
+        Writes the results of the aggregation pipeline to a specified collection. The merge operator must be the last stage in the pipeline.
+        Unlike out, merge can incorporate the results into an existing collection (insert new documents, merge documents,
+        replace documents, keep existing documents, fail the operation, process documents with a custom update pipeline).
+
+        Source : https://www.mongodb.com/docs/manual/reference/operator/aggregation/merge/#mongodb-pipeline-pipe.-merge
+        """
+
+        self.stages.append(
+            Merge(
+                into=into,
+                db=db,
+                on=on,
+                let=let,
+                when_matched=when_matched,
+                when_not_matched=when_not_matched,
+            )
+        )
+        return self
+
     def out(
         self,
         collection: str | None = None,
@@ -677,6 +1202,51 @@ class Pipeline(BaseModel):  # pylint: disable=too-many-public-methods
         )
         return self
 
+    def redact(
+        self,
+        condition: Any = None,
+        *,
+        when: Any = None,
+        then: Any = DESCEND,
+        otherwise: Any = PRUNE,
+    ) -> Self:
+        """
+        Adds a redact stage to the current pipeline.
+        Restricts entire documents or content within documents from being outputted based on information stored in the documents themselves.
+
+        Arguments:
+        -----------
+            - condition, Any : expression resolving to $$DESCEND, $$PRUNE or $$KEEP.
+                               Usually a Cond or a Switch operator whose cases use the set operators (ex: $setIntersection)
+                               to compare the access levels of the documents with the ones of the user.
+
+        Online MongoDB documentation:
+        -----------------------------
+        Restricts entire documents or content within documents from being outputted based on information stored in the documents themselves.
+
+        The argument can be any valid expression as long as it resolves to the $$DESCEND, $$PRUNE, or $$KEEP system variables.
+
+        Source : https://www.mongodb.com/docs/manual/reference/operator/aggregation/redact/#mongodb-pipeline-pipe.-redact
+
+        Usage:
+        -----------------------------
+        When condition is not provided, a Cond operator is built from:
+            - when, Any : boolean expression to evaluate at each document level
+            - then, Any : outcome when the when expression is true. Defaults to $$DESCEND.
+            - otherwise, Any : outcome when the when expression is false. Defaults to $$PRUNE.
+
+            >>> user_access = ["STLW", "G"]
+            >>> Pipeline().redact(when=S.gt(S.size(S.set_intersection("$tags", user_access)), 0))
+        """
+
+        if condition is None:
+            if when is None:
+                raise ValueError("Either condition or when must be provided")
+            condition = Cond(if_=when, then_=then, else_=otherwise)
+
+        self.stages.append(Redact(condition=condition))
+        return self
+
     def replace_root(
         self,
         path: str | None = None,
@@ -789,6 +1359,10 @@ class Pipeline(BaseModel):  # pylint: disable=too-many-public-methods
         highlight: HighlightOptions | None = None,
         return_stored_source: bool = False,
         score_details: bool = False,
+        concurrent: bool = False,
+        sort: dict[str, Any] | None = None,
+        after: str | None = None,
+        before: str | None = None,
         **kwargs: Any,
     ) -> Self:
         """
@@ -816,6 +1390,14 @@ class Pipeline(BaseModel):  # pylint: disable=too-many-public-methods
                                     the documents in the results. Defaults to False.
                                     To view the details, you must use the $meta expression in the
                                     $project stage.
+            - concurrent, bool : Indicates whether to parallelize the search across the segments of the index
+                                 (dedicated search nodes only). Defaults to False.
+            - sort, dict|None : fields to sort the results by, sorted by Atlas Search rather than
+                                by a $sort stage. Ex: {"released": -1, "score": {"$meta": "searchScore"}}
+            - after, str|None : pagination token ({"$meta": "searchSequenceToken"}) of the result
+                                to return the next page after
+            - before, str|None : pagination token ({"$meta": "searchSequenceToken"}) of the result
+                                 to return the previous page before (in reverse order)
             - operator_name, str : Name of the operator to search with. Use the compound operator to run a
                               compound (i.e query with multiple operators).
             - kwargs, Any : Operators specific options.
@@ -856,12 +1438,17 @@ class Pipeline(BaseModel):  # pylint: disable=too-many-public-methods
                 highlight=highlight,
                 return_stored_source=return_stored_source,
                 score_details=score_details,
+                concurrent=concurrent,
+                sort=sort,
+                search_after=after,
+                search_before=before,
                 **kwargs,
             )
 
         # If pipeline is not empty then the first stage must be Search stage.
         # If so, adds the operator to the existing stage using Compound.
         elif len(self) >= 1 and isinstance(self.stages[0], Search):
+            self.__update_search_options(concurrent, sort, after, before)
             kwargs.update(
                 {
                     # "collector_name":collector_name,
@@ -978,6 +1565,117 @@ class Pipeline(BaseModel):  # pylint: disable=too-many-public-methods
 
         return self
 
+    def search_with_meta(
+        self,
+        path: str | list[str] | None = None,
+        query: str | list[str] | None = None,
+        *,
+        operator_name: OperatorLiteral | None = None,
+        facets: Facets | None = None,
+        how: Literal["facet", "set"] = "facet",
+        skip: int = 0,
+        limit: int | None = None,
+        results_field: str = "docs",
+        meta_field: str = "meta",
+        index: str = "default",
+        count: CountOptions | None = None,
+        sort: dict[str, Any] | None = None,
+        **kwargs: Any,
+    ) -> Self:
+        """
+        Adds a combination of stages returning a page of search results and their metadata (count and facets)
+        in a single aggregation, instead of one $search and one $searchMeta aggregation.
+        This is a virtual and unofficial stage. It is not documented on MongoDB aggregation pipeline reference page.
+
+        The search stage uses a facet collector when facets are provided, and its metadata is read
+        from the $$SEARCH_META variable.
+
+        NOTE : The metadata is only available when at least one document matches the search.
+
+        Arguments:
+        -------------------------------
+            - path, str|list[str]|None : field to search in
+            - query, str|list[str]|None : text to search for
+            - operator_name, str|None : name of the operator to search with. Defaults to text when a query is provided.
+            - facets, list[StringFacet|NumericFacet|DateFacet]|None : facets to compute over the matching documents
+            - how, "facet"|"set" : how to return the metadata.
+                                   "facet" => a single document with the page of results in results_field
+                                              and the metadata in meta_field (via $facet)
+                                   "set" => the page of results, each one with the metadata in meta_field (via $set)
+            - skip, int : number of results to skip. Defaults to 0.
+            - limit, int|None : maximum number of results to return
+            - results_field, str : name of the field storing the results when how is "facet". Defaults to docs.
+            - meta_field, str : name of the field storing the metadata. Defaults to meta.
+            - index, str : name of the index to use for the search. Defaults to default
+            - count, CountOptions|None : count options of the metadata (ex: {"type": "total"})
+            - sort, dict|None : fields to sort the results by, sorted by Atlas Search
+            - kwargs, Any : other options of the search stage and the operator (see `search`)
+
+        Usage:
+        -------------------------------
+            >>> pipeline = Pipeline().search_with_meta(
+                    "plot",
+                    "space",
+                    facets=[StringFacet(name="genres", path="genres", num_buckets=10)],
+                    count={"type": "total"},
+                    skip=20,
+                    limit=10,
+                )
+            >>> page, = db.movies.aggregate(pipeline.export())
+            >>> page["meta"]["count"]["total"], page["meta"]["facet"]["genres"]["buckets"], page["docs"]
+
+        """
+
+        if self.stages:
+            raise ValueError("search_with_meta must start the pipeline, as $search must be the first stage")
+        if how not in ("facet", "set"):
+            raise ValueError(f"how must be facet or set, got {how}")
+
+        if operator_name is None and query is not None:
+            operator_name = "text"
+        if facets:
+            kwargs.update(collector_name="facet", facets=facets)
+
+        self.search(path, query, operator_name=operator_name, index=index, count=count, sort=sort, **kwargs)
+
+        page: list[AnyStage] = []
+        if skip:
+            page.append(Skip(value=skip))
+        if limit is not None:
+            page.append(Limit(value=limit))
+
+        if how == "set":
+            self.stages.extend(page)
+            self.stages.append(Set(document={meta_field: SEARCH_META}))
+        else:
+            self.stages.append(
+                FacetStage(
+                    pipelines={
+                        results_field: page,
+                        meta_field: [Limit(value=1), ReplaceRoot(path=SEARCH_META)],
+                    }
+                )
+            )
+            self.stages.append(Set(document={meta_field: First(operand=f"${meta_field}")}))
+
+        return self
+
+    def __update_search_options(
+        self, concurrent: bool, sort: dict[str, Any] | None, after: str | None, before: str | None
+    ) -> None:
+        """Sets the concurrency, sort and pagination options of the search stage starting the pipeline."""
+
+        search_stage = self.stages[0]
+        options = SearchConfig(
+            sort=search_stage.sort if sort is None else sort,
+            search_after=search_stage.search_after if after is None else after,
+            search_before=search_stage.search_before if before is None else before,
+        )
+        search_stage.concurrent = search_stage.concurrent or concurrent
+        search_stage.sort = options.sort
+        search_stage.search_after = options.search_after
+        search_stage.search_before = options.search_before
+
     def _init_search(
         self,
         search_class: Literal["search", "searchMeta"],
@@ -1150,6 +1848,54 @@ class Pipeline(BaseModel):  # pylint: disable=too-many-public-methods
         self.stages.append(Set(document=document))
         return self
 
+    def set_window_fields(
+        self,
+        output: dict[str, Any] = {},
+        *,
+        partition_by: Any = None,
+        sort_by: dict[str, Literal[1, -1]] | None = None,
+        **kwargs: Any,
+    ) -> Self:
+        """
+        Adds a set_window_fields stage to the current pipeline.
+        Performs operations on windows of documents (running totals, moving averages, ranks, lag/lead, etc).
+
+        Arguments:
+        ---------------------------
+        - output, dict[str, Any] : fields to append to the documents, mapped to window operators or WindowOutput
+                                   (for operators applied on a window).
+        - partition_by, Any : expression to group the documents into partitions. Defaults to a single partition.
+        - sort_by, dict[str, Literal[1, -1]] | None : fields to sort the documents by in the partitions.
+                                                     Required by $rank, $denseRank, $shift, $derivative, $integral and $expMovingAvg.
+
+        Online MongoDB documentation:
+        -----------------------------
+        Performs operations on a specified span of documents in a collection, known as a window,
+        and returns the results based on the chosen window operator.
+
+        Source : https://www.mongodb.com/docs/manual/reference/operator/aggregation/setWindowFields/#mongodb-pipeline-pipe.-setWindowFields
+
+        Usage:
+        -----------------------------
+        Output fields can also be passed as keyword arguments:
+
+            >>> pipeline.set_window_fields(
+                    partition_by="$state",
+                    sort_by={"orderDate": 1},
+                    cumulative_quantity=WindowOutput(
+                        operator=S.sum("$quantity"),
+                        window=Window(documents=["unbounded", "current"]),
+                    ),
+                    rank=S.rank(),
+                )
+        """
+
+        output = output | kwargs
+        self.stages.append(
+            SetWindowFields(partition_by=partition_by, sort_by=sort_by, output=output)
+        )
+        return self
+
     def skip(self, value: int) -> Self:
         """
         Adds a skip stage to the current pipeline.
@@ -1254,7 +2000,10 @@ class Pipeline(BaseModel):  # pylint: disable=too-many-public-methods
         return self
 
     def union_with(
-        self, collection: str, coll: str, pipeline: list[dict] | None = None
+        self,
+        collection: str | None = None,
+        coll: str | None = None,
+        pipeline: list[dict] | None = None,
     ) -> Self:
         """
         Adds a union_with stage to the current pipeline.
@@ -1264,7 +2013,8 @@ class Pipeline(BaseModel):  # pylint: disable=too-many-public-methods
         Arguments:
         ---------------------------------
 
-            - collection / coll, str : The collection or view whose pipeline results you wish to include in the result set
+            - collection / coll, str | None : The collection or view whose pipeline results you wish to include in the result set.
+                                              Can be omitted when the pipeline starts with a $documents stage.
             - pipeline, list[dict] | Pipeline | None : An aggregation pipeline to apply to the specified coll.
 
         Online MongoDB documentation:
@@ -1343,10 +2093,12 @@ class Pipeline(BaseModel):  # pylint: disable=too-many-public-methods
         self,
         index: str,
         path: str,
-        query_vector: list[float],
-        num_candidates: int,
+        query_vector: list[float] | BinaryVector | Any,
+        num_candidates: int | None,
         limit: int,
         filter: dict | None = None,
+        *,
+        exact: bool = False,
     ) -> Self:
         """
         Adds a vector_search stage to the current pipeline.
@@ -1356,10 +2108,18 @@ class Pipeline(BaseModel):  # pylint: disable=too-many-public-methods
 
             - index, str : name of the Atlas Vector Search index to use
             - path, str : path to the vector field to search
-            - query_vector, list[float] : array of numbers of the BSON double type that represent the query vector
-            - num_candidates, int : number of nearest neighbors to use during the search
+            - query_vector, list[float] | BinaryVector : array of numbers of the BSON double type that represent the query vector.
+                                                         NumPy arrays, array.array and memoryview objects are converted to
+                                                         BinaryVector (BSON BinData subtype 9) without validating each element.
+            - num_candidates, int|None : number of nearest neighbors to use during the search. Required unless exact is true.
             - limit, int : number of documents to return in the results
             - filter, dict|None : any MQL match expression that compares an indexed field with a boolean, number (not decimals), or string to use as a prefilter
+            - exact, bool : whether to run an exact nearest neighbors (ENN) search instead of an aNN search. Defaults to False.
+
+        Usage:
+        ---------------------------------
+        Pass num_candidates=None with exact=True to run an ENN search. Use `monggregate.vectors.tune_num_candidates`
+        to pick the smallest num_candidates reaching a target recall on a sample of queries.
 
         """
 
@@ -1371,6 +2131,111 @@ class Pipeline(BaseModel):  # pylint: disable=too-many-public-methods
                 num_candidates=num_candidates,
                 limit=limit,
                 filter=filter,
+                exact=exact,
             )
         )
         return self
+
+    def vector_search_many(
+        self,
+        collection: str,
+        index: str,
+        path: str,
+        vectors: list[Any],
+        num_candidates: int | None,
+        limit: int,
+        filter: dict | None = None,
+        *,
+        exact: bool = False,
+        group_by: Literal["document", "query"] | None = "document",
+        query_field: str = "query",
+        score_field: str = "score",
+    ) -> Self:
+        """
+        Adds a combination of stages that runs one vector search per query vector in a single aggregation.
+        This is a virtual and unofficial stage. It is not documented on MongoDB aggregation pipeline reference page.
+
+        The first search starts the pipeline and the others are fanned out through $unionWith sub-pipelines,
+        each hit being tagged with the index of its query vector and its vectorSearchScore.
+
+        Arguments:
+        -------------------
+            - collection, str : the collection the pipeline runs on, searched again by the $unionWith sub-pipelines
+            - index, str : name of the Atlas Vector Search index to use
+            - path, str : path to the vector field to search
+            - vectors, list[list[float] | BinaryVector | Any] : the query vectors
+            - num_candidates, int|None : number of nearest neighbors to use during each search. Required unless exact is true.
+            - limit, int : number of documents returned by each search
+            - filter, dict|None : prefilter applied to each search
+            - exact, bool : whether to run exact nearest neighbors (ENN) searches. Defaults to False.
+            - group_by, "document" | "query" | None : how to gather the hits
+                    "document" : deduplicates the hits. Each document keeps its best score and
+                                 the list of the indexes of the queries that returned it in query_field.
+                                 The documents are sorted by decreasing score.
+                    "query" : outputs one document per query vector, {"_id": <query index>, "results": [<hits>]},
+                              the hits being sorted by decreasing score.
+                    None : outputs the hits as they are, tagged with the index of their query.
+            - query_field, str : field holding the index of the query vector of the hits. Defaults to "query".
+            - score_field, str : field holding the score of the hits. Defaults to "score".
+
+        NOTE : $vectorSearch is only supported in $unionWith sub-pipelines starting in MongoDB 8.0,
+        and must be the first stage of the pipeline, which must therefore be empty.
+        """
+
+        if self.stages:
+            raise ValueError("vector_search_many must start the pipeline, as $vectorSearch must be the first stage")
+        if not vectors:
+            raise ValueError("At least one query vector is required")
+
+        for position, query_vector in enumerate(vectors):
+            branch: list[AnyStage] = [
+                VectorSearch(
+                    index=index,
+                    path=path,
+                    query_vector=query_vector,
+                    num_candidates=num_candidates,
+                    limit=limit,
+                    filter=filter,
+                    exact=exact,
+                ),
+                Set(document={query_field: position, score_field: {"$meta": "vectorSearchScore"}}),
+            ]
+            if position == 0:
+                self.stages.extend(branch)
+            else:
+                self.stages.append(UnionWith(collection=collection, pipeline=branch))
+
+        if group_by == "document":
+            document_field = "__document__"
+            self.stages.extend(
+                [
+                    Sort(descending=[score_field]),
+                    Group(
+                        by="_id",
+                        query={
+                            document_field: {"$first": ROOT},
+                            score_field: {"$max": "$" + score_field},
+                            query_field: {"$push": "$" + query_field},
+                        },
+                    ),
+                    ReplaceRoot(
+                        document=MergeObjects(
+                            operand=[
+                                "$" + document_field,
+                                {score_field: "$" + score_field, query_field: "$" + query_field},
+                            ]
+                        ).expression
+                    ),
+                    Sort(descending=[score_field]),
+                ]
+            )
+        elif group_by == "query":
+            self.stages.extend(
+                [
+                    Sort(query={query_field: 1, score_field: -1}),
+                    Group(by=query_field, query={"results": {"$push": ROOT}}),
+                    Sort(ascending=["_id"]),
+                ]
+            )
+
+        return self
@@ -6,6 +6,7 @@ from monggregate.search.commons import (
     HighlightOptions,
     HightlightOutput,
     CountResults,
+    StoredSource,
 )
 from monggregate.search.collectors import (
     Facet,
@@ -23,7 +24,11 @@ from monggregate.search.operators import (
     Compound,
     Equals,
     Exists,
+    In,
     MoreLikeThis,
+    Near,
+    Phrase,
+    QueryString,
     Range,
     Regex,
     Text,
@@ -38,6 +43,7 @@ __all__ = [
     "HighlightOptions",
     "HightlightOutput",
     "CountResults",
+    "StoredSource",
     "Facet",
     "Facets",
     "FacetBucket",
@@ -51,7 +57,11 @@ __all__ = [
     "Compound",
     "Equals",
     "Exists",
+    "In",
     "MoreLikeThis",
+    "Near",
+    "Phrase",
+    "QueryString",
     "Range",
     "Regex",
     "Text",
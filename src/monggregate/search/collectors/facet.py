@@ -177,7 +177,11 @@ from monggregate.search.operators import (
     Compound,
     Equals,
     Exists,
+    In,
     MoreLikeThis,
+    Near,
+    Phrase,
+    QueryString,
     Range,
     Regex,
     Text,
@@ -186,6 +190,7 @@ from monggregate.search.operators import (
 )
 from monggregate.search.operators.operator import OperatorLiteral
 from monggregate.search.commons import FuzzyOptions
+from monggregate.geo import GeoJSONPoint
 
 # Aliases
 # ----------------------------------------------
@@ -511,6 +516,28 @@ class Facet(SearchCollector):
 
         return cls(operator=_exists)
 
+    @classmethod
+    def init_in(
+        cls,
+        path: str | list[str],
+        value: str | int | float | bool | datetime | list,
+        score: dict | None = None,
+        **kwargs: Any,
+    ) -> Self:
+        """
+        Creates a search stage with an in operator
+
+        Summary:
+        --------------------------------
+        This checks whether a field matches one of the values you specify.
+        You may want to use this rather than a compound query made of one equals clause per value.
+
+        """
+
+        _in = In(path=path, value=value, score=score)
+
+        return cls(operator=_in)
+
     @classmethod
     def init_more_like_this(cls, like: dict | list[dict], **kwargs: Any) -> Self:
         """
@@ -528,6 +555,76 @@ class Facet(SearchCollector):
 
         return cls(operator=_more_like_this)
 
+    @classmethod
+    def init_near(
+        cls,
+        path: str | list[str],
+        origin: int | float | datetime | GeoJSONPoint,
+        pivot: int | float,
+        score: dict | None = None,
+        **kwargs: Any,
+    ) -> Self:
+        """
+        Creates a search stage with a near operator
+
+        Summary:
+        --------------------------------
+        This scores the documents by the proximity of a number, date or geographic point to an origin.
+        You may want to use this rather than sorting the results by distance after the search.
+
+        """
+
+        _near = Near(path=path, origin=origin, pivot=pivot, score=score)
+
+        return cls(operator=_near)
+
+    @classmethod
+    def init_phrase(
+        cls,
+        query: str | list[str],
+        path: str | list[str],
+        slop: int = 0,
+        score: dict | None = None,
+        synonyms: str | None = None,
+        **kwargs: Any,
+    ) -> Self:
+        """
+        Creates a search stage with a phrase operator
+
+        Summary:
+        --------------------------------
+        The phrase operator searches for documents containing an ordered sequence of terms,
+        at most slop positions apart.
+
+        """
+
+        _phrase = Phrase(query=query, path=path, slop=slop, score=score, synonyms=synonyms)
+
+        return cls(operator=_phrase)
+
+    @classmethod
+    def init_query_string(
+        cls,
+        query: str,
+        default_path: str | None = None,
+        score: dict | None = None,
+        path: str | None = None,
+        **kwargs: Any,
+    ) -> Self:
+        """
+        Creates a search stage with a queryString operator
+
+        Summary:
+        --------------------------------
+        The queryString operator searches a combination of fields and values written with the Lucene query syntax.
+        path is used as the default path when default_path is not provided.
+
+        """
+
+        _query_string = QueryString(default_path=default_path or path, query=query, score=score)
+
+        return cls(operator=_query_string)
+
     @classmethod
     def init_range(
         cls,
@@ -1105,7 +1202,11 @@ class Facet(SearchCollector):
             "equals": cls.init_equals,
             "exists": cls.init_exists,
             # "facet":cls.init_facet,
+            "in": cls.init_in,
             "more_like_this": cls.init_more_like_this,
+            "near": cls.init_near,
+            "phrase": cls.init_phrase,
+            "query_string": cls.init_query_string,
             "range": cls.init_range,
             "regex": cls.init_regex,
             "text": cls.init_text,
@@ -3,6 +3,7 @@
 from monggregate.search.commons.count import CountOptions, CountResults
 from monggregate.search.commons.fuzzy import FuzzyOptions
 from monggregate.search.commons.highlight import HighlightOptions, HightlightOutput
+from monggregate.search.commons.stored_source import StoredSource
 
 __all__ = [
     "CountOptions",
@@ -10,4 +11,5 @@ __all__ = [
     "FuzzyOptions",
     "HighlightOptions",
     "HightlightOutput",
+    "StoredSource",
 ]
\ No newline at end of file
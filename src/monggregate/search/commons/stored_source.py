@@ -0,0 +1,216 @@
+"""
+Module defining an interface to the stored source of Atlas Search indexes,
+and helpers checking that a pipeline can use it.
+
+https://www.mongodb.com/docs/atlas/atlas-search/stored-source-definition/
+
+With returnStoredSource, $search returns the fields stored in the index directly from Atlas Search (mongot)
+instead of looking the full documents up on the database (mongod). The documents returned only contain the
+stored fields: the stages following $search that reference other fields silently work on missing values,
+unless the full documents are looked up again, which defeats the purpose of the option.
+
+`uncovered_fields` lists the fields referenced by the stages following $search that are not stored.
+It analyses the $match, $sort, $project, $group, $set/$addFields, $unset, $limit and $skip stages, up to
+the first stage reshaping the documents ($project, $group) or that cannot be analysed.
+
+Usage:
+----------------------------
+    >>> pipeline = Pipeline().search(path="title", query="star wars", return_stored_source=True)
+    >>> pipeline.match(year={"$gte": 2000}).project(include=["title", "plot"])
+    >>> uncovered_fields(pipeline.export()[1:], StoredSource(include=["title", "year"]))
+    ['plot']
+
+"""
+
+from typing import Any
+
+from monggregate.base import BaseModel, Expression, pyd
+
+# Stages following $search whose field references are analysed. The documents keep their fields through them.
+_TRANSPARENT_STAGES = {"$match", "$sort", "$set", "$addFields", "$unset", "$limit", "$skip"}
+
+# Stages whose field references are analysed but that end the analysis, as they reshape the documents.
+_RESHAPING_STAGES = {"$project", "$group"}
+
+# Variables referencing the whole document
+_DOCUMENT_VARIABLES = ("$$ROOT", "$$CURRENT")
+
+
+class StoredSource(BaseModel):
+    """
+    Class representing the storedSource definition of an Atlas Search index.
+
+    Attributes:
+    --------------------------------
+        - include, list[str]|None : fields to store. Either this or exclude is required.
+        - exclude, list[str]|None : fields not to store, all the other ones being stored.
+
+    NOTE : _id is always stored, unless it is excluded.
+
+    """
+
+    include: list[str] | None
+    exclude: list[str] | None
+
+    @pyd.validator("exclude", always=True)
+    @classmethod
+    def validate_exclude(cls, exclude: list[str] | None, values: dict) -> list[str] | None:
+        """Ensures that exactly one of include or exclude is provided"""
+
+        if (exclude is None) == (values.get("include") is None):
+            raise ValueError("Exactly one of include or exclude must be provided")
+
+        return exclude
+
+    @property
+    def expression(self) -> Expression:
+        """Returns the storedSource definition of the index"""
+
+        if self.include is not None:
+            return self.express({"include": self.include})
+
+        return self.express({"exclude": self.exclude})
+
+    def covers(self, path: str) -> bool:
+        """Returns whether the value at path is fully stored"""
+
+        if path in _DOCUMENT_VARIABLES:
+            return self.exclude == []
+
+        if self.include is not None:
+            return path == "_id" or any(_is_prefix(field, path) for field in self.include)
+
+        return not any(_is_prefix(field, path) or _is_prefix(path, field) for field in self.exclude or [])
+
+
+def referenced_fields(stages: list[dict]) -> list[str]:
+    """
+    Returns the fields of the input documents referenced by a list of exported stages, in order of appearance.
+
+    The fields created by $set and $addFields stages are not returned, and a reference to the whole
+    document (e.g $$ROOT) is returned as is.
+    """
+
+    references: list[str] = []
+    created: list[str] = []
+
+    def add(paths: list[str]) -> None:
+        for path in paths:
+            if path not in references and not any(_is_prefix(field, path) for field in created):
+                references.append(path)
+
+    for statement in stages:
+        ((name, specification),) = statement.items()
+        if name not in _TRANSPARENT_STAGES | _RESHAPING_STAGES:
+            break
+
+        if name == "$match":
+            add(_query_fields(specification))
+        elif name == "$sort":
+            add([path for path, order in specification.items() if not isinstance(order, dict)])
+        elif name in ("$set", "$addFields"):
+            add(_expression_fields(specification))
+            created.extend(_flatten_keys(specification))
+        elif name == "$project":
+            add(_projected_fields(specification))
+        elif name == "$group":
+            add(_expression_fields(specification))
+
+        if name in _RESHAPING_STAGES:
+            break
+
+    return references
+
+
+def uncovered_fields(stages: list[dict], stored_source: "StoredSource | list[str] | bool") -> list[str]:
+    """
+    Returns the fields referenced by the stages following a $search stage which are not stored in the index.
+
+    stored_source is the storedSource definition of the index: true (all fields), false (_id only),
+    a StoredSource or the list of stored fields.
+    """
+
+    if stored_source is True:
+        return []
+    if stored_source is False:
+        stored_source = StoredSource(include=[])
+    elif isinstance(stored_source, list):
+        stored_source = StoredSource(include=stored_source)
+
+    return [path for path in referenced_fields(stages) if not stored_source.covers(path)]
+
+
+def _is_prefix(field: str, path: str) -> bool:
+    """Returns whether field is path or one of its parents"""
+
+    return path == field or path.startswith(field + ".")
+
+
+def _expression_fields(expression: Any) -> list[str]:
+    """Returns the field paths used in an aggregation expression"""
+
+    if isinstance(expression, str):
+        if expression.startswith(_DOCUMENT_VARIABLES):
+            variable, _, path = expression.partition(".")
+            return [path] if path else [variable]
+        if expression.startswith("$") and not expression.startswith("$$"):
+            return [expression[1:]]
+        return []
+
+    if isinstance(expression, dict):
+        return [
+            path
+            for key, value in expression.items()
+            if key != "$literal"
+            for path in _expression_fields(value)
+        ]
+
+    if isinstance(expression, list):
+        return [path for value in expression for path in _expression_fields(value)]
+
+    return []
+
+
+def _query_fields(query: dict) -> list[str]:
+    """Returns the fields filtered by a query"""
+
+    fields: list[str] = []
+    for key, value in query.items():
+        if key in ("$and", "$or", "$nor"):
+            fields.extend(path for clause in value for path in _query_fields(clause))
+        elif key == "$expr":
+            fields.extend(_expression_fields(value))
+        elif not key.startswith("$"):
+            fields.append(key)
+
+    return fields
+
+
+def _projected_fields(specification: dict, prefix: str = "") -> list[str]:
+    """Returns the fields used by a $project specification, excluded fields aside"""
+
+    fields: list[str] = []
+    for key, value in specification.items():
+        path = prefix + key
+        if isinstance(value, bool) or value in (0, 1):
+            if value:
+                fields.append(path)
+        elif isinstance(value, dict) and not any(name.startswith("$") for name in value):
+            fields.extend(_projected_fields(value, path + "."))
+        else:
+            fields.extend(_expression_fields(value))
+
+    return fields
+
+
+def _flatten_keys(specification: dict, prefix: str = "") -> list[str]:
+    """Returns the paths of the fields set by a $set specification"""
+
+    paths = []
+    for key, value in specification.items():
+        if isinstance(value, dict) and value and not any(name.startswith("$") for name in value):
+            paths.extend(_flatten_keys(value, prefix + key + "."))
+        else:
+            paths.append(prefix + key)
+
+    return paths
@@ -10,6 +10,7 @@ compound            Combines other operators into a single query.
 embeddedDocument    Queries fields in embedded documents, which are documents that are elements of an array.
 equals              Works in conjunction with the boolean and objectId data types.
 exists              Tests for the presence of a specified field.
+in                  Queries both single value and array of values.
 geoShape            Queries for values with specified geo shapes.
 geoWithin           Queries for points within specified geographic shapes.
 moreLikeThis        Queries for similar documents.
@@ -28,7 +29,11 @@ from monggregate.search.operators.autocomplete import Autocomplete
 from monggregate.search.operators.compound import Compound
 from monggregate.search.operators.equals import Equals
 from monggregate.search.operators.exists import Exists
+from monggregate.search.operators.in_ import In
 from monggregate.search.operators.more_like_this import MoreLikeThis
+from monggregate.search.operators.near import Near
+from monggregate.search.operators.phrase import Phrase
+from monggregate.search.operators.query_string import QueryString
 from monggregate.search.operators.range import Range
 from monggregate.search.operators.regex import Regex
 from monggregate.search.operators.text import Text
@@ -39,7 +44,11 @@ AnyOperator = (
     | Compound
     | Equals
     | Exists
+    | In
     | MoreLikeThis
+    | Near
+    | Phrase
+    | QueryString
     | Range
     | Regex
     | Text
@@ -50,7 +59,11 @@ OperatorMap = {
     "compound": Compound,
     "equals": Equals,
     "exists": Exists,
+    "in": In,
     "more_like_this": MoreLikeThis,
+    "near": Near,
+    "phrase": Phrase,
+    "query_string": QueryString,
     "range": Range,
     "regex": Regex,
     "text": Text,
@@ -3,10 +3,27 @@
 from monggregate.search.operators.autocomplete import Autocomplete
 from monggregate.search.operators.equals import Equals
 from monggregate.search.operators.exists import Exists
+from monggregate.search.operators.in_ import In
 from monggregate.search.operators.more_like_this import MoreLikeThis
+from monggregate.search.operators.near import Near
+from monggregate.search.operators.phrase import Phrase
+from monggregate.search.operators.query_string import QueryString
 from monggregate.search.operators.range import Range
 from monggregate.search.operators.regex import Regex
 from monggregate.search.operators.text import Text
 from monggregate.search.operators.wildcard import Wildcard
 
-Clause = Autocomplete | Equals | Exists | MoreLikeThis | Range | Regex | Text | Wildcard
+Clause = (
+    Autocomplete
+    | Equals
+    | Exists
+    | In
+    | MoreLikeThis
+    | Near
+    | Phrase
+    | QueryString
+    | Range
+    | Regex
+    | Text
+    | Wildcard
+)
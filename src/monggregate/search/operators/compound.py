@@ -68,13 +68,18 @@ from monggregate.search.operators.clause import (
     Autocomplete,
     Equals,
     Exists,
+    In,
     MoreLikeThis,
+    Near,
+    Phrase,
+    QueryString,
     Range,
     Regex,
     Text,
     Wildcard,
 )
 from monggregate.search.commons import FuzzyOptions
+from monggregate.geo import GeoJSONPoint
 
 ClauseType = Literal["must", "mustNot", "should", "filter"]
 
@@ -218,6 +223,23 @@ class Compound(SearchOperator):
 
         return self
 
+    def in_(
+        self,
+        type: ClauseType,
+        *,
+        path: str | list[str],
+        value: str | int | float | bool | datetime | list,
+        score: dict | None = None,
+        **kwargs: Any,
+    ) -> Self:
+        """Adds an in clause to the current compound instance."""
+
+        _in = In(path=path, value=value, score=score)
+
+        self._register_clause(type, _in)
+
+        return self
+
     def more_like_this(
         self, type: ClauseType, like: dict | list[dict], **kwargs: Any
     ) -> Self:
@@ -228,6 +250,65 @@ class Compound(SearchOperator):
 
         return self
 
+    def near(
+        self,
+        type: ClauseType,
+        *,
+        path: str | list[str],
+        origin: int | float | datetime | GeoJSONPoint,
+        pivot: int | float,
+        score: dict | None = None,
+        **kwargs: Any,
+    ) -> Self:
+        """Adds a near clause to the current compound instance."""
+
+        _near = Near(path=path, origin=origin, pivot=pivot, score=score)
+
+        self._register_clause(type, _near)
+
+        return self
+
+    def phrase(
+        self,
+        type: ClauseType,
+        *,
+        query: str | list[str],
+        path: str | list[str],
+        slop: int = 0,
+        score: dict | None = None,
+        synonyms: str | None = None,
+        **kwargs: Any,
+    ) -> Self:
+        """Adds a phrase clause to the current compound instance."""
+
+        _phrase = Phrase(query=query, path=path, slop=slop, score=score, synonyms=synonyms)
+
+        self._register_clause(type, _phrase)
+
+        return self
+
+    def query_string(
+        self,
+        type: ClauseType,
+        *,
+        query: str,
+        default_path: str | None = None,
+        score: dict | None = None,
+        path: str | None = None,
+        **kwargs: Any,
+    ) -> Self:
+        """
+        Adds a queryString clause to the current compound instance.
+
+        path is used as the default path when default_path is not provided.
+        """
+
+        _query_string = QueryString(default_path=default_path or path, query=query, score=score)
+
+        self._register_clause(type, _query_string)
+
+        return self
+
     def range(
         self,
         type: ClauseType,
@@ -391,8 +472,12 @@ class Compound(SearchOperator):
             "compound": self.compound,  # FIXME : This breaks typing
             "equals": self.equals,
             "exists": self.exists,
+            "in": self.in_,
             "range": self.range,
             "more_like_this": self.more_like_this,
+            "near": self.near,
+            "phrase": self.phrase,
+            "query_string": self.query_string,
             "regex": self.regex,
             "text": self.text,
             "wildcard": self.wildcard,
@@ -0,0 +1,123 @@
+"""
+Module defining an interface to MongoDB Atlas Search in operator
+
+Online MongoDB documentation:
+----------------------------------------------
+Last updated (in this package) : 19/10/2026
+Source : https://www.mongodb.com/docs/atlas/atlas-search/in/
+
+# Definition
+# --------------------------------------------
+
+The in operator performs a search for an array of BSON values in a field.
+You can use the in operator to query fields of the following data types:
+
+    * boolean
+    * date
+    * number, including int32, int64, and double
+    * objectId
+    * string (indexed as the token type)
+
+A single in clause replaces a compound query made of one equals clause per value.
+
+# Syntax
+# ----------------------------------------------
+
+in has the following syntax:
+
+    >>> {
+            $search: {
+                "index": <index name>, // optional, defaults to "default"
+                "in": {
+                    "path": "<field-to-search>",
+                    "value": <single-or-array-of-values-to-search>,
+                    "score": <score-options>
+                }
+            }
+        }
+
+# Options
+# ---------------------------------------------
+
+Field       Type                Description                                 Necessity
+
+path        string or           Indexed field or fields to search.          Yes
+            array of strings
+
+value       boolean, date,      Value or values to search.                  Yes
+            number, objectId,   The values in an array must all be
+            string or array     of the same type.
+
+score       object              Score assigned to matching search           No
+                                term results. Use one of the following
+                                options to modify the score:
+                                    * boost : multiply the score by
+                                              the given number
+                                    * constant : replace the result
+                                                 score with the given
+                                                 number
+
+# Behavior
+# ---------------------------------------------
+
+If the field holds an array, a document matches when at least one of its elements is one of the values.
+
+"""
+
+from datetime import datetime
+from monggregate.base import pyd, Expression
+from monggregate.search.operators.operator import SearchOperator
+
+InValue = str | int | float | bool | datetime
+
+
+class In(SearchOperator, smart_union=True):
+    """
+    Creates an in operation statement in an Atlas Search query.
+
+    Description:
+    ----------------------------------------------
+    The in operator checks whether a field matches one of the values you specify.
+
+    Attributes:
+    ----------------------------------------------
+        - path, str | list[str] : Indexed field or fields to search.
+        - value, str | int | float | bool | datetime | list : Value or values to query for.
+                                                              The values must all be of the same type.
+        - score, dict : Score assigned to matching search term results.
+                        Use one of the following options to modify the score:
+                            * boost : multiply the score by the given number
+                            * constant : replace the result score with the given number
+
+    """
+
+    path : str | list[str]
+    value : InValue | list[InValue]
+    score : dict|None
+
+    @pyd.validator("value")
+    def validate_value(cls, value:InValue | list[InValue])->InValue | list[InValue]:
+        """Validates that the values are of the same type"""
+
+        if isinstance(value, list):
+            if not value:
+                raise ValueError("value must contain at least one value")
+            types = {
+                bool if isinstance(item, bool) else float if isinstance(item, int) else type(item)
+                for item in value
+            }
+            if len(types) > 1:
+                raise ValueError(f"The values of in must all be of the same type, got {value}")
+
+        return value
+
+    @property
+    def expression(self) -> Expression:
+
+        return self.express({
+            "in":{
+                "path": self.path,
+                "value": self.value,
+                "score": self.score
+            }
+        })
@@ -0,0 +1,131 @@
+"""
+Module defining an interface to MongoDB Atlas Search near operator
+
+Online MongoDB documentation:
+----------------------------------------------
+Last updated (in this package) : 19/10/2026
+Source : https://www.mongodb.com/docs/atlas/atlas-search/near/
+
+# Definition
+# --------------------------------------------
+
+The near operator supports querying and scoring numeric, date, and GeoJSON point values.
+This operator can be used to perform a search over:
+
+    * Number fields of BSON int32, int64, and double data types.
+
+    * Date fields of BSON date type in ISODate format.
+
+    * Geographic location fields defined using latitude and longitude coordinates.
+
+You can use the near operator to find results that are near a number or a date,
+and to rank them by their proximity to it, instead of sorting them in a later stage.
+
+# Syntax
+# ----------------------------------------------
+
+near has the following syntax:
+
+    >>> {
+            $search: {
+                "index": <index name>, // optional, defaults to "default"
+                "near": {
+                    "path": "<field-to-search>",
+                    "origin": <date-or-number-or-geo>,
+                    "pivot": <pivot-distance>,
+                    "score": <score-options>
+                }
+            }
+        }
+
+# Options
+# ---------------------------------------------
+
+Field       Type                Description                                 Necessity
+
+path        string or           Indexed field or fields to search.          Yes
+            array of strings
+
+origin      date, number        Number, date, or geographic point to        Yes
+            or geo              search near. This is the origin from
+                                which the proximity of the results is
+                                measured.
+
+pivot       number              Value to use to calculate scores of         Yes
+                                Atlas Search result documents.
+                                Score is calculated using the following
+                                formula:
+
+                                    score = pivot / (pivot + abs(origin - value))
+
+                                * For number fields, the value can be an
+                                  int32, int64, or double.
+                                * For date fields, the value is in
+                                  milliseconds.
+                                * For geo fields, the value is in meters.
+
+                                pivot must be greater than 0.
+
+score       object              Score assigned to matching search           No
+                                results. Use one of the following
+                                options to modify the score:
+                                    * boost : multiply the score by
+                                              the given number
+                                    * constant : replace the result
+                                                 score with the given
+                                                 number
+
+"""
+
+from datetime import datetime
+from monggregate.base import pyd, Expression
+from monggregate.geo import GeoJSONPoint
+from monggregate.search.operators.operator import SearchOperator
+
+
+class Near(SearchOperator, smart_union=True):
+    """
+    Creates a near operation statement in an Atlas Search query.
+
+    Description:
+    ----------------------------------------------
+    The near operator scores the documents by the proximity of a number, date or geographic point field to an origin.
+
+    Attributes:
+    ----------------------------------------------
+        - path, str | list[str] : Indexed field or fields to search.
+        - origin, int | float | datetime | GeoJSONPoint : Number, date or geographic point to search near.
+        - pivot, int | float : Distance (in milliseconds for dates, in meters for points)
+                               at which the score of a document is halved. Must be greater than 0.
+        - score, dict : Score assigned to matching search results.
+                        Use one of the following options to modify the score:
+                            * boost : multiply the score by the given number
+                            * constant : replace the result score with the given number
+
+    """
+
+    path : str | list[str]
+    origin : int | float | datetime | GeoJSONPoint
+    pivot : int | float
+    score : dict|None
+
+    @pyd.validator("pivot")
+    def validate_pivot(cls, pivot:int | float)->int | float:
+        """Validates that the pivot is greater than 0"""
+
+        if pivot <= 0:
+            raise ValueError(f"pivot must be greater than 0, got {pivot}")
+
+        return pivot
+
+    @property
+    def expression(self) -> Expression:
+
+        return self.express({
+            "near":{
+                "path": self.path,
+                "origin": self.origin,
+                "pivot": self.pivot,
+                "score": self.score
+            }
+        })
@@ -21,7 +21,11 @@ OperatorLiteral = Literal[
     "equals",
     "exists",
     #"facet",
+    "in",
     "more_like_this",
+    "near",
+    "phrase",
+    "query_string",
     "range",
     "regex",
     "text",
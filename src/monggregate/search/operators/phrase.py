@@ -0,0 +1,114 @@
+"""
+Module defining an interface to MongoDB Atlas Search phrase operator
+
+Online MongoDB documentation:
+----------------------------------------------
+Last updated (in this package) : 19/10/2026
+Source : https://www.mongodb.com/docs/atlas/atlas-search/phrase/
+
+# Definition
+# --------------------------------------------
+
+The phrase operator performs search for documents containing an ordered sequence of terms
+using the analyzer specified in the index configuration.
+If no analyzer is specified, the default standard analyzer is used.
+
+# Syntax
+# ----------------------------------------------
+
+phrase has the following syntax:
+
+    >>> {
+            $search: {
+                "index": <index name>, // optional, defaults to "default"
+                "phrase": {
+                    "query": "<search-string>",
+                    "path": "<field-to-search>",
+                    "score": <options>,
+                    "slop": <distance-number>,
+                    "synonyms": "<synonyms-mapping-name>"
+                }
+            }
+        }
+
+# Options
+# ---------------------------------------------
+
+Field       Type                Description                                 Necessity
+
+query       string or           String or strings to search for.            Yes
+            array of strings
+
+path        string or           Indexed field or fields to search.          Yes
+            array of strings    You can also specify a wildcard path to
+                                search.
+
+slop        integer             Allowable distance between words in the     No
+                                query phrase. Lower value allows less
+                                positional distance between the words and
+                                greater value allows more reorganization
+                                of the words and more distance between the
+                                words to satisfy the query.
+                                The default is 0, meaning that words must
+                                be exactly in the same position as the
+                                query in order to be considered a match.
+                                Exact matches are scored higher.
+
+score       object              Score to assign to matching search          No
+                                results. You can modify the default
+                                score using the following options:
+                                    * boost : multiply the result score
+                                              by the given number.
+                                    * constant : replace the result score
+                                                 with the given number.
+
+synonyms    string              Name of the synonym mapping definition in   No
+                                the index definition. Value can't be an
+                                empty string.
+
+"""
+
+from monggregate.base import pyd, Expression
+from monggregate.search.operators.operator import SearchOperator
+
+
+class Phrase(SearchOperator):
+    """
+    Creates a phrase operation statement in an Atlas Search query.
+
+    Description:
+    ----------------------------------------
+    The phrase operator searches for documents containing an ordered sequence of terms.
+
+    Attributes:
+    -----------------------------------------
+        - query, str | list[str] : The string or strings to search for.
+        - path, str | list[str] : Indexed field or fields to search in.
+        - slop, int : Allowable distance between the words of the query phrase. Defaults to 0,
+                      meaning that the words must be in the same order and adjacent.
+        - score, dict : Score to assign to matching search results.
+        - synonyms, str : Name of the synonym mapping definition in the index definition.
+
+    """
+
+    query : str|list[str]
+    path : str | list[str]
+    slop : int = 0
+    score : dict | None = None
+    synonyms : str | None = None
+
+    @pyd.validator("slop")
+    def validate_slop(cls, slop:int)->int:
+        """Validates that the slop is not negative"""
+
+        if slop < 0:
+            raise ValueError(f"slop must be positive, got {slop}")
+
+        return slop
+
+    @property
+    def expression(self) -> Expression:
+
+        return self.express({
+            "phrase" : self.dict(exclude_none=True, by_alias=True)
+        })
@@ -0,0 +1,89 @@
+"""
+Module defining an interface to MongoDB Atlas Search queryString operator
+
+Online MongoDB documentation:
+----------------------------------------------
+Last updated (in this package) : 19/10/2026
+Source : https://www.mongodb.com/docs/atlas/atlas-search/queryString/
+
+# Definition
+# --------------------------------------------
+
+The queryString operator supports querying a combination of indexed fields and values.
+You can perform text, wildcard, regular expression, fuzzy, and range searches on string fields using the queryString operator.
+
+The query uses the Lucene query syntax:
+
+    * boolean operators (AND, OR, NOT) and parenthesized sub-queries,
+      ex: "plot:(captain OR kirk) AND title:star*"
+    * fields prefixes, the terms without prefix being searched in defaultPath
+    * phrases ("star trek"), wildcards (star*), regular expressions (/.*trek/),
+      fuzzy terms (trek~1) and ranges ([1 TO 5], {a TO z})
+
+# Syntax
+# ----------------------------------------------
+
+queryString has the following syntax:
+
+    >>> {
+            $search: {
+                "index": <index name>, // optional, defaults to "default"
+                "queryString": {
+                    "defaultPath": "<default-field-to-search>",
+                    "query": "(<field-to-search>: (<search-values>) AND|OR (<search-values>)) AND|OR (<search-values>)",
+                    "score": <score-options>
+                }
+            }
+        }
+
+# Options
+# ---------------------------------------------
+
+Field           Type        Description                                 Necessity
+
+defaultPath     string      The indexed field to search by default.     Yes
+                            Atlas Search only searches the field in
+                            defaultPath if you omit the field to
+                            search in the query.
+
+query           string      One or more indexed fields and values to    Yes
+                            search. Fields and values are colon-delimited.
+
+score           object      Score assigned to matching results.         No
+
+"""
+
+from monggregate.base import Expression
+from monggregate.search.operators.operator import SearchOperator
+
+
+class QueryString(SearchOperator):
+    """
+    Creates a queryString operation statement in an Atlas Search query.
+
+    Description:
+    ----------------------------------------
+    The queryString operator searches a combination of fields and values written with the Lucene query syntax.
+
+    Attributes:
+    -----------------------------------------
+        - default_path, str : Indexed field to search when the query does not specify one.
+        - query, str : Fields and values to search, ex: "title:(star OR trek) AND plot:captain".
+        - score, dict : Score assigned to matching results.
+
+    """
+
+    default_path : str
+    query : str
+    score : dict | None = None
+
+    @property
+    def expression(self) -> Expression:
+
+        return self.express({
+            "queryString" : {
+                "defaultPath": self.default_path,
+                "query": self.query,
+                "score": self.score
+            }
+        })
@@ -5,16 +5,25 @@ from monggregate.stages.stage import Stage
 from monggregate.stages.bucket_auto import BucketAuto, GranularityEnum
 from monggregate.stages.bucket import Bucket
 from monggregate.stages.count import Count
+from monggregate.stages.densify import Densify, DensifyRange, DensifyUnitEnum
+from monggregate.stages.documents import Documents
+from monggregate.stages.facet import Facet
+from monggregate.stages.fill import Fill, FillMethodEnum
+from monggregate.stages.geo_near import GeoNear
+from monggregate.stages.graph_lookup import GraphLookup
 from monggregate.stages.group import Group
 from monggregate.stages.limit import Limit
 from monggregate.stages.lookup import Lookup
 from monggregate.stages.match import Match
+from monggregate.stages.merge import Merge, WhenMatchedEnum, WhenNotMatchedEnum
 from monggregate.stages.out import Out
 from monggregate.stages.project import Project
+from monggregate.stages.redact import Redact
 from monggregate.stages.replace_root import ReplaceRoot
 from monggregate.stages.sample import Sample
 from monggregate.stages.search import Search, SearchMeta, SearchStageMap
 from monggregate.stages.set import Set
+from monggregate.stages.set_window_fields import SetWindowFields, Window, WindowOutput
 from monggregate.stages.skip import Skip
 from monggregate.stages.sort_by_count import SortByCount
 from monggregate.stages.sort import Sort
@@ -50,17 +59,26 @@ AnyStage = Union[
     BucketAuto,
     Bucket,
     Count,
+    Densify,
+    Documents,
+    Facet,
+    Fill,
+    GeoNear,
+    GraphLookup,
     Group,
     Limit,
     Lookup,
     Match,
+    Merge,
     Out,
     Project,
+    Redact,
     ReplaceRoot,
     Sample,
     Search,
     SearchMeta,
     Set,
+    SetWindowFields,
     Skip,
     SortByCount,
     Sort,
@@ -0,0 +1,196 @@
+"""
+Module defining an interface to MongoDB $densify stage operation in aggregation pipeline
+
+Online MongoDB documentation:
+--------------------------------------------------------------------------------------------------------------------
+
+Last Updated (in this package) : 19/10/2026
+Source : https://www.mongodb.com/docs/manual/reference/operator/aggregation/densify/#mongodb-pipeline-pipe.-densify
+
+# Definition
+# ----------------------------------------
+New in version 5.1.
+
+Creates new documents in a sequence of documents where certain values in a field are missing.
+
+You can use $densify to:
+
+    * Fill gaps in time series data.
+
+    * Add missing values between groups of data.
+
+    * Populate your data with a specified range of values.
+
+# Syntax
+# ---------------------------------------
+The $densify stage has this syntax:
+
+>>> {
+        $densify: {
+            field: <fieldName>,
+            partitionByFields: [ <field 1>, <field 2> ... <field n> ],
+            range: {
+                step: <number>,
+                unit: <time unit>,
+                bounds: < "full" || "partition" > || [ < lower bound >, < upper bound > ]
+            }
+        }
+    }
+
+The $densify stage takes a document with these fields:
+
+Field               Description
+
+field               The field to densify. The values of the specified field must either be all numeric values or all dates.
+                    Documents that do not contain the specified field continue through the pipeline unmodified.
+
+partitionByFields   Optional. The set of fields to act as the compound key to group the documents.
+                    In the $densify stage, each group of documents is known as a partition.
+                    If you omit this field, $densify uses one partition for the entire collection.
+
+range               An object that specifies how the data is densified:
+
+                        * step : The amount to increment the field value in each document.
+                                 $densify creates a new document for each step between the existing documents.
+                                 If range.unit is specified, step must be an integer. Otherwise, step can be any numeric value.
+
+                        * unit : Required if field is a date. The unit to apply to the step field when incrementing date values in field.
+                                 One of millisecond, second, minute, hour, day, week, month, quarter or year.
+
+                        * bounds : The range to add missing values to. Either:
+
+                            - "full" : $densify adds documents spanning the full range of values of the field.
+
+                            - "partition" : $densify adds documents to each partition, spanning the range of values of the partition.
+
+                            - [ <lower bound>, <upper bound> ] : $densify adds documents spanning the range of values within the
+                              specified bounds. The lower bound is inclusive and the upper bound is exclusive.
+
+# Behavior
+# ------------------------------
+
+If field is a date, the range.unit field is required and the bounds must also be dates.
+
+$densify does not fill in missing data aside from the field. Use $fill to populate the other fields of the created documents.
+
+"""
+
+from typing import Any, Literal
+from monggregate.base import pyd, BaseModel, Expression
+from monggregate.stages.stage import Stage
+from monggregate.utils import StrEnum
+
+
+class DensifyUnitEnum(StrEnum):
+    """Enumeration of the time units usable to densify dates"""
+
+    YEAR = "year"
+    QUARTER = "quarter"
+    MONTH = "month"
+    WEEK = "week"
+    DAY = "day"
+    HOUR = "hour"
+    MINUTE = "minute"
+    SECOND = "second"
+    MILLISECOND = "millisecond"
+
+
+class DensifyRange(BaseModel):
+    """
+    Specification of how the data is densified in the $densify stage.
+
+    Attributes:
+    -----------
+        - step, int | float : amount to increment the field value with. Must be an integer when unit is provided.
+        - unit, DensifyUnitEnum | None : time unit of step. Required when densifying dates.
+        - bounds, "full" | "partition" | list : range to add missing values to. Defaults to "full".
+    """
+
+    step: pyd.StrictInt | float
+    unit: DensifyUnitEnum | None
+    bounds: Literal["full", "partition"] | list[Any] = "full"
+
+    @pyd.validator("step")
+    @classmethod
+    def validate_step_value(cls, step: int | float) -> int | float:
+        """Validates that step is strictly positive"""
+
+        if step <= 0:
+            raise ValueError("step must be strictly positive")
+
+        return step
+
+    @pyd.validator("bounds")
+    @classmethod
+    def validate_bounds(cls, bounds: str | list[Any]) -> str | list[Any]:
+        """Validates that explicit bounds contain a lower and an upper bound"""
+
+        if isinstance(bounds, list) and len(bounds) != 2:
+            raise ValueError("Explicit bounds must have exactly two values: [lower, upper]")
+
+        return bounds
+
+    @pyd.root_validator(skip_on_failure=True)
+    @classmethod
+    def validate_step(cls, values: dict) -> dict:
+        """Validates that step is an integer when unit is provided"""
+
+        step = values.get("step")
+        if values.get("unit") and step is not None and not float(step).is_integer():
+            raise ValueError("step must be an integer when unit is provided")
+
+        return values
+
+    @property
+    def expression(self) -> Expression:
+        """Generates statement from attributes"""
+
+        statement: dict[str, Any] = {"step": self.step}
+        if self.unit:
+            statement["unit"] = self.unit
+        statement["bounds"] = self.bounds
+
+        return self.express(statement)
+
+
+class Densify(Stage):
+    """
+    Abstraction of MongoDB $densify statement that creates new documents where values of a field are missing.
+
+    Attributes:
+    -----------
+        - field, str : the field to densify. Its values must either be all numeric values or all dates.
+        - partition_by_fields, list[str] | None : fields to group the documents into partitions. Defaults to a single partition.
+        - range, DensifyRange : step, unit and bounds of the values to add.
+
+    Online MongoDB documentation:
+    -----------------------------
+    Creates new documents in a sequence of documents where certain values in a field are missing.
+
+    Source : https://www.mongodb.com/docs/manual/reference/operator/aggregation/densify/#mongodb-pipeline-pipe.-densify
+    """
+
+    field: str
+    partition_by_fields: list[str] | None
+    range: DensifyRange
+
+    @pyd.validator("range")
+    @classmethod
+    def validate_range(cls, range_: DensifyRange, values: dict) -> DensifyRange:
+        """Validates that "partition" bounds are used with partition_by_fields"""
+
+        if range_.bounds == "partition" and not values.get("partition_by_fields"):
+            raise ValueError('"partition" bounds require partition_by_fields')
+
+        return range_
+
+    @property
+    def expression(self) -> Expression:
+        """Generates statement from attributes"""
+
+        statement: dict[str, Any] = {"field": self.field}
+        if self.partition_by_fields:
+            statement["partitionByFields"] = self.partition_by_fields
+        statement["range"] = self.range
+
+        return self.express({"$densify": statement})
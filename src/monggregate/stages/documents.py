@@ -0,0 +1,99 @@
+"""
+Module defining an interface to MongoDB $documents stage operation in aggregation pipeline
+
+Online MongoDB documentation:
+--------------------------------------------------------------------------------------------------------------------
+
+Last Updated (in this package) : 19/10/2026
+Source : https://www.mongodb.com/docs/manual/reference/operator/aggregation/documents/#mongodb-pipeline-pipe.-documents
+
+# Definition
+# ----------------------------------------
+New in version 5.1.
+
+Returns literal documents from input values.
+
+# Syntax
+# ---------------------------------------
+The $documents stage has the following form:
+
+>>> { $documents: <expression> }
+
+$documents accepts any valid expression that resolves to an array of objects. This includes:
+
+    * system variables, such as $$NOW or $$SEARCH_META
+
+    * $let expressions
+
+    * variables in scope from $lookup expressions
+
+Expressions that do not resolve to a current document, like $myField or $$ROOT, will result in an error.
+
+# Behavior
+# ------------------------------
+
+You can only use $documents in a database-level aggregation pipeline.
+
+You must use $documents as the first stage of an aggregation pipeline.
+
+Uses
+
+Correlated pipeline stages:
+
+    * The $documents stage can be used to inject literal documents in the pipeline of a $lookup or a $unionWith stage.
+      In that case, the from field of the $lookup stage and the coll field of the $unionWith stage can be omitted.
+
+This allows to join client-side values (ex: a batch of ids) with a collection without writing them to a temporary collection.
+
+"""
+
+from typing import Any
+from monggregate.base import pyd, Expression
+from monggregate.stages.stage import Stage
+
+
+class Documents(Stage):
+    """
+    Abstraction of MongoDB $documents statement that returns literal documents from input values.
+
+    Attributes:
+    -----------
+        - documents, list[dict] | Any : the literal documents, or an expression resolving to an array of documents.
+                                        Literal documents are emitted as is (they are neither validated nor copied),
+                                        so that large batches can be injected cheaply.
+
+    Online MongoDB documentation:
+    -----------------------------
+    Returns literal documents from input values.
+    You must use documents as the first stage of an aggregation pipeline.
+
+    Source : https://www.mongodb.com/docs/manual/reference/operator/aggregation/documents/#mongodb-pipeline-pipe.-documents
+    """
+
+    # Typed as Any on purpose : pydantic would otherwise copy every document on validation
+    documents: Any
+
+    @pyd.validator("documents")
+    @classmethod
+    def validate_documents(cls, documents: Any) -> Any:
+        """Validates that literal documents are objects"""
+
+        if isinstance(documents, list):
+            for document in documents:
+                if not isinstance(document, dict):
+                    raise ValueError(f"$documents can only contain objects, got {type(document).__name__}")
+
+        elif documents is None or (isinstance(documents, str) and not documents.startswith("$")):
+            raise ValueError("documents must be a list of documents or an expression resolving to one")
+
+        return documents
+
+    @property
+    def expression(self) -> Expression:
+        """Generates statement from attributes"""
+
+        # Literal documents are returned without being walked by express
+        if isinstance(self.documents, list):
+            return {"$documents": self.documents}
+
+        return self.express({"$documents": self.documents})
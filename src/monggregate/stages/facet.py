@@ -0,0 +1,147 @@
+"""
+Module defining an interface to MongoDB $facet stage operation in aggregation pipeline
+
+Online MongoDB documentation:
+--------------------------------------------------------------------------------------------------------------------
+
+Last Updated (in this package) : 19/10/2026
+Source : https://www.mongodb.com/docs/manual/reference/operator/aggregation/facet/#mongodb-pipeline-pipe.-facet
+
+# Definition
+# ----------------------------------------
+New in version 3.4.
+
+Processes multiple aggregation pipelines within a single stage on the same set of input documents.
+Each sub-pipeline has its own field in the output document where its results are stored as an array of documents.
+
+The $facet stage allows you to create multi-faceted aggregations which characterize data across multiple dimensions,
+or facets, within a single aggregation stage. Multi-faceted aggregations provide multiple filters and categorizations
+to guide data browsing and analysis. Retailers commonly use faceting to narrow search results by creating filters
+on product price, manufacturer, size, etc.
+
+Input documents are passed to the $facet stage only once. $facet enables various aggregations on the same set of
+input documents, without needing to retrieve the input documents multiple times.
+
+NOTE : This is the aggregation $facet stage. See `monggregate.search.collectors.Facet` for the Atlas Search facet collector.
+
+# Syntax
+# ---------------------------------------
+The $facet stage has the following form:
+
+>>> { $facet:
+        {
+          <outputField1>: [ <stage1>, <stage2>, ... ],
+          <outputField2>: [ <stage1>, <stage2>, ... ],
+          ...
+
+        }
+    }
+
+Specify the output field name for each specified pipeline.
+
+# Behavior
+# ------------------------------
+Facet-related aggregation stages categorize and group incoming documents.
+Specify any of the following facet-related stages within different $facet sub-pipeline's <stage> to perform a multi-faceted aggregation:
+
+    * $bucket
+
+    * $bucketAuto
+
+    * $sortByCount
+
+Other aggregation stages can also be used with $facet with the following exceptions:
+
+    * $collStats
+
+    * $facet
+
+    * $geoNear
+
+    * $indexStats
+
+    * $out
+
+    * $merge
+
+    * $planCacheStats
+
+    * $search, $searchMeta and $vectorSearch (Atlas Search stages must be the first stage of the main pipeline)
+
+Each sub-pipeline within $facet is passed the exact same set of input documents. These sub-pipelines are completely
+independent of one another and the document array output by each is stored in separate fields in the output document.
+The output of one sub-pipeline can not be used as the input for a different sub-pipeline within the same $facet stage.
+If further aggregations are required, add additional stages after $facet and specify the field name, <outputField>, of the desired sub-pipeline output.
+
+The $facet stage, and its sub-pipelines, cannot make use of indexes, even if its sub-pipelines use $match or if $facet is the first stage in the pipeline.
+The $facet stage will always perform a COLLSCAN during execution.
+
+The output document of $facet is subject to the 100 megabyte BSON document size limit.
+
+"""
+
+from typing import Any
+from monggregate.base import pyd, Expression
+from monggregate.stages.stage import Stage, StageEnum
+
+# Stages that cannot be used in $facet sub-pipelines
+FORBIDDEN_FACET_STAGES = {
+    StageEnum.COLL_STATS.value,
+    StageEnum.FACET.value,
+    StageEnum.GEO_NEAR.value,
+    StageEnum.INDEX_STATS.value,
+    StageEnum.MERGE.value,
+    StageEnum.OUT.value,
+    StageEnum.PLAN_CACHE_STATS.value,
+    StageEnum.SEARCH.value,
+    StageEnum.SEARCH_META.value,
+    "$vectorSearch",
+}
+
+
+class Facet(Stage):
+    """
+    Abstraction of MongoDB $facet statement that processes multiple aggregation pipelines within a single stage on the same set of input documents.
+
+    Attributes:
+    -----------
+        - pipelines, dict[str, Pipeline | list[Stage | dict]] : sub-pipelines mapped to the name of the output field storing their results.
+                                                               The sub-pipelines cannot contain $collStats, $facet, $geoNear, $indexStats,
+                                                               $out, $merge, $planCacheStats, $search, $searchMeta or $vectorSearch stages.
+
+    Online MongoDB documentation:
+    -----------------------------
+    Processes multiple aggregation pipelines within a single stage on the same set of input documents.
+    Each sub-pipeline has its own field in the output document where its results are stored as an array of documents.
+
+    Source : https://www.mongodb.com/docs/manual/reference/operator/aggregation/facet/#mongodb-pipeline-pipe.-facet
+    """
+
+    pipelines: dict[str, Any]
+
+    @pyd.validator("pipelines")
+    @classmethod
+    def validate_pipelines(cls, pipelines: dict[str, Any]) -> dict[str, Any]:
+        """Validates that the sub-pipelines don't contain forbidden stages"""
+
+        if not pipelines:
+            raise ValueError("pipelines must contain at least one sub-pipeline")
+
+        for name, pipeline in pipelines.items():
+            statements = cls.express(pipeline)
+            if not isinstance(statements, list):
+                raise ValueError(f"Sub-pipeline {name} must be a pipeline or a list of stages")
+            for statement in statements:
+                forbidden = FORBIDDEN_FACET_STAGES.intersection(statement)
+                if forbidden:
+                    raise ValueError(
+                        f"{forbidden.pop()} stage cannot be used in a $facet sub-pipeline (found in {name})"
+                    )
+
+        return pipelines
+
+    @property
+    def expression(self) -> Expression:
+        """Generates statement from attributes"""
+
+        return self.express({"$facet": self.pipelines})
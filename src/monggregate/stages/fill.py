@@ -0,0 +1,154 @@
+"""
+Module defining an interface to MongoDB $fill stage operation in aggregation pipeline
+
+Online MongoDB documentation:
+--------------------------------------------------------------------------------------------------------------------
+
+Last Updated (in this package) : 19/10/2026
+Source : https://www.mongodb.com/docs/manual/reference/operator/aggregation/fill/#mongodb-pipeline-pipe.-fill
+
+# Definition
+# ----------------------------------------
+New in version 5.3.
+
+Populates null and missing field values within documents.
+
+You can use $fill to populate missing data points:
+
+    * In a sequence based on surrounding values.
+
+    * With a fixed value.
+
+# Syntax
+# ---------------------------------------
+The $fill stage has this syntax:
+
+>>> {
+        $fill: {
+            partitionBy: <expression>,
+            partitionByFields: [ <field 1>, <field 2>, ... , <field n> ],
+            sortBy: {
+                <sort field 1>: <sort order>,
+                <sort field 2>: <sort order>,
+                ...,
+                <sort field n>: <sort order>
+            },
+            output: {
+                <field 1>: { value: <expression> },
+                <field 2>: { method: <string> },
+                ...
+            }
+        }
+    }
+
+The $fill stage takes a document with these fields:
+
+Field               Description
+
+partitionBy         Optional. Specifies an expression to group the documents. In the $fill stage, a group of documents is known as a partition.
+                    If you omit partitionBy and partitionByFields, $fill uses one partition for the entire collection.
+                    partitionBy and partitionByFields are mutually exclusive.
+
+partitionByFields   Optional. Specifies an array of fields as the compound key to group the documents.
+                    partitionBy and partitionByFields are mutually exclusive.
+
+sortBy              Optional. Specifies the field or fields to sort the documents within each partition.
+                    Uses the same syntax as the $sort stage. Required by the linear and locf methods.
+
+output              Specifies an object containing each field for which to fill missing values. You can specify multiple fields in the output object.
+                    The object name is the name of the field to fill. The object value specifies how the field is filled:
+
+                        * value : Specifies an expression to fill the field with.
+
+                        * method : Specifies a method to fill the field with. Either:
+
+                            - linear : Fills null and missing fields using linear interpolation based on the surrounding non-null values in the sequence.
+
+                            - locf : Fills null and missing fields with the last non-null value of the field (last observation carried forward).
+
+# Behavior
+# ------------------------------
+
+$fill does not create new documents. Use $densify to create documents for missing values of a field.
+
+"""
+
+from typing import Any, Literal
+from monggregate.base import pyd, Expression
+from monggregate.stages.stage import Stage
+from monggregate.utils import StrEnum
+
+
+class FillMethodEnum(StrEnum):
+    """Enumeration of the methods available to fill missing values"""
+
+    LINEAR = "linear"
+    LOCF = "locf"
+
+
+class Fill(Stage):
+    """
+    Abstraction of MongoDB $fill statement that populates null and missing field values within documents.
+
+    Attributes:
+    -----------
+        - output, dict[str, Any] : fields to fill, mapped to {"value": <expression>} or {"method": "linear" | "locf"}
+        - sort_by, dict[str, Literal[1, -1]] | None : fields to sort the documents by in the partitions. Required by the linear and locf methods.
+        - partition_by, Any : expression to group the documents into partitions. Defaults to a single partition.
+        - partition_by_fields, list[str] | None : fields to group the documents into partitions. Cannot be used with partition_by.
+
+    Online MongoDB documentation:
+    -----------------------------
+    Populates null and missing field values within documents.
+
+    Source : https://www.mongodb.com/docs/manual/reference/operator/aggregation/fill/#mongodb-pipeline-pipe.-fill
+    """
+
+    partition_by: Any = None
+    partition_by_fields: list[str] | None
+    sort_by: dict[str, Literal[1, -1]] | None
+    output: dict[str, Any]
+
+    @pyd.validator("partition_by_fields")
+    @classmethod
+    def validate_partition_by_fields(cls, partition_by_fields: list[str] | None, values: dict) -> list[str] | None:
+        """Validates that partition_by and partition_by_fields are mutually exclusive"""
+
+        if partition_by_fields and values.get("partition_by") is not None:
+            raise ValueError("partition_by and partition_by_fields are mutually exclusive")
+
+        return partition_by_fields
+
+    @pyd.validator("output")
+    @classmethod
+    def validate_output(cls, output: dict[str, Any], values: dict) -> dict[str, Any]:
+        """Validates that each field is filled either with a value or with a method"""
+
+        if not output:
+            raise ValueError("output must contain at least one field")
+
+        for field, specification in output.items():
+            if not isinstance(specification, dict) or list(specification) not in (["value"], ["method"]):
+                raise ValueError(f"Field {field} must be filled either with a value or with a method")
+            if "method" in specification:
+                if specification["method"] not in set(FillMethodEnum):
+                    raise ValueError(f"Unknown fill method {specification['method']} for field {field}")
+                if not values.get("sort_by"):
+                    raise ValueError(f"The {specification['method']} method requires sort_by")
+
+        return output
+
+    @property
+    def expression(self) -> Expression:
+        """Generates statement from attributes"""
+
+        statement: dict[str, Any] = {}
+        if self.partition_by is not None:
+            statement["partitionBy"] = self.partition_by
+        if self.partition_by_fields:
+            statement["partitionByFields"] = self.partition_by_fields
+        if self.sort_by:
+            statement["sortBy"] = self.sort_by
+        statement["output"] = self.output
+
+        return self.express({"$fill": statement})
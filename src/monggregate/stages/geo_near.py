@@ -0,0 +1,187 @@
+"""
+Module defining an interface to MongoDB $geoNear stage operation in aggregation pipeline
+
+Online MongoDB documentation:
+--------------------------------------------------------------------------------------------------------------------
+
+Last Updated (in this package) : 19/10/2026
+Source : https://www.mongodb.com/docs/manual/reference/operator/aggregation/geoNear/#mongodb-pipeline-pipe.-geoNear
+
+# Definition
+# ----------------------------------------
+Outputs documents in order of nearest to farthest from a specified point.
+
+NOTE : Starting in version 8.1, MongoDB ignores the num option and the limit on the number of returned documents.
+
+# Syntax
+# ---------------------------------------
+The $geoNear stage has the following prototype form:
+
+>>> { $geoNear: { <geoNear options> } }
+
+The $geoNear operator accepts a document that contains the following $geoNear options.
+Specify all distances in the same units as those of the processed documents' coordinate system:
+
+Field               Description
+
+distanceField       The output field that contains the calculated distance. To specify a field within an embedded document, use dot notation.
+
+distanceMultiplier  Optional. The factor to multiply all distances returned by the query.
+                    For example, use the distanceMultiplier to convert radians, as returned by a spherical query,
+                    to kilometers by multiplying by the radius of the Earth.
+
+includeLocs         Optional. This specifies the output field that identifies the location used to calculate the distance.
+
+key                 Optional. Specify the geospatial indexed field to use when calculating the distance.
+                    If your collection has multiple 2d and/or multiple 2dsphere indexes, you must use the key option
+                    to specify the indexed field path to use.
+                    If you do not specify the key, and you have multiple 2d indexes and/or multiple 2dsphere indexes,
+                    MongoDB will return an error.
+                    If you do not specify the key, and you have at most only one 2d index and/or only one 2dsphere index,
+                    MongoDB looks first for a 2d index to use. If a 2d index does not exists, then MongoDB looks for a 2dsphere index to use.
+
+maxDistance         Optional. The maximum distance from the center point that the documents can be.
+                    MongoDB limits the results to those documents that fall within the specified distance from the center point.
+                    Specify the distance in meters if the specified point is GeoJSON and in radians if the specified point is legacy coordinate pairs.
+
+minDistance         Optional. The minimum distance from the center point that the documents can be.
+                    MongoDB limits the results to those documents that fall outside the specified distance from the center point.
+                    Specify the distance in meters for GeoJSON data and in radians for legacy coordinate pairs.
+
+near                The point for which to find the closest documents.
+                    If using a 2dsphere index, you can specify the point as either a GeoJSON point or legacy coordinate pair.
+                    If using a 2d index, specify the point as a legacy coordinate pair.
+
+query               Optional. Limits the results to the documents that match the query. The query syntax is the usual MongoDB read operation query syntax.
+                    You cannot specify a $near predicate in the query field of the $geoNear stage.
+
+spherical           Optional. Determines how MongoDB calculates the distance between two points:
+
+                        * When true, MongoDB uses $nearSphere semantics and calculates distances using spherical geometry.
+
+                        * When false, MongoDB uses $near semantics: spherical geometry for 2dsphere indexes and planar geometry for 2d indexes.
+
+                    Default: false.
+
+# Behavior
+# ------------------------------
+
+When using $geoNear, consider that:
+
+    * You can only use $geoNear as the first stage of a pipeline.
+
+    * You must include the distanceField option. The distanceField option specifies the field that will contain the calculated distance.
+
+    * $geoNear requires a geospatial index.
+
+      If you have more than one geospatial index on the collection, use the key parameter to specify which field to use in the calculation.
+      If you have only one geospatial index, $geoNear implicitly uses the indexed field for the calculation.
+
+    * You cannot specify a $near predicate in the query field of the $geoNear stage.
+
+    * Views do not support geoNear operations (i.e. $geoNear pipeline stage and the deprecated geoNear command).
+
+    * minDistance can only be used with a 2dsphere index, that is with a GeoJSON point or with spherical set to true.
+
+"""
+
+from typing import Any
+from monggregate.base import pyd, Expression
+from monggregate.geo import GeoJSONPoint
+from monggregate.stages.stage import Stage
+
+# Query operators that cannot be used in the query of $geoNear
+FORBIDDEN_GEO_NEAR_QUERY_OPERATORS = {"$near", "$nearSphere"}
+
+
+class GeoNear(Stage):
+    """
+    Abstraction of MongoDB $geoNear statement that outputs documents in order of nearest to farthest from a specified point.
+
+    Attributes:
+    -----------
+        - near, GeoJSONPoint | list[float] : the point for which to find the closest documents.
+                                             Either a GeoJSON point or a legacy [x, y] coordinate pair.
+        - distance_field, str : output field containing the calculated distance
+        - spherical, bool : whether to use spherical geometry to compute the distances. Defaults to False.
+        - max_distance, float | None : maximum distance from near of the documents.
+                                       In meters for GeoJSON points, in radians for legacy coordinate pairs.
+        - min_distance, float | None : minimum distance from near of the documents. Requires a GeoJSON point or spherical.
+        - query, dict | None : query the documents must match. Cannot contain $near or $nearSphere.
+        - key, str | None : geospatial indexed field to use. Required if the collection has several geospatial indexes.
+        - distance_multiplier, float | None : factor to multiply the distances with (ex: to convert radians to kilometers).
+
+    Online MongoDB documentation:
+    -----------------------------
+    Outputs documents in order of nearest to farthest from a specified point.
+    You can only use geoNear as the first stage of a pipeline.
+
+    Source : https://www.mongodb.com/docs/manual/reference/operator/aggregation/geoNear/#mongodb-pipeline-pipe.-geoNear
+    """
+
+    near: GeoJSONPoint | list[float]
+    distance_field: str
+    spherical: bool = False
+    max_distance: float | None = pyd.Field(None, ge=0)
+    min_distance: float | None = pyd.Field(None, ge=0)
+    query: dict | None
+    key: str | None
+    distance_multiplier: float | None
+
+    @pyd.validator("near")
+    @classmethod
+    def validate_near(cls, near: GeoJSONPoint | list[float]) -> GeoJSONPoint | list[float]:
+        """Validates that legacy coordinates are a pair"""
+
+        if isinstance(near, list) and len(near) != 2:
+            raise ValueError("Legacy coordinates must be an [x, y] pair")
+
+        return near
+
+    @pyd.validator("query")
+    @classmethod
+    def validate_query(cls, query: dict | None) -> dict | None:
+        """Validates that the query does not contain $near predicates"""
+
+        for condition in (query or {}).values():
+            if isinstance(condition, dict) and FORBIDDEN_GEO_NEAR_QUERY_OPERATORS.intersection(condition):
+                raise ValueError("The query of the $geoNear stage cannot contain $near or $nearSphere predicates")
+
+        return query
+
+    @pyd.root_validator(skip_on_failure=True)
+    @classmethod
+    def validate_distances(cls, values: dict) -> dict:
+        """Validates the distances bounds against each other and against the index type"""
+
+        max_distance, min_distance = values.get("max_distance"), values.get("min_distance")
+        if max_distance is not None and min_distance is not None and min_distance > max_distance:
+            raise ValueError("min_distance cannot be greater than max_distance")
+
+        if min_distance is not None and not (isinstance(values.get("near"), GeoJSONPoint) or values.get("spherical")):
+            raise ValueError("min_distance requires near to be a GeoJSON point or spherical to be true (2dsphere index)")
+
+        return values
+
+    @property
+    def expression(self) -> Expression:
+        """Generates statement from attributes"""
+
+        statement: dict[str, Any] = {
+            "near": self.near,
+            "distanceField": self.distance_field,
+        }
+        if self.spherical:
+            statement["spherical"] = self.spherical
+        if self.max_distance is not None:
+            statement["maxDistance"] = self.max_distance
+        if self.min_distance is not None:
+            statement["minDistance"] = self.min_distance
+        if self.query is not None:
+            statement["query"] = self.query
+        if self.key is not None:
+            statement["key"] = self.key
+        if self.distance_multiplier is not None:
+            statement["distanceMultiplier"] = self.distance_multiplier
+
+        return self.express({"$geoNear": statement})
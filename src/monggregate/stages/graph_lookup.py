@@ -0,0 +1,164 @@
+"""
+Module defining an interface to MongoDB $graphLookup stage operation in aggregation pipeline
+
+Online MongoDB documentation:
+--------------------------------------------------------------------------------------------------------------------
+
+Last Updated (in this package) : 19/10/2026
+Source : https://www.mongodb.com/docs/manual/reference/operator/aggregation/graphLookup/#mongodb-pipeline-pipe.-graphLookup
+
+# Definition
+# ----------------------------------------
+Performs a recursive search on a collection, with options for restricting the search by recursion depth and query filter.
+
+The $graphLookup search process is summarized below:
+
+    1. Input documents flow into the $graphLookup stage of an aggregation operation.
+
+    2. $graphLookup targets the search to the collection designated by the from parameter.
+
+    3. For each input document, the search begins with the value designated by startWith.
+
+    4. $graphLookup matches the startWith value against the field designated by connectToField
+       in other documents in the from collection.
+
+    5. For each matching document, $graphLookup takes the value of the connectFromField and checks every document
+       in the from collection for a matching connectToField value. For each match, $graphLookup adds the matching document
+       in the from collection to an array field named by the as parameter.
+
+       This step continues recursively until no more matching documents are found, or until the operation reaches
+       a recursion depth specified by the maxDepth parameter. $graphLookup then appends the array field to the input document.
+       $graphLookup returns results after completing its search on all input documents.
+
+# Syntax
+# ---------------------------------------
+$graphLookup has the following prototype form:
+
+>>> {
+        $graphLookup: {
+            from: <collection>,
+            startWith: <expression>,
+            connectFromField: <string>,
+            connectToField: <string>,
+            as: <string>,
+            maxDepth: <number>,
+            depthField: <string>,
+            restrictSearchWithMatch: <document>
+        }
+    }
+
+$graphLookup takes a document with the following fields:
+
+Field                       Description
+
+from                        Target collection for the $graphLookup operation to search, recursively matching
+                            the connectFromField to the connectToField. The from collection must be in the same database
+                            as any other collections used in the operation.
+
+startWith                   Expression that specifies the value of the connectFromField with which to start the recursive search.
+                            Optionally, startWith may be array of values, each of which is individually followed through the traversal process.
+
+connectFromField            Field name whose value $graphLookup uses to recursively match against the connectToField
+                            of other documents in the collection. If the value is an array, each element is individually
+                            followed through the traversal process.
+
+connectToField              Field name in other documents against which to match the value of the field specified by
+                            the connectFromField parameter.
+
+as                          Name of the array field added to each output document. Contains the documents traversed in
+                            the $graphLookup stage to reach the document.
+
+                            NOTE : Documents returned in the as field are not guaranteed to be in any order.
+
+maxDepth                    Optional. Non-negative integral number specifying the maximum recursion depth.
+
+depthField                  Optional. Name of the field to add to each traversed document in the search path.
+                            The value of this field is the recursion depth for the document, represented as a NumberLong.
+                            Recursion depth value starts at zero, so the first lookup corresponds to zero depth.
+
+restrictSearchWithMatch     Optional. A document specifying additional conditions for the recursive search.
+                            The syntax is identical to query filter syntax.
+
+                            NOTE : You cannot use any aggregation expression in this filter. For example, a query document
+                            such as { lastName: { $ne: "$lastName" } } will not work in this context to find documents
+                            in which the lastName value is different from the lastName value of the input document,
+                            because "$lastName" will act as a string literal, not a field path.
+
+# Considerations
+# ------------------------------
+
+Sharded Collections
+
+Starting in MongoDB 5.1, you can specify sharded collections in the from parameter of $graphLookup stages.
+
+Max Depth
+
+Setting the maxDepth field to 0 is equivalent to a non-recursive $graphLookup search stage.
+
+Memory
+
+The $graphLookup stage must stay within the 100 megabyte memory limit. If allowDiskUse: true is specified
+for the aggregate() operation, the $graphLookup stage ignores the option.
+
+Views and Collation
+
+If performing an aggregation that involves multiple views, such as with $lookup or $graphLookup,
+the views must have the same collation.
+
+"""
+
+from typing import Any
+from monggregate.base import pyd, Expression
+from monggregate.stages.stage import Stage
+
+
+class GraphLookup(Stage):
+    """
+    Abstraction for MongoDB $graphLookup statement that performs a recursive search on a collection.
+
+    Attributes:
+    -----------
+        - right / from (official MongoDB name), str : collection to search recursively
+        - start_with, Any : expression giving the value(s) of connect_from_field to start the search with
+        - connect_from_field, str : field whose value is recursively matched against connect_to_field
+        - connect_to_field, str : field of the documents of the from collection to match against
+        - name / as, str : name of the array field containing the traversed documents
+        - max_depth, int | None : maximum recursion depth. Defaults to an unlimited depth.
+        - depth_field, str | None : name of the field storing the recursion depth of the traversed documents
+        - restrict_search_with_match, dict | None : additional query filter the traversed documents must match
+
+    Online MongoDB documentation:
+    -----------------------------
+    Performs a recursive search on a collection, with options for restricting the search by recursion depth and query filter.
+
+    Source : https://www.mongodb.com/docs/manual/reference/operator/aggregation/graphLookup/#mongodb-pipeline-pipe.-graphLookup
+    """
+
+    right: str = pyd.Field(..., alias="from")
+    start_with: Any
+    connect_from_field: str
+    connect_to_field: str
+    name: str = pyd.Field(..., alias="as")
+    max_depth: int | None = pyd.Field(None, ge=0)
+    depth_field: str | None
+    restrict_search_with_match: dict | None
+
+    @property
+    def expression(self) -> Expression:
+        """Generates statement from attributes"""
+
+        statement: dict[str, Any] = {
+            "from": self.right,
+            "startWith": self.start_with,
+            "connectFromField": self.connect_from_field,
+            "connectToField": self.connect_to_field,
+            "as": self.name,
+        }
+        if self.max_depth is not None:
+            statement["maxDepth"] = self.max_depth
+        if self.depth_field is not None:
+            statement["depthField"] = self.depth_field
+        if self.restrict_search_with_match is not None:
+            statement["restrictSearchWithMatch"] = self.restrict_search_with_match
+
+        return self.express({"$graphLookup": statement})
@@ -245,8 +245,10 @@ For more information, see [$lookup Optimization](https://www.mongodb.com/docs/ma
 
 """
 
-from monggregate.base import pyd, Expression
+from typing import Any
+from monggregate.base import pyd, BaseModel, Expression, express
 from monggregate.stages.stage import Stage
+from monggregate.stages.union_with import starts_with_documents
 from monggregate.utils import StrEnum
 
 
@@ -264,7 +266,7 @@ class Lookup(Stage):
 
     Attributes:
     -----------
-        - right / from (official MongoDB name), str : foreign collection
+        - right / from (official MongoDB name), str | None : foreign collection. Can be omitted when the pipeline starts with a $documents stage.
         - left_on / local_field (official MongoDB name)), str | None : field of the current collection to join on
         - right_on / foreign_field (official MongoDB name), str | None : field of the foreign collection to join on
         - let, dict | None : variables to be used in the inner pipeline
@@ -317,7 +319,7 @@ class Lookup(Stage):
         dict | None
     )  # the let variables can be accessed by the stages in the pipeline including additional $lookup stages
     # nested in
-    pipeline: list[dict] | None
+    pipeline: list[Any] | None
 
     type_: LookupTypeEnum = pyd.Field("simple", exclude=True)
     # internal variable to know the type of join (simple, correlated, uncorrelated)
@@ -333,6 +335,17 @@ class Lookup(Stage):
 
         return value
 
+    @pyd.validator("pipeline", pre=True)
+    @classmethod
+    def validate_pipeline(cls, pipeline: Any) -> Any:
+        """Converts pipelines to their list of stages"""
+
+        if isinstance(pipeline, BaseModel):
+            # Stages are kept as is, so that $documents values are not copied when expressed
+            pipeline = list(getattr(pipeline, "stages", None) or pipeline.expression)
+
+        return pipeline
+
     @pyd.validator("type_", pre=True, always=True)
     @classmethod
     def set_type(cls, value: str, values: dict) -> str:
@@ -370,6 +383,9 @@ class Lookup(Stage):
             # that is either missing argument or superflous argument <VM, 16/04/2023>
             raise TypeError("Incompatible combination of arguments")
 
+        if not right and not starts_with_documents(pipeline):
+            raise ValueError("from can only be omitted when the pipeline starts with a $documents stage")
+
         return type_
 
     @property
@@ -386,5 +402,156 @@ class Lookup(Stage):
                 "as": self.name,
             }
         }
+        if self.right is None:
+            # from can be omitted when the pipeline starts with a $documents stage
+            del statement["$lookup"]["from"]
 
         return self.express(statement)
+
+    def to_concise(self) -> "Lookup":
+        """
+        Returns the concise (MongoDB 5.0+) form of an equality-correlated subquery,
+        or the lookup itself when it cannot be rewritten.
+
+        When the first stage of the pipeline is a $match whose $expr contains an equality between a field
+        of the foreign collection and a let variable bound to a field of the local collection,
+        ex: {"$expr": {"$eq": ["$sku", "$$item"]}} with let={"item": "$item"},
+        the equality is moved to local_field/foreign_field. The rest of the $match stage, the rest of the pipeline
+        and the variables still in use are kept. When nothing else remains, the simple form is returned.
+
+        This allows the server to use an index on the foreign field even when the $expr equality would not
+        (ex: on servers older than 5.0, or when the foreign field is multikey).
+
+        NOTE : localField/foreignField equality matches array elements and treats missing fields as null,
+        whereas $expr $eq compares values as a whole. The rewrite is therefore only equivalent when
+        the joined fields are scalars that are neither null nor missing.
+        """
+
+        if self.left_on or self.right_on or not self.let or not self.pipeline:
+            return self
+
+        first, *rest = self.pipeline
+        statement = express(first)
+        if not isinstance(statement, dict) or list(statement) != ["$match"] or "$expr" not in statement["$match"]:
+            return self
+
+        match = dict(statement["$match"])
+        conditions = _conjunction(match.pop("$expr"))
+        for position, condition in enumerate(conditions):
+            fields = _correlated_fields(condition, self.let)
+            if fields:
+                break
+        else:
+            return self
+
+        local_field, foreign_field = fields
+        residual = conditions[:position] + conditions[position + 1 :]
+        if len(residual) == 1:
+            match["$expr"] = residual[0]
+        elif residual:
+            match["$expr"] = {"$and": residual}
+
+        pipeline = ([{"$match": match}] if match else []) + rest
+        statements = express(pipeline)
+        let = {variable: value for variable, value in self.let.items() if _uses_variable(statements, variable)}
+
+        return Lookup(
+            right=self.right,
+            left_on=local_field,
+            right_on=foreign_field,
+            let=let or None,
+            pipeline=pipeline or None,
+            name=self.name,
+        )
+
+    def index_suggestion(self) -> dict[str, int] | None:
+        """
+        Returns the keys of an index on the foreign collection supporting the lookup, None if there are none.
+
+        The index starts with the foreign field of the join (after rewriting to the concise form when possible),
+        followed by the fields compared for equality in the first $match stage of the pipeline.
+        """
+
+        lookup = self.to_concise()
+        keys: dict[str, int] = {}
+        if lookup.right_on:
+            keys[lookup.right_on] = 1
+
+        if lookup.pipeline:
+            statement = express(lookup.pipeline[0])
+            if isinstance(statement, dict) and list(statement) == ["$match"]:
+                for field, value in statement["$match"].items():
+                    if not field.startswith("$") and not (isinstance(value, dict) and set(value) - {"$eq"}):
+                        keys.setdefault(field, 1)
+                for condition in _conjunction(statement["$match"].get("$expr")):
+                    field = _equality_field(condition)
+                    if field:
+                        keys.setdefault(field, 1)
+
+        return keys or None
+
+
+def _conjunction(expression: Any) -> list[Any]:
+    """Returns the conditions of an $and expression, or the expression itself"""
+
+    if expression is None:
+        return []
+
+    if isinstance(expression, dict) and list(expression) == ["$and"]:
+        return list(expression["$and"])
+
+    return [expression]
+
+
+def _equality_field(condition: Any) -> str | None:
+    """Returns the field path compared for equality to a variable or a constant in an $eq condition"""
+
+    if not (isinstance(condition, dict) and list(condition) == ["$eq"] and len(condition["$eq"]) == 2):
+        return None
+
+    fields = [operand for operand in condition["$eq"] if _is_field_path(operand)]
+    others = [operand for operand in condition["$eq"] if not _is_field_path(operand)]
+    if len(fields) != 1 or isinstance(others[0], dict):
+        return None
+
+    return fields[0][1:]
+
+
+def _correlated_fields(condition: Any, let: dict) -> tuple[str, str] | None:
+    """
+    Returns the local and the foreign fields of an $eq condition between a foreign field and a let variable
+    bound to a local field, None if condition is not such an equality
+    """
+
+    foreign_field = _equality_field(condition)
+    if not foreign_field:
+        return None
+
+    (variable,) = [operand for operand in condition["$eq"] if not _is_field_path(operand)]
+    if not (isinstance(variable, str) and variable.startswith("$$")):
+        return None
+
+    local = let.get(variable[2:])
+    if local is None or not _is_field_path(local):
+        return None
+
+    return local[1:], foreign_field
+
+
+def _uses_variable(expression: Any, variable: str) -> bool:
+    """Returns true if expression references the variable"""
+
+    if isinstance(expression, str):
+        return expression == f"$${variable}" or expression.startswith(f"$${variable}.")
+    if isinstance(expression, dict):
+        return any(_uses_variable(value, variable) for value in expression.values())
+    if isinstance(expression, list):
+        return any(_uses_variable(element, variable) for element in expression)
+
+    return False
+
+
+def _is_field_path(value: Any) -> bool:
+    """Returns true if value is a field path (ex: "$field.subfield")"""
+
+    return isinstance(value, str) and value.startswith("$") and not value.startswith("$$")
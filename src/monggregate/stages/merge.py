@@ -0,0 +1,233 @@
+"""
+Module defining an interface to MongoDB $merge stage operation in aggregation pipeline
+
+Online MongoDB documentation:
+--------------------------------------------------------------------------------------------------------------------
+
+Last Updated (in this package) : 19/10/2026
+Source : https://www.mongodb.com/docs/manual/reference/operator/aggregation/merge/#mongodb-pipeline-pipe.-merge
+
+# Definition
+# ----------------------------------------
+New in version 4.2.
+
+Writes the results of the aggregation pipeline to a specified collection. The $merge operator must be the last stage in the pipeline.
+
+The $merge stage:
+
+    * Can output to a collection in the same or different database.
+
+    * Creates a new collection if the output collection does not already exist.
+
+    * Can incorporate results (insert new documents, merge documents, replace documents, keep existing documents,
+      fail the operation, process documents with a custom update pipeline) into an existing collection.
+
+    * Can output to a sharded collection. Input collection can also be sharded.
+
+Unlike $out that replaces the whole output collection, $merge can incrementally update the output collection,
+which makes it suitable to maintain on-demand materialized views.
+
+# Syntax
+# ---------------------------------------
+$merge has the following syntax:
+
+>>> { $merge: {
+        into: <collection> -or- { db: <db>, coll: <collection> },
+        on: <identifier field> -or- [ <identifier field1>, ...],  // Optional
+        let: <variables>,                                         // Optional
+        whenMatched: <replace|keepExisting|merge|fail|pipeline>,  // Optional
+        whenNotMatched: <insert|discard|fail>                     // Optional
+    } }
+
+For example:
+
+>>> { $merge: { into: "myOutput", on: "_id", whenMatched: "replace", whenNotMatched: "insert" } }
+
+If using all default options for $merge, including writing to a collection in the same database, you can use the simplified form:
+
+>>> { $merge: <collection> } // Output collection is in the same database
+
+The $merge takes a document with the following fields:
+
+Field               Description
+
+into                The output collection. Specify either:
+
+                        * The collection name as a string to output to a collection in the same database where the aggregation is run.
+
+                        * The database and collection name in a document { db: <db>, coll: <collection> }.
+
+on                  Optional. Field or fields that act as a unique identifier for a document. The identifier determines if a results document
+                    matches an existing document in the output collection.
+                    For the specified field or fields, the output collection must have a unique index on those fields.
+                    The default value for on depends on the output collection : _id for an unsharded collection.
+
+let                 Optional. Specifies variables for use in the whenMatched pipeline.
+                    The new document being merged is available in the pipeline as $$new.
+
+whenMatched         Optional. The behavior of $merge if a result document and an existing document in the collection have the same value for the specified on field(s).
+                    You can specify either:
+
+                        * One of the pre-defined action strings:
+
+                            - replace : Replace the existing document in the output collection with the matching results document.
+
+                            - keepExisting : Keep the existing document in the output collection.
+
+                            - merge (Default) : Merge the matching documents (similar to the $mergeObjects operator).
+
+                            - fail : Stop and fail the aggregation operation.
+
+                        * An aggregation pipeline to update the document in the collection.
+                          The pipeline can only consist of the following stages: $addFields and its alias $set,
+                          $project and its alias $unset, $replaceRoot and its alias $replaceWith.
+
+whenNotMatched      Optional. The behavior of $merge if a result document does not match an existing document in the output collection.
+
+                        - insert (Default) : Insert the document into the output collection.
+
+                        - discard : Discard the document.
+
+                        - fail : Stop and fail the aggregation operation.
+
+# Restrictions
+# ------------------------------
+
+    * Transactions : An aggregation pipeline cannot use $merge inside a transaction.
+
+    * View Definition : $merge cannot be used as part of a view definition.
+
+    * $lookup stage : $lookup stage's nested pipeline cannot include the $merge stage.
+
+    * $facet stage : $facet stage's nested pipeline cannot include the $merge stage.
+
+    * $unionWith stage : $unionWith stage's nested pipeline cannot include the $merge stage.
+
+    * "linearizable" read concern : The $merge stage cannot be used in conjunction with read concern "linearizable".
+
+"""
+
+from typing import Any
+from monggregate.base import pyd, Expression
+from monggregate.stages.stage import Stage
+from monggregate.utils import StrEnum
+
+
+class WhenMatchedEnum(StrEnum):
+    """Enumeration of the pre-defined actions when a document matches an existing document"""
+
+    REPLACE = "replace"
+    KEEP_EXISTING = "keepExisting"
+    MERGE = "merge"
+    FAIL = "fail"
+
+
+class WhenNotMatchedEnum(StrEnum):
+    """Enumeration of the actions when a document does not match an existing document"""
+
+    INSERT = "insert"
+    DISCARD = "discard"
+    FAIL = "fail"
+
+
+# Stages allowed in the whenMatched pipeline
+WHEN_MATCHED_PIPELINE_STAGES = {
+    "$addFields",
+    "$set",
+    "$project",
+    "$unset",
+    "$replaceRoot",
+    "$replaceWith",
+}
+
+
+class Merge(Stage):
+    """
+    Abstraction for the MongoDB $merge statement that writes the documents returned by the aggregation pipeline into a collection.
+
+    Attributes:
+    -----------
+        - into, str : name of the output collection
+        - db, str|None : name of the db of the output collection. Defaults to the current db.
+        - on, str|list[str]|None : field or fields that act as a unique identifier for a document. Defaults to _id.
+        - let, dict|None : variables accessible in the whenMatched pipeline. The merged document is available as $$new.
+        - when_matched, WhenMatchedEnum|list[dict]|None : action or update pipeline to apply when a document matches an existing document.
+                                                           Defaults to merge.
+        - when_not_matched, WhenNotMatchedEnum|None : action to apply when a document does not match an existing document.
+                                                     Defaults to insert.
+
+    Online MongoDB documentation:
+    -----------------------------
+    Writes the results of the aggregation pipeline to a specified collection. The merge operator must be the last stage in the pipeline.
+    Unlike out, merge can incorporate the results into an existing collection (insert new documents, merge documents,
+    replace documents, keep existing documents, fail the operation, process documents with a custom update pipeline).
+
+    Source : https://www.mongodb.com/docs/manual/reference/operator/aggregation/merge/#mongodb-pipeline-pipe.-merge
+    """
+
+    into: str
+    db: str | None
+    on: str | list[str] | None
+    when_matched: WhenMatchedEnum | list[Any] | None
+    when_not_matched: WhenNotMatchedEnum | None
+    let: dict | None  # declared after when_matched to be validated against it
+
+    @pyd.validator("on")
+    @classmethod
+    def validate_on(cls, on: str | list[str] | None) -> str | list[str] | None:
+        """Validates that on is not an empty list"""
+
+        if isinstance(on, list) and not on:
+            raise ValueError("on must contain at least one field")
+
+        return on
+
+    @pyd.validator("when_matched")
+    @classmethod
+    def validate_when_matched(
+        cls, when_matched: WhenMatchedEnum | list[Any] | None
+    ) -> WhenMatchedEnum | list[Any] | None:
+        """Validates that the whenMatched pipeline only contains the allowed stages"""
+
+        if isinstance(when_matched, list):
+            for stage in cls.express(when_matched):
+                if not isinstance(stage, dict) or len(stage) != 1:
+                    raise ValueError(f"Invalid stage in whenMatched pipeline: {stage}")
+                name = next(iter(stage))
+                if name not in WHEN_MATCHED_PIPELINE_STAGES:
+                    raise ValueError(
+                        f"{name} is not allowed in the whenMatched pipeline. "
+                        f"Allowed stages are: {', '.join(sorted(WHEN_MATCHED_PIPELINE_STAGES))}"
+                    )
+
+        return when_matched
+
+    @pyd.validator("let")
+    @classmethod
+    def validate_let(cls, let: dict | None, values: dict) -> dict | None:
+        """Validates that let is only used with a whenMatched pipeline"""
+
+        if let and not isinstance(values.get("when_matched"), list):
+            raise ValueError("let can only be used when when_matched is a pipeline")
+
+        return let
+
+    @property
+    def expression(self) -> Expression:
+        """Generates statement from attributes"""
+
+        into: str | dict = self.into
+        if self.db:
+            into = {"db": self.db, "coll": self.into}
+
+        statement: dict[str, Any] = {"into": into}
+        if self.on is not None:
+            statement["on"] = self.on
+        if self.let is not None:
+            statement["let"] = self.let
+        if self.when_matched is not None:
+            statement["whenMatched"] = self.when_matched
+        if self.when_not_matched is not None:
+            statement["whenNotMatched"] = self.when_not_matched
+
+        return self.express({"$merge": statement})
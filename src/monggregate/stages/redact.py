@@ -0,0 +1,159 @@
+"""
+Module defining an interface to MongoDB $redact stage operation in aggregation pipeline
+
+Online MongoDB documentation:
+--------------------------------------------------------------------------------------------------------------------
+
+Last Updated (in this package) : 19/10/2026
+Source : https://www.mongodb.com/docs/manual/reference/operator/aggregation/redact/#mongodb-pipeline-pipe.-redact
+
+# Definition
+# ----------------------------------------
+Restricts entire documents or content within documents from being outputted based on information stored in the documents themselves.
+
+The $redact stage has the following prototype form:
+
+>>> { $redact: <expression> }
+
+The argument can be any valid expression as long as it resolves to the $$DESCEND, $$PRUNE, or $$KEEP system variables.
+
+System Variable     Description
+
+$$DESCEND           $redact returns the fields at the current document level, excluding embedded documents.
+                    To include embedded documents and embedded documents within arrays, apply the $cond
+                    expression to the embedded documents to determine access for these embedded documents.
+
+$$PRUNE             $redact excludes all fields at this current document/embedded document level,
+                    without further inspection of any of the excluded fields.
+                    This applies even if the excluded field contains embedded documents that may have different access levels.
+
+$$KEEP              $redact returns or keeps all fields at this current document/embedded document level,
+                    without further inspection of the fields at this level.
+                    This applies even if the included field contains embedded documents that may have different access levels.
+
+# Examples
+# ------------------------------
+
+Evaluate Access at Every Document Level
+
+A forecasts collection contains documents of the following form where the tags field lists
+the different access values for that document/embedded document level:
+
+>>> {
+        _id: 1,
+        title: "123 Department Report",
+        tags: [ "G", "STLW" ],
+        year: 2014,
+        subsections: [
+            {
+                subtitle: "Section 1: Overview",
+                tags: [ "SI", "G" ],
+                content:  "Section 1: This is the content of section 1."
+            },
+            {
+                subtitle: "Section 2: Analysis",
+                tags: [ "STLW" ],
+                content: "Section 2: This is the content of section 2."
+            }
+        ]
+    }
+
+A user has access to view information with either the tag "STLW" or "G".
+To run a query on all documents with year 2014 for this user, include a $redact stage as in the following:
+
+>>> var userAccess = [ "STLW", "G" ];
+    db.forecasts.aggregate(
+        [
+            { $match: { year: 2014 } },
+            { $redact: {
+                $cond: {
+                    if: { $gt: [ { $size: { $setIntersection: [ "$tags", userAccess ] } }, 0 ] },
+                    then: "$$DESCEND",
+                    else: "$$PRUNE"
+                }
+            }
+            }
+        ]
+    );
+
+Redacting on the server avoids sending the pruned sub-documents over the network.
+
+"""
+
+from typing import Any
+from monggregate.base import pyd, BaseModel, Expression
+from monggregate.dollar import DESCEND, KEEP, PRUNE
+from monggregate.operators.conditional import Cond, Switch
+from monggregate.stages.stage import Stage
+
+REDACT_OUTCOMES = {DESCEND, PRUNE, KEEP}
+
+
+class Redact(Stage):
+    """
+    Abstraction of MongoDB $redact statement that restricts the content of the documents
+    based on information stored in the documents themselves.
+
+    Attributes:
+    -----------
+        - condition, Any : expression resolving to $$DESCEND, $$PRUNE or $$KEEP.
+                           Usually a Cond or a Switch operator whose cases use the set operators (ex: $setIntersection)
+                           to compare the access levels of the documents with the ones of the user.
+
+    Online MongoDB documentation:
+    -----------------------------
+    Restricts entire documents or content within documents from being outputted based on information stored in the documents themselves.
+
+    The argument can be any valid expression as long as it resolves to the $$DESCEND, $$PRUNE, or $$KEEP system variables.
+
+    Source : https://www.mongodb.com/docs/manual/reference/operator/aggregation/redact/#mongodb-pipeline-pipe.-redact
+    """
+
+    condition: Any
+
+    @pyd.validator("condition")
+    @classmethod
+    def validate_condition(cls, condition: Any) -> Any:
+        """Validates that the literal outcomes of the condition are $$DESCEND, $$PRUNE or $$KEEP"""
+
+        for outcome in _outcomes(condition):
+            if not isinstance(outcome, (str, dict, BaseModel)) or (
+                isinstance(outcome, str) and not outcome.startswith("$")
+            ):
+                raise ValueError(
+                    f"$redact expressions must resolve to {', '.join(sorted(REDACT_OUTCOMES))}, got {outcome!r}"
+                )
+
+        return condition
+
+    @property
+    def expression(self) -> Expression:
+        """Generates statement from attributes"""
+
+        return self.express({"$redact": self.condition})
+
+
+def _outcomes(condition: Any) -> list[Any]:
+    """Returns the possible outcomes of the Cond and Switch operators in condition"""
+
+    if isinstance(condition, Cond):
+        condition = {"$cond": {"then": condition.then_, "else": condition.else_}}
+    elif isinstance(condition, Switch):
+        condition = {"$switch": {"branches": condition.branches, "default": condition.default}}
+
+    outcomes: list[Any] = []
+    if isinstance(condition, dict) and "$cond" in condition:
+        arguments = condition["$cond"]
+        branches = [arguments.get("then"), arguments.get("else")] if isinstance(arguments, dict) else arguments[1:]
+        for branch in branches:
+            outcomes.extend(_outcomes(branch))
+    elif isinstance(condition, dict) and "$switch" in condition:
+        arguments = condition["$switch"]
+        for branch in arguments.get("branches", []):
+            outcomes.extend(_outcomes(branch.get("then") if isinstance(branch, dict) else branch))
+        if arguments.get("default") is not None:
+            outcomes.extend(_outcomes(arguments["default"]))
+    else:
+        outcomes.append(condition)
+
+    return outcomes
@@ -16,7 +16,11 @@ from monggregate.search.operators import (
     Compound,
     Equals,
     Exists,
+    In,
     MoreLikeThis,
+    Near,
+    Phrase,
+    QueryString,
     Range,
     Regex,
     Text,
@@ -27,6 +31,7 @@ from monggregate.search.operators import (
 from monggregate.search.operators.operator import OperatorLiteral
 from monggregate.search.operators.compound import ClauseType
 from monggregate.search.commons import CountOptions, FuzzyOptions, HighlightOptions
+from monggregate.geo import GeoJSONPoint
 
 
 # Classes
@@ -53,6 +58,21 @@ class SearchConfig(BaseModel):
                                 To view the details, you must use the $meta expression in the
                                 $project stage.
 
+        - concurrent, bool : Flag that specifies whether to parallelize the search across segments on
+                             dedicated search nodes. Defaults to false.
+
+        - sort, dict|None : Document that specifies the fields to sort the results by, in the search index.
+                            Each field maps to 1 (ascending), -1 (descending) or a document with an order
+                            and a noData option. The score can be sorted with {"$meta": "searchScore"}.
+
+        - search_after, str|None : Pagination token (from {"$meta": "searchSequenceToken"}) of the reference point
+                                   to return the results after. Cannot be used with search_before.
+
+        - search_before, str|None : Pagination token (from {"$meta": "searchSequenceToken"}) of the reference point
+                                    to return the results before, in reverse order. Cannot be used with search_after.
+
+    NOTE : concurrent, sort, search_after and search_before only apply to the $search stage.
+
     """
 
     index: str = "default"
@@ -60,6 +80,39 @@ class SearchConfig(BaseModel):
     highlight: HighlightOptions | None
     return_stored_source: bool = False
     score_details: bool = False
+    concurrent: bool = False
+    sort: dict[str, Any] | None
+    search_after: str | None
+    search_before: str | None
+
+    @pyd.validator("sort")
+    @classmethod
+    def validate_sort(cls, sort: dict[str, Any] | None) -> dict[str, Any] | None:
+        """Validates the sort orders"""
+
+        for field, order in (sort or {}).items():
+            if isinstance(order, dict) and "$meta" in order:
+                if order["$meta"] != "searchScore":
+                    raise ValueError(f"{field} can only be sorted by the searchScore metadata")
+                order = order.get("order", -1)
+            elif isinstance(order, dict):
+                if order.get("noData", "lowest") not in ("lowest", "highest"):
+                    raise ValueError(f"noData must be lowest or highest, got {order['noData']}")
+                order = order.get("order")
+            if order not in (1, -1):
+                raise ValueError(f"The sort order of {field} must be 1 or -1, got {order}")
+
+        return sort
+
+    @pyd.validator("search_before")
+    @classmethod
+    def validate_search_before(cls, search_before: str | None, values: dict) -> str | None:
+        """Ensures that search_after and search_before are not used together"""
+
+        if search_before is not None and values.get("search_after") is not None:
+            raise ValueError("search_after and search_before cannot be used together")
+
+        return search_before
 
     @property
     def expression(self) -> Expression:
@@ -92,6 +145,14 @@ class SearchBase(Stage, SearchConfig):
                                 To view the details, you must use the $meta expression in the
                                 $project stage.
 
+        - concurrent, bool : Flag that specifies whether to parallelize the search across segments.
+
+        - sort, dict|None : Document that specifies the fields to sort the results by, in the search index.
+
+        - search_after, str|None : Pagination token of the reference point to return the results after.
+
+        - search_before, str|None : Pagination token of the reference point to return the results before.
+
         - operator, SearchOperator|None : Name of the operator to search with. You can provide a document
                                           that contains the operator-specific options as the value for this field
                                           Either this or collector is required.
@@ -295,6 +356,29 @@ class SearchBase(Stage, SearchConfig):
 
         return cls(**base_params, collector=facet_)
 
+    @classmethod
+    def init_in(
+        cls,
+        path: str | list[str],
+        value: str | int | float | bool | datetime | list,
+        score: dict | None = None,
+        **kwargs: Any,
+    ) -> Self:
+        """
+        Creates a search stage with an in operator
+
+        Summary:
+        --------------------------------
+        This checks whether a field matches one of the values you specify.
+        You may want to use this rather than a compound query made of one equals clause per value.
+
+        """
+
+        base_params = SearchConfig(**kwargs).dict()
+        in_statement = In(path=path, value=value, score=score)
+
+        return cls(**base_params, operator=in_statement)
+
     @classmethod
     def init_more_like_this(cls, like: dict | list[dict], **kwargs: Any) -> Self:
         """
@@ -313,6 +397,79 @@ class SearchBase(Stage, SearchConfig):
 
         return cls(**base_params, operator=more_like_this_stasement)
 
+    @classmethod
+    def init_near(
+        cls,
+        path: str | list[str],
+        origin: int | float | datetime | GeoJSONPoint,
+        pivot: int | float,
+        score: dict | None = None,
+        **kwargs: Any,
+    ) -> Self:
+        """
+        Creates a search stage with a near operator
+
+        Summary:
+        --------------------------------
+        This scores the documents by the proximity of a number, date or geographic point to an origin.
+        You may want to use this rather than sorting the results by distance after the search.
+
+        """
+
+        base_params = SearchConfig(**kwargs).dict()
+        near_statement = Near(path=path, origin=origin, pivot=pivot, score=score)
+
+        return cls(**base_params, operator=near_statement)
+
+    @classmethod
+    def init_phrase(
+        cls,
+        query: str | list[str],
+        path: str | list[str],
+        slop: int = 0,
+        score: dict | None = None,
+        synonyms: str | None = None,
+        **kwargs: Any,
+    ) -> Self:
+        """
+        Creates a search stage with a phrase operator
+
+        Summary:
+        --------------------------------
+        The phrase operator searches for documents containing an ordered sequence of terms,
+        at most slop positions apart.
+
+        """
+
+        base_params = SearchConfig(**kwargs).dict()
+        phrase_statement = Phrase(query=query, path=path, slop=slop, score=score, synonyms=synonyms)
+
+        return cls(**base_params, operator=phrase_statement)
+
+    @classmethod
+    def init_query_string(
+        cls,
+        query: str,
+        default_path: str | None = None,
+        score: dict | None = None,
+        path: str | None = None,
+        **kwargs: Any,
+    ) -> Self:
+        """
+        Creates a search stage with a queryString operator
+
+        Summary:
+        --------------------------------
+        The queryString operator searches a combination of fields and values written with the Lucene query syntax.
+        path is used as the default path when default_path is not provided.
+
+        """
+
+        base_params = SearchConfig(**kwargs).dict()
+        query_string_statement = QueryString(default_path=default_path or path, query=query, score=score)
+
+        return cls(**base_params, operator=query_string_statement)
+
     @classmethod
     def init_range(
         cls,
@@ -461,12 +618,36 @@ class SearchBase(Stage, SearchConfig):
 
         return Facet(**kwargs)
 
+    @staticmethod
+    def In(**kwargs) -> In:
+        """Returns an in operator."""
+
+        return In(**kwargs)
+
     @staticmethod
     def MoreLikeThis(**kwargs) -> MoreLikeThis:
         """Returns a more_like_this operator."""
 
         return MoreLikeThis(**kwargs)
 
+    @staticmethod
+    def Near(**kwargs) -> Near:
+        """Returns a near operator."""
+
+        return Near(**kwargs)
+
+    @staticmethod
+    def Phrase(**kwargs) -> Phrase:
+        """Returns a phrase operator."""
+
+        return Phrase(**kwargs)
+
+    @staticmethod
+    def QueryString(**kwargs) -> QueryString:
+        """Returns a queryString operator."""
+
+        return QueryString(**kwargs)
+
     @staticmethod
     def Range(**kwargs) -> Range:
         """Returns a range operator."""
@@ -567,6 +748,26 @@ class SearchBase(Stage, SearchConfig):
 
         return self
 
+    def in_(
+        self,
+        type: ClauseType,
+        *,
+        path: str | list[str],
+        value: str | int | float | bool | datetime | list,
+        score: dict | None = None,
+        **kwargs: Any,
+    ) -> Self:
+        """Adds an in clause to the top-level Compound operator."""
+
+        if isinstance(self.operator, Compound):
+            self.operator.in_(type, path=path, value=value, score=score)
+        elif self.collector and isinstance(self.collector.operator, Compound):
+            self.collector.operator.in_(type, path=path, value=value, score=score)
+        else:
+            raise TypeError(f"Cannot call in_ on {self.operator}")
+
+        return self
+
     def more_like_this(
         self, type: ClauseType, like: dict | list[dict], **kwargs: Any
     ) -> Self:
@@ -581,6 +782,71 @@ class SearchBase(Stage, SearchConfig):
 
         return self
 
+    def near(
+        self,
+        type: ClauseType,
+        *,
+        path: str | list[str],
+        origin: int | float | datetime | GeoJSONPoint,
+        pivot: int | float,
+        score: dict | None = None,
+        **kwargs: Any,
+    ) -> Self:
+        """Adds a near clause to the top-level Compound operator."""
+
+        if isinstance(self.operator, Compound):
+            self.operator.near(type, path=path, origin=origin, pivot=pivot, score=score)
+        elif self.collector and isinstance(self.collector.operator, Compound):
+            self.collector.operator.near(type, path=path, origin=origin, pivot=pivot, score=score)
+        else:
+            raise TypeError(f"Cannot call near on {self.operator}")
+
+        return self
+
+    def phrase(
+        self,
+        type: ClauseType,
+        *,
+        query: str | list[str],
+        path: str | list[str],
+        slop: int = 0,
+        score: dict | None = None,
+        synonyms: str | None = None,
+        **kwargs: Any,
+    ) -> Self:
+        """Adds a phrase clause to the top-level Compound operator."""
+
+        if isinstance(self.operator, Compound):
+            self.operator.phrase(type, query=query, path=path, slop=slop, score=score, synonyms=synonyms)
+        elif self.collector and isinstance(self.collector.operator, Compound):
+            self.collector.operator.phrase(type, query=query, path=path, slop=slop, score=score, synonyms=synonyms)
+        else:
+            raise TypeError(f"Cannot call phrase on {self.operator}")
+
+        return self
+
+    def query_string(
+        self,
+        type: ClauseType,
+        *,
+        query: str,
+        default_path: str | None = None,
+        score: dict | None = None,
+        path: str | None = None,
+        **kwargs: Any,
+    ) -> Self:
+        """Adds a queryString clause to the top-level Compound operator."""
+
+        default_path = default_path or path
+        if isinstance(self.operator, Compound):
+            self.operator.query_string(type, default_path=default_path, query=query, score=score)
+        elif self.collector and isinstance(self.collector.operator, Compound):
+            self.collector.operator.query_string(type, default_path=default_path, query=query, score=score)
+        else:
+            raise TypeError(f"Cannot call query_string on {self.operator}")
+
+        return self
+
     def range(
         self,
         type: ClauseType,
@@ -922,7 +1188,11 @@ class SearchBase(Stage, SearchConfig):
             "equals": cls.init_equals,
             "exists": cls.init_exists,
             # "facet":cls.init_facet,
+            "in": cls.init_in,
             "more_like_this": cls.init_more_like_this,
+            "near": cls.init_near,
+            "phrase": cls.init_phrase,
+            "query_string": cls.init_query_string,
             "range": cls.init_range,
             "regex": cls.init_regex,
             "text": cls.init_text,
@@ -941,8 +1211,12 @@ class SearchBase(Stage, SearchConfig):
             "compound": self.compound,  # FIXME : This breaks typing
             "equals": self.equals,
             "exists": self.exists,
+            "in": self.in_,
             "range": self.range,
             "more_like_this": self.more_like_this,
+            "near": self.near,
+            "phrase": self.phrase,
+            "query_string": self.query_string,
             "regex": self.regex,
             "text": self.text,
             "wildcard": self.wildcard,
@@ -960,7 +1234,11 @@ class SearchBase(Stage, SearchConfig):
             - count,
             - highlight,
             - return_stored_source,
-            - score_details
+            - score_details,
+            - concurrent,
+            - sort,
+            - search_after,
+            - search_before
 
         """
 
@@ -969,3 +1247,7 @@ class SearchBase(Stage, SearchConfig):
         kwargs.pop("highlight", None)
         kwargs.pop("return_stored_source", None)
         kwargs.pop("score_details", None)
+        kwargs.pop("concurrent", None)
+        kwargs.pop("sort", None)
+        kwargs.pop("search_after", None)
+        kwargs.pop("search_before", None)
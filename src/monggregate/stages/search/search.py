@@ -3,7 +3,7 @@
 Online MongoDB documentation:
 --------------------------------------------------------------------------------------------------
 
-Last Updated (in this package) : 25/04/2023
+Last Updated (in this package) : 19/10/2026
 Source : https://www.mongodb.com/docs/atlas/atlas-search/query-syntax/#mongodb-pipeline-pipe.-search
 
 # Definition
@@ -39,6 +39,8 @@ Field                       Type       Necessity       Description
 <collector-name>            document   Conditional     Name of the collector to use with the query. 
                                                        You can provide a document that contains the collector-specific options as the value for this field. 
                                                        Either this or <operator-name> is required.
+concurrent                  boolean    Optional        Parallelize the search across segments on dedicated search nodes.
+                                                       If omitted, defaults to false.
 count                       document   Optional        Document that specifies the count options for retrieving a count of the results. 
                                                        To learn more, see Count Atlas Search Results.
 highlight                   document   Optional        Document that specifies the highlight options for displaying search terms in their original context.
@@ -48,6 +50,9 @@ index                       string     Required        Name of the Atlas Search
                                                        Either this or <collector-name> is required.
 returnStoredSource          boolean    Optional        Flag that specifies whether to perform a full document lookup on the backend database or return only stored source fields directly from Atlas Search. 
                                                        If omitted, defaults to false. To learn more, see Return Stored Source pyd.Fields.
+searchAfter                 string     Optional        Reference point (token) for retrieving results after it.
+searchBefore                string     Optional        Reference point (token) for retrieving results before it, in reverse order.
+sort                        document   Optional        Document that specifies the fields to sort the Atlas Search results by in ascending or descending order.
 
 # Behavior
 #---------------------------
@@ -58,6 +63,33 @@ $search cannot be used in:
 
     * a $facet pipeline stage
 
+# Sort and Pagination
+#---------------------------
+Sorting the results with the sort option is done by Atlas Search (mongot). A $sort stage after $search
+requires mongot to return all the matching documents to mongod first, which makes deep pages slow.
+
+The token of each result is retrieved with {"$meta": "searchSequenceToken"} and can be passed to
+searchAfter (next page) or searchBefore (previous page, returned in reverse order) with the same query and sort.
+
+    >>> {
+            $search: {
+                "text": {"query": "war", "path": "title"},
+                "sort": {"released": -1},
+                "searchAfter": "<token of the last result of the previous page>"
+            }
+        },
+        {$limit: 10},
+        {$set: {"paginationToken": {"$meta": "searchSequenceToken"}}}
+
+# Stored Source and Concurrency
+#---------------------------
+With returnStoredSource, Atlas Search returns the fields stored in the index (storedSource definition)
+instead of looking the full documents up on the database. The stages following $search only see the stored
+fields: `Pipeline.check_stored_source` warns when they reference other ones.
+
+With concurrent, Atlas Search parallelizes the query across the segments of the index on dedicated
+search nodes, which reduces the latency of queries over large indexes.
+
 # Aggregation Variable
 #---------------------------
 $search returns only the results of your query. The metadata results of your 
@@ -101,6 +133,19 @@ class Search(SearchBase):
                                 To view the details, you must use the $meta expression in the
                                 $project stage.
 
+        - concurrent, bool : Flag that specifies whether to parallelize the search across the segments of
+                             the index. Only applies to clusters with dedicated search nodes. Defaults to false.
+
+        - sort, dict|None : Document that specifies the fields to sort the results by, in the search index.
+                            Sorting in the index is faster than a $sort stage after $search, which requires
+                            all the results to be returned by Atlas Search.
+
+        - search_after, str|None : Token, retrieved with {"$meta": "searchSequenceToken"}, of the result
+                                   to return the next page of results after.
+
+        - search_before, str|None : Token, retrieved with {"$meta": "searchSequenceToken"}, of the result
+                                    to return the previous page of results before (in reverse order).
+
         - <operator-name>, dict|None : Name of the operator to search with. You can provide a document
                                   that contains the operator-specific options as the value for this field
                                   Either this or <collector-name> is required.
@@ -127,6 +172,14 @@ class Search(SearchBase):
                 "returnStoredSource":self.return_stored_source,
                 "scoreDetails":self.score_details
             }
+        if self.concurrent:
+            config["concurrent"] = True
+        if self.sort is not None:
+            config["sort"] = self.sort
+        if self.search_after is not None:
+            config["searchAfter"] = self.search_after
+        if self.search_before is not None:
+            config["searchBefore"] = self.search_before
         
         method = self.collector or self.operator
 
@@ -0,0 +1,264 @@
+"""
+Module defining an interface to MongoDB $setWindowFields stage operation in aggregation pipeline
+
+Online MongoDB documentation:
+--------------------------------------------------------------------------------------------------------------------
+
+Last Updated (in this package) : 19/10/2026
+Source : https://www.mongodb.com/docs/manual/reference/operator/aggregation/setWindowFields/#mongodb-pipeline-pipe.-setWindowFields
+
+# Definition
+# ----------------------------------------
+New in version 5.0.
+
+Performs operations on a specified span of documents in a collection, known as a window, and returns the results
+based on the chosen window operator.
+
+For example, you can use the $setWindowFields stage to output the:
+
+    * Difference in sales between two documents in a collection.
+
+    * Sales rankings.
+
+    * Cumulative sales totals.
+
+    * Analysis of complex time series information without exporting the data to an external database.
+
+# Syntax
+# ---------------------------------------
+The $setWindowFields stage syntax:
+
+>>> {
+        $setWindowFields: {
+            partitionBy: <expression>,
+            sortBy: {
+                <sort field 1>: <sort order>,
+                <sort field 2>: <sort order>,
+                ...,
+                <sort field n>: <sort order>
+            },
+            output: {
+                <output field 1>: {
+                    <window operator>: <window operator parameters>,
+                    window: {
+                        documents: [ <lower boundary>, <upper boundary> ],
+                        range: [ <lower boundary>, <upper boundary> ],
+                        unit: <time unit>
+                    }
+                },
+                <output field 2>: { ... },
+                ...
+                <output field n>: { ... }
+            }
+        }
+    }
+
+The $setWindowFields stage takes a document with the following fields:
+
+Field               Description
+
+partitionBy         Optional. Specifies an expression to group the documents. In the $setWindowFields stage,
+                    the group of documents is known as a partition. Default is one partition for the entire collection.
+
+sortBy              Required for some operators. Specifies the field(s) to sort the documents by in the partition.
+                    Uses the same syntax as the $sort stage. Default is no sorting.
+
+output              Specifies the field(s) to append to the documents in the output returned by the $setWindowFields stage.
+                    Each field is set to the result returned by the window operator.
+
+window              Optional. Specifies the window boundaries and options. Set the boundaries to one of these values:
+
+                        * documents : A window where the lower and upper boundaries are specified relative to the
+                                      position of the current document read from the collection.
+
+                        * range : A window where the lower and upper boundaries are specified using a range based
+                                  on the sortBy field values in the current document.
+
+                    Boundaries are integers (or numbers for range windows), or the strings "current" and "unbounded".
+                    Default is ["unbounded", "unbounded"].
+
+unit                Optional. Specifies the units for time range window boundaries. If omitted, default numeric range window boundaries are used.
+
+# Behavior
+# ------------------------------
+
+The following operators require sortBy: $denseRank, $derivative, $documentNumber, $expMovingAvg, $integral, $rank, $shift.
+$denseRank, $documentNumber and $rank require sortBy to contain a single field.
+
+The following operators do not accept a window: $denseRank, $documentNumber, $expMovingAvg, $locf, $rank, $shift.
+
+"""
+
+from typing import Any, Literal
+from monggregate.base import pyd, BaseModel, Expression
+from monggregate.stages.stage import Stage
+from monggregate.operators.window.window import TimeUnitEnum
+
+Boundary = int | float | Literal["current", "unbounded"]
+
+# Operators requiring sortBy
+SORTED_WINDOW_OPERATORS = {
+    "$denseRank",
+    "$derivative",
+    "$documentNumber",
+    "$expMovingAvg",
+    "$integral",
+    "$rank",
+    "$shift",
+}
+
+# Operators requiring sortBy to contain a single field
+RANK_WINDOW_OPERATORS = {"$denseRank", "$documentNumber", "$rank"}
+
+# Operators that do not accept a window
+UNBOUNDED_WINDOW_OPERATORS = {
+    "$denseRank",
+    "$documentNumber",
+    "$expMovingAvg",
+    "$locf",
+    "$rank",
+    "$shift",
+}
+
+
+class Window(BaseModel):
+    """
+    Boundaries of a window in the $setWindowFields stage.
+
+    Attributes:
+    -----------
+        - documents, list[Boundary] | None : lower and upper boundaries relative to the position of the current document
+        - range, list[Boundary] | None : lower and upper boundaries relative to the sortBy field value of the current document
+        - unit, TimeUnitEnum | None : time unit of the range boundaries
+
+        NOTE : Exactly one of documents and range must be provided.
+    """
+
+    documents: list[Boundary] | None
+    range: list[Boundary] | None
+    unit: TimeUnitEnum | None
+
+    @pyd.validator("documents", "range")
+    @classmethod
+    def validate_boundaries(cls, boundaries: list[Boundary] | None) -> list[Boundary] | None:
+        """Validates that boundaries contain a lower and an upper boundary"""
+
+        if boundaries is not None and len(boundaries) != 2:
+            raise ValueError("A window must have exactly two boundaries: [lower, upper]")
+
+        return boundaries
+
+    @pyd.root_validator(skip_on_failure=True)
+    @classmethod
+    def validate_window(cls, values: dict) -> dict:
+        """Validates that exactly one of documents and range is provided, and that unit is only used with range"""
+
+        documents, range_ = values.get("documents"), values.get("range")
+        if (documents is None) == (range_ is None):
+            raise ValueError("Exactly one of documents and range must be provided")
+        if values.get("unit") and range_ is None:
+            raise ValueError("unit can only be used with range windows")
+
+        return values
+
+    @property
+    def expression(self) -> Expression:
+        """Generates statement from attributes"""
+
+        if self.documents is not None:
+            statement: dict[str, Any] = {"documents": self.documents}
+        else:
+            statement = {"range": self.range}
+            if self.unit:
+                statement["unit"] = self.unit
+
+        return self.express(statement)
+
+
+class WindowOutput(BaseModel):
+    """
+    Output field of the $setWindowFields stage, made of a window operator and optional window boundaries.
+
+    Attributes:
+    -----------
+        - operator, Any : the window operator (ex: S.sum("$quantity"), S.rank())
+        - window, Window | None : the window boundaries. Defaults to the whole partition.
+    """
+
+    operator: Any
+    window: Window | None
+
+    @property
+    def expression(self) -> Expression:
+        """Generates statement from attributes"""
+
+        statement = dict(self.express(self.operator))
+        if self.window is not None:
+            statement["window"] = self.window
+
+        return self.express(statement)
+
+
+class SetWindowFields(Stage):
+    """
+    Abstraction of MongoDB $setWindowFields statement that performs operations on windows of documents.
+
+    Attributes:
+    -----------
+        - output, dict[str, Any] : fields to append to the documents, mapped to window operators or WindowOutput
+                                   (for operators applied on a window).
+        - partition_by, Any : expression to group the documents into partitions. Defaults to a single partition.
+        - sort_by, dict[str, Literal[1, -1]] | None : fields to sort the documents by in the partitions.
+                                                     Required by $rank, $denseRank, $shift, $derivative, $integral and $expMovingAvg.
+
+    Online MongoDB documentation:
+    -----------------------------
+    Performs operations on a specified span of documents in a collection, known as a window,
+    and returns the results based on the chosen window operator.
+
+    Source : https://www.mongodb.com/docs/manual/reference/operator/aggregation/setWindowFields/#mongodb-pipeline-pipe.-setWindowFields
+    """
+
+    partition_by: Any = None
+    sort_by: dict[str, Literal[1, -1]] | None
+    output: dict[str, Any]
+
+    @pyd.validator("output")
+    @classmethod
+    def validate_output(cls, output: dict[str, Any], values: dict) -> dict[str, Any]:
+        """Validates the window operators against the sortBy field and their windows"""
+
+        if not output:
+            raise ValueError("output must contain at least one field")
+
+        sort_by = values.get("sort_by")
+        for field, specification in cls.express(output).items():
+            if not isinstance(specification, dict):
+                raise ValueError(f"Invalid window operator for field {field}: {specification}")
+
+            operators = [key for key in specification if key != "window"]
+            if len(operators) != 1:
+                raise ValueError(f"Field {field} must have exactly one window operator")
+
+            (operator,) = operators
+            if operator in SORTED_WINDOW_OPERATORS and not sort_by:
+                raise ValueError(f"{operator} requires sort_by")
+            if operator in RANK_WINDOW_OPERATORS and len(sort_by or {}) != 1:
+                raise ValueError(f"{operator} requires sort_by to contain a single field")
+            if operator in UNBOUNDED_WINDOW_OPERATORS and "window" in specification:
+                raise ValueError(f"{operator} does not accept a window")
+
+        return output
+
+    @property
+    def expression(self) -> Expression:
+        """Generates statement from attributes"""
+
+        statement: dict[str, Any] = {}
+        if self.partition_by is not None:
+            statement["partitionBy"] = self.partition_by
+        if self.sort_by:
+            statement["sortBy"] = self.sort_by
+        statement["output"] = self.output
+
+        return self.express({"$setWindowFields": statement})
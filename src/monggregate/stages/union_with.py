@@ -181,7 +181,8 @@ class UnionWith(Stage):
 
     Attributes:
     -----------
-        - collection / coll, str : The collection or view whose pipeline results you wish to include in the result set
+        - collection / coll, str | None : The collection or view whose pipeline results you wish to include in the result set.
+                                          Can be omitted when the pipeline starts with a $documents stage.
         - pipeline, list[dict] | Pipeline | None : An aggregation pipeline to apply to the specified coll.
     
     Online MongoDB documentation:
@@ -194,17 +195,21 @@ class UnionWith(Stage):
     Source : https://www.mongodb.com/docs/manual/reference/operator/aggregation/unionWith/#mongodb-pipeline-pipe.-unionWith
     """
     
-    collection: str = pyd.Field(alias="coll")
+    collection: str | None = pyd.Field(None, alias="coll")
     # Find a way to better type the pipeline while avoiding circular imports <VM, 18/06/2023>
-    pipeline: list[dict] | None = None
+    pipeline: list[Any] | None = None
 
     @pyd.validator("pipeline", pre=True, always=True)
-    def validate_pipeline(cls, pipeline: Any):
+    def validate_pipeline(cls, pipeline: Any, values: dict):
         """Validates the pipeline"""
 
         output = pipeline
         if isinstance(pipeline, BaseModel):
-            output =  pipeline.expression
+            # Stages are kept as is, so that $documents values are not copied when expressed
+            output = list(getattr(pipeline, "stages", None) or pipeline.expression)
+
+        if not values.get("collection") and not starts_with_documents(output):
+            raise ValueError("coll can only be omitted when the pipeline starts with a $documents stage")
 
         return output
 
@@ -213,13 +218,25 @@ class UnionWith(Stage):
         """Generates $unionWith statement"""
 
         if self.pipeline:
-            statement = {
-                "$unionWith": {
-                    "coll": self.collection,
-                    "pipeline": self.pipeline
-                }
-            }
+            arguments: dict[str, Any] = {}
+            if self.collection:
+                arguments["coll"] = self.collection
+            arguments["pipeline"] = self.pipeline
+            statement = {"$unionWith": arguments}
         else:
             statement = {"$unionWith": self.collection}
 
         return self.express(statement)
+
+
+def starts_with_documents(pipeline: list[Any] | None) -> bool:
+    """Returns true if the first stage of pipeline is a $documents stage"""
+
+    if not pipeline:
+        return False
+
+    first = pipeline[0]
+    if isinstance(first, BaseModel):
+        first = first.expression
+
+    return isinstance(first, dict) and "$documents" in first
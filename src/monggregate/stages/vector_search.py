@@ -21,7 +21,8 @@ A $vectorSearch pipeline has the following prototype form:
     "queryVector": [<array-of-numbers>],
     "numCandidates": <number-of-candidates>,
     "limit": <number-of-results>,
-    "filter": {<filter-specification>}
+    "filter": {<filter-specification>},
+    "exact": <true|false>
   }
 }
 
@@ -32,6 +33,13 @@ The $vectorSearch stage takes a document with the following fields:
 
 Field Name	        | Type	    |   Necessity   |   Description
 
+exact               | boolean	| Optional	    |   Flag that specifies whether to run ENN or ANN search. Value can be one of the following:
+                                                        * false - to run ANN search
+                                                        * true - to run ENN search
+                                                    If omitted, defaults to false.
+                                                    ENN search scans every indexed vector matching the filter : use it on small or heavily
+                                                    pre-filtered collections, or to compute the ground truth of ANN searches.
+
 filter              | document	| Optional	    |   Any MQL match expression that compares an indexed field with a boolean, number (not decimals), 
                                                     or string to use as a prefilter. You can use any of the following comparison query and aggregation pipeline
                                                     operators in your filter: $gt, $lt, $gte, $lte, $eq, $ne, $in, $nin, $and, $or
@@ -42,12 +50,14 @@ index	            | string	| Required	    |   Name of the Atlas Vector Search in
 
 limit	            | number	| Required      |   Number (of type int only) of documents to return in the results. Value can't exceed the value of numCandidates.
 
-numCandidates	    | number	| Required	    |   Number of nearest neighbors to use during the search. Value must be less than or equal to (<=) 10000. 
+numCandidates	    | number	| Conditional   |   Required if exact is false or omitted. Omit if exact is true.
+                                                    Number of nearest neighbors to use during the search. Value must be less than or equal to (<=) 10000. 
                                                     You can't specify a number less than the number of documents to return (limit).
 
                                                     We recommend that you specify a number higher than the number of documents to return (limit) to increase accuracy although this might impact latency. 
                                                     For example, we recommend a ratio of ten to twenty nearest neighbors for a limit of only one document. 
                                                     This overrequest pattern is the recommended way to trade off latency and recall in your aNN searches, and we recommend tuning this on your specific dataset.
+                                                    (see `monggregate.vectors.tune_num_candidates`)
 
 path	            | string	| Required	    |   Indexed [vectorEmbedding](https://www.mongodb.com/docs/atlas/atlas-search/field-types/knn-vector/#std-label-fts-data-types-knn-vector) type field to search. 
                                                     To learn more, see [Path Construction](https://www.mongodb.com/docs/atlas/atlas-search/path-construction/#std-label-ref-path).
@@ -148,8 +158,10 @@ To learn more, see [Create a Local Atlas Deployment](https://www.mongodb.com/doc
 
 """
 
+from typing import Any
 from monggregate.base import pyd, Expression
 from monggregate.stages.stage import Stage
+from monggregate.vectors import BinaryVector, is_buffer_vector
 
 class VectorSearch(Stage):
     """
@@ -160,27 +172,52 @@ class VectorSearch(Stage):
 
         - index, str : name of the Atlas Vector Search index to use
         - path, str : path to the vector field to search
-        - query_vector, list[float] : array of numbers of the BSON double type that represent the query vector
-        - num_candidates, int : number of nearest neighbors to use during the search
+        - query_vector, list[float] | BinaryVector : array of numbers of the BSON double type that represent the query vector.
+                                                     NumPy arrays, array.array and memoryview objects are converted to
+                                                     BinaryVector (BSON BinData subtype 9) without validating each element.
+        - num_candidates, int|None : number of nearest neighbors to use during the search. Required unless exact is true.
         - limit, int : number of documents to return in the results
         - filter, dict|None : any MQL match expression that compares an indexed field with a boolean, number (not decimals), or string to use as a prefilter
+        - exact, bool : whether to run an exact nearest neighbors (ENN) search instead of an aNN search. Defaults to False.
     
     """
 
     filter : dict|None
     index : str
     limit : int = pyd.Field(le=10000)
-    num_candidates : int
+    exact : bool = False
+    num_candidates : int | None
     path : str
-    query_vector : list[float]
+    query_vector : BinaryVector | list[float]
+
+    @pyd.validator("query_vector", pre=True)
+    @classmethod
+    def validate_query_vector(cls, query_vector:Any)->Any:
+        """Converts buffers (NumPy arrays, array.array, memoryview) to binary vectors"""
+
+        if is_buffer_vector(query_vector):
+            query_vector = BinaryVector.from_buffer(query_vector)
+
+        return query_vector
 
     @pyd.validator("num_candidates", pre=True, always=True)
-    def validate_num_candidates(cls, num_candidates:int, values:dict)->int:
-        """Validates that num_candidates is less than or equal to 10000"""
-    
+    def validate_num_candidates(cls, num_candidates:int|None, values:dict)->int|None:
+        """Validates that num_candidates is greater than limit and less than or equal to 10000, and only set for aNN searches"""
+
+        if values.get("exact"):
+            if num_candidates is not None:
+                raise ValueError("num_candidates must be omitted when exact is true")
+            return num_candidates
+
+        if num_candidates is None:
+            raise ValueError("num_candidates is required unless exact is true")
+
         limit:int = values.get("limit", 1)
         if limit >= num_candidates:
             raise ValueError("num_candidates must be greater than limit")
+
+        if num_candidates > 10000:
+            raise ValueError("num_candidates must be less than or equal to 10000")
         
         return num_candidates
     
@@ -188,12 +225,18 @@ class VectorSearch(Stage):
     def expression(self) -> Expression:
         """Generates set stage statement from arguments"""
 
-        return self.express({"$vectorSearch" : {
+        statement = {
             "index" : self.index,
             "path" : self.path,
             "queryVector" : self.query_vector,
             "numCandidates" : self.num_candidates,
             "limit" : self.limit,
             "filter" : self.filter
-        }})
+        }
+        if self.exact:
+            # numCandidates must be omitted for ENN searches
+            del statement["numCandidates"]
+            statement["exact"] = True
+
+        return self.express({"$vectorSearch" : statement})
     
\ No newline at end of file
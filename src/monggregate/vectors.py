@@ -0,0 +1,476 @@
+"""
+Module defining the binary encoding of vectors (BSON BinData subtype 9), an exact local vector search
+and the tuning of the numCandidates option of $vectorSearch.
+
+Online MongoDB documentation:
+--------------------------------------------------------------------------------------------------------------------
+
+Last Updated (in this package) : 19/10/2026
+Source : https://www.mongodb.com/docs/atlas/atlas-vector-search/create-embeddings/#ingest-binary-vectors
+
+Definition
+--------------------------------------------
+Vectors can be stored and queried as BSON BinData vectors (subtype 9) instead of arrays of BSON doubles.
+A BinData vector is made of a 2 bytes header followed by the packed values:
+
+    * the first byte of the header is the type of the values:
+        - 0x27 : float32, 4 bytes per dimension (little-endian)
+        - 0x03 : int8, 1 byte per dimension
+        - 0x10 : packed bit, 1 bit per dimension
+    * the second byte of the header is the padding, that is the number of bits to ignore at the end of
+      a packed bit vector (0 for the other types).
+
+An array of BSON doubles costs 8 bytes per dimension plus the key and the type of each element,
+whereas a float32 BinData vector costs 4 bytes per dimension, which divides the size of the requests by about 4.
+
+Usage:
+--------------------------------------------
+NumPy arrays, `array.array` and `memoryview` objects are converted without iterating over their elements:
+
+    >>> BinaryVector.from_buffer(numpy.random.rand(1536).astype("float32"))
+    >>> BinaryVector.from_buffer(array("f", embedding))
+    >>> BinaryVector.from_buffer(numpy.packbits(bits), dtype="packed_bit", padding=4)
+
+NOTE : The BSON Binary objects are only available when pymongo is installed.
+Otherwise, BinaryVector expresses itself as the list of its values.
+
+Tuning numCandidates
+--------------------------------------------
+The recall of an aNN search increases with numCandidates, and so does its latency.
+`tune_num_candidates` searches the smallest numCandidates whose mean recall@limit on a sample of queries
+reaches a target, the expected results being computed by an exact (ENN) search:
+
+    >>> def search(query_vector, num_candidates):
+            pipeline = Pipeline().vector_search("index", "embedding", query_vector, num_candidates, 10).project(include="_id")
+            return [document["_id"] for document in db.movies.aggregate(pipeline.export())]
+    >>> documents = list(db.movies.find({}, {"embedding": 1}))
+    >>> ground_truth = [
+            [document["_id"] for _, document in exact_search(documents, "embedding", query_vector, 10)]
+            for query_vector in sample
+        ]
+    >>> tuning = tune_num_candidates(search, sample, ground_truth, limit=10, target_recall=0.95)
+    >>> tuning.num_candidates, tuning.recall
+
+The expected results can also be computed by the server with `exact=True`.
+The exact local search uses NumPy when it is installed and falls back to pure Python otherwise.
+
+"""
+
+# Standard Library imports
+# ----------------------------
+import heapq
+import math
+import struct
+import sys
+import time
+from array import array
+from typing import Any, Callable, Iterable, Sequence
+
+# Package imports
+# ----------------------------
+from monggregate.base import pyd, BaseModel
+from monggregate.utils import StrEnum
+
+# BSON binary subtype of vectors
+VECTOR_SUBTYPE = 9
+
+
+class BinaryVectorDtype(StrEnum):
+    """Enumeration of the types of the values of BinData vectors"""
+
+    FLOAT32 = "float32"
+    INT8 = "int8"
+    PACKED_BIT = "packed_bit"
+
+
+class VectorSimilarity(StrEnum):
+    """Enumeration of the similarity functions of Atlas Vector Search indexes"""
+
+    COSINE = "cosine"
+    DOT_PRODUCT = "dotProduct"
+    EUCLIDEAN = "euclidean"
+
+
+# Mapping between the dtypes and the first byte of the BinData header
+HEADERS: dict[str, int] = {
+    BinaryVectorDtype.FLOAT32: 0x27,
+    BinaryVectorDtype.INT8: 0x03,
+    BinaryVectorDtype.PACKED_BIT: 0x10,
+}
+
+# Mapping between the buffer formats (array typecodes, memoryview formats, numpy dtypes) and the dtypes
+_FORMATS: dict[str, str] = {
+    "f": BinaryVectorDtype.FLOAT32,
+    "d": BinaryVectorDtype.FLOAT32,
+    "b": BinaryVectorDtype.INT8,
+    "B": BinaryVectorDtype.PACKED_BIT,
+}
+
+
+class BinaryVector(BaseModel):
+    """
+    Vector encoded as a BSON BinData subtype 9 value.
+
+    Attributes:
+    -----------
+        - data, bytes : the packed values (little-endian float32, int8 or packed bits), without the header
+        - dtype, BinaryVectorDtype : type of the values
+        - padding, int : number of bits to ignore at the end of a packed bit vector. Defaults to 0.
+
+    Use `from_buffer` to build a vector from a NumPy array, an `array.array` or a `memoryview`,
+    and `from_bson` to decode the value of a bson.Binary.
+    """
+
+    data: bytes
+    dtype: BinaryVectorDtype = pyd.Field(BinaryVectorDtype.FLOAT32)
+    padding: int = pyd.Field(0, ge=0, le=7)
+
+    @pyd.root_validator(skip_on_failure=True)
+    @classmethod
+    def validate_size(cls, values: dict) -> dict:
+        """Validates that the data can be split in values and that only packed bits vectors are padded"""
+
+        dtype = values["dtype"]
+        if dtype == BinaryVectorDtype.FLOAT32 and len(values["data"]) % 4:
+            raise ValueError("The size of float32 vectors must be a multiple of 4 bytes")
+
+        if values["padding"] and (dtype != BinaryVectorDtype.PACKED_BIT or not values["data"]):
+            raise ValueError("Only non empty packed bit vectors can be padded")
+
+        return values
+
+    @classmethod
+    def from_buffer(
+        cls, values: Any, dtype: BinaryVectorDtype | str | None = None, padding: int = 0
+    ) -> "BinaryVector":
+        """
+        Builds a vector from a NumPy array, an `array.array` or a `memoryview`.
+
+        The dtype is inferred from the type of the values when not provided:
+            * floating point values are encoded as float32
+            * signed bytes are encoded as int8
+            * unsigned bytes are considered as already packed bits
+        """
+
+        buffer_format = _buffer_format(values)
+        dtype = BinaryVectorDtype(dtype) if dtype else _FORMATS.get(buffer_format or "")
+        if dtype is None:
+            raise TypeError(f"Cannot infer the dtype of a vector of type {type(values).__name__} ({buffer_format})")
+
+        if dtype == BinaryVectorDtype.FLOAT32:
+            data = _float32_bytes(values, buffer_format)
+        elif buffer_format in ("b", "B"):
+            data = values.tobytes()
+        else:
+            raise TypeError(f"{dtype} vectors must be built from bytes, got {buffer_format} values")
+
+        return cls(data=data, dtype=dtype, padding=padding)
+
+    @classmethod
+    def from_bson(cls, value: bytes) -> "BinaryVector":
+        """Decodes the value of a BinData subtype 9 (header included)"""
+
+        if len(value) < 2:
+            raise ValueError("BinData vectors start with a 2 bytes header")
+
+        dtypes = {header: dtype for dtype, header in HEADERS.items()}
+        if value[0] not in dtypes:
+            raise ValueError(f"Unknown BinData vector type: {value[0]:#04x}")
+
+        return cls(data=bytes(value[2:]), dtype=dtypes[value[0]], padding=value[1])
+
+    def to_bytes(self) -> bytes:
+        """Returns the value of the BinData subtype 9 (header included)"""
+
+        return bytes((HEADERS[self.dtype], self.padding)) + self.data
+
+    def to_list(self) -> list[float] | list[int]:
+        """Returns the values of the vector (the bits for packed bit vectors)"""
+
+        if self.dtype == BinaryVectorDtype.FLOAT32:
+            output: list = list(struct.unpack(f"<{len(self.data) // 4}f", self.data))
+        elif self.dtype == BinaryVectorDtype.INT8:
+            output = list(struct.unpack(f"{len(self.data)}b", self.data))
+        else:
+            output = [(byte >> shift) & 1 for byte in self.data for shift in range(7, -1, -1)]
+            output = output[: len(output) - self.padding]
+
+        return output
+
+    def __len__(self) -> int:
+        """Returns the number of dimensions of the vector"""
+
+        if self.dtype == BinaryVectorDtype.FLOAT32:
+            return len(self.data) // 4
+        if self.dtype == BinaryVectorDtype.INT8:
+            return len(self.data)
+        return len(self.data) * 8 - self.padding
+
+    @property
+    def expression(self) -> Any:
+        """Returns a bson.Binary when pymongo is installed, the list of values otherwise"""
+
+        try:
+            from bson.binary import Binary  # pylint: disable=import-outside-toplevel
+        except ImportError:
+            return self.to_list()
+
+        return Binary(self.to_bytes(), VECTOR_SUBTYPE)
+
+
+def is_buffer_vector(value: Any) -> bool:
+    """Returns true if value is a NumPy array, an `array.array` or a `memoryview`"""
+
+    return isinstance(value, (array, memoryview)) or (hasattr(value, "dtype") and hasattr(value, "tobytes"))
+
+
+def _buffer_format(values: Any) -> str | None:
+    """Returns the struct format of the values of a buffer"""
+
+    if isinstance(values, array):
+        return values.typecode
+    if isinstance(values, memoryview):
+        return values.format.lstrip("@=<")
+    if hasattr(values, "dtype"):
+        # NumPy arrays, recognized by their attributes so that numpy remains optional
+        if getattr(values, "ndim", 1) != 1:
+            raise ValueError("Only one dimensional arrays can be encoded as vectors")
+        kind, itemsize = values.dtype.kind, values.dtype.itemsize
+        if kind == "f":
+            return "f"
+        if (kind, itemsize) == ("i", 1):
+            return "b"
+        if (kind, itemsize) == ("u", 1):
+            return "B"
+        return f"{kind}{itemsize}"
+
+    return None
+
+
+def _float32_bytes(values: Any, buffer_format: str | None) -> bytes:
+    """Returns the little-endian float32 encoding of a buffer"""
+
+    if hasattr(values, "dtype"):
+        # Casting is a no-op for little-endian float32 arrays
+        return values.astype("<f4", copy=False).tobytes()
+
+    if buffer_format != "f":
+        values = array("f", memoryview(values).tolist() if isinstance(values, memoryview) else values)
+    elif isinstance(values, memoryview):
+        values = array("f", values.cast("B").tobytes()) if values.contiguous else array("f", values.tolist())
+
+    if sys.byteorder == "big":
+        values = array("f", values)
+        values.byteswap()
+
+    return values.tobytes()
+
+
+# Exact search
+# ----------------------------
+def vector_values(vector: Any) -> list[float] | list[int]:
+    """Returns the values of a vector stored as an array, a BinaryVector, a BSON BinData vector or a buffer"""
+
+    if isinstance(vector, BinaryVector):
+        return vector.to_list()
+    if isinstance(vector, bytes) and getattr(vector, "subtype", None) == VECTOR_SUBTYPE:
+        return BinaryVector.from_bson(vector).to_list()
+    if is_buffer_vector(vector):
+        return vector.tolist()
+
+    return list(vector)
+
+
+def similarity_score(
+    left: Sequence[float], right: Sequence[float], similarity: VectorSimilarity | str = VectorSimilarity.COSINE
+) -> float:
+    """
+    Returns the score of two vectors, normalized between 0 and 1 as Atlas Vector Search does:
+        * cosine and dotProduct : (1 + similarity) / 2
+        * euclidean : 1 / (1 + distance)
+    """
+
+    similarity = VectorSimilarity(similarity)
+    if similarity == VectorSimilarity.EUCLIDEAN:
+        return 1 / (1 + math.dist(left, right))
+
+    product = math.fsum(a * b for a, b in zip(left, right))
+    if similarity == VectorSimilarity.COSINE:
+        norms = math.hypot(*left) * math.hypot(*right)
+        product = product / norms if norms else 0.0
+
+    return (1 + product) / 2
+
+
+def exact_search(
+    documents: Iterable[dict],
+    path: str,
+    query_vector: Any,
+    limit: int,
+    similarity: VectorSimilarity | str = VectorSimilarity.COSINE,
+) -> list[tuple[float, dict]]:
+    """
+    Returns the limit documents whose vector at path is the most similar to query_vector, with their scores,
+    by comparing the query vector with every vector (ENN search).
+
+    Documents without a vector at path are ignored.
+    """
+
+    candidates = [(document, vector) for document in documents if (vector := _vector_at(document, path)) is not None]
+    vectors = [vector_values(vector) for _, vector in candidates]
+    scores = _similarity_scores(vectors, vector_values(query_vector), VectorSimilarity(similarity))
+    ranked = heapq.nlargest(limit, range(len(candidates)), key=scores.__getitem__)
+
+    return [(scores[position], candidates[position][0]) for position in ranked]
+
+
+def _vector_at(document: Any, path: str) -> Any:
+    """Returns the value at a dotted path of a document, None if there is none"""
+
+    for part in path.split("."):
+        if not isinstance(document, dict):
+            return None
+        document = document.get(part)
+
+    return document
+
+
+def _similarity_scores(vectors: list[list], query: list, similarity: VectorSimilarity) -> list[float]:
+    """Returns the scores of the vectors, computed on a float32 matrix when numpy is installed"""
+
+    try:
+        import numpy  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        return [similarity_score(vector, query, similarity) for vector in vectors]
+
+    if not vectors:
+        return []
+
+    matrix = numpy.asarray(vectors, dtype="float32")
+    target = numpy.asarray(query, dtype="float32")
+    if similarity == VectorSimilarity.EUCLIDEAN:
+        return (1 / (1 + numpy.linalg.norm(matrix - target, axis=1))).tolist()
+
+    products = matrix @ target
+    if similarity == VectorSimilarity.COSINE:
+        norms = numpy.linalg.norm(matrix, axis=1) * numpy.linalg.norm(target)
+        products = numpy.divide(products, norms, out=numpy.zeros_like(products), where=norms != 0)
+
+    return ((1 + products) / 2).tolist()
+
+
+# Tuning
+# ----------------------------
+def recall_at_k(expected: Sequence[Any], actual: Sequence[Any], k: int) -> float:
+    """Returns the share of the k first expected results found in the k first actual results"""
+
+    relevant = set(expected[:k])
+    if not relevant:
+        return 1.0
+
+    return len(relevant.intersection(actual[:k])) / len(relevant)
+
+
+class NumCandidatesTuning:
+    """
+    Result of `tune_num_candidates`.
+
+    Attributes:
+    ----------------------------
+        - num_candidates, int : the smallest numCandidates reaching the target recall,
+                                the largest one tried when the target is not reached
+        - recall, float : the mean recall@limit of num_candidates
+        - target_recall, float : the recall to reach
+        - recalls, dict[int, float] : the mean recall@limit of each numCandidates tried
+        - latencies, dict[int, float] : the mean duration (in seconds) of the searches of each numCandidates tried
+    """
+
+    def __init__(
+        self,
+        num_candidates: int,
+        target_recall: float,
+        recalls: dict[int, float],
+        latencies: dict[int, float],
+    ) -> None:
+        self.num_candidates = num_candidates
+        self.recall = recalls[num_candidates]
+        self.target_recall = target_recall
+        self.recalls = recalls
+        self.latencies = latencies
+
+    @property
+    def reached(self) -> bool:
+        """Whether the target recall was reached (otherwise, consider an ENN search with exact=True)"""
+
+        return self.recall >= self.target_recall
+
+    def __repr__(self) -> str:
+        return (
+            f"NumCandidatesTuning(num_candidates={self.num_candidates}, recall={self.recall:.3f}, "
+            f"target_recall={self.target_recall}, reached={self.reached})"
+        )
+
+
+def tune_num_candidates(
+    search: Callable[[Any, int], Sequence[Any]],
+    queries: Sequence[Any],
+    ground_truth: Sequence[Sequence[Any]],
+    *,
+    limit: int,
+    target_recall: float = 0.95,
+    max_num_candidates: int = 10000,
+) -> NumCandidatesTuning:
+    """
+    Returns the smallest numCandidates whose mean recall@limit on the queries reaches target_recall.
+
+    Arguments:
+    ----------------------------
+        - search, Callable[[Any, int], Sequence[Any]] : runs the aNN search of a query with a numCandidates
+                                                        and returns the identifiers of the results (in order)
+        - queries, Sequence[Any] : sample of query vectors
+        - ground_truth, Sequence[Sequence[Any]] : identifiers of the exact results of each query
+                                                  (ex: from `exact_search` or from a $vectorSearch with exact=True)
+        - limit, int : number of results of the searches
+        - target_recall, float : mean recall@limit to reach. Defaults to 0.95.
+        - max_num_candidates, int : largest numCandidates to try. Defaults to 10000, the maximum of $vectorSearch.
+
+    The recall is assumed to increase with numCandidates, so that the candidates are found by a binary search
+    between limit + 1 and max_num_candidates, each value being evaluated once.
+    """
+
+    if not queries or len(queries) != len(ground_truth):
+        raise ValueError("queries and ground_truth must be non empty and of the same length")
+    if not 0 < target_recall <= 1:
+        raise ValueError("target_recall must be in ]0, 1]")
+    if not limit < max_num_candidates <= 10000:
+        raise ValueError("max_num_candidates must be greater than limit and less than or equal to 10000")
+
+    recalls: dict[int, float] = {}
+    latencies: dict[int, float] = {}
+
+    def evaluate(num_candidates: int) -> float:
+        """Returns the mean recall@limit of num_candidates"""
+
+        if num_candidates not in recalls:
+            total = 0.0
+            start = time.perf_counter()
+            for query, expected in zip(queries, ground_truth):
+                total += recall_at_k(expected, search(query, num_candidates), limit)
+            latencies[num_candidates] = (time.perf_counter() - start) / len(queries)
+            recalls[num_candidates] = total / len(queries)
+
+        return recalls[num_candidates]
+
+    low, high = limit + 1, max_num_candidates
+    if evaluate(high) < target_recall:
+        return NumCandidatesTuning(high, target_recall, recalls, latencies)
+
+    while low < high:
+        middle = (low + high) // 2
+        if evaluate(middle) >= target_recall:
+            high = middle
+        else:
+            low = middle + 1
+
+    evaluate(high)
+    return NumCandidatesTuning(high, target_recall, recalls, latencies)
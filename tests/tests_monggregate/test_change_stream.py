@@ -0,0 +1,193 @@
+"""Tests for `monggregate.change_stream` module."""
+
+from typing import Any
+
+import pytest
+
+from monggregate.change_stream import (
+    ChangeStreamConsumer,
+    ChangeStreamPipeline,
+    FileTokenStore,
+    MemoryTokenStore,
+)
+from monggregate.stages import Group, Match
+
+
+class FakeChangeStream:
+    """Minimal pymongo-like change stream replaying events"""
+
+    def __init__(self, events: list[dict | None], start_after: dict | None) -> None:
+        self.events = list(events)
+        if start_after is not None:
+            position = next(index for index, event in enumerate(self.events) if event and event["_id"] == start_after)
+            self.events = self.events[position + 1 :]
+        self.resume_token: dict | None = start_after
+        self.alive = True
+
+    def __enter__(self) -> "FakeChangeStream":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.alive = False
+
+    def try_next(self) -> dict | None:
+        if not self.events:
+            return None
+        event = self.events.pop(0)
+        if event is not None:
+            self.resume_token = event["_id"]
+            if event["operationType"] == "invalidate":
+                self.alive = False
+        return event
+
+
+class FakeCollection:
+    """Minimal pymongo-like collection"""
+
+    def __init__(self, events: list[dict | None]) -> None:
+        self.events = events
+        self.calls: list[tuple[list[dict], dict]] = []
+
+    def watch(self, pipeline: list[dict] | None = None, **kwargs: Any) -> FakeChangeStream:
+        self.calls.append((pipeline or [], kwargs))
+        return FakeChangeStream(self.events, kwargs.get("start_after"))
+
+
+def _event(index: int) -> dict:
+    return {"_id": {"_data": f"{index:04d}"}, "operationType": "insert", "documentKey": {"_id": index}}
+
+
+class TestChangeStreamPipeline:
+    """Tests for `ChangeStreamPipeline` class."""
+
+    def test_allowed_stages(self) -> None:
+        """Test that change stream stages can be used."""
+
+        pipeline = ChangeStreamPipeline().match(operationType="insert").set(source="orders").unset("fullDocument")
+        assert pipeline.export() == [
+            {"$match": {"operationType": "insert"}},
+            {"$set": {"source": "orders"}},
+            {"$unset": "fullDocument"},
+        ]
+
+        stages = [
+            {"$redact": {"$cond": [{"$eq": ["$ns.coll", "orders"]}, "$$KEEP", "$$PRUNE"]}},
+            {"$changeStreamSplitLargeEvent": {}},
+        ]
+        assert ChangeStreamPipeline(stages=stages).export() == stages
+
+    def test_forbidden_stages(self) -> None:
+        """Test that other stages are rejected."""
+
+        with pytest.raises(ValueError):
+            ChangeStreamPipeline(stages=[Group(by="operationType", query={})])
+        with pytest.raises(ValueError):
+            ChangeStreamPipeline().append({"$limit": 10})
+        with pytest.raises(ValueError):
+            ChangeStreamPipeline().limit(10).export()
+
+    def test_resume_token_is_preserved(self) -> None:
+        """Test that stages cannot modify or remove _id."""
+
+        with pytest.raises(ValueError):
+            ChangeStreamPipeline().project(exclude="_id").export()
+        with pytest.raises(ValueError):
+            ChangeStreamPipeline().set(_id="$documentKey").export()
+        with pytest.raises(ValueError):
+            ChangeStreamPipeline(stages=[{"$unset": ["_id", "ns"]}])
+
+
+class TestChangeStreamConsumer:
+    """Tests for `ChangeStreamConsumer` class."""
+
+    def test_batches(self) -> None:
+        """Test that events are handed to the callback by batches."""
+
+        batches: list[list[dict]] = []
+        collection = FakeCollection([_event(index) for index in range(5)])
+        consumer = ChangeStreamConsumer(
+            collection, batches.append, [Match(query={"operationType": "insert"})], batch_size=2
+        )
+
+        assert consumer.run(until_idle=True) == 5
+        assert [len(batch) for batch in batches] == [2, 2, 1]
+        assert consumer.resume_token == _event(4)["_id"]
+        assert collection.calls[0][0] == [{"$match": {"operationType": "insert"}}]
+
+    def test_idle_flushes_partial_batch(self) -> None:
+        """Test that a partial batch is delivered when the stream is idle."""
+
+        batches: list[list[dict]] = []
+        collection = FakeCollection([_event(0), None, _event(1), _event(2)])
+        consumer = ChangeStreamConsumer(collection, batches.append, batch_size=10)
+
+        assert consumer.run(until_idle=True) == 1
+        assert batches == [[_event(0)]]
+
+    def test_end_of_stream_flushes_partial_batch(self) -> None:
+        """Test that a partial batch is delivered when the stream is invalidated."""
+
+        batches: list[list[dict]] = []
+        invalidate = {"_id": {"_data": "0003"}, "operationType": "invalidate"}
+        events = [_event(0), _event(1), _event(2), invalidate]
+        consumer = ChangeStreamConsumer(FakeCollection(events), batches.append, batch_size=10)
+
+        assert consumer.run() == 4
+        assert batches == [events]
+        assert consumer.resume_token == invalidate["_id"]
+
+    def test_stop_flushes_partial_batch(self) -> None:
+        """Test that a partial batch is delivered when the consumer is stopped."""
+
+        batches: list[list[dict]] = []
+        collection = FakeCollection([_event(index) for index in range(5)])
+        consumer = ChangeStreamConsumer(collection, batches.append, batch_size=10)
+        watch = collection.watch
+
+        def watch_and_stop(pipeline: list[dict] | None = None, **kwargs: Any) -> FakeChangeStream:
+            stream = watch(pipeline, **kwargs)
+            try_next = stream.try_next
+
+            def next_and_stop() -> dict | None:
+                event = try_next()
+                if event is not None and event["documentKey"]["_id"] == 2:
+                    consumer.stop()
+                return event
+
+            stream.try_next = next_and_stop  # type: ignore[method-assign]
+            return stream
+
+        collection.watch = watch_and_stop  # type: ignore[method-assign]
+
+        assert consumer.run() == 3
+        assert batches == [[_event(0), _event(1), _event(2)]]
+        assert consumer.resume_token == _event(2)["_id"]
+
+    def test_resume(self) -> None:
+        """Test that a consumer resumes after the last processed batch, and not after a failed one."""
+
+        events = [_event(index) for index in range(4)]
+        store = MemoryTokenStore()
+
+        def fail(batch: list[dict]) -> None:
+            if batch[-1]["documentKey"]["_id"] == 3:
+                raise RuntimeError("callback failed")
+
+        with pytest.raises(RuntimeError):
+            ChangeStreamConsumer(FakeCollection(events), fail, batch_size=2, token_store=store).run()
+        assert store.load() == _event(1)["_id"]
+
+        batches: list[list[dict]] = []
+        collection = FakeCollection(events)
+        ChangeStreamConsumer(collection, batches.append, batch_size=2, token_store=store).run(max_batches=1)
+        assert batches == [events[2:]]
+        assert collection.calls[0][1]["start_after"] == _event(1)["_id"]
+
+    def test_file_token_store(self, tmp_path: Any) -> None:
+        """Test that tokens can be persisted in a file."""
+
+        store = FileTokenStore(tmp_path / "orders.token")
+        assert store.load() is None
+
+        store.save({"_data": "0001"})
+        assert FileTokenStore(tmp_path / "orders.token").load() == {"_data": "0001"}
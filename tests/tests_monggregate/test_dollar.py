@@ -118,3 +118,8 @@ class TestDollarDollar:
         """Test the __getattr__ method of the DollarDollar class."""
 
         assert DollarDollar().name == "$$name"
+
+    def test_search_meta(self):
+        """Test that the SEARCH_META variable is available."""
+
+        assert SS.SEARCH_META == "$$SEARCH_META"
@@ -0,0 +1,24 @@
+"""Tests for `monggregate.geo` module."""
+
+import pytest
+from monggregate.geo import GeoJSONPoint
+
+
+class TestGeoJSONPoint:
+    """Tests for `GeoJSONPoint` class."""
+
+    def test_expression(self) -> None:
+        """Test that the expression method returns the GeoJSON document."""
+
+        point = GeoJSONPoint.from_lon_lat(-73.99279, 40.719296)
+        assert point.expression == {"type": "Point", "coordinates": [-73.99279, 40.719296]}
+
+    def test_invalid_coordinates(self) -> None:
+        """Test that coordinates must be a valid [longitude, latitude] pair."""
+
+        with pytest.raises(ValueError):
+            GeoJSONPoint(coordinates=[1])
+        with pytest.raises(ValueError):
+            GeoJSONPoint.from_lon_lat(200, 0)
+        with pytest.raises(ValueError):
+            GeoJSONPoint.from_lon_lat(0, -91)
@@ -1,19 +1,32 @@
 import pytest
+from monggregate.engine import evaluate
+from monggregate.engine.indexes import IndexedCollection
+from monggregate.geo import GeoJSONPoint
 from monggregate.pipeline import Pipeline
+from monggregate.search.collectors.facet import StringFacet
 from monggregate.stages import (
     AddFields,
     Bucket,
     BucketAuto,
     Count,
+    Densify,
+    Documents,
+    Facet,
+    Fill,
+    GeoNear,
+    GraphLookup,
     Group,
     Limit,
     Lookup,
     Match,
+    Merge,
     Out,
     Project,
+    Redact,
     ReplaceRoot,
     Sample,
     Set,
+    SetWindowFields,
     Skip,
     SortByCount,
     Sort,
@@ -178,6 +191,31 @@ class TestPipeline:
 
         pipeline.extend([Project(fields=["name", "age"], include=True)])
 
+    def test_rewrite_lookups(self) -> None:
+        """Test the rewrite_lookups method of the Pipeline class."""
+
+        pipeline = Pipeline().match(status="A").lookup(
+            right="customers",
+            let={"customer_id": "$customer"},
+            pipeline=[{"$match": {"$expr": {"$eq": ["$_id", "$$customer_id"]}}}],
+            name="customer",
+        )
+
+        assert pipeline.rewrite_lookups() is pipeline
+        assert pipeline[1] == Lookup(right="customers", left_on="customer", right_on="_id", name="customer")
+
+    def test_suggest_indexes(self) -> None:
+        """Test the suggest_indexes method of the Pipeline class."""
+
+        pipeline = (
+            Pipeline()
+            .lookup(right="customers", left_on="customer", right_on="_id", name="customer")
+            .lookup(right="items", let={"sku": "$sku"}, pipeline=[{"$match": {"$expr": {"$eq": ["$sku", "$$sku"]}}}], name="item")
+            .lookup(right="items", left_on="sku", right_on="sku", name="item_again")
+        )
+
+        assert pipeline.suggest_indexes() == {"customers": [{"_id": 1}], "items": [{"sku": 1}]}
+
     # ---------------------------------------------------
     # Stages
     # ---------------------------------------------------
@@ -339,6 +377,77 @@ class TestPipeline:
             assert pipeline[0] == expected_first_stage
             assert pipeline.export() == [{"$count": "a_field"}]
 
+    class TestDensify:
+        """Test the `densify` method of the Pipeline class."""
+
+        def test_with_step(self) -> None:
+            """Test the `densify` method with step, unit and bounds arguments."""
+
+            pipeline = Pipeline()
+            pipeline.densify("timestamp", step=1, unit="hour", bounds=["2024-01-01", "2024-01-02"])
+
+            assert isinstance(pipeline[0], Densify)
+            assert pipeline.export() == [
+                {
+                    "$densify": {
+                        "field": "timestamp",
+                        "range": {"step": 1, "unit": "hour", "bounds": ["2024-01-01", "2024-01-02"]},
+                    }
+                }
+            ]
+
+        def test_with_range(self) -> None:
+            """Test the `densify` method with a range."""
+
+            pipeline = Pipeline()
+            pipeline.densify("altitude", range={"step": 200}, partition_by_fields=["area"])
+
+            assert pipeline.export() == [
+                {
+                    "$densify": {
+                        "field": "altitude",
+                        "partitionByFields": ["area"],
+                        "range": {"step": 200, "bounds": "full"},
+                    }
+                }
+            ]
+
+        def test_chaining(self) -> None:
+            """Test that densify method returns self for chaining."""
+
+            pipeline = Pipeline()
+            result = pipeline.densify("altitude", step=200)
+
+            assert result is pipeline
+            assert len(pipeline) == 1
+
+    class TestDocuments:
+        """Test the `documents` method of the Pipeline class."""
+
+        def test_with_documents(self) -> None:
+            """Test the `documents` method with literal documents."""
+
+            pipeline = Pipeline()
+            pipeline.documents([{"sku": 1}, {"sku": 2}]).lookup(right="products", on="sku", name="product")
+
+            assert isinstance(pipeline[0], Documents)
+            assert pipeline.export()[0] == {"$documents": [{"sku": 1}, {"sku": 2}]}
+
+        def test_first_stage(self) -> None:
+            """Test that documents must be the first stage of the pipeline."""
+
+            with pytest.raises(ValueError):
+                Pipeline().limit(10).documents([{"sku": 1}])
+
+        def test_chaining(self) -> None:
+            """Test that documents method returns self for chaining."""
+
+            pipeline = Pipeline()
+            result = pipeline.documents([{"sku": 1}])
+
+            assert result is pipeline
+            assert len(pipeline) == 1
+
     class TestExplode:
         """Test the `explode` method of the Pipeline class."""
 
@@ -399,6 +508,158 @@ class TestPipeline:
             assert result is pipeline
             assert len(pipeline) == 1
 
+    class TestFacet:
+        """Test the `facet` method of the Pipeline class."""
+
+        def test_with_pipelines(self) -> None:
+            """Test the `facet` method with sub-pipelines."""
+
+            pipeline = Pipeline()
+            pipeline.facet(
+                {"total": Pipeline().count("count")}, categories=[{"$sortByCount": "$genre"}]
+            )
+
+            assert isinstance(pipeline[0], Facet)
+            assert pipeline.export() == [
+                {
+                    "$facet": {
+                        "total": [{"$count": "count"}],
+                        "categories": [{"$sortByCount": "$genre"}],
+                    }
+                }
+            ]
+
+        def test_forbidden_stage(self) -> None:
+            """Test that the `facet` method rejects forbidden stages."""
+
+            with pytest.raises(ValueError):
+                Pipeline().facet(results=Pipeline().out("results"))
+
+        def test_chaining(self) -> None:
+            """Test that facet method returns self for chaining."""
+
+            pipeline = Pipeline()
+            result = pipeline.facet(total=[{"$count": "count"}])
+
+            assert result is pipeline
+            assert len(pipeline) == 1
+
+    class TestFill:
+        """Test the `fill` method of the Pipeline class."""
+
+        def test_with_output(self) -> None:
+            """Test the `fill` method with output fields."""
+
+            pipeline = Pipeline()
+            pipeline.fill(
+                {"temperature": {"method": "locf"}},
+                sort_by={"timestamp": 1},
+                status={"value": "unknown"},
+            )
+
+            assert isinstance(pipeline[0], Fill)
+            assert pipeline.export() == [
+                {
+                    "$fill": {
+                        "sortBy": {"timestamp": 1},
+                        "output": {"temperature": {"method": "locf"}, "status": {"value": "unknown"}},
+                    }
+                }
+            ]
+
+        def test_chaining(self) -> None:
+            """Test that fill method returns self for chaining."""
+
+            pipeline = Pipeline()
+            result = pipeline.fill(status={"value": "unknown"})
+
+            assert result is pipeline
+            assert len(pipeline) == 1
+
+    class TestGeoNear:
+        """Test the `geo_near` method of the Pipeline class."""
+
+        def test_with_point(self) -> None:
+            """Test the `geo_near` method with a GeoJSON point."""
+
+            pipeline = Pipeline()
+            pipeline.geo_near(
+                GeoJSONPoint.from_lon_lat(-73.99, 40.72), distance_field="distance", max_distance=1000
+            )
+
+            assert isinstance(pipeline[0], GeoNear)
+            assert pipeline.export() == [
+                {
+                    "$geoNear": {
+                        "near": {"type": "Point", "coordinates": [-73.99, 40.72]},
+                        "distanceField": "distance",
+                        "maxDistance": 1000,
+                    }
+                }
+            ]
+
+        def test_first_stage(self) -> None:
+            """Test that geo_near must be the first stage of the pipeline."""
+
+            with pytest.raises(ValueError):
+                Pipeline().limit(10).geo_near([0, 0], distance_field="distance")
+
+            pipeline = Pipeline().limit(10)
+            pipeline.append(GeoNear(near=[0, 0], distance_field="distance"))
+            with pytest.raises(ValueError):
+                pipeline.export()
+
+        def test_chaining(self) -> None:
+            """Test that geo_near method returns self for chaining."""
+
+            pipeline = Pipeline()
+            result = pipeline.geo_near([0, 0], distance_field="distance")
+
+            assert result is pipeline
+            assert len(pipeline) == 1
+
+    class TestGraphLookup:
+        """Test the `graph_lookup` method of the Pipeline class."""
+
+        def test_with_params(self) -> None:
+            """Test the `graph_lookup` method with its parameters."""
+
+            pipeline = Pipeline()
+            pipeline.graph_lookup(
+                right="employees",
+                start_with="$reportsTo",
+                connect_from_field="reportsTo",
+                connect_to_field="name",
+                name="hierarchy",
+                max_depth=1,
+            )
+
+            expected_stage = GraphLookup(
+                right="employees",
+                start_with="$reportsTo",
+                connect_from_field="reportsTo",
+                connect_to_field="name",
+                name="hierarchy",
+                max_depth=1,
+            )
+            assert isinstance(pipeline[0], GraphLookup)
+            assert pipeline[0] == expected_stage
+
+        def test_chaining(self) -> None:
+            """Test that graph_lookup method returns self for chaining."""
+
+            pipeline = Pipeline()
+            result = pipeline.graph_lookup(
+                right="employees",
+                start_with="$reportsTo",
+                connect_from_field="reportsTo",
+                connect_to_field="name",
+                name="hierarchy",
+            )
+
+            assert result is pipeline
+            assert len(pipeline) == 1
+
     class TestGroup:
         """Test the `group` method of the Pipeline class."""
 
@@ -596,6 +857,36 @@ class TestPipeline:
             assert result is pipeline
             assert len(pipeline) == 1
 
+    class TestMerge:
+        """Test the `merge` method of the Pipeline class."""
+
+        def test_with_collection_name(self) -> None:
+            """Test the `merge` method with collection name."""
+
+            pipeline = Pipeline()
+            pipeline.merge("result_collection", on="day", when_matched="replace")
+
+            expected_stage = Merge(into="result_collection", on="day", when_matched="replace")
+            assert pipeline[0] == expected_stage
+            assert isinstance(pipeline[0], Merge)
+
+        def test_must_be_last(self) -> None:
+            """Test that the merge stage must be the last stage."""
+
+            pipeline = Pipeline().match(status="active").merge("results").limit(1)
+
+            with pytest.raises(ValueError):
+                pipeline.export()
+
+        def test_chaining(self) -> None:
+            """Test that merge method returns self for chaining."""
+
+            pipeline = Pipeline()
+            result = pipeline.match(status="active").merge("results")
+
+            assert result is pipeline
+            assert pipeline.export()[-1] == {"$merge": {"into": "results"}}
+
     class TestOut:
         """Test the `out` method of the Pipeline class."""
 
@@ -701,6 +992,43 @@ class TestPipeline:
             assert result is pipeline
             assert len(pipeline) == 1
 
+    class TestRedact:
+        """Test the `redact` method of the Pipeline class."""
+
+        def test_with_condition(self) -> None:
+            """Test the `redact` method with a condition."""
+
+            pipeline = Pipeline()
+            condition = {"$cond": {"if": {"$eq": ["$level", 5]}, "then": "$$PRUNE", "else": "$$DESCEND"}}
+            pipeline.redact(condition)
+
+            assert pipeline[0] == Redact(condition=condition)
+
+        def test_with_when(self) -> None:
+            """Test that the `redact` method builds a $cond from when, then and otherwise."""
+
+            pipeline = Pipeline()
+            pipeline.redact(when={"$in": ["G", "$tags"]}, otherwise="$$KEEP")
+
+            assert pipeline.export() == [
+                {"$redact": {"$cond": {"if": {"$in": ["G", "$tags"]}, "then": "$$DESCEND", "else": "$$KEEP"}}}
+            ]
+
+        def test_without_condition(self) -> None:
+            """Test that the `redact` method requires a condition."""
+
+            with pytest.raises(ValueError):
+                Pipeline().redact()
+
+        def test_chaining(self) -> None:
+            """Test that redact method returns self for chaining."""
+
+            pipeline = Pipeline()
+            result = pipeline.redact("$$KEEP")
+
+            assert result is pipeline
+            assert len(pipeline) == 1
+
     class TestReplaceRoot:
         """Test the `replace_root` method of the Pipeline class."""
 
@@ -814,6 +1142,95 @@ class TestPipeline:
             assert result is pipeline
             assert len(pipeline) == 1
 
+    class TestSearch:
+        """Test the `search` method of the Pipeline class."""
+
+        def test_sort_and_pagination(self) -> None:
+            """Test that the results are sorted and paginated by the search stage."""
+
+            pipeline = Pipeline().search(path="title", query="war", sort={"released": -1}, after="token")
+
+            statement = pipeline.export()[0]["$search"]
+            assert statement["sort"] == {"released": -1}
+            assert statement["searchAfter"] == "token"
+            assert "searchBefore" not in statement
+
+        def test_pagination_of_existing_search(self) -> None:
+            """Test that the sort and pagination options are set on the search stage starting the pipeline."""
+
+            pipeline = Pipeline().search(path="title", query="war", sort={"released": -1})
+            pipeline.search(path="plot", query="peace", before="token")
+
+            assert len(pipeline) == 1
+            assert pipeline[0].sort == {"released": -1}
+            assert pipeline[0].search_before == "token"
+            with pytest.raises(ValueError):
+                pipeline.search(path="plot", query="peace", after="token")
+
+        def test_concurrent(self) -> None:
+            """Test that the search can be parallelized across segments."""
+
+            pipeline = Pipeline().search(path="title", query="war", concurrent=True)
+            assert pipeline.export()[0]["$search"]["concurrent"] is True
+
+            pipeline = Pipeline().search(path="title", query="war").search(path="plot", query="peace", concurrent=True)
+            assert pipeline[0].concurrent
+
+        def test_query_string(self) -> None:
+            """Test that the path is used as the default path of queryString operators."""
+
+            pipeline = Pipeline().search("title", "war AND peace", operator_name="query_string")
+            assert pipeline.export()[0]["$search"]["queryString"] == {
+                "defaultPath": "title",
+                "query": "war AND peace",
+                "score": None,
+            }
+
+            pipeline = Pipeline().search(operator_name="compound").search("plot", "war OR peace", operator_name="query_string")
+            assert pipeline[0].operator.should[0].default_path == "plot"
+
+    class TestSearchWithMeta:
+        """Test the `search_with_meta` method of the Pipeline class."""
+
+        documents = [{"_id": i, "title": "war" if i % 2 else "war and peace", "genre": "ab"[i % 2]} for i in range(6)]
+
+        def test_facet(self) -> None:
+            """Test that a page of results and the metadata are returned in a single document."""
+
+            facets = [StringFacet(name="genre", path="genre")]
+            pipeline = Pipeline().search_with_meta("title", "war", facets=facets, count={"type": "total"}, skip=1, limit=2)
+
+            search, facet, _ = pipeline.export()
+            assert search["$search"]["facet"]["operator"] == {"text": {"query": "war", "path": "title"}}
+            assert facet["$facet"]["docs"] == [{"$skip": 1}, {"$limit": 2}]
+            assert facet["$facet"]["meta"][-1] == {"$replaceRoot": {"newRoot": "$$SEARCH_META"}}
+
+            collection = IndexedCollection(self.documents)
+            collection.create_search_index()
+            (page,) = evaluate(pipeline, collection)
+            assert len(page["docs"]) == 2
+            assert page["meta"]["count"] == {"total": 6}
+            assert page["meta"]["facet"]["genre"]["buckets"] == [{"_id": "a", "count": 3}, {"_id": "b", "count": 3}]
+
+        def test_set(self) -> None:
+            """Test that the metadata is set on each result."""
+
+            pipeline = Pipeline().search_with_meta("title", "peace", how="set", limit=2)
+            assert pipeline.export()[1:] == [{"$limit": 2}, {"$set": {"meta": "$$SEARCH_META"}}]
+
+            collection = IndexedCollection(self.documents)
+            collection.create_search_index()
+            output = evaluate(pipeline, collection)
+            assert [document["meta"] for document in output] == [{"count": {"lowerBound": 3}}] * 2
+
+        def test_invalid(self) -> None:
+            """Test that the stages must start the pipeline."""
+
+            with pytest.raises(ValueError):
+                Pipeline().match(a=1).search_with_meta("title", "war")
+            with pytest.raises(ValueError):
+                Pipeline().search_with_meta("title", "war", how="group")  # type: ignore[arg-type]
+
     class TestSet:
         """Test the `set` method of the Pipeline class."""
 
@@ -865,6 +1282,42 @@ class TestPipeline:
             assert result is pipeline
             assert len(pipeline) == 1
 
+    class TestSetWindowFields:
+        """Test the `set_window_fields` method of the Pipeline class."""
+
+        def test_with_output(self) -> None:
+            """Test the `set_window_fields` method with an output dictionary."""
+
+            pipeline = Pipeline()
+            pipeline.set_window_fields(
+                {"rank": {"$rank": {}}}, partition_by="$state", sort_by={"quantity": -1}
+            )
+
+            expected_stage = SetWindowFields(
+                partition_by="$state", sort_by={"quantity": -1}, output={"rank": {"$rank": {}}}
+            )
+            assert pipeline[0] == expected_stage
+            assert isinstance(pipeline[0], SetWindowFields)
+
+        def test_with_kwargs(self) -> None:
+            """Test the `set_window_fields` method with output fields as keyword arguments."""
+
+            pipeline = Pipeline()
+            pipeline.set_window_fields(total={"$sum": "$quantity"})
+
+            assert pipeline.export() == [
+                {"$setWindowFields": {"output": {"total": {"$sum": "$quantity"}}}}
+            ]
+
+        def test_chaining(self) -> None:
+            """Test that set_window_fields method returns self for chaining."""
+
+            pipeline = Pipeline()
+            result = pipeline.set_window_fields(total={"$sum": "$quantity"})
+
+            assert result is pipeline
+            assert len(pipeline) == 1
+
     class TestSkip:
         """Test the `skip` method of the Pipeline class."""
 
@@ -1192,6 +1645,126 @@ class TestPipeline:
             assert result is pipeline
             assert len(pipeline) == 1
 
+        def test_exact(self) -> None:
+            """Test the `vector_search` method with an ENN search."""
+
+            pipeline = Pipeline().vector_search("vector_index", "embedding", [0.1, 0.2], None, 10, exact=True)
+            assert pipeline[0] == VectorSearch(
+                index="vector_index", path="embedding", query_vector=[0.1, 0.2], limit=10, exact=True
+            )
+
+        def test_limit_is_required(self) -> None:
+            """Test that omitting the limit fails at the call."""
+
+            with pytest.raises(TypeError):
+                Pipeline().vector_search("vector_index", "embedding", [0.1, 0.2], 100)  # type: ignore[call-arg]
+            with pytest.raises(TypeError):
+                Pipeline().vector_search_many("movies", "index", "embedding", [[0.1]], 100)  # type: ignore[call-arg]
+
+    class TestHybridSearch:
+        """Test the `hybrid_search` method of the Pipeline class."""
+
+        vector = {"index": "vector_index", "path": "embedding", "query_vector": [0.1], "num_candidates": 100, "limit": 10}
+
+        def test_branches(self) -> None:
+            """Test that the full-text search is ranked in a $unionWith sub-pipeline."""
+
+            pipeline = Pipeline().hybrid_search(
+                "movies", text={"path": "title", "query": "star wars"}, vector=self.vector, weights={"text": 0.5}
+            )
+            statements = pipeline.export()
+            assert "$vectorSearch" in statements[0]
+            assert statements[2]["$setWindowFields"]["output"] == {"__rank__": {"$documentNumber": {}}}
+            assert statements[3] == {"$set": {"vector_score": {"$divide": [1.0, {"$add": [60, "$__rank__"]}]}}}
+
+            text_branch = statements[5]["$unionWith"]["pipeline"]
+            assert text_branch[0]["$search"]["text"] == {"query": "star wars", "path": "title"}
+            assert text_branch[1] == {"$limit": 10}
+            assert text_branch[4] == {"$set": {"text_score": {"$divide": [0.5, {"$add": [60, "$__rank__"]}]}}}
+
+        def test_fusion(self) -> None:
+            """Test that the scores of the documents found by both searches are summed."""
+
+            pipeline = Pipeline().hybrid_search(
+                "movies", text={"path": "title", "query": "star wars"}, vector=VectorSearch(**self.vector), limit=2
+            )
+            ranked = [
+                {"_id": 1, "vector_score": 1 / 61},
+                {"_id": 2, "vector_score": 1 / 62},
+                {"_id": 2, "text_score": 1 / 61},
+                {"_id": 3, "text_score": 1 / 62},
+            ]
+            results = evaluate(pipeline[6:], ranked)
+            assert [result["_id"] for result in results] == [2, 1]
+            assert results[0]["score"] == 1 / 62 + 1 / 61
+            assert results[1]["text_score"] == 0
+
+        def test_invalid(self) -> None:
+            """Test that invalid weights and non empty pipelines are rejected."""
+
+            text = {"path": "title", "query": "star wars"}
+            with pytest.raises(ValueError):
+                Pipeline().hybrid_search("movies", text=text, vector=self.vector, weights={"image": 1})
+            with pytest.raises(ValueError):
+                Pipeline().hybrid_search("movies", text=text, vector=self.vector, k=0)
+            with pytest.raises(ValueError):
+                Pipeline().match(a=1).hybrid_search("movies", text=text, vector=self.vector)
+
+    class TestVectorSearchMany:
+        """Test the `vector_search_many` method of the Pipeline class."""
+
+        hits = [
+            {"_id": 1, "query": 0, "score": 0.9},
+            {"_id": 2, "query": 0, "score": 0.7},
+            {"_id": 1, "query": 1, "score": 0.95},
+            {"_id": 3, "query": 1, "score": 0.8},
+        ]
+
+        def test_fan_out(self) -> None:
+            """Test that the searches after the first one are run in $unionWith sub-pipelines."""
+
+            pipeline = Pipeline().vector_search_many("movies", "index", "embedding", [[0.1], [0.2], [0.3]], 100, 10)
+            statements = pipeline.export()
+            assert statements[0]["$vectorSearch"]["queryVector"] == [0.1]
+            assert statements[1] == {"$set": {"query": 0, "score": {"$meta": "vectorSearchScore"}}}
+            for position, statement in enumerate(statements[2:4], start=1):
+                assert statement["$unionWith"]["coll"] == "movies"
+                search, tag = statement["$unionWith"]["pipeline"]
+                assert search["$vectorSearch"]["queryVector"] == [(position + 1) / 10]
+                assert tag["$set"]["query"] == position
+
+        def test_group_by_document(self) -> None:
+            """Test that the hits are deduplicated, keeping the best score and the queries of each document."""
+
+            pipeline = Pipeline().vector_search_many("movies", "index", "embedding", [[0.1], [0.2]], 100, 10)
+            results = evaluate(pipeline[3:], self.hits)
+            assert results == [
+                {"_id": 1, "query": [1, 0], "score": 0.95},
+                {"_id": 3, "query": [1], "score": 0.8},
+                {"_id": 2, "query": [0], "score": 0.7},
+            ]
+
+        def test_group_by_query(self) -> None:
+            """Test that the hits are gathered by query."""
+
+            pipeline = Pipeline().vector_search_many(
+                "movies", "index", "embedding", [[0.1], [0.2]], None, 10, exact=True, group_by="query"
+            )
+            results = evaluate(pipeline[3:], self.hits)
+            assert [result["_id"] for result in results] == [0, 1]
+            assert [hit["_id"] for hit in results[1]["results"]] == [1, 3]
+
+            pipeline = Pipeline().vector_search_many("movies", "index", "embedding", [[0.1]], 100, 10, group_by=None)
+            assert len(pipeline) == 2
+
+        def test_invalid(self) -> None:
+            """Test that the searches must start the pipeline."""
+
+            with pytest.raises(ValueError):
+                Pipeline().match(a=1).vector_search_many("movies", "index", "embedding", [[0.1]], 100, 10)
+            with pytest.raises(ValueError):
+                Pipeline().vector_search_many("movies", "index", "embedding", [], 100, 10)
+
     class TestMethodChaining:
         """Test method chaining across different stage methods."""
 
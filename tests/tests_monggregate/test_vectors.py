@@ -0,0 +1,151 @@
+"""Tests for `monggregate.vectors` module."""
+
+from array import array
+
+import pytest
+from monggregate.vectors import (
+    BinaryVector,
+    BinaryVectorDtype,
+    exact_search,
+    recall_at_k,
+    similarity_score,
+    tune_num_candidates,
+)
+
+
+class TestBinaryVector:
+    """Tests for `BinaryVector` class."""
+
+    def test_float32(self) -> None:
+        """Test that float buffers are encoded as little-endian float32 values."""
+
+        vector = BinaryVector.from_buffer(array("f", [1.0, 0.5, -2.0]))
+        assert vector.dtype == BinaryVectorDtype.FLOAT32
+        assert vector.to_bytes() == b"\x27\x00" + b"\x00\x00\x80\x3f" + b"\x00\x00\x00\x3f" + b"\x00\x00\x00\xc0"
+        assert vector.to_list() == [1.0, 0.5, -2.0]
+        assert len(vector) == 3
+
+    def test_buffers(self) -> None:
+        """Test that arrays of doubles and memoryviews are supported."""
+
+        assert BinaryVector.from_buffer(array("d", [0.25, 3])).to_list() == [0.25, 3.0]
+        assert BinaryVector.from_buffer(memoryview(array("f", [1.5, 2.5]))).to_list() == [1.5, 2.5]
+        assert BinaryVector.from_buffer(memoryview(array("f", [1, 2, 3, 4]))[::2]).to_list() == [1.0, 3.0]
+
+    def test_numpy(self) -> None:
+        """Test that NumPy arrays are supported."""
+
+        numpy = pytest.importorskip("numpy")
+        assert BinaryVector.from_buffer(numpy.array([0.5, 1.0])).to_list() == [0.5, 1.0]
+        assert BinaryVector.from_buffer(numpy.array([-1, 2], dtype="int8")).dtype == BinaryVectorDtype.INT8
+
+    def test_int8_and_packed_bit(self) -> None:
+        """Test that signed bytes are encoded as int8 and unsigned bytes as packed bits."""
+
+        assert BinaryVector.from_buffer(array("b", [-3, 4])).to_bytes() == b"\x03\x00\xfd\x04"
+
+        bits = BinaryVector.from_buffer(array("B", [0b10110000]), padding=4)
+        assert bits.to_bytes() == b"\x10\x04\xb0"
+        assert bits.to_list() == [1, 0, 1, 1]
+        assert len(bits) == 4
+
+    def test_from_bson(self) -> None:
+        """Test that BinData values can be decoded."""
+
+        vector = BinaryVector.from_buffer(array("f", [1.0, 2.0]))
+        assert BinaryVector.from_bson(vector.to_bytes()) == vector
+        with pytest.raises(ValueError):
+            BinaryVector.from_bson(b"\x42\x00")
+
+    def test_invalid_vectors(self) -> None:
+        """Test that inconsistent vectors are rejected."""
+
+        with pytest.raises(ValueError):
+            BinaryVector(data=b"\x00\x00\x00")
+        with pytest.raises(ValueError):
+            BinaryVector(data=b"\x00\x00\x00\x00", padding=1)
+        with pytest.raises(TypeError):
+            BinaryVector.from_buffer(array("i", [1, 2]))
+
+    def test_expression(self) -> None:
+        """Test that vectors are expressed as BinData subtype 9 when pymongo is installed."""
+
+        binary = pytest.importorskip("bson.binary")
+        vector = BinaryVector.from_buffer(array("f", [1.0]))
+        assert vector.expression == binary.Binary(b"\x27\x00\x00\x00\x80\x3f", 9)
+
+
+class TestExactSearch:
+    """Tests for `exact_search` function."""
+
+    documents = [
+        {"_id": 1, "item": {"embedding": [1.0, 0.0]}},
+        {"_id": 2, "item": {"embedding": [0.0, 1.0]}},
+        {"_id": 3, "item": {"embedding": BinaryVector.from_buffer(array("f", [2.0, 1.0]))}},
+        {"_id": 4, "item": {}},
+    ]
+
+    def test_similarity_score(self) -> None:
+        """Test that scores are normalized as in Atlas Vector Search."""
+
+        assert similarity_score([1, 0], [-1, 0]) == 0
+        assert similarity_score([1, 0], [2, 0], "cosine") == 1
+        assert similarity_score([1, 0], [0.5, 0], "dotProduct") == 0.75
+        assert similarity_score([0, 0], [3, 4], "euclidean") == 1 / 6
+
+    def test_exact_search(self) -> None:
+        """Test that the most similar documents are returned first."""
+
+        results = exact_search(self.documents, "item.embedding", array("f", [1.0, 0.1]), 2)
+        assert [document["_id"] for _, document in results] == [1, 3]
+        assert results[0][0] > results[1][0]
+
+        results = exact_search(self.documents, "item.embedding", [0.0, 3.0], 3, similarity="euclidean")
+        assert [document["_id"] for _, document in results] == [2, 3, 1]
+
+
+class TestTuneNumCandidates:
+    """Tests for `tune_num_candidates` function."""
+
+    @staticmethod
+    def search(query: list[int], num_candidates: int) -> list[int]:
+        """Simulates an aNN search whose results get exact with 40 candidates or more"""
+
+        return query if num_candidates >= 40 else query[:-1] + [-1]
+
+    def test_recall_at_k(self) -> None:
+        """Test the recall@k of a search."""
+
+        assert recall_at_k([1, 2, 3, 4], [2, 5, 1, 3], 2) == 0.5
+        assert recall_at_k([], [1], 3) == 1.0
+
+    def test_tune(self) -> None:
+        """Test that the smallest numCandidates reaching the target recall is found."""
+
+        queries = [[1, 2, 3, 4], [5, 6, 7, 8]]
+        tuning = tune_num_candidates(self.search, queries, queries, limit=4, target_recall=1.0)
+        assert tuning.num_candidates == 40
+        assert tuning.recall == 1.0 and tuning.reached
+        assert tuning.recalls[39] == 0.75
+        assert len(tuning.recalls) < 20
+        assert set(tuning.latencies) == set(tuning.recalls)
+
+        tuning = tune_num_candidates(self.search, queries, queries, limit=4, target_recall=0.75)
+        assert tuning.num_candidates == 5
+
+    def test_unreachable_target(self) -> None:
+        """Test that the largest numCandidates is returned when the target recall cannot be reached."""
+
+        tuning = tune_num_candidates(lambda query, _: [], [[1]], [[1]], limit=1, max_num_candidates=100)
+        assert tuning.num_candidates == 100
+        assert not tuning.reached
+
+    def test_invalid_arguments(self) -> None:
+        """Test that inconsistent arguments are rejected."""
+
+        with pytest.raises(ValueError):
+            tune_num_candidates(self.search, [[1]], [], limit=1)
+        with pytest.raises(ValueError):
+            tune_num_candidates(self.search, [[1]], [[1]], limit=1, target_recall=0)
+        with pytest.raises(ValueError):
+            tune_num_candidates(self.search, [[1]], [[1]], limit=10, max_num_candidates=10)
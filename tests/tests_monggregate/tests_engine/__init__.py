@@ -0,0 +1 @@
+"""Tests for `monggregate.engine` subpackage."""
@@ -0,0 +1,95 @@
+"""Tests for `monggregate.engine.accumulators` module."""
+
+import pytest
+
+from monggregate.engine.accumulators import build_reducer
+
+
+def _reduce(specification: dict, values: list, start: int = 0):
+    """Folds values into a state, positions starting at start"""
+
+    reducer = build_reducer(specification)
+    state = reducer.initial()
+    for position, value in enumerate(values, start=start):
+        state = reducer.step(state, value, position)
+    return reducer, state
+
+
+@pytest.mark.parametrize(
+    "specification, expected",
+    [
+        ({"$sum": "$x"}, 15),
+        ({"$avg": "$x"}, 3),
+        ({"$min": "$x"}, 1),
+        ({"$max": "$x"}, 5),
+        ({"$first": "$x"}, 4),
+        ({"$last": "$x"}, 3),
+        ({"$push": "$x"}, [4, 1, 5, 2, 3]),
+        ({"$count": {}}, 5),
+    ],
+)
+def test_merge(specification: dict, expected) -> None:
+    """Test that merging partial states gives the same result as a single pass."""
+
+    values = [4, 1, 5, 2, 3]
+    reducer, left = _reduce(specification, values[:2])
+    _, right = _reduce(specification, values[2:], start=2)
+    assert reducer.result(reducer.merge(left, right)) == expected
+    assert reducer.result(_reduce(specification, values)[1]) == expected
+
+
+@pytest.mark.parametrize(
+    "specification, expected",
+    [
+        ({"$topN": {"n": 2, "sortBy": {"score": -1}, "output": "$player"}}, ["e", "c"]),
+        ({"$bottomN": {"n": 2, "sortBy": {"score": -1}, "output": "$player"}}, ["b", "d"]),
+        ({"$top": {"sortBy": {"score": 1}, "output": "$player"}}, "d"),
+        ({"$bottom": {"sortBy": {"score": 1}, "output": "$player"}}, "e"),
+        ({"$firstN": {"input": "$score", "n": 2}}, [31, 10]),
+        ({"$lastN": {"input": "$score", "n": 3}}, [52, None, 99]),
+        ({"$maxN": {"input": "$score", "n": 2}}, [99, 52]),
+        ({"$minN": {"input": "$score", "n": 10}}, [10, 31, 52, 99]),
+    ],
+)
+def test_bounded(specification: dict, expected) -> None:
+    """Test the N accumulators, their merge and that their states stay bounded."""
+
+    documents = [
+        {"player": "a", "score": 31},
+        {"player": "b", "score": 10},
+        {"player": "c", "score": 52},
+        {"player": "d"},
+        {"player": "e", "score": 99},
+    ]
+    values = [build_reducer(specification).value({"CURRENT": document}) for document in documents]
+    reducer, left = _reduce(specification, values[:2])
+    _, right = _reduce(specification, values[2:], start=2)
+    assert reducer.result(reducer.merge(left, right)) == expected
+
+    _, state = _reduce(specification, values)
+    assert reducer.result(state) == expected
+    assert len(state[1]) <= specification[next(iter(specification))].get("n", 1)
+
+
+def test_bounded_invalid_n() -> None:
+    """Test that n must resolve to a positive integer."""
+
+    reducer = build_reducer({"$firstN": {"input": "$score", "n": "$n"}})
+    with pytest.raises(ValueError):
+        reducer.value({"CURRENT": {"score": 1, "n": 0}})
+
+
+def test_std_dev_merge() -> None:
+    """Test that standard deviations states merge."""
+
+    values = [2, 4, 4, 4, 5, 5, 7, 9]
+    reducer, left = _reduce({"$stdDevPop": "$x"}, values[:3])
+    _, right = _reduce({"$stdDevPop": "$x"}, values[3:])
+    assert reducer.result(reducer.merge(left, right)) == pytest.approx(2.0)
+
+
+def test_unsupported_accumulator() -> None:
+    """Test that unsupported accumulators raise an error."""
+
+    with pytest.raises(NotImplementedError):
+        build_reducer({"$unknown": "$x"})
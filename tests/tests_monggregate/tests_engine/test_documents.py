@@ -0,0 +1,86 @@
+"""Tests for `monggregate.engine.documents` module."""
+
+from monggregate.engine.documents import (
+    MISSING,
+    freeze,
+    get_path,
+    iter_values,
+    set_path,
+    unset_path,
+)
+
+
+class TestGetPath:
+    """Tests for `get_path` function."""
+
+    def test_nested_document(self) -> None:
+        """Test that nested documents are traversed."""
+
+        assert get_path({"a": {"b": 1}}, "$a.b") == 1
+        assert get_path({"a": {"b": 1}}, "a") == {"b": 1}
+
+    def test_missing(self) -> None:
+        """Test that unresolved paths return MISSING."""
+
+        assert get_path({"a": 1}, "a.b") is MISSING
+        assert get_path({}, "a") is MISSING
+        assert not MISSING
+
+    def test_array_traversal(self) -> None:
+        """Test that arrays map the remaining path over their elements."""
+
+        document = {"a": [{"b": 1}, {"b": 2}, {}]}
+        assert get_path(document, "a.b") == [1, 2]
+
+
+class TestIterValues:
+    """Tests for `iter_values` function."""
+
+    def test_leaf_array(self) -> None:
+        """Test that leaf arrays are yielded as a whole and element by element."""
+
+        assert list(iter_values({"a": {"b": [1, 2]}}, "a.b")) == [[1, 2], 1, 2]
+
+    def test_array_of_documents(self) -> None:
+        """Test that arrays of documents are traversed."""
+
+        assert list(iter_values({"a": [{"b": 1}, {"b": 2}]}, "a.b")) == [1, 2]
+
+    def test_numeric_component(self) -> None:
+        """Test that numeric components index arrays."""
+
+        assert list(iter_values({"a": [{"b": 1}, {"b": 2}]}, "a.1.b")) == [2]
+
+    def test_missing(self) -> None:
+        """Test that nothing is yielded for unresolved paths."""
+
+        assert list(iter_values({"a": 1}, "b")) == []
+
+
+class TestSetPath:
+    """Tests for `set_path` and `unset_path` functions."""
+
+    def test_set_does_not_mutate(self) -> None:
+        """Test that set_path copies the documents along the path."""
+
+        document = {"a": {"b": 1}, "c": 2}
+        output = set_path(document, "a.d", 3)
+
+        assert output == {"a": {"b": 1, "d": 3}, "c": 2}
+        assert document == {"a": {"b": 1}, "c": 2}
+
+    def test_unset(self) -> None:
+        """Test that unset_path removes nested fields without mutating the input."""
+
+        document = {"a": {"b": 1, "c": 2}}
+        assert unset_path(document, "a.b") == {"a": {"c": 2}}
+        assert document == {"a": {"b": 1, "c": 2}}
+
+
+def test_freeze() -> None:
+    """Test that freeze produces hashable values distinguishing booleans."""
+
+    assert hash(freeze({"a": [1, {"b": 2}]}))
+    assert freeze(True) != freeze(1)
+    assert freeze(1) == freeze(1.0)
+    assert freeze(MISSING) is None
@@ -0,0 +1,194 @@
+"""Tests for `monggregate.engine.evaluator` module."""
+
+import pytest
+
+from monggregate.engine import evaluate
+from monggregate.dollar import S
+from monggregate.pipeline import Pipeline
+
+ORDERS = [
+    {"_id": index, "customer": f"c{index % 3}", "amount": index, "items": ["a", "b"][: index % 3]}
+    for index in range(30)
+]
+
+
+class TestEvaluate:
+    """Tests for `evaluate` function."""
+
+    def test_match_project(self) -> None:
+        """Test filtering and projections."""
+
+        pipeline = Pipeline().match(customer="c1").project(include=["amount"]).limit(2)
+        assert evaluate(pipeline, ORDERS) == [{"_id": 1, "amount": 1}, {"_id": 4, "amount": 4}]
+
+    def test_group_sort(self) -> None:
+        """Test grouping and sorting."""
+
+        pipeline = [
+            {"$group": {"_id": "$customer", "total": {"$sum": "$amount"}}},
+            {"$sort": {"total": -1}},
+        ]
+        assert evaluate(pipeline, ORDERS) == [
+            {"_id": "c2", "total": 155},
+            {"_id": "c1", "total": 145},
+            {"_id": "c0", "total": 135},
+        ]
+
+    def test_unwind(self) -> None:
+        """Test unwinding arrays."""
+
+        pipeline = [{"$match": {"_id": {"$lt": 3}}}, {"$unwind": "$items"}, {"$project": {"items": 1, "_id": 0}}]
+        assert evaluate(pipeline, ORDERS) == [{"items": "a"}, {"items": "a"}, {"items": "b"}]
+
+    def test_lookup(self) -> None:
+        """Test that lookups read the provided collections."""
+
+        customers = [{"name": "c0", "city": "Paris"}]
+        pipeline = [
+            {"$match": {"_id": 0}},
+            {"$lookup": {"from": "customers", "localField": "customer", "foreignField": "name", "as": "info"}},
+        ]
+        output = evaluate(pipeline, ORDERS, collections={"customers": customers})
+        assert output[0]["info"] == customers
+
+    def test_facet(self) -> None:
+        """Test that facet sub-pipelines run on the same documents."""
+
+        pipeline = Pipeline().match(customer="c0").facet(
+            total=Pipeline().count("count"),
+            top=Pipeline().sort(by="amount", descending=True).limit(1).project(include="amount"),
+        )
+        assert evaluate(pipeline, ORDERS) == [{"total": [{"count": 10}], "top": [{"_id": 27, "amount": 27}]}]
+
+    def test_graph_lookup(self) -> None:
+        """Test the recursive search of graph lookups."""
+
+        employees = [
+            {"_id": 1, "name": "Dev"},
+            {"_id": 2, "name": "Eliot", "reportsTo": "Dev"},
+            {"_id": 3, "name": "Ron", "reportsTo": "Eliot"},
+            {"_id": 4, "name": "Andrew", "reportsTo": "Eliot", "active": False},
+            {"_id": 5, "name": "Asya", "reportsTo": "Ron"},
+        ]
+        pipeline = Pipeline().match(name="Asya").graph_lookup(
+            right="employees",
+            start_with="$reportsTo",
+            connect_from_field="reportsTo",
+            connect_to_field="name",
+            name="hierarchy",
+            depth_field="level",
+        )
+        output = evaluate(pipeline, employees, collections={"employees": employees})
+        assert [(document["name"], document["level"]) for document in output[0]["hierarchy"]] == [
+            ("Ron", 0),
+            ("Eliot", 1),
+            ("Dev", 2),
+        ]
+
+        pipeline = Pipeline().match(name="Dev").graph_lookup(
+            right="employees",
+            start_with="$name",
+            connect_from_field="name",
+            connect_to_field="reportsTo",
+            name="reports",
+            max_depth=1,
+            restrict_search_with_match={"active": {"$ne": False}},
+        )
+        output = evaluate(pipeline, employees, collections={"employees": employees})
+        assert [document["name"] for document in output[0]["reports"]] == ["Eliot", "Ron"]
+
+    def test_redact(self) -> None:
+        """Test that documents and embedded documents are redacted level by level."""
+
+        forecast = {
+            "_id": 1,
+            "tags": ["G", "STLW"],
+            "subsections": [
+                {"subtitle": "Overview", "tags": ["SI", "G"], "details": {"tags": ["TOP"], "content": "secret"}},
+                {"subtitle": "Analysis", "tags": ["STLW"]},
+                {"subtitle": "Budget", "tags": ["TOP"]},
+            ],
+        }
+        pipeline = Pipeline().redact(when=S.gt(S.size(S.set_intersection("$tags", ["G", "STLW"])), 0))
+        assert evaluate(pipeline, [forecast]) == [
+            {
+                "_id": 1,
+                "tags": ["G", "STLW"],
+                "subsections": [{"subtitle": "Overview", "tags": ["SI", "G"]}, {"subtitle": "Analysis", "tags": ["STLW"]}],
+            }
+        ]
+
+        pipeline = Pipeline().redact(S.cond(S.eq("$_id", 1), "$$KEEP", "$$PRUNE"))
+        assert evaluate(pipeline, [forecast, {"_id": 2}]) == [forecast]
+
+        with pytest.raises(ValueError):
+            evaluate(Pipeline().redact("$tags"), [forecast])
+
+    def test_documents(self) -> None:
+        """Test that literal documents can be joined with a collection."""
+
+        customers = [{"name": "c0", "city": "Paris"}, {"name": "c1", "city": "Lyon"}]
+        pipeline = Pipeline().documents([{"customer": "c1"}, {"customer": "c2"}]).lookup(
+            right="customers", local_field="customer", foreign_field="name", name="info"
+        )
+        output = evaluate(pipeline, [], collections={"customers": customers})
+        assert output == [{"customer": "c1", "info": [customers[1]]}, {"customer": "c2", "info": []}]
+
+        pipeline = Pipeline().match(_id=0).union_with(pipeline=Pipeline().documents([{"_id": "extra"}]))
+        assert evaluate(pipeline, ORDERS)[1] == {"_id": "extra"}
+
+    def test_lookup_documents_with_let(self) -> None:
+        """Test that the equality join applies to the documents produced in the scope of each local document."""
+
+        lookup = {
+            "$lookup": {
+                "localField": "k",
+                "foreignField": "k",
+                "as": "m",
+                "let": {"x": "$_id"},
+                "pipeline": [{"$documents": [{"k": "a"}, {"k": "b"}]}, {"$set": {"source": "$$x"}}],
+            }
+        }
+        output = evaluate([lookup], [{"_id": 1, "k": "a"}, {"_id": 2, "k": "b"}, {"_id": 3, "k": None}])
+        assert output == [
+            {"_id": 1, "k": "a", "m": [{"k": "a", "source": 1}]},
+            {"_id": 2, "k": "b", "m": [{"k": "b", "source": 2}]},
+            {"_id": 3, "k": None, "m": []},
+        ]
+
+    def test_unsupported_stage(self) -> None:
+        """Test that unsupported stages raise an error."""
+
+        with pytest.raises(NotImplementedError):
+            evaluate([{"$unknownStage": {}}], ORDERS)
+
+
+class TestParallelEvaluate:
+    """Tests for the parallel evaluation."""
+
+    def test_group_merge(self) -> None:
+        """Test that partial group states are merged consistently with the sequential evaluation."""
+
+        pipeline = [
+            {"$match": {"amount": {"$gte": 2}}},
+            {"$set": {"double": {"$multiply": ["$amount", 2]}}},
+            {
+                "$group": {
+                    "_id": "$customer",
+                    "total": {"$sum": "$double"},
+                    "average": {"$avg": "$amount"},
+                    "lowest": {"$min": "$amount"},
+                    "highest": {"$max": "$amount"},
+                    "first": {"$first": "$amount"},
+                    "last": {"$last": "$amount"},
+                }
+            },
+            {"$sort": {"_id": 1}},
+        ]
+        assert evaluate(pipeline, ORDERS, workers=3) == evaluate(pipeline, ORDERS)
+
+    def test_streamable_prefix(self) -> None:
+        """Test that the order of the documents is preserved without a group stage."""
+
+        pipeline = [{"$unwind": "$items"}, {"$project": {"items": 1}}, {"$skip": 2}]
+        assert evaluate(pipeline, ORDERS, workers=4) == evaluate(pipeline, ORDERS)
@@ -0,0 +1,73 @@
+"""Tests for `monggregate.engine.expressions` module."""
+
+import pytest
+
+from monggregate.engine.documents import MISSING, AnnotatedDocument
+from monggregate.engine.expressions import evaluate_expression
+
+
+class TestEvaluateExpression:
+    """Tests for `evaluate_expression` function."""
+
+    document = {"a": 2, "b": 3, "items": [1, 2, 3], "name": "Mongo"}
+
+    def test_field_paths(self) -> None:
+        """Test that field paths and variables are resolved."""
+
+        assert evaluate_expression("$a", self.document) == 2
+        assert evaluate_expression("$$ROOT.name", self.document) == "Mongo"
+        assert evaluate_expression("$unknown", self.document) is MISSING
+
+    def test_arithmetic(self) -> None:
+        """Test arithmetic operators."""
+
+        assert evaluate_expression({"$add": ["$a", "$b", 1]}, self.document) == 6
+        assert evaluate_expression({"$multiply": ["$a", "$b"]}, self.document) == 6
+        assert evaluate_expression({"$divide": ["$b", "$a"]}, self.document) == 1.5
+        assert evaluate_expression({"$add": ["$a", None]}, self.document) is None
+
+    def test_conditionals(self) -> None:
+        """Test conditional operators."""
+
+        expression = {"$cond": [{"$gt": ["$a", 1]}, "big", "small"]}
+        assert evaluate_expression(expression, self.document) == "big"
+        assert evaluate_expression({"$ifNull": ["$missing", "default"]}, self.document) == "default"
+
+    def test_arrays(self) -> None:
+        """Test array operators and their variables."""
+
+        expression = {"$filter": {"input": "$items", "as": "item", "cond": {"$gte": ["$$item", 2]}}}
+        assert evaluate_expression(expression, self.document) == [2, 3]
+        expression = {"$map": {"input": "$items", "in": {"$multiply": ["$$this", 10]}}}
+        assert evaluate_expression(expression, self.document) == [10, 20, 30]
+
+    def test_sets(self) -> None:
+        """Test set operators."""
+
+        assert evaluate_expression({"$setIntersection": ["$items", [3, 2, 2, 5]]}, self.document) == [2, 3]
+        assert evaluate_expression({"$setUnion": ["$items", [3, 4]]}, self.document) == [1, 2, 3, 4]
+        assert evaluate_expression({"$setDifference": ["$items", [2]]}, self.document) == [1, 3]
+        assert evaluate_expression({"$setEquals": ["$items", [3, 1, 2, 1]]}, self.document) is True
+        assert evaluate_expression({"$setIsSubset": [[1, 1], "$items"]}, self.document) is True
+        assert evaluate_expression({"$anyElementTrue": [[0, None, "$a"]]}, self.document) is True
+        assert evaluate_expression({"$allElementsTrue": [[1, 0]]}, self.document) is False
+        assert evaluate_expression({"$setUnion": ["$items", "$missing"]}, self.document) is None
+
+    def test_documents(self) -> None:
+        """Test that documents are evaluated field by field."""
+
+        expression = {"total": {"$sum": "$items"}, "upper": {"$toUpper": "$name"}, "none": "$missing"}
+        assert evaluate_expression(expression, self.document) == {"total": 6, "upper": "MONGO"}
+
+    def test_meta(self) -> None:
+        """Test that $meta reads the metadata of annotated documents."""
+
+        document = AnnotatedDocument(self.document, {"vectorSearchScore": 0.9})
+        assert evaluate_expression({"$meta": "vectorSearchScore"}, document) == 0.9
+        assert evaluate_expression({"$meta": "searchScore"}, self.document) is MISSING
+
+    def test_unsupported_operator(self) -> None:
+        """Test that unsupported operators raise an error."""
+
+        with pytest.raises(NotImplementedError):
+            evaluate_expression({"$unknownOperator": 1}, self.document)
@@ -0,0 +1,95 @@
+"""Tests for `monggregate.engine.indexes` module."""
+
+import re
+
+import pytest
+
+from monggregate.engine import evaluate
+from monggregate.engine.indexes import HashIndex, IndexedCollection, SortedIndex
+
+DOCUMENTS = [
+    {"_id": index, "status": ["A", "B", "C"][index % 3], "amount": (index * 7) % 10, "tags": ["x", f"t{index % 2}"]}
+    for index in range(20)
+] + [{"_id": 20, "status": None}, {"_id": 21, "amount": "ten"}]
+
+
+@pytest.fixture
+def orders() -> IndexedCollection:
+    collection = IndexedCollection(DOCUMENTS)
+    collection.create_index("status")
+    collection.create_index("amount", kind="sorted")
+    collection.create_index("tags")
+    return collection
+
+
+class TestIndexes:
+    """Tests for the indexes."""
+
+    def test_hash_index(self) -> None:
+        """Test equality lookups on hash indexes, including multikey and missing values."""
+
+        index = HashIndex("tags", DOCUMENTS)
+        assert index.multikey
+        assert index.equal("t1") == set(range(1, 20, 2))
+        assert index.equal(None) == {20, 21}
+
+    def test_sorted_index(self) -> None:
+        """Test range lookups on sorted indexes, restricted to the type bracket of the bounds."""
+
+        index = SortedIndex("amount", DOCUMENTS)
+        assert not index.multikey
+        assert index.range({"$gte": 8}) == {4, 14, 7, 17}
+        assert index.range({"$gt": 1, "$lte": 2}) == {6, 16}
+        assert index.range({"$gt": "a"}) == {21}
+
+
+class TestSelectIndex:
+    """Tests for the index selection."""
+
+    def test_equality_first(self, orders: IndexedCollection) -> None:
+        """Test that equality indexes are preferred."""
+
+        index = orders.select_index({"status": "A", "amount": {"$gt": 2}}, {"amount": 1})
+        assert index is orders.indexes["status"]
+
+    def test_sort_before_range(self, orders: IndexedCollection) -> None:
+        """Test that sort indexes are preferred over range indexes."""
+
+        orders.create_index("_id", kind="sorted")
+        index = orders.select_index({"amount": {"$gt": 2}}, {"_id": -1})
+        assert index is orders.indexes["_id"]
+
+    def test_no_index(self, orders: IndexedCollection) -> None:
+        """Test that no index is selected for unindexed fields."""
+
+        assert orders.select_index({"unknown": 1}) is None
+
+
+@pytest.mark.parametrize(
+    "pipeline",
+    [
+        [{"$match": {"status": "B"}}],
+        [{"$match": {"status": {"$in": ["A", None]}}}],
+        [{"$match": {"tags": "t0", "amount": {"$lt": 5}}}],
+        [{"$match": {"amount": {"$gte": 3, "$lt": 7}}}, {"$sort": {"amount": -1}}],
+        [{"$sort": {"amount": 1}}, {"$limit": 5}],
+        [{"$match": {"status": "C"}}, {"$sort": {"amount": 1}}, {"$project": {"amount": 1}}],
+        [{"$match": {"amount": re.compile("^t")}}, {"$sort": {"amount": 1}}],
+        [{"$match": {"status": re.compile("^[AB]")}}],
+    ],
+)
+def test_indexed_evaluation(orders: IndexedCollection, pipeline: list[dict]) -> None:
+    """Test that indexed evaluations give the same results as full scans."""
+
+    assert evaluate(pipeline, orders) == evaluate(pipeline, DOCUMENTS)
+
+
+def test_indexed_evaluation_with_variables(orders: IndexedCollection) -> None:
+    """Test that the user variables are available to the queries run on indexes."""
+
+    condition = {"$eq": ["$amount", "$$target"]}
+    for query in ({"$expr": condition}, {"amount": {"$gte": 2}, "$expr": condition}):
+        pipeline = [{"$match": query}, {"$sort": {"amount": 1}}]
+        output = evaluate(pipeline, orders, variables={"target": 4})
+        assert output == evaluate(pipeline, DOCUMENTS, variables={"target": 4})
+        assert [document["_id"] for document in output] == [2, 12]
@@ -0,0 +1,161 @@
+"""Tests for `monggregate.engine.join` module."""
+
+import pytest
+
+from monggregate.engine.documents import freeze, iter_values
+from monggregate.engine.join import CollectionJoin, hash_join, join
+from monggregate.stages import Lookup
+
+
+class FakeCollection:
+    """Minimal in-memory collection supporting `$in` queries on a single field."""
+
+    def __init__(self, documents: list[dict]) -> None:
+        self.documents = documents
+        self.queries: list[dict] = []
+
+    def find(self, filter: dict, projection: dict | None = None) -> list[dict]:
+        """Returns the documents matching a {field: {"$in": [...]}} filter."""
+
+        self.queries.append(filter)
+        ((field, condition),) = filter.items()
+        wanted = {freeze(value) for value in condition["$in"]}
+        output = []
+        for document in self.documents:
+            keys = {freeze(value) for value in iter_values(document, field)} or {None}
+            if keys & wanted:
+                output.append(document)
+
+        return output
+
+
+@pytest.fixture
+def lookup() -> Lookup:
+    """Lookup joining orders to their customers."""
+
+    return Lookup(right="customers", left_on="customer_id", right_on="_id", name="customer")
+
+
+@pytest.fixture
+def orders() -> list[dict]:
+    """Local documents."""
+
+    return [
+        {"_id": 1, "customer_id": "a"},
+        {"_id": 2, "customer_id": "b"},
+        {"_id": 3, "customer_id": "z"},
+        {"_id": 4},
+        {"_id": 5, "customer_id": ["a", "b"]},
+    ]
+
+
+@pytest.fixture
+def customers() -> list[dict]:
+    """Foreign documents."""
+
+    return [
+        {"_id": "a", "name": "Alice"},
+        {"_id": "b", "name": "Bob"},
+    ]
+
+
+EXPECTED = [
+    [{"_id": "a", "name": "Alice"}],
+    [{"_id": "b", "name": "Bob"}],
+    [],
+    [],
+    [{"_id": "a", "name": "Alice"}, {"_id": "b", "name": "Bob"}],
+]
+
+
+class TestHashJoin:
+    """Tests for `hash_join` function."""
+
+    def test_foreign_is_build_side(self, lookup, orders, customers) -> None:
+        """Test the join when the foreign side is the smaller one."""
+
+        output = hash_join(lookup, orders, customers)
+        assert [doc["customer"] for doc in output] == EXPECTED
+
+    def test_local_is_build_side(self, lookup, orders, customers) -> None:
+        """Test the join when the local side is hashed and the foreign side streamed."""
+
+        output = hash_join(lookup, orders, iter(customers))
+        assert [doc["customer"] for doc in output] == EXPECTED
+
+    def test_null_matches_missing(self, lookup) -> None:
+        """Test that missing local fields match missing foreign fields."""
+
+        output = hash_join(lookup, [{"_id": 1}], [{"name": "no id"}, {"_id": "a"}])
+        assert output[0]["customer"] == [{"name": "no id"}]
+
+    def test_does_not_mutate_inputs(self, lookup, orders, customers) -> None:
+        """Test that the input documents are left untouched."""
+
+        hash_join(lookup, orders, customers)
+        assert "customer" not in orders[0]
+
+    def test_unsupported_lookup(self) -> None:
+        """Test that subquery lookups are rejected."""
+
+        lookup = Lookup(right="customers", pipeline=[], name="customer")
+        with pytest.raises(ValueError):
+            hash_join(lookup, [], [])
+
+
+class TestCollectionJoin:
+    """Tests for `CollectionJoin` class."""
+
+    def test_join(self, lookup, orders, customers) -> None:
+        """Test that the live join matches the local join."""
+
+        collection = FakeCollection(customers)
+        output = list(CollectionJoin(lookup, collection, batch_size=2, max_workers=2)(orders))
+
+        assert [doc["customer"] for doc in output] == EXPECTED
+
+    def test_batches(self, lookup, orders, customers) -> None:
+        """Test that keys are batched into $in queries of at most batch_size values."""
+
+        collection = FakeCollection(customers)
+        list(CollectionJoin(lookup, collection, batch_size=2, max_workers=1)(orders))
+
+        # 4 distinct keys : "a", "b", "z" and null
+        assert len(collection.queries) == 2
+        assert all(len(query["_id"]["$in"]) <= 2 for query in collection.queries)
+
+    def test_cache(self, lookup, orders, customers) -> None:
+        """Test that cached keys, including misses, are not queried again."""
+
+        collection = FakeCollection(customers)
+        executor = CollectionJoin(lookup, collection)
+        list(executor(orders))
+        list(executor(orders))
+        assert len(collection.queries) == 1
+
+        executor.clear_cache()
+        list(executor(orders))
+        assert len(collection.queries) == 2
+
+    def test_cache_size(self, lookup, orders, customers) -> None:
+        """Test that the cache is bounded."""
+
+        collection = FakeCollection(customers)
+        executor = CollectionJoin(lookup, collection, cache_size=1)
+        list(executor(orders))
+        assert len(executor._cache) == 1
+
+    def test_invalid_arguments(self, lookup) -> None:
+        """Test that invalid batch sizes are rejected."""
+
+        with pytest.raises(ValueError):
+            CollectionJoin(lookup, FakeCollection([]), batch_size=0)
+
+
+def test_join_dispatch(lookup, orders, customers) -> None:
+    """Test that join dispatches on the type of the foreign argument."""
+
+    local = join(lookup, orders, customers)
+    live = join(lookup, orders, FakeCollection(customers), batch_size=1)
+
+    assert local == live
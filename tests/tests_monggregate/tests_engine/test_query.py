@@ -0,0 +1,45 @@
+"""Tests for `monggregate.engine.query` module."""
+
+from monggregate.engine.query import matches
+
+
+class TestMatches:
+    """Tests for `matches` function."""
+
+    document = {"a": 1, "tags": ["x", "y"], "nested": {"b": "text"}, "items": [{"qty": 5}, {"qty": 15}]}
+
+    def test_equality(self) -> None:
+        """Test equality on scalars, arrays elements and nested fields."""
+
+        assert matches(self.document, {"a": 1})
+        assert matches(self.document, {"tags": "x"})
+        assert matches(self.document, {"tags": ["x", "y"]})
+        assert matches(self.document, {"nested.b": "text"})
+        assert matches(self.document, {"missing": None})
+        assert not matches(self.document, {"a": "1"})
+
+    def test_comparison(self) -> None:
+        """Test that comparisons only match values of the same type bracket."""
+
+        assert matches(self.document, {"a": {"$gte": 1, "$lt": 2}})
+        assert not matches(self.document, {"a": {"$gt": "0"}})
+        assert matches(self.document, {"items.qty": {"$gt": 10}})
+
+    def test_logical(self) -> None:
+        """Test logical operators."""
+
+        assert matches(self.document, {"$or": [{"a": 2}, {"tags": "y"}]})
+        assert not matches(self.document, {"$nor": [{"a": 1}]})
+        assert matches(self.document, {"a": {"$not": {"$gt": 5}}})
+
+    def test_array_operators(self) -> None:
+        """Test array query operators."""
+
+        assert matches(self.document, {"tags": {"$all": ["y", "x"], "$size": 2}})
+        assert matches(self.document, {"items": {"$elemMatch": {"qty": {"$gt": 10}}}})
+        assert not matches(self.document, {"items": {"$elemMatch": {"qty": {"$gt": 20}}}})
+
+    def test_expr(self) -> None:
+        """Test that $expr evaluates aggregation expressions."""
+
+        assert matches(self.document, {"$expr": {"$eq": ["$a", 1]}})
@@ -0,0 +1,205 @@
+"""Tests for `monggregate.engine.search_index` module."""
+
+from datetime import datetime
+
+import pytest
+
+from monggregate.engine import evaluate
+from monggregate.engine.indexes import IndexedCollection
+from monggregate.engine.search_index import SearchIndex, edit_distance, tokenize
+from monggregate.geo import GeoJSONPoint
+from monggregate.pipeline import Pipeline
+from monggregate.search.collectors.facet import DateFacet, NumericFacet, StringFacet
+from monggregate.search.operators.compound import Compound
+from monggregate.search.operators.equals import Equals
+from monggregate.search.operators.range import Range
+from monggregate.search.operators.text import Text
+from monggregate.stages import Search
+
+MOVIES = [
+    {
+        "_id": 1,
+        "title": "Star Wars",
+        "genres": ["scifi", "action"],
+        "year": 1977,
+        "released": datetime(1977, 5, 25),
+        "location": {"type": "Point", "coordinates": [-118.24, 34.05]},
+    },
+    {"_id": 2, "title": "Star Trek", "genres": ["scifi"], "year": 1979, "released": datetime(1979, 12, 7)},
+    {"_id": 3, "title": "The Wars of the Roses", "genres": ["comedy"], "year": 1989, "released": datetime(1989, 12, 8)},
+    {"_id": 4, "title": "Stardust", "genres": ["fantasy"], "year": 2007, "released": datetime(2007, 8, 10)},
+    {"_id": 5, "plot": "A movie without title"},
+]
+
+
+def _ids(pipeline: Pipeline, collection: IndexedCollection) -> list[int]:
+    return [document["_id"] for document in evaluate(pipeline, collection)]
+
+
+@pytest.fixture
+def movies() -> IndexedCollection:
+    collection = IndexedCollection(MOVIES)
+    collection.create_search_index()
+    return collection
+
+
+class TestAnalysis:
+    """Tests for the analysis functions."""
+
+    def test_tokenize(self) -> None:
+        """Test that texts are split into lower cased words."""
+
+        assert tokenize("The Wars, of the ROSES!") == ["the", "wars", "of", "the", "roses"]
+
+    def test_edit_distance(self) -> None:
+        """Test that the distance counts transpositions as one edit and is bounded."""
+
+        assert edit_distance("star", "star", 2) == 0
+        assert edit_distance("star", "satr", 2) == 1
+        assert edit_distance("star", "stardust", 2) == 3
+        assert edit_distance("kitten", "sitting", 2) == 3
+
+
+class TestSearchIndex:
+    """Tests for the evaluation of search operators."""
+
+    def test_text(self, movies: IndexedCollection) -> None:
+        """Test that text searches are ranked with BM25."""
+
+        output = evaluate(Pipeline().search(path="title", query="star wars").set(score={"$meta": "searchScore"}), movies)
+        assert [document["_id"] for document in output] == [1, 2, 3]
+        assert output[0]["score"] > output[1]["score"] > output[2]["score"] > 0
+
+    def test_fuzzy(self, movies: IndexedCollection) -> None:
+        """Test that fuzzy options bound the number of edits and honor the prefix length."""
+
+        assert _ids(Pipeline().search(path="title", query="strar", fuzzy={"max_edits": 1}), movies) == [1, 2]
+        assert _ids(Pipeline().search(path="title", query="tsar", fuzzy={"prefix_length": 1}), movies) == []
+        assert _ids(Pipeline().search(path="title", query="strar"), movies) == []
+
+    def test_autocomplete(self, movies: IndexedCollection) -> None:
+        """Test that autocomplete matches the prefixes of the tokens."""
+
+        pipeline = Pipeline().search(path="title", query="sta", operator_name="autocomplete")
+        assert sorted(_ids(pipeline, movies)) == [1, 2, 4]
+        pipeline = Pipeline().search(path="title", query="star w", operator_name="autocomplete", token_order="sequential")
+        assert _ids(pipeline, movies) == [1]
+
+    def test_term_level_operators(self, movies: IndexedCollection) -> None:
+        """Test the regex, wildcard, equals, range and exists operators."""
+
+        assert _ids(Pipeline().search(path="title", query="Star.*", operator_name="regex"), movies) == [1, 2, 4]
+        assert _ids(Pipeline().search(path="title", query="star?", operator_name="wildcard"), movies) == []
+        pipeline = Pipeline().search(path="title", query="star?", operator_name="wildcard", allow_analyzed_field=True)
+        assert _ids(pipeline, movies) == []
+        pipeline = Pipeline().search(path="title", query="w?rs", operator_name="wildcard", allow_analyzed_field=True)
+        assert _ids(pipeline, movies) == [1, 3]
+        assert _ids(Pipeline().search(path="genres", operator_name="equals", value="scifi"), movies) == [1, 2]
+        assert _ids(Pipeline().search(path="year", operator_name="range", gte=1978, lt=2007), movies) == [2, 3]
+        assert _ids(Pipeline().search(path="title", operator_name="exists"), movies) == [1, 2, 3, 4]
+
+    def test_in_near_phrase(self, movies: IndexedCollection) -> None:
+        """Test the in, near and phrase operators."""
+
+        assert _ids(Pipeline().search(path="genres", operator_name="in", value=["comedy", "fantasy"]), movies) == [3, 4]
+        assert _ids(Pipeline().search(path="year", operator_name="near", origin=1980, pivot=2), movies) == [2, 1, 3, 4]
+        pipeline = Pipeline().search(
+            path="location", operator_name="near", origin=GeoJSONPoint(coordinates=[-118.25, 34.05]), pivot=1000
+        ).set(score={"$meta": "searchScore"})
+        (output,) = evaluate(pipeline, movies)
+        assert output["score"] == pytest.approx(1000 / (1000 + 921), rel=0.01)
+        assert _ids(Pipeline().search(path="title", query="star wars", operator_name="phrase"), movies) == [1]
+        assert _ids(Pipeline().search(path="title", query="wars roses", operator_name="phrase"), movies) == []
+        assert _ids(Pipeline().search(path="title", query="wars roses", operator_name="phrase", slop=2), movies) == [3]
+
+    def test_compound(self, movies: IndexedCollection) -> None:
+        """Test that compound clauses are combined and that filters do not score."""
+
+        compound = Compound(
+            must=[Text(query="star", path="title")],
+            must_not=[Equals(path="year", value=1979)],
+            should=[Text(query="stardust", path="title", score={"boost": {"value": 3}})],
+            filter=[Range(path="year", gte=1970, lte=2010)],
+        )
+        assert _ids(Pipeline(stages=[Search(operator=compound)]), movies) == [1]
+
+        compound = Compound(should=[Text(query="stardust", path="title"), Text(query="star", path="title")])
+        assert _ids(Pipeline(stages=[Search(operator=compound)]), movies) == [4, 1, 2]
+
+        compound = Compound(should=[Text(query="wars", path="title"), Text(query="star", path="title")], minimum_should_match=2)
+        assert _ids(Pipeline(stages=[Search(operator=compound)]), movies) == [1]
+
+    def test_constant_score(self) -> None:
+        """Test that constant scores replace the computed ones."""
+
+        index = SearchIndex(MOVIES)
+        scores = index.evaluate({"text": {"query": "star", "path": "title", "score": {"constant": {"value": 5}}}})
+        assert scores == {0: 5, 1: 5}
+
+    def test_facets(self, movies: IndexedCollection) -> None:
+        """Test that facets are computed over the matching documents."""
+
+        facets = [
+            StringFacet(path="genres", num_buckets=1),
+            NumericFacet(path="year", boundaries=[1970, 1980, 1990], default="other"),
+            DateFacet(name="decades", path="released", boundaries=[datetime(1970, 1, 1), datetime(2000, 1, 1)]),
+        ]
+        pipeline = Pipeline().search_meta(
+            collector_name="facet", operator_name="text", path="title", query="star", facets=facets, count={"type": "total"}
+        )
+        (meta,) = evaluate(pipeline, movies)
+        assert meta == {
+            "count": {"total": 2},
+            "facet": {
+                "genres": {"buckets": [{"_id": "scifi", "count": 2}]},
+                "year": {
+                    "buckets": [{"_id": 1970, "count": 2}, {"_id": 1980, "count": 0}, {"_id": "other", "count": 0}]
+                },
+                "decades": {"buckets": [{"_id": datetime(1970, 1, 1), "count": 2}]},
+            },
+        }
+
+    def test_search_meta_variable(self, movies: IndexedCollection) -> None:
+        """Test that the metadata of $search results is available as $$SEARCH_META."""
+
+        pipeline = Pipeline().search(path="title", query="star").set(meta="$$SEARCH_META")
+        assert evaluate(pipeline, movies)[0]["meta"] == {"count": {"lowerBound": 2}}
+
+    def test_sort(self, movies: IndexedCollection) -> None:
+        """Test that the sort option orders the results by fields and score, documents without values sorting lowest."""
+
+        assert _ids(Pipeline().search(path="title", operator_name="exists", sort={"year": -1}), movies) == [4, 3, 2, 1]
+        pipeline = Pipeline().search(path="genres", query="scifi comedy", sort={"released": 1})
+        assert _ids(pipeline, movies) == [1, 2, 3]
+        pipeline = Pipeline().search(
+            path="title", query="star wars", sort={"score": {"$meta": "searchScore", "order": 1}}
+        )
+        assert _ids(pipeline, movies) == [3, 2, 1]
+        pipeline = Pipeline().search(operator_name="compound", sort={"year": {"order": 1, "noData": "highest"}})
+        assert _ids(pipeline, movies) == [1, 2, 3, 4, 5]
+
+    def test_pagination(self, movies: IndexedCollection) -> None:
+        """Test that searchSequenceToken references a result to paginate after or before."""
+
+        pipeline = Pipeline().search(path="title", operator_name="exists", sort={"year": 1}).limit(2)
+        page = evaluate(pipeline.set(token={"$meta": "searchSequenceToken"}), movies)
+        assert [document["_id"] for document in page] == [1, 2]
+
+        pipeline = Pipeline().search(path="title", operator_name="exists", sort={"year": 1}, after=page[-1]["token"])
+        assert _ids(pipeline.limit(2), movies) == [3, 4]
+        pipeline = Pipeline().search(path="title", operator_name="exists", sort={"year": 1}, before=page[-1]["token"])
+        assert _ids(pipeline, movies) == [1]
+        with pytest.raises(ValueError):
+            evaluate(Pipeline().search(path="title", operator_name="exists", after="not a token"), movies)
+
+    def test_unsupported(self, movies: IndexedCollection) -> None:
+        """Test that unsupported features and misplaced stages raise errors."""
+
+        with pytest.raises(NotImplementedError):
+            evaluate(Pipeline().search(path="title", query="star", synonyms="movies"), movies)
+        with pytest.raises(NotImplementedError):
+            evaluate(Pipeline().search(operator_name="more_like_this", like={"title": "star"}), movies)
+        with pytest.raises(ValueError):
+            evaluate(Pipeline().search(path="title", query="star", index="unknown"), movies)
+        with pytest.raises(ValueError):
+            evaluate(Pipeline().search(path="title", query="star"), MOVIES)
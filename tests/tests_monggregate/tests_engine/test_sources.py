@@ -0,0 +1,133 @@
+"""Tests for `monggregate.engine.sources` module."""
+
+import json
+import struct
+from datetime import datetime, timezone
+
+import pytest
+
+from monggregate.engine import evaluate
+from monggregate.engine.sources import (
+    BSONSource,
+    NDJSONSource,
+    open_source,
+    pushdown_fields,
+)
+
+
+def _encode(document: dict) -> bytes:
+    """Minimal BSON encoder supporting the types used in the tests"""
+
+    elements = b""
+    for key, value in document.items():
+        name = key.encode() + b"\x00"
+        if isinstance(value, bool):
+            elements += b"\x08" + name + (b"\x01" if value else b"\x00")
+        elif isinstance(value, int):
+            elements += b"\x10" + name + struct.pack("<i", value)
+        elif isinstance(value, float):
+            elements += b"\x01" + name + struct.pack("<d", value)
+        elif isinstance(value, str):
+            encoded = value.encode() + b"\x00"
+            elements += b"\x02" + name + struct.pack("<i", len(encoded)) + encoded
+        elif isinstance(value, dict):
+            elements += b"\x03" + name + _encode(value)
+        elif isinstance(value, list):
+            elements += b"\x04" + name + _encode({str(index): element for index, element in enumerate(value)})
+        elif value is None:
+            elements += b"\x0a" + name
+    return struct.pack("<i", len(elements) + 5) + elements + b"\x00"
+
+
+DOCUMENTS = [
+    {"_id": index, "customer": f"c{index % 2}", "amount": float(index), "details": {"tags": ["a", "b"]}, "active": index % 2 == 0}
+    for index in range(5)
+]
+
+
+@pytest.fixture
+def bson_file(tmp_path):
+    path = tmp_path / "orders.bson"
+    path.write_bytes(b"".join(_encode(document) for document in DOCUMENTS))
+    return path
+
+
+@pytest.fixture
+def ndjson_file(tmp_path):
+    path = tmp_path / "orders.json"
+    path.write_text("\n".join(json.dumps(document) for document in DOCUMENTS) + "\n")
+    return path
+
+
+class TestSources:
+    """Tests for the dataset sources."""
+
+    def test_bson(self, bson_file) -> None:
+        """Test that BSON files are decoded by batches."""
+
+        source = BSONSource(bson_file, batch_size=2)
+        assert [len(batch) for batch in source.batches()] == [2, 2, 1]
+        assert list(source) == DOCUMENTS
+
+    def test_ndjson(self, ndjson_file) -> None:
+        """Test that newline-delimited JSON files are decoded."""
+
+        assert list(open_source(ndjson_file)) == DOCUMENTS
+
+    def test_extended_json(self, tmp_path) -> None:
+        """Test that Extended JSON wrappers are converted."""
+
+        path = tmp_path / "dates.jsonl"
+        path.write_text('{"at": {"$date": "2024-01-01T00:00:00Z"}, "n": {"$numberLong": "3"}}\n')
+        assert list(NDJSONSource(path)) == [{"at": datetime(2024, 1, 1, tzinfo=timezone.utc), "n": 3}]
+
+    def test_projection(self, bson_file, ndjson_file) -> None:
+        """Test that sources only return the projected fields."""
+
+        for source in (BSONSource(bson_file), NDJSONSource(ndjson_file)):
+            assert list(source.project(["amount"]))[1] == {"amount": 1.0}
+
+    def test_empty_file(self, tmp_path) -> None:
+        """Test that empty files yield no documents."""
+
+        path = tmp_path / "empty.bson"
+        path.write_bytes(b"")
+        assert list(open_source(path)) == []
+
+    def test_unknown_extension(self, tmp_path) -> None:
+        """Test that unknown extensions raise an error."""
+
+        with pytest.raises(ValueError):
+            open_source(tmp_path / "orders.csv")
+
+
+class TestPushdownFields:
+    """Tests for `pushdown_fields` function."""
+
+    def test_group(self) -> None:
+        """Test that the fields used before a group are returned."""
+
+        pipeline = [
+            {"$match": {"active": True}},
+            {"$group": {"_id": "$customer", "total": {"$sum": "$amount"}}},
+        ]
+        assert pushdown_fields(pipeline) == {"_id", "active", "customer", "amount"}
+
+    def test_inclusion(self) -> None:
+        """Test that inclusion projections restrict the fields."""
+
+        assert pushdown_fields([{"$project": {"details.tags": 1}}]) == {"_id", "details"}
+
+    def test_whole_documents(self) -> None:
+        """Test that None is returned when the whole documents are needed."""
+
+        assert pushdown_fields([{"$match": {"active": True}}]) is None
+        assert pushdown_fields([{"$replaceRoot": {"newRoot": "$$ROOT"}}]) is None
+
+    def test_evaluation(self, bson_file) -> None:
+        """Test that pushed down sources give the same results."""
+
+        pipeline = [{"$group": {"_id": "$customer", "total": {"$sum": "$amount"}}}]
+        source = BSONSource(bson_file).for_pipeline(pipeline)
+        assert source.fields == {"_id", "customer", "amount"}
+        assert evaluate(pipeline, source) == evaluate(pipeline, DOCUMENTS)
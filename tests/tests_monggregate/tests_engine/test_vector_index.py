@@ -0,0 +1,131 @@
+"""Tests for `monggregate.engine.vector_index` module."""
+
+import random
+from array import array
+
+import pytest
+
+from monggregate.engine import evaluate
+from monggregate.engine.indexes import IndexedCollection
+from monggregate.engine.vector_index import VectorIndex
+from monggregate.pipeline import Pipeline
+from monggregate.vectors import BinaryVector, exact_search
+
+_random = random.Random(42)
+DOCUMENTS = [
+    {"_id": index, "genre": ["drama", "comedy"][index % 2], "embedding": [_random.gauss(0, 1) for _ in range(8)]}
+    for index in range(200)
+] + [{"_id": 200, "genre": "drama"}]
+QUERIES = [[_random.gauss(0, 1) for _ in range(8)] for _ in range(10)]
+
+
+def _ids(results: list) -> list[int]:
+    return [document["_id"] for _, document in results]
+
+
+class TestVectorIndex:
+    """Tests for `VectorIndex` class."""
+
+    @pytest.mark.parametrize("similarity", ["cosine", "dotProduct", "euclidean"])
+    def test_exact(self, similarity: str) -> None:
+        """Test that exact searches match a brute-force search, documents without vectors being ignored."""
+
+        index = VectorIndex(DOCUMENTS, "embedding", similarity=similarity)
+        assert len(index) == 200 and index.dimensions == 8
+        for query in QUERIES[:3]:
+            results = index.search(query, 5, exact=True)
+            expected = exact_search(DOCUMENTS, "embedding", query, 5, similarity=similarity)
+            assert _ids(results) == _ids(expected)
+            assert results[0][0] == pytest.approx(expected[0][0], abs=1e-5)
+
+    def test_filter(self) -> None:
+        """Test that the filter is applied before the search."""
+
+        for kind in ("flat", "hnsw"):
+            index = VectorIndex(DOCUMENTS, "embedding", kind=kind)
+            results = index.search(QUERIES[0], 10, num_candidates=50, filter={"genre": "comedy"})
+            assert len(results) == 10
+            assert all(document["genre"] == "comedy" for _, document in results)
+
+    def test_hnsw_recall(self) -> None:
+        """Test that the recall of graph searches increases with numCandidates."""
+
+        index = VectorIndex(DOCUMENTS, "embedding", kind="hnsw", m=4, ef_construction=20)
+
+        def recall(num_candidates: int) -> float:
+            found = 0
+            for query in QUERIES:
+                expected = set(_ids(index.search(query, 10, exact=True)))
+                found += len(expected.intersection(_ids(index.search(query, 10, num_candidates=num_candidates))))
+            return found / (10 * len(QUERIES))
+
+        assert recall(11) <= recall(50) <= recall(200)
+        assert recall(200) >= 0.95
+
+    def test_binary_vectors(self) -> None:
+        """Test that BinData vectors are indexed as their values."""
+
+        documents = [
+            {"_id": 1, "embedding": BinaryVector.from_buffer(array("f", [1.0, 0.0]))},
+            {"_id": 2, "embedding": [0.0, 1.0]},
+        ]
+        assert _ids(VectorIndex(documents, "embedding").search([0.9, 0.1], 1, exact=True)) == [1]
+
+    def test_invalid(self) -> None:
+        """Test that inconsistent vectors and options are rejected."""
+
+        with pytest.raises(ValueError):
+            VectorIndex([{"v": [1.0, 2.0]}, {"v": [1.0]}], "v")
+        with pytest.raises(ValueError):
+            VectorIndex(DOCUMENTS, "embedding", kind="ivf")  # type: ignore[arg-type]
+        with pytest.raises(ValueError):
+            VectorIndex(DOCUMENTS, "embedding").search(QUERIES[0], 10)
+
+
+class TestVectorSearchStage:
+    """Tests for the evaluation of $vectorSearch stages."""
+
+    @pytest.fixture
+    def movies(self) -> IndexedCollection:
+        collection = IndexedCollection(DOCUMENTS)
+        collection.create_vector_index("embedding", kind="hnsw")
+        return collection
+
+    def test_vector_search(self, movies: IndexedCollection) -> None:
+        """Test that a leading $vectorSearch uses the vector index and exposes the scores."""
+
+        pipeline = (
+            Pipeline()
+            .vector_search("vector_index", "embedding", QUERIES[0], 100, 3, filter={"genre": "drama"})
+            .project(include=["genre"])
+        )
+        output = evaluate(pipeline, movies)
+        assert [document["_id"] for document in output] == _ids(
+            movies.vector_indexes["vector_index"].search(QUERIES[0], 3, exact=True, filter={"genre": "drama"})
+        )
+
+        pipeline = Pipeline().vector_search("vector_index", "embedding", QUERIES[0], 100, 3).set(
+            score={"$meta": "vectorSearchScore"}
+        )
+        output = evaluate(pipeline, movies)
+        assert output[0]["score"] >= output[1]["score"] >= output[2]["score"]
+
+    def test_union_with(self, movies: IndexedCollection) -> None:
+        """Test that the vector indexes of the collections are used in $unionWith sub-pipelines."""
+
+        pipeline = Pipeline().vector_search_many("movies", "vector_index", "embedding", QUERIES[:2], 100, 5)
+        output = evaluate(pipeline, movies, collections={"movies": movies})
+        found = {document["_id"] for document in output}
+        for query in QUERIES[:2]:
+            assert found.issuperset(_ids(exact_search(DOCUMENTS, "embedding", query, 5)))
+        assert all(isinstance(document["query"], list) for document in output)
+
+    def test_invalid(self, movies: IndexedCollection) -> None:
+        """Test that $vectorSearch requires a vector index on the searched path."""
+
+        with pytest.raises(ValueError):
+            evaluate(Pipeline().vector_search("unknown", "embedding", QUERIES[0], 100, 3), movies)
+        with pytest.raises(ValueError):
+            evaluate(Pipeline().vector_search("vector_index", "other", QUERIES[0], 100, 3), movies)
+        with pytest.raises(ValueError):
+            evaluate(Pipeline().vector_search("vector_index", "embedding", QUERIES[0], 100, 3), DOCUMENTS)
@@ -0,0 +1,27 @@
+"""Tests for `monggregate.operators.accumulators.bottom` module."""
+
+import pytest
+from monggregate.operators.accumulators.bottom import Bottom, bottom
+
+
+class TestBottom:
+    """Tests for `Bottom` class."""
+
+    def test_instantiation(self) -> None:
+        """Test that `Bottom` class can be instantiated."""
+        operator = Bottom(sort_by={"score": -1}, output=["$playerId", "$score"])
+        assert isinstance(operator, Bottom)
+
+    def test_expression(self) -> None:
+        """Test that `Bottom` class returns the correct expression."""
+        operator = bottom({"score": -1}, ["$playerId", "$score"])
+        assert operator.expression == {
+            "$bottom": {"sortBy": {"score": -1}, "output": ["$playerId", "$score"]}
+        }
+
+    def test_invalid_sort_by(self) -> None:
+        """Test that `Bottom` class rejects invalid sort orders."""
+        with pytest.raises(ValueError):
+            bottom({}, "$playerId")
+        with pytest.raises(ValueError):
+            bottom({"score": 2}, "$playerId")
@@ -0,0 +1,32 @@
+"""Tests for `monggregate.operators.accumulators.bottom_n` module."""
+
+import pytest
+from monggregate.operators.accumulators.bottom_n import BottomN, bottom_n
+
+
+class TestBottomN:
+    """Tests for `BottomN` class."""
+
+    def test_instantiation(self) -> None:
+        """Test that `BottomN` class can be instantiated."""
+        operator = BottomN(n=3, sort_by={"score": -1}, output=["$playerId", "$score"])
+        assert isinstance(operator, BottomN)
+
+    def test_expression(self) -> None:
+        """Test that `BottomN` class returns the correct expression."""
+        operator = bottom_n(3, {"score": -1}, ["$playerId", "$score"])
+        assert operator.expression == {
+            "$bottomN": {"n": 3, "sortBy": {"score": -1}, "output": ["$playerId", "$score"]}
+        }
+
+    def test_invalid_sort_by(self) -> None:
+        """Test that `BottomN` class rejects invalid sort orders."""
+        with pytest.raises(ValueError):
+            bottom_n(3, {}, "$playerId")
+        with pytest.raises(ValueError):
+            bottom_n(3, {"score": 2}, "$playerId")
+
+    def test_invalid_n(self) -> None:
+        """Test that `BottomN` class rejects non positive n."""
+        with pytest.raises(ValueError):
+            bottom_n(0, {"score": -1}, "$playerId")
@@ -0,0 +1,27 @@
+"""Tests for `monggregate.operators.accumulators.first_n` module."""
+
+import pytest
+from monggregate.operators.accumulators.first_n import FirstN, first_n
+
+
+class TestFirstN:
+    """Tests for `FirstN` class."""
+
+    def test_instantiation(self) -> None:
+        """Test that `FirstN` class can be instantiated."""
+        operator = FirstN(input="$score", n=3)
+        assert isinstance(operator, FirstN)
+
+    def test_expression(self) -> None:
+        """Test that `FirstN` class returns the correct expression."""
+        operator = first_n("$score", 3)
+        assert operator.expression == {"$firstN": {"input": "$score", "n": 3}}
+
+    def test_n(self) -> None:
+        """Test that n can be an expression but not a non positive integer."""
+        operator = first_n("$score", {"$cond": {"if": {"$eq": ["$gameId", "G2"]}, "then": 1, "else": 3}})
+        assert operator.expression["$firstN"]["n"]["$cond"]["then"] == 1
+        with pytest.raises(ValueError):
+            first_n("$score", 0)
+        with pytest.raises(ValueError):
+            first_n("$score", 1.5)
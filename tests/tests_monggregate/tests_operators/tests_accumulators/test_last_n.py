@@ -0,0 +1,27 @@
+"""Tests for `monggregate.operators.accumulators.last_n` module."""
+
+import pytest
+from monggregate.operators.accumulators.last_n import LastN, last_n
+
+
+class TestLastN:
+    """Tests for `LastN` class."""
+
+    def test_instantiation(self) -> None:
+        """Test that `LastN` class can be instantiated."""
+        operator = LastN(input="$score", n=3)
+        assert isinstance(operator, LastN)
+
+    def test_expression(self) -> None:
+        """Test that `LastN` class returns the correct expression."""
+        operator = last_n("$score", 3)
+        assert operator.expression == {"$lastN": {"input": "$score", "n": 3}}
+
+    def test_n(self) -> None:
+        """Test that n can be an expression but not a non positive integer."""
+        operator = last_n("$score", {"$cond": {"if": {"$eq": ["$gameId", "G2"]}, "then": 1, "else": 3}})
+        assert operator.expression["$lastN"]["n"]["$cond"]["then"] == 1
+        with pytest.raises(ValueError):
+            last_n("$score", 0)
+        with pytest.raises(ValueError):
+            last_n("$score", 1.5)
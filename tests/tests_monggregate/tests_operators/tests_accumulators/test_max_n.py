@@ -0,0 +1,27 @@
+"""Tests for `monggregate.operators.accumulators.max_n` module."""
+
+import pytest
+from monggregate.operators.accumulators.max_n import MaxN, max_n
+
+
+class TestMaxN:
+    """Tests for `MaxN` class."""
+
+    def test_instantiation(self) -> None:
+        """Test that `MaxN` class can be instantiated."""
+        operator = MaxN(input="$score", n=3)
+        assert isinstance(operator, MaxN)
+
+    def test_expression(self) -> None:
+        """Test that `MaxN` class returns the correct expression."""
+        operator = max_n("$score", 3)
+        assert operator.expression == {"$maxN": {"input": "$score", "n": 3}}
+
+    def test_n(self) -> None:
+        """Test that n can be an expression but not a non positive integer."""
+        operator = max_n("$score", {"$cond": {"if": {"$eq": ["$gameId", "G2"]}, "then": 1, "else": 3}})
+        assert operator.expression["$maxN"]["n"]["$cond"]["then"] == 1
+        with pytest.raises(ValueError):
+            max_n("$score", 0)
+        with pytest.raises(ValueError):
+            max_n("$score", 1.5)
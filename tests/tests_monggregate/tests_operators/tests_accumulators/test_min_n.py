@@ -0,0 +1,27 @@
+"""Tests for `monggregate.operators.accumulators.min_n` module."""
+
+import pytest
+from monggregate.operators.accumulators.min_n import MinN, min_n
+
+
+class TestMinN:
+    """Tests for `MinN` class."""
+
+    def test_instantiation(self) -> None:
+        """Test that `MinN` class can be instantiated."""
+        operator = MinN(input="$score", n=3)
+        assert isinstance(operator, MinN)
+
+    def test_expression(self) -> None:
+        """Test that `MinN` class returns the correct expression."""
+        operator = min_n("$score", 3)
+        assert operator.expression == {"$minN": {"input": "$score", "n": 3}}
+
+    def test_n(self) -> None:
+        """Test that n can be an expression but not a non positive integer."""
+        operator = min_n("$score", {"$cond": {"if": {"$eq": ["$gameId", "G2"]}, "then": 1, "else": 3}})
+        assert operator.expression["$minN"]["n"]["$cond"]["then"] == 1
+        with pytest.raises(ValueError):
+            min_n("$score", 0)
+        with pytest.raises(ValueError):
+            min_n("$score", 1.5)
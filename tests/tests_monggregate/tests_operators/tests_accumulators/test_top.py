@@ -0,0 +1,27 @@
+"""Tests for `monggregate.operators.accumulators.top` module."""
+
+import pytest
+from monggregate.operators.accumulators.top import Top, top
+
+
+class TestTop:
+    """Tests for `Top` class."""
+
+    def test_instantiation(self) -> None:
+        """Test that `Top` class can be instantiated."""
+        operator = Top(sort_by={"score": -1}, output=["$playerId", "$score"])
+        assert isinstance(operator, Top)
+
+    def test_expression(self) -> None:
+        """Test that `Top` class returns the correct expression."""
+        operator = top({"score": -1}, ["$playerId", "$score"])
+        assert operator.expression == {
+            "$top": {"sortBy": {"score": -1}, "output": ["$playerId", "$score"]}
+        }
+
+    def test_invalid_sort_by(self) -> None:
+        """Test that `Top` class rejects invalid sort orders."""
+        with pytest.raises(ValueError):
+            top({}, "$playerId")
+        with pytest.raises(ValueError):
+            top({"score": 2}, "$playerId")
@@ -0,0 +1,32 @@
+"""Tests for `monggregate.operators.accumulators.top_n` module."""
+
+import pytest
+from monggregate.operators.accumulators.top_n import TopN, top_n
+
+
+class TestTopN:
+    """Tests for `TopN` class."""
+
+    def test_instantiation(self) -> None:
+        """Test that `TopN` class can be instantiated."""
+        operator = TopN(n=3, sort_by={"score": -1}, output=["$playerId", "$score"])
+        assert isinstance(operator, TopN)
+
+    def test_expression(self) -> None:
+        """Test that `TopN` class returns the correct expression."""
+        operator = top_n(3, {"score": -1}, ["$playerId", "$score"])
+        assert operator.expression == {
+            "$topN": {"n": 3, "sortBy": {"score": -1}, "output": ["$playerId", "$score"]}
+        }
+
+    def test_invalid_sort_by(self) -> None:
+        """Test that `TopN` class rejects invalid sort orders."""
+        with pytest.raises(ValueError):
+            top_n(3, {}, "$playerId")
+        with pytest.raises(ValueError):
+            top_n(3, {"score": 2}, "$playerId")
+
+    def test_invalid_n(self) -> None:
+        """Test that `TopN` class rejects non positive n."""
+        with pytest.raises(ValueError):
+            top_n(0, {"score": -1}, "$playerId")
@@ -0,0 +1,10 @@
+"""Tests for `monggregate.operators.set_` subpackage."""
+
+from monggregate.operators.set_.all_elements_true import AllElementsTrue
+from monggregate.operators.set_.any_element_true import AnyElementTrue
+from monggregate.operators.set_.set_ import SetOperator
+from monggregate.operators.set_.set_difference import SetDifference
+from monggregate.operators.set_.set_equals import SetEquals
+from monggregate.operators.set_.set_intersection import SetIntersection
+from monggregate.operators.set_.set_is_subset import SetIsSubset
+from monggregate.operators.set_.set_union import SetUnion
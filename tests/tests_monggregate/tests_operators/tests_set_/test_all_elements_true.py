@@ -0,0 +1,17 @@
+"""Tests for `monggregate.operators.set_.all_elements_true` module."""
+
+from monggregate.operators.set_.all_elements_true import AllElementsTrue, all_elements_true
+
+
+class TestAllElementsTrue:
+    """Tests for `AllElementsTrue` class."""
+
+    def test_instantiation(self) -> None:
+        """Test that `AllElementsTrue` class can be instantiated."""
+        operator = AllElementsTrue(operand="$responses")
+        assert isinstance(operator, AllElementsTrue)
+
+    def test_expression(self) -> None:
+        """Test that `AllElementsTrue` class returns the correct expression."""
+        operator = all_elements_true("$responses")
+        assert operator.expression == {"$allElementsTrue": ["$responses"]}
@@ -0,0 +1,17 @@
+"""Tests for `monggregate.operators.set_.any_element_true` module."""
+
+from monggregate.operators.set_.any_element_true import AnyElementTrue, any_element_true
+
+
+class TestAnyElementTrue:
+    """Tests for `AnyElementTrue` class."""
+
+    def test_instantiation(self) -> None:
+        """Test that `AnyElementTrue` class can be instantiated."""
+        operator = AnyElementTrue(operand="$responses")
+        assert isinstance(operator, AnyElementTrue)
+
+    def test_expression(self) -> None:
+        """Test that `AnyElementTrue` class returns the correct expression."""
+        operator = any_element_true("$responses")
+        assert operator.expression == {"$anyElementTrue": ["$responses"]}
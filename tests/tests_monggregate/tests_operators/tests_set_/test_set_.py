@@ -0,0 +1,35 @@
+"""Tests for `monggregate.operators.set_.set_` module."""
+
+import pytest
+
+from monggregate.operators.set_.set_ import SetOperator, SetOperatorEnum
+from tests.utils import generate_enum_member_name
+
+
+class TestSetOperator:
+    """Tests for the `SetOperator` class."""
+
+    def test_is_abstract(self) -> None:
+        """Test that `SetOperator` is an abstract class."""
+        with pytest.raises(TypeError):
+            SetOperator()
+
+
+class TestSetOperatorEnum:
+    """Tests for the `SetOperatorEnum` class."""
+
+    def test_naming_convention(self) -> None:
+        """Test that the naming convention is correct."""
+        mismatches = []
+
+        for member in SetOperatorEnum:
+            expected_name = generate_enum_member_name(member.value)
+            if member.name != expected_name:
+                mismatches.append(
+                    f"\n- {member.name}: got '{member.name}', expected '{expected_name}'"
+                )
+
+        assert not mismatches, (
+            "The following members do not follow the naming convention:"
+            f"{''.join(mismatches)}"
+        )
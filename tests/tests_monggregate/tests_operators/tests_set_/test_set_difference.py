@@ -0,0 +1,17 @@
+"""Tests for `monggregate.operators.set_.set_difference` module."""
+
+from monggregate.operators.set_.set_difference import SetDifference, set_difference
+
+
+class TestSetDifference:
+    """Tests for `SetDifference` class."""
+
+    def test_instantiation(self) -> None:
+        """Test that `SetDifference` class can be instantiated."""
+        operator = SetDifference(left="$A", right="$B")
+        assert isinstance(operator, SetDifference)
+
+    def test_expression(self) -> None:
+        """Test that `SetDifference` class returns the correct expression."""
+        operator = set_difference("$A", ["red", "blue"])
+        assert operator.expression == {"$setDifference": ["$A", ["red", "blue"]]}
@@ -0,0 +1,24 @@
+"""Tests for `monggregate.operators.set_.set_equals` module."""
+
+import pytest
+
+from monggregate.operators.set_.set_equals import SetEquals, set_equals
+
+
+class TestSetEquals:
+    """Tests for `SetEquals` class."""
+
+    def test_instantiation(self) -> None:
+        """Test that `SetEquals` class can be instantiated."""
+        operator = SetEquals(operands=["$A", "$B"])
+        assert isinstance(operator, SetEquals)
+
+    def test_expression(self) -> None:
+        """Test that `SetEquals` class returns the correct expression."""
+        operator = set_equals("$A", "$B", ["red"])
+        assert operator.expression == {"$setEquals": ["$A", "$B", ["red"]]}
+
+    def test_requires_two_arrays(self) -> None:
+        """Test that `SetEquals` class requires at least two arrays."""
+        with pytest.raises(ValueError):
+            set_equals("$A")
@@ -0,0 +1,17 @@
+"""Tests for `monggregate.operators.set_.set_intersection` module."""
+
+from monggregate.operators.set_.set_intersection import SetIntersection, set_intersection
+
+
+class TestSetIntersection:
+    """Tests for `SetIntersection` class."""
+
+    def test_instantiation(self) -> None:
+        """Test that `SetIntersection` class can be instantiated."""
+        operator = SetIntersection(operands=["$A", "$B"])
+        assert isinstance(operator, SetIntersection)
+
+    def test_expression(self) -> None:
+        """Test that `SetIntersection` class returns the correct expression."""
+        operator = set_intersection("$A", "$B", ["red"])
+        assert operator.expression == {"$setIntersection": ["$A", "$B", ["red"]]}
@@ -0,0 +1,17 @@
+"""Tests for `monggregate.operators.set_.set_is_subset` module."""
+
+from monggregate.operators.set_.set_is_subset import SetIsSubset, set_is_subset
+
+
+class TestSetIsSubset:
+    """Tests for `SetIsSubset` class."""
+
+    def test_instantiation(self) -> None:
+        """Test that `SetIsSubset` class can be instantiated."""
+        operator = SetIsSubset(left="$A", right="$B")
+        assert isinstance(operator, SetIsSubset)
+
+    def test_expression(self) -> None:
+        """Test that `SetIsSubset` class returns the correct expression."""
+        operator = set_is_subset("$A", ["red", "blue"])
+        assert operator.expression == {"$setIsSubset": ["$A", ["red", "blue"]]}
@@ -0,0 +1,17 @@
+"""Tests for `monggregate.operators.set_.set_union` module."""
+
+from monggregate.operators.set_.set_union import SetUnion, set_union
+
+
+class TestSetUnion:
+    """Tests for `SetUnion` class."""
+
+    def test_instantiation(self) -> None:
+        """Test that `SetUnion` class can be instantiated."""
+        operator = SetUnion(operands=["$A", "$B"])
+        assert isinstance(operator, SetUnion)
+
+    def test_expression(self) -> None:
+        """Test that `SetUnion` class returns the correct expression."""
+        operator = set_union("$A", "$B", ["red"])
+        assert operator.expression == {"$setUnion": ["$A", "$B", ["red"]]}
@@ -0,0 +1 @@
+"""Tests for `monggregate.operators.window` subpackage."""
@@ -0,0 +1,16 @@
+"""Tests for `monggregate.operators.window.dense_rank` module."""
+
+from monggregate.operators.window.dense_rank import DenseRank, dense_rank
+
+
+class TestDenseRank:
+    """Tests for `DenseRank` class."""
+
+    def test_instantiation(self) -> None:
+        """Test that `DenseRank` class can be instantiated."""
+        dense_rank_op = dense_rank()
+        assert isinstance(dense_rank_op, DenseRank)
+
+    def test_expression(self) -> None:
+        """Test that `DenseRank` class returns the correct expression."""
+        assert DenseRank().expression == {"$denseRank": {}}
@@ -0,0 +1,21 @@
+"""Tests for `monggregate.operators.window.derivative` module."""
+
+from monggregate.operators.window.derivative import Derivative, derivative
+
+
+class TestDerivative:
+    """Tests for `Derivative` class."""
+
+    def test_instantiation(self) -> None:
+        """Test that `Derivative` class can be instantiated."""
+        derivative_op = derivative("$miles")
+        assert isinstance(derivative_op, Derivative)
+
+    def test_expression(self) -> None:
+        """Test that `Derivative` class returns the correct expression."""
+        derivative_op = Derivative(input="$miles", unit="hour")
+        assert derivative_op.expression == {"$derivative": {"input": "$miles", "unit": "hour"}}
+
+    def test_expression_without_unit(self) -> None:
+        """Test that the unit is omitted when not provided."""
+        assert Derivative(input="$miles").expression == {"$derivative": {"input": "$miles"}}
@@ -0,0 +1,28 @@
+"""Tests for `monggregate.operators.window.exp_moving_avg` module."""
+
+import pytest
+
+from monggregate.operators.window.exp_moving_avg import ExpMovingAvg, exp_moving_avg
+
+
+class TestExpMovingAvg:
+    """Tests for `ExpMovingAvg` class."""
+
+    def test_instantiation(self) -> None:
+        """Test that `ExpMovingAvg` class can be instantiated."""
+        exp_moving_avg_op = exp_moving_avg("$price", n=2)
+        assert isinstance(exp_moving_avg_op, ExpMovingAvg)
+
+    def test_expression(self) -> None:
+        """Test that `ExpMovingAvg` class returns the correct expression."""
+        assert ExpMovingAvg(input="$price", N=2).expression == {"$expMovingAvg": {"input": "$price", "N": 2}}
+        assert ExpMovingAvg(input="$price", alpha=0.75).expression == {
+            "$expMovingAvg": {"input": "$price", "alpha": 0.75}
+        }
+
+    def test_n_or_alpha(self) -> None:
+        """Test that exactly one of n and alpha must be provided."""
+        with pytest.raises(ValueError):
+            ExpMovingAvg(input="$price")
+        with pytest.raises(ValueError):
+            ExpMovingAvg(input="$price", n=2, alpha=0.5)
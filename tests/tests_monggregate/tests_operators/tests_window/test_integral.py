@@ -0,0 +1,21 @@
+"""Tests for `monggregate.operators.window.integral` module."""
+
+from monggregate.operators.window.integral import Integral, integral
+
+
+class TestIntegral:
+    """Tests for `Integral` class."""
+
+    def test_instantiation(self) -> None:
+        """Test that `Integral` class can be instantiated."""
+        integral_op = integral("$miles")
+        assert isinstance(integral_op, Integral)
+
+    def test_expression(self) -> None:
+        """Test that `Integral` class returns the correct expression."""
+        integral_op = Integral(input="$miles", unit="hour")
+        assert integral_op.expression == {"$integral": {"input": "$miles", "unit": "hour"}}
+
+    def test_expression_without_unit(self) -> None:
+        """Test that the unit is omitted when not provided."""
+        assert Integral(input="$miles").expression == {"$integral": {"input": "$miles"}}
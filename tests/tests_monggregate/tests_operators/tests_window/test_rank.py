@@ -0,0 +1,16 @@
+"""Tests for `monggregate.operators.window.rank` module."""
+
+from monggregate.operators.window.rank import Rank, rank
+
+
+class TestRank:
+    """Tests for `Rank` class."""
+
+    def test_instantiation(self) -> None:
+        """Test that `Rank` class can be instantiated."""
+        rank_op = rank()
+        assert isinstance(rank_op, Rank)
+
+    def test_expression(self) -> None:
+        """Test that `Rank` class returns the correct expression."""
+        assert Rank().expression == {"$rank": {}}
@@ -0,0 +1,23 @@
+"""Tests for `monggregate.operators.window.shift` module."""
+
+from monggregate.operators.window.shift import Shift, shift
+
+
+class TestShift:
+    """Tests for `Shift` class."""
+
+    def test_instantiation(self) -> None:
+        """Test that `Shift` class can be instantiated."""
+        shift_op = shift("$quantity", by=-1)
+        assert isinstance(shift_op, Shift)
+
+    def test_expression(self) -> None:
+        """Test that `Shift` class returns the correct expression."""
+        assert Shift(output="$quantity", by=1).expression == {"$shift": {"output": "$quantity", "by": 1}}
+
+    def test_expression_with_default(self) -> None:
+        """Test that the default value is included when provided."""
+        shift_op = Shift(output="$quantity", by=-1, default="Not available")
+        assert shift_op.expression == {
+            "$shift": {"output": "$quantity", "by": -1, "default": "Not available"}
+        }
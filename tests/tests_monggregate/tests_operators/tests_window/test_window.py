@@ -0,0 +1,35 @@
+"""Tests for `monggregate.operators.window.window` module."""
+
+import pytest
+
+from monggregate.operators.window.window import WindowOperator, WindowOperatorEnum
+from tests.utils import generate_enum_member_name
+
+
+class TestWindowOperator:
+    """Tests for the `WindowOperator` class."""
+
+    def test_is_abstract(self) -> None:
+        """Test that `WindowOperator` is an abstract class."""
+        with pytest.raises(TypeError):
+            WindowOperator()
+
+
+class TestWindowOperatorEnum:
+    """Tests for the `WindowOperatorEnum` class."""
+
+    def test_naming_convention(self) -> None:
+        """Test that the naming convention is correct."""
+        mismatches = []
+
+        for member in WindowOperatorEnum:
+            expected_name = generate_enum_member_name(member.value)
+            if member.name != expected_name:
+                mismatches.append(
+                    f"\n- {member.name}: got '{member.name}', expected '{expected_name}'"
+                )
+
+        assert not mismatches, (
+            "The following members do not follow the naming convention:"
+            f"{''.join(mismatches)}"
+        )
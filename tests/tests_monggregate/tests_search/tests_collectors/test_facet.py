@@ -72,3 +72,35 @@ class TestFacet:
         assert isinstance(facet.operator, Wildcard)
         assert facet.operator.query == "test"
         assert facet.operator.path == "field"
+
+    def test_init_in(self) -> None:
+        """Test that `init_in` creates a facet with an in operator."""
+        from monggregate.search.operators import In
+
+        facet = Facet.init_in(path="field", value=["a", "b"])
+        assert isinstance(facet.operator, In)
+        assert facet.operator.value == ["a", "b"]
+
+    def test_init_near(self) -> None:
+        """Test that `init_near` creates a facet with a near operator."""
+        from monggregate.search.operators import Near
+
+        facet = Facet.init_near(path="field", origin=10, pivot=2)
+        assert isinstance(facet.operator, Near)
+        assert facet.operator.pivot == 2
+
+    def test_init_phrase(self) -> None:
+        """Test that `init_phrase` creates a facet with a phrase operator."""
+        from monggregate.search.operators import Phrase
+
+        facet = Facet.init_phrase(query="test phrase", path="field", slop=1)
+        assert isinstance(facet.operator, Phrase)
+        assert facet.operator.slop == 1
+
+    def test_init_query_string(self) -> None:
+        """Test that `init_query_string` creates a facet with a queryString operator."""
+        from monggregate.search.operators import QueryString
+
+        facet = Facet.init_query_string(default_path="field", query="a OR b")
+        assert isinstance(facet.operator, QueryString)
+        assert facet.operator.default_path == "field"
@@ -0,0 +1,98 @@
+"""Tests for `monggregate.search.commons.stored_source` module."""
+
+import pytest
+
+from monggregate.pipeline import Pipeline
+from monggregate.search.commons.stored_source import StoredSource, referenced_fields, uncovered_fields
+
+
+class TestStoredSource:
+    """Tests for the `StoredSource` class."""
+
+    def test_expression(self) -> None:
+        """Test that the storedSource definition is exported."""
+
+        assert StoredSource(include=["title"]).expression == {"include": ["title"]}
+        assert StoredSource(exclude=["plot"]).expression == {"exclude": ["plot"]}
+
+    def test_include_or_exclude(self) -> None:
+        """Test that exactly one of include and exclude is required."""
+
+        with pytest.raises(ValueError):
+            StoredSource()
+        with pytest.raises(ValueError):
+            StoredSource(include=["title"], exclude=["plot"])
+
+    def test_covers(self) -> None:
+        """Test that a path is covered by its stored parents, and not by partially stored ones."""
+
+        stored_source = StoredSource(include=["title", "awards.wins"])
+        assert stored_source.covers("_id")
+        assert stored_source.covers("awards.wins")
+        assert not stored_source.covers("awards")
+        assert not stored_source.covers("$$ROOT")
+
+        stored_source = StoredSource(exclude=["awards.wins"])
+        assert stored_source.covers("title")
+        assert not stored_source.covers("awards")
+        assert not stored_source.covers("awards.wins.count")
+
+
+class TestFieldReferences:
+    """Tests for the analysis of the stages following $search."""
+
+    def test_referenced_fields(self) -> None:
+        """Test that the fields referenced up to the first reshaping stage are returned."""
+
+        pipeline = (
+            Pipeline()
+            .match(query={"$or": [{"year": 2000}, {"$expr": {"$gt": ["$rating", 8]}}]})
+            .sort(by="released", descending=True)
+            .set(decade={"$floor": {"$divide": ["$year", 10]}}, label={"$literal": "$not_a_field"})
+            .match(decade=200)
+            .limit(10)
+            .project(title=1, score={"$meta": "searchScore"}, writers="$crew.writers")
+            .match(unreachable=True)
+        )
+        assert referenced_fields(pipeline.export()) == ["year", "rating", "released", "title", "crew.writers"]
+
+    def test_group(self) -> None:
+        """Test that references to the whole document are returned as is."""
+
+        pipeline = Pipeline().group(by="$genre", query={"votes": {"$sum": "$$ROOT.votes"}, "movies": {"$push": "$$ROOT"}})
+        assert sorted(referenced_fields(pipeline.export())) == ["$$ROOT", "genre", "votes"]
+
+    def test_unknown_stage(self) -> None:
+        """Test that the analysis stops at stages it does not handle."""
+
+        pipeline = Pipeline().match(year=2000).unwind(path="genres").match(genres="drama")
+        assert referenced_fields(pipeline.export()) == ["year"]
+
+    def test_uncovered_fields(self) -> None:
+        """Test that the fields not stored in the index are returned."""
+
+        stages = Pipeline().match(year=2000).project(include=["title", "plot"]).export()
+        assert uncovered_fields(stages, ["title", "year"]) == ["plot"]
+        assert uncovered_fields(stages, StoredSource(exclude=["plot"])) == ["plot"]
+        assert uncovered_fields(stages, True) == []
+        assert sorted(uncovered_fields(stages, False)) == ["plot", "title", "year"]
+
+
+class TestCheckStoredSource:
+    """Tests for `Pipeline.check_stored_source`."""
+
+    def test_warning(self) -> None:
+        """Test that a warning is raised only when the stored source is returned."""
+
+        pipeline = Pipeline().search(path="title", query="matrix", return_stored_source=True).project(include=["plot"])
+        with pytest.warns(UserWarning):
+            assert pipeline.check_stored_source(["title"]) == ["plot"]
+
+        pipeline = Pipeline().search(path="title", query="matrix").project(include=["plot"])
+        assert pipeline.check_stored_source(["title"]) == ["plot"]
+
+    def test_without_search(self) -> None:
+        """Test that the pipeline must start with a search stage."""
+
+        with pytest.raises(TypeError):
+            Pipeline().match(year=2000).check_stored_source(["year"])
@@ -0,0 +1,50 @@
+"""Tests for `monggregate.search.operators.in_` module."""
+
+import pytest
+
+from monggregate.search.operators.compound import Compound
+from monggregate.search.operators.in_ import In
+
+
+def test_in_expression() -> None:
+    """Tests that the in expression is correct."""
+
+    # Setup
+    in_op = In(path="genres", value=["action", "comedy"], score={"boost": {"value": 2}})
+
+    expected_expression = {
+        "in": {
+            "path": "genres",
+            "value": ["action", "comedy"],
+            "score": {"boost": {"value": 2}},
+        }
+    }
+
+    # Act
+    actual_expression = in_op.expression
+
+    # Assert
+    assert actual_expression == expected_expression
+
+
+def test_in_values_validation() -> None:
+    """Tests that the values must be of the same type, numbers being of the same type."""
+
+    assert In(path="year", value=[1977, 1979.5]).value == [1977, 1979.5]
+    with pytest.raises(ValueError):
+        In(path="year", value=[])
+    with pytest.raises(ValueError):
+        In(path="year", value=[1977, "1979"])
+    with pytest.raises(ValueError):
+        In(path="year", value=[1, True])
+
+
+def test_in_compound_clause() -> None:
+    """Tests that in clauses are kept as such in compound operators."""
+
+    compound = Compound().in_("filter", path="genres", value=["action", "comedy"])
+
+    assert isinstance(compound.filter[0], In)
+    assert compound.expression == {
+        "compound": {"filter": [{"in": {"path": "genres", "value": ["action", "comedy"], "score": None}}]}
+    }
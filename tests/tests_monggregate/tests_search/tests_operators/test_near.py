@@ -0,0 +1,40 @@
+"""Tests for `monggregate.search.operators.near` module."""
+
+from datetime import datetime
+
+import pytest
+
+from monggregate.geo import GeoJSONPoint
+from monggregate.search.operators.near import Near
+
+
+def test_near_expression_with_number() -> None:
+    """Tests that the near expression is correct with a numeric origin."""
+
+    # Setup
+    near_op = Near(path="runtime", origin=279, pivot=2)
+
+    expected_expression = {"near": {"path": "runtime", "origin": 279, "pivot": 2, "score": None}}
+
+    # Act
+    actual_expression = near_op.expression
+
+    # Assert
+    assert actual_expression == expected_expression
+
+
+def test_near_expression_with_date_and_point() -> None:
+    """Tests that dates and GeoJSON points are accepted as origins."""
+
+    near_op = Near(path="released", origin=datetime(1915, 9, 13), pivot=7776000000)
+    assert near_op.expression["near"]["origin"] == datetime(1915, 9, 13)
+
+    near_op = Near(path="address.location", origin=GeoJSONPoint(coordinates=[-8.61, 41.15]), pivot=1000)
+    assert near_op.expression["near"]["origin"] == {"type": "Point", "coordinates": [-8.61, 41.15]}
+
+
+def test_near_pivot_validation() -> None:
+    """Tests that the pivot must be positive."""
+
+    with pytest.raises(ValueError):
+        Near(path="runtime", origin=279, pivot=0)
@@ -0,0 +1,27 @@
+"""Tests for `monggregate.search.operators.phrase` module."""
+
+import pytest
+
+from monggregate.search.operators.phrase import Phrase
+
+
+def test_phrase_expression() -> None:
+    """Tests that the phrase expression is correct."""
+
+    # Setup
+    phrase_op = Phrase(query="men women", path="title", slop=5)
+
+    expected_expression = {"phrase": {"query": "men women", "path": "title", "slop": 5}}
+
+    # Act
+    actual_expression = phrase_op.expression
+
+    # Assert
+    assert actual_expression == expected_expression
+
+
+def test_phrase_slop_validation() -> None:
+    """Tests that the slop cannot be negative."""
+
+    with pytest.raises(ValueError):
+        Phrase(query="men women", path="title", slop=-1)
@@ -0,0 +1,24 @@
+"""Tests for `monggregate.search.operators.query_string` module."""
+
+from monggregate.search.operators.query_string import QueryString
+
+
+def test_query_string_expression() -> None:
+    """Tests that the queryString expression is correct."""
+
+    # Setup
+    query_string_op = QueryString(default_path="title", query="Rocky AND (IV OR 4 OR Four)")
+
+    expected_expression = {
+        "queryString": {
+            "defaultPath": "title",
+            "query": "Rocky AND (IV OR 4 OR Four)",
+            "score": None,
+        }
+    }
+
+    # Act
+    actual_expression = query_string_op.expression
+
+    # Assert
+    assert actual_expression == expected_expression
@@ -0,0 +1,50 @@
+"""Tests for the Densify stage."""
+
+import pytest
+from monggregate.stages import Densify, DensifyRange
+
+
+class TestDensify:
+    """Tests for the Densify stage."""
+
+    def test_instantiation(self) -> None:
+        """Test that the Densify stage can be instantiated correctly."""
+
+        densify = Densify(field="altitude", range=DensifyRange(step=200))
+        assert isinstance(densify, Densify)
+
+    def test_expression(self) -> None:
+        """Test that the expression method returns the correct expression."""
+
+        densify = Densify(field="altitude", range={"step": 200, "bounds": [0, 1000]})
+        assert densify.expression == {
+            "$densify": {"field": "altitude", "range": {"step": 200, "bounds": [0, 1000]}}
+        }
+
+    def test_expression_with_partitions(self) -> None:
+        """Test that the expression method returns the correct expression with partitions and a unit."""
+
+        densify = Densify(
+            field="timestamp",
+            partition_by_fields=["sensor"],
+            range=DensifyRange(step=1, unit="hour", bounds="partition"),
+        )
+        assert densify.expression == {
+            "$densify": {
+                "field": "timestamp",
+                "partitionByFields": ["sensor"],
+                "range": {"step": 1, "unit": "hour", "bounds": "partition"},
+            }
+        }
+
+    def test_invalid_range(self) -> None:
+        """Test that invalid ranges are rejected."""
+
+        with pytest.raises(ValueError):
+            DensifyRange(step=0)
+        with pytest.raises(ValueError):
+            DensifyRange(step=1.5, unit="day")
+        with pytest.raises(ValueError):
+            DensifyRange(step=1, bounds=[0])
+        with pytest.raises(ValueError):
+            Densify(field="timestamp", range=DensifyRange(step=1, unit="day", bounds="partition"))
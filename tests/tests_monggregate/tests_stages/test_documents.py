@@ -0,0 +1,60 @@
+"""Tests for the Documents stage."""
+
+import pytest
+from monggregate.pipeline import Pipeline
+from monggregate.stages import Documents, Lookup, UnionWith
+
+
+class TestDocuments:
+    """Tests for the Documents stage."""
+
+    def test_instantiation(self) -> None:
+        """Test that the Documents stage can be instantiated correctly."""
+
+        documents = Documents(documents=[{"x": 10}, {"x": 2}])
+        assert isinstance(documents, Documents)
+
+    def test_expression(self) -> None:
+        """Test that the expression method returns the correct expression."""
+
+        documents = Documents(documents=[{"x": 10}, {"x": 2}])
+        assert documents.expression == {"$documents": [{"x": 10}, {"x": 2}]}
+
+    def test_expression_with_variable(self) -> None:
+        """Test that documents can be an expression resolving to an array."""
+
+        documents = Documents(documents="$$batch")
+        assert documents.expression == {"$documents": "$$batch"}
+
+    def test_documents_are_not_copied(self) -> None:
+        """Test that literal documents are emitted without being copied."""
+
+        batch = [{"sku": index} for index in range(1000)]
+        documents = Documents(documents=batch)
+
+        assert documents.expression["$documents"] is batch
+        assert Pipeline(stages=[documents]).export()[0]["$documents"] is batch
+
+    def test_invalid_documents(self) -> None:
+        """Test that invalid documents are rejected."""
+
+        with pytest.raises(ValueError):
+            Documents(documents=[1, 2])
+        with pytest.raises(ValueError):
+            Documents(documents="not an expression")
+
+    def test_in_sub_pipelines(self) -> None:
+        """Test that the Documents stage can be used in lookup and unionWith sub-pipelines without a collection."""
+
+        batch = [{"sku": index} for index in range(10)]
+        lookup = Lookup(name="batch", pipeline=Pipeline().documents(batch))
+        union_with = UnionWith(pipeline=[Documents(documents=batch)])
+
+        assert lookup.expression["$lookup"]["pipeline"][0]["$documents"] is batch
+        assert "from" not in lookup.expression["$lookup"]
+        assert union_with.expression == {"$unionWith": {"pipeline": [{"$documents": batch}]}}
+
+        with pytest.raises(ValueError):
+            UnionWith(pipeline=[{"$match": {"sku": 1}}])
+        with pytest.raises(ValueError):
+            Lookup(name="batch", pipeline=[{"$match": {}}])
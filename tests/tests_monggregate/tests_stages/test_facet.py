@@ -0,0 +1,52 @@
+"""Tests for the Facet stage."""
+
+import pytest
+from monggregate.pipeline import Pipeline
+from monggregate.stages import Facet, Out
+
+
+class TestFacet:
+    """Tests for the Facet stage."""
+
+    def test_instantiation(self) -> None:
+        """Test that the Facet stage can be instantiated correctly."""
+
+        facet = Facet(pipelines={"total": [{"$count": "count"}]})
+        assert isinstance(facet, Facet)
+
+    def test_expression(self) -> None:
+        """Test that the expression method returns the correct expression."""
+
+        facet = Facet(
+            pipelines={
+                "results": Pipeline().skip(20).limit(10),
+                "total": [{"$count": "count"}],
+            }
+        )
+        assert facet.expression == {
+            "$facet": {
+                "results": [{"$skip": 20}, {"$limit": 10}],
+                "total": [{"$count": "count"}],
+            }
+        }
+
+    @pytest.mark.parametrize(
+        "pipeline",
+        [
+            [Out(collection="results")],
+            [{"$merge": {"into": "results"}}],
+            [{"$search": {"text": {"query": "python", "path": "title"}}}],
+            [{"$facet": {"nested": []}}],
+        ],
+    )
+    def test_forbidden_stages(self, pipeline: list) -> None:
+        """Test that forbidden stages are rejected in the sub-pipelines."""
+
+        with pytest.raises(ValueError):
+            Facet(pipelines={"invalid": pipeline})
+
+    def test_empty_pipelines(self) -> None:
+        """Test that at least one sub-pipeline is required."""
+
+        with pytest.raises(ValueError):
+            Facet(pipelines={})
@@ -0,0 +1,50 @@
+"""Tests for the Fill stage."""
+
+import pytest
+from monggregate.stages import Fill
+
+
+class TestFill:
+    """Tests for the Fill stage."""
+
+    def test_instantiation(self) -> None:
+        """Test that the Fill stage can be instantiated correctly."""
+
+        fill = Fill(output={"status": {"value": "unknown"}})
+        assert isinstance(fill, Fill)
+
+    def test_expression(self) -> None:
+        """Test that the expression method returns the correct expression."""
+
+        fill = Fill(
+            partition_by_fields=["sensor"],
+            sort_by={"timestamp": 1},
+            output={"temperature": {"method": "linear"}, "status": {"value": "unknown"}},
+        )
+        assert fill.expression == {
+            "$fill": {
+                "partitionByFields": ["sensor"],
+                "sortBy": {"timestamp": 1},
+                "output": {"temperature": {"method": "linear"}, "status": {"value": "unknown"}},
+            }
+        }
+
+    def test_method_requires_sort_by(self) -> None:
+        """Test that the linear and locf methods require sort_by."""
+
+        with pytest.raises(ValueError):
+            Fill(output={"temperature": {"method": "locf"}})
+
+    def test_invalid_output(self) -> None:
+        """Test that each field is filled either with a value or with a method."""
+
+        with pytest.raises(ValueError):
+            Fill(sort_by={"timestamp": 1}, output={"temperature": {"method": "linear", "value": 0}})
+        with pytest.raises(ValueError):
+            Fill(sort_by={"timestamp": 1}, output={"temperature": {"method": "spline"}})
+
+    def test_exclusive_partitions(self) -> None:
+        """Test that partition_by and partition_by_fields are mutually exclusive."""
+
+        with pytest.raises(ValueError):
+            Fill(partition_by="$sensor", partition_by_fields=["sensor"], output={"status": {"value": 0}})
@@ -0,0 +1,64 @@
+"""Tests for the GeoNear stage."""
+
+import pytest
+from monggregate.geo import GeoJSONPoint
+from monggregate.stages import GeoNear
+
+
+class TestGeoNear:
+    """Tests for the GeoNear stage."""
+
+    def test_instantiation(self) -> None:
+        """Test that the GeoNear stage can be instantiated correctly."""
+
+        geo_near = GeoNear(near=GeoJSONPoint.from_lon_lat(-73.99, 40.72), distance_field="distance")
+        assert isinstance(geo_near, GeoNear)
+
+    def test_expression(self) -> None:
+        """Test that the expression method returns the correct expression."""
+
+        geo_near = GeoNear(
+            near={"type": "Point", "coordinates": [-73.99, 40.72]},
+            distance_field="dist.calculated",
+            max_distance=2000,
+            min_distance=100,
+            query={"category": "Parks"},
+            key="location",
+        )
+        assert isinstance(geo_near.near, GeoJSONPoint)
+        assert geo_near.expression == {
+            "$geoNear": {
+                "near": {"type": "Point", "coordinates": [-73.99, 40.72]},
+                "distanceField": "dist.calculated",
+                "maxDistance": 2000,
+                "minDistance": 100,
+                "query": {"category": "Parks"},
+                "key": "location",
+            }
+        }
+
+    def test_expression_with_legacy_coordinates(self) -> None:
+        """Test that legacy coordinate pairs are supported."""
+
+        geo_near = GeoNear(near=[-73.99, 40.72], distance_field="distance", spherical=True, distance_multiplier=6378.1)
+        assert geo_near.expression == {
+            "$geoNear": {
+                "near": [-73.99, 40.72],
+                "distanceField": "distance",
+                "spherical": True,
+                "distanceMultiplier": 6378.1,
+            }
+        }
+
+    def test_invalid_arguments(self) -> None:
+        """Test that invalid combinations of arguments are rejected."""
+
+        point = GeoJSONPoint.from_lon_lat(-73.99, 40.72)
+        with pytest.raises(ValueError):
+            GeoNear(near=[1, 2, 3], distance_field="distance")
+        with pytest.raises(ValueError):
+            GeoNear(near=point, distance_field="distance", min_distance=10, max_distance=5)
+        with pytest.raises(ValueError):
+            GeoNear(near=[-73.99, 40.72], distance_field="distance", min_distance=10)
+        with pytest.raises(ValueError):
+            GeoNear(near=point, distance_field="distance", query={"location": {"$near": point.expression}})
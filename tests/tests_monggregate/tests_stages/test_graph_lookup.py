@@ -0,0 +1,77 @@
+"""Tests for the GraphLookup stage."""
+
+import pytest
+from monggregate.stages import GraphLookup
+
+
+class TestGraphLookup:
+    """Tests for the GraphLookup stage."""
+
+    def test_instantiation(self) -> None:
+        """Test that the GraphLookup stage can be instantiated correctly."""
+
+        graph_lookup = GraphLookup(
+            right="employees",
+            start_with="$reportsTo",
+            connect_from_field="reportsTo",
+            connect_to_field="name",
+            name="hierarchy",
+        )
+        assert isinstance(graph_lookup, GraphLookup)
+
+    def test_expression(self) -> None:
+        """Test that the expression method returns the correct expression."""
+
+        graph_lookup = GraphLookup(
+            right="employees",
+            start_with="$reportsTo",
+            connect_from_field="reportsTo",
+            connect_to_field="name",
+            name="hierarchy",
+        )
+        assert graph_lookup.expression == {
+            "$graphLookup": {
+                "from": "employees",
+                "startWith": "$reportsTo",
+                "connectFromField": "reportsTo",
+                "connectToField": "name",
+                "as": "hierarchy",
+            }
+        }
+
+    def test_expression_with_options(self) -> None:
+        """Test that the expression method returns the correct expression with all the options."""
+
+        graph_lookup = GraphLookup(
+            right="employees",
+            start_with="$reportsTo",
+            connect_from_field="reportsTo",
+            connect_to_field="name",
+            name="hierarchy",
+            max_depth=2,
+            depth_field="level",
+            restrict_search_with_match={"active": True},
+        )
+        assert graph_lookup.expression["$graphLookup"] == {
+            "from": "employees",
+            "startWith": "$reportsTo",
+            "connectFromField": "reportsTo",
+            "connectToField": "name",
+            "as": "hierarchy",
+            "maxDepth": 2,
+            "depthField": "level",
+            "restrictSearchWithMatch": {"active": True},
+        }
+
+    def test_negative_max_depth(self) -> None:
+        """Test that max_depth must be non-negative."""
+
+        with pytest.raises(ValueError):
+            GraphLookup(
+                right="employees",
+                start_with="$reportsTo",
+                connect_from_field="reportsTo",
+                connect_to_field="name",
+                name="hierarchy",
+                max_depth=-1,
+            )
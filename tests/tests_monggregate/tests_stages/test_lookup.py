@@ -95,6 +95,75 @@ class TestLookup:
         }
         # fmt: on
 
+    def test_to_concise(self) -> None:
+        """Test that equality-correlated subqueries are rewritten to the concise syntax."""
+
+        lookup = Lookup(
+            right="warehouses",
+            let={"order_item": "$item", "order_qty": "$ordered"},
+            pipeline=[
+                {"$match": {"$expr": {"$and": [
+                    {"$eq": ["$stock_item", "$$order_item"]},
+                    {"$gte": ["$instock", "$$order_qty"]},
+                ]}}},
+                {"$project": {"stock_item": 0, "_id": 0}},
+            ],
+            name="stockdata",
+        )
+
+        concise = lookup.to_concise()
+        assert concise.expression == {
+            "$lookup": {
+                "from": "warehouses",
+                "localField": "item",
+                "foreignField": "stock_item",
+                "let": {"order_qty": "$ordered"},
+                "pipeline": [
+                    {"$match": {"$expr": {"$gte": ["$instock", "$$order_qty"]}}},
+                    {"$project": {"stock_item": 0, "_id": 0}},
+                ],
+                "as": "stockdata",
+            }
+        }
+
+    def test_to_concise_simple(self) -> None:
+        """Test that a subquery reduced to the equality is rewritten to the simple syntax."""
+
+        lookup = Lookup(
+            right="inventory",
+            let={"sku": "$item"},
+            pipeline=[{"$match": {"$expr": {"$eq": ["$$sku", "$sku"]}}}],
+            name="inventory_docs",
+        )
+
+        concise = lookup.to_concise()
+        assert concise == Lookup(right="inventory", left_on="item", right_on="sku", name="inventory_docs")
+        assert concise.type_ == "simple"
+
+    def test_to_concise_not_rewritable(self) -> None:
+        """Test that lookups without a correlated equality are returned as is."""
+
+        lookups = [
+            Lookup(right="a", left_on="x", right_on="y", name="z"),
+            Lookup(right="a", pipeline=[{"$match": {"year": 2018}}], name="z"),
+            Lookup(right="a", let={"x": {"$toLower": "$x"}}, pipeline=[{"$match": {"$expr": {"$eq": ["$y", "$$x"]}}}], name="z"),
+            Lookup(right="a", let={"x": "$x"}, pipeline=[{"$match": {"$expr": {"$lt": ["$y", "$$x"]}}}], name="z"),
+        ]
+        for lookup in lookups:
+            assert lookup.to_concise() is lookup
+
+    def test_index_suggestion(self) -> None:
+        """Test that the suggested index starts with the foreign field and includes the equality fields."""
+
+        lookup = Lookup(
+            right="orders",
+            let={"customer_id": "$_id"},
+            pipeline=[{"$match": {"status": "A", "$expr": {"$eq": ["$customer", "$$customer_id"]}}}],
+            name="orders",
+        )
+        assert lookup.index_suggestion() == {"customer": 1, "status": 1}
+        assert Lookup(right="a", pipeline=[{"$match": {"year": {"$gt": 2018}}}], name="z").index_suggestion() is None
+
 
 #         db.absences.aggregate([
 #    {
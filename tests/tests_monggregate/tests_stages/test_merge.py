@@ -0,0 +1,72 @@
+"""Tests for the Merge stage."""
+
+import pytest
+from monggregate.stages import Merge
+
+
+class TestMerge:
+    """Tests for the Merge stage."""
+
+    def test_instantiation(self) -> None:
+        """Test that the Merge stage can be instantiated correctly."""
+        merge = Merge(into="test_collection")
+        assert isinstance(merge, Merge)
+
+    def test_expression(self) -> None:
+        """Test that the expression method returns the correct expression."""
+
+        merge = Merge(into="test_collection")
+        assert merge.expression == {"$merge": {"into": "test_collection"}}
+
+    def test_expression_with_options(self) -> None:
+        """Test that the expression method returns the correct expression with all the options."""
+
+        merge = Merge(
+            into="test_collection",
+            db="test_db",
+            on=["year", "month"],
+            when_matched="replace",
+            when_not_matched="discard",
+        )
+        assert merge.expression == {
+            "$merge": {
+                "into": {"db": "test_db", "coll": "test_collection"},
+                "on": ["year", "month"],
+                "whenMatched": "replace",
+                "whenNotMatched": "discard",
+            }
+        }
+
+    def test_expression_with_pipeline(self) -> None:
+        """Test that whenMatched accepts an update pipeline and let variables."""
+
+        merge = Merge(
+            into="test_collection",
+            let={"total": "$$new.total"},
+            when_matched=[{"$set": {"total": {"$add": ["$total", "$$total"]}}}],
+        )
+        assert merge.expression == {
+            "$merge": {
+                "into": "test_collection",
+                "let": {"total": "$$new.total"},
+                "whenMatched": [{"$set": {"total": {"$add": ["$total", "$$total"]}}}],
+            }
+        }
+
+    def test_invalid_pipeline_stage(self) -> None:
+        """Test that only update stages are allowed in the whenMatched pipeline."""
+
+        with pytest.raises(ValueError):
+            Merge(into="test_collection", when_matched=[{"$match": {"a": 1}}])
+
+    def test_let_without_pipeline(self) -> None:
+        """Test that let requires a whenMatched pipeline."""
+
+        with pytest.raises(ValueError):
+            Merge(into="test_collection", let={"a": 1}, when_matched="merge")
+
+    def test_empty_on(self) -> None:
+        """Test that on cannot be empty."""
+
+        with pytest.raises(ValueError):
+            Merge(into="test_collection", on=[])
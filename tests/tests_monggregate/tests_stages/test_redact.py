@@ -0,0 +1,49 @@
+"""Tests for the Redact stage."""
+
+import pytest
+from monggregate.dollar import DESCEND, KEEP, PRUNE, S
+from monggregate.stages import Redact
+
+
+class TestRedact:
+    """Tests for the Redact stage."""
+
+    def test_instantiation(self) -> None:
+        """Test that the Redact stage can be instantiated correctly."""
+
+        redact = Redact(condition=KEEP)
+        assert isinstance(redact, Redact)
+
+    def test_expression(self) -> None:
+        """Test that the expression method returns the correct expression."""
+
+        condition = S.cond(S.gt(S.size(S.set_intersection("$tags", ["STLW", "G"])), 0), DESCEND, PRUNE)
+        redact = Redact(condition=condition)
+        assert redact.expression == {
+            "$redact": {
+                "$cond": {
+                    "if": {"$gt": [{"$size": {"$setIntersection": ["$tags", ["STLW", "G"]]}}, 0]},
+                    "then": "$$DESCEND",
+                    "else": "$$PRUNE",
+                }
+            }
+        }
+
+    def test_switch(self) -> None:
+        """Test that a Switch operator can be used as condition."""
+
+        condition = S.switch([{"case": S.eq("$level", 5), "then": PRUNE}], DESCEND)
+        redact = Redact(condition=condition)
+        assert redact.expression == {
+            "$redact": {"$switch": {"branches": [{"case": {"$eq": ["$level", 5]}, "then": "$$PRUNE"}], "default": "$$DESCEND"}}
+        }
+
+    def test_invalid_outcomes(self) -> None:
+        """Test that literal outcomes other than the redact variables are rejected."""
+
+        with pytest.raises(ValueError):
+            Redact(condition=S.cond(S.eq("$level", 5), "prune", DESCEND))
+        with pytest.raises(ValueError):
+            Redact(condition={"$switch": {"branches": [{"case": True, "then": 0}], "default": KEEP}})
+        with pytest.raises(ValueError):
+            Redact(condition=True)
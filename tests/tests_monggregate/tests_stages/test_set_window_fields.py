@@ -0,0 +1,113 @@
+"""Tests for the SetWindowFields stage."""
+
+import pytest
+from monggregate.dollar import S
+from monggregate.stages import SetWindowFields, Window, WindowOutput
+
+
+class TestWindow:
+    """Tests for the Window class."""
+
+    def test_documents_expression(self) -> None:
+        """Test that documents windows are expressed correctly."""
+
+        window = Window(documents=["unbounded", "current"])
+        assert window.expression == {"documents": ["unbounded", "current"]}
+
+    def test_range_expression(self) -> None:
+        """Test that range windows are expressed correctly with their unit."""
+
+        window = Window(range=[-10, 0], unit="day")
+        assert window.expression == {"range": [-10, 0], "unit": "day"}
+
+    def test_documents_or_range(self) -> None:
+        """Test that exactly one of documents and range must be provided."""
+
+        with pytest.raises(ValueError):
+            Window()
+        with pytest.raises(ValueError):
+            Window(documents=[-1, 1], range=[-1, 1])
+
+    def test_unit_with_documents(self) -> None:
+        """Test that unit cannot be used with documents windows."""
+
+        with pytest.raises(ValueError):
+            Window(documents=[-1, 1], unit="day")
+
+    def test_boundaries(self) -> None:
+        """Test that windows have two boundaries."""
+
+        with pytest.raises(ValueError):
+            Window(documents=[-1])
+
+
+class TestSetWindowFields:
+    """Tests for the SetWindowFields stage."""
+
+    def test_instantiation(self) -> None:
+        """Test that the SetWindowFields stage can be instantiated correctly."""
+
+        stage = SetWindowFields(sort_by={"orderDate": 1}, output={"rank": S.rank()})
+        assert isinstance(stage, SetWindowFields)
+
+    def test_expression(self) -> None:
+        """Test that the expression method returns the correct expression."""
+
+        stage = SetWindowFields(
+            partition_by="$state",
+            sort_by={"orderDate": 1},
+            output={
+                "cumulativeQuantity": WindowOutput(
+                    operator=S.sum("$quantity"),
+                    window=Window(documents=["unbounded", "current"]),
+                ),
+                "movingAverage": {"$avg": "$quantity", "window": {"range": [-1, 0], "unit": "day"}},
+                "previousQuantity": S.shift("$quantity", by=-1, default=0),
+                "rank": S.dense_rank(),
+            },
+        )
+        assert stage.expression == {
+            "$setWindowFields": {
+                "partitionBy": "$state",
+                "sortBy": {"orderDate": 1},
+                "output": {
+                    "cumulativeQuantity": {"$sum": "$quantity", "window": {"documents": ["unbounded", "current"]}},
+                    "movingAverage": {"$avg": "$quantity", "window": {"range": [-1, 0], "unit": "day"}},
+                    "previousQuantity": {"$shift": {"output": "$quantity", "by": -1, "default": 0}},
+                    "rank": {"$denseRank": {}},
+                },
+            }
+        }
+
+    def test_expression_without_partition(self) -> None:
+        """Test that partitionBy and sortBy are omitted when not provided."""
+
+        stage = SetWindowFields(output={"total": S.sum("$quantity")})
+        assert stage.expression == {"$setWindowFields": {"output": {"total": {"$sum": "$quantity"}}}}
+
+    def test_sort_required(self) -> None:
+        """Test that sorted window operators require sort_by."""
+
+        with pytest.raises(ValueError):
+            SetWindowFields(output={"average": S.exp_moving_avg("$price", n=3)})
+
+    def test_single_sort_field(self) -> None:
+        """Test that rank operators require a single sort field."""
+
+        with pytest.raises(ValueError):
+            SetWindowFields(sort_by={"a": 1, "b": -1}, output={"rank": S.rank()})
+
+    def test_window_not_accepted(self) -> None:
+        """Test that some operators do not accept windows."""
+
+        with pytest.raises(ValueError):
+            SetWindowFields(
+                sort_by={"a": 1},
+                output={"previous": WindowOutput(operator=S.shift("$a", by=-1), window=Window(documents=[-1, 0]))},
+            )
+
+    def test_empty_output(self) -> None:
+        """Test that output cannot be empty."""
+
+        with pytest.raises(ValueError):
+            SetWindowFields(output={})
@@ -1,5 +1,8 @@
+from array import array
+
 import pytest
 from monggregate.stages import VectorSearch
+from monggregate.vectors import BinaryVector
 
 
 class TestVectorSearch:
@@ -60,3 +63,34 @@ class TestVectorSearch:
                 "filter": None,
             }
         }
+
+    def test_buffer_query_vector(self) -> None:
+        """Test that buffers are converted to binary vectors."""
+
+        vector_search = VectorSearch(
+            index="index",
+            path="field",
+            query_vector=array("f", [0.5] * 1536),
+            num_candidates=100,
+            limit=10,
+        )
+        assert isinstance(vector_search.query_vector, BinaryVector)
+        assert len(vector_search.query_vector) == 1536
+
+        vector = BinaryVector.from_buffer(array("b", [1, -1]))
+        vector_search = VectorSearch(index="index", path="field", query_vector=vector, num_candidates=100, limit=10)
+        assert vector_search.query_vector == vector
+
+    def test_exact(self) -> None:
+        """Test that ENN searches omit numCandidates."""
+
+        vector_search = VectorSearch(index="index", path="field", query_vector=[1, 2, 3], limit=10, exact=True)
+        assert vector_search.expression["$vectorSearch"]["exact"] is True
+        assert "numCandidates" not in vector_search.expression["$vectorSearch"]
+
+        with pytest.raises(ValueError):
+            VectorSearch(index="index", path="field", query_vector=[1, 2, 3], num_candidates=100, limit=10, exact=True)
+        with pytest.raises(ValueError):
+            VectorSearch(index="index", path="field", query_vector=[1, 2, 3], limit=10)
+        with pytest.raises(ValueError):
+            VectorSearch(index="index", path="field", query_vector=[1, 2, 3], num_candidates=10001, limit=10)
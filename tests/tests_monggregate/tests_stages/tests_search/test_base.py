@@ -53,6 +53,9 @@ class TestSearchBase:
         "gte": 1,
         "lte": 2,
         "like": {"title": "test"},
+        "origin": 10,
+        "pivot": 2,
+        "default_path": "field",
     }
 
     def test_instantiation(self) -> None:
@@ -1,5 +1,7 @@
 """Tests for the `search_meta` module."""
 
+import pytest
+
 from monggregate.search.commons.fuzzy import FuzzyOptions
 from monggregate.stages.search.search import Search
 
@@ -40,3 +42,38 @@ class TestSearch:
         }
 
         assert search.expression == expected_expression
+
+    def test_sort_and_pagination(self) -> None:
+        """Tests that the sort and pagination options are only exported when set."""
+
+        search = Search.from_operator(
+            operator_name="text",
+            path="title",
+            query="test",
+            sort={"released": {"order": -1, "noData": "highest"}, "score": {"$meta": "searchScore"}},
+            search_before="token",
+        )
+
+        statement = search.expression["$search"]
+        assert statement["sort"] == {"released": {"order": -1, "noData": "highest"}, "score": {"$meta": "searchScore"}}
+        assert statement["searchBefore"] == "token"
+        assert "searchAfter" not in statement
+
+    def test_invalid_sort_and_pagination(self) -> None:
+        """Tests that invalid sort orders and conflicting pagination tokens are rejected."""
+
+        with pytest.raises(ValueError):
+            Search.from_operator(operator_name="text", path="title", query="test", sort={"released": 0})
+        with pytest.raises(ValueError):
+            Search.from_operator(operator_name="text", path="title", query="test", sort={"score": {"$meta": "textScore"}})
+        with pytest.raises(ValueError):
+            Search.from_operator(operator_name="text", path="title", query="test", search_after="a", search_before="b")
+
+    def test_concurrent(self) -> None:
+        """Tests that the concurrent option is only exported when enabled."""
+
+        search = Search.from_operator(operator_name="text", path="title", query="test", concurrent=True)
+        assert search.expression["$search"]["concurrent"] is True
+
+        search = Search.from_operator(operator_name="text", path="title", query="test")
+        assert "concurrent" not in search.expression["$search"]